@@ -25,7 +25,14 @@ from pyimpspec import (
     get_default_num_procs,
     set_default_num_procs,
 )
-from deareis.data import Project
+from deareis.api.pool import (
+    configure_worker_pool,
+    shutdown_worker_pool,
+)
+from deareis.data import (
+    FitIndex,
+    Project,
+)
 from deareis.api.data import (
     DataSet,
     # - functions
@@ -46,22 +53,36 @@ from deareis.api.kramers_kronig import (
     # - functions
     perform_kramers_kronig_test,
     perform_exploratory_kramers_kronig_tests,
+    perform_batch_kramers_kronig_tests,
 )
 from deareis.api.fitting import (
+    FitConfidenceIntervals,
     FitResult,
     FitSettings,
     FittedParameter,
+    MultiStartSummary,
     # - enums
     CNLSMethod,
+    ResamplingMethod,
     Weight,
     # - functions
+    calculate_confidence_intervals,
     fit_circuit,
+    fit_circuit_multistart,
 )
 from deareis.api.simulation import (
     SimulationResult,
     SimulationSettings,
+    SimulationSweepResult,
+    SimulationSweepSettings,
+    SweptParameter,
+    # - enums
+    NoiseModel,
     # - functions
+    analyze_replicates,
+    generate_noisy_replicates,
     simulate_spectrum,
+    sweep_simulation,
 )
 from deareis.api.plotting import (
     PlotSeries,
@@ -71,6 +92,8 @@ from deareis.api.plotting import (
 )
 from deareis.api.drt import (
     DRTResult,
+    DRTSeriesResult,
+    DRTSeriesSettings,
     DRTSettings,
     # - enums
     CrossValidationMethod,
@@ -81,6 +104,8 @@ from deareis.api.drt import (
     TRNNLSLambdaMethod,
     # - functions
     calculate_drt,
+    calculate_drt_series,
+    extract_drt_peaks,
 )
 from deareis.api.zhit import (
     ZHITResult,
@@ -91,6 +116,7 @@ from deareis.api.zhit import (
     ZHITWindow,
     ZHITRepresentation,
     # - functions
+    perform_batch_zhit,
     perform_zhit,
 )
 from deareis.api.plot import mpl  # matplotlib-based plotting
@@ -37,3 +37,7 @@ from pyimpspec import (
     CircuitBuilder,
     parse_cdc,
 )
+from .compiled import (
+    CompiledCircuit,
+    compile_circuit,
+)
@@ -0,0 +1,338 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from copy import deepcopy
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    cast,
+)
+from numpy import (
+    array,
+    complex128,
+    empty,
+    errstate,
+    float64,
+    inf,
+    isinf,
+    zeros,
+)
+from numpy.typing import NDArray
+from pyimpspec import (
+    Circuit,
+    Frequencies,
+)
+from pyimpspec.circuit.base import (
+    Connection,
+    Container,
+    Element,
+)
+from pyimpspec.circuit.parallel import Parallel
+from pyimpspec.circuit.series import Series
+from deareis.data.cache import CIRCUIT_CACHE
+
+
+# Each instruction is a tuple containing an opcode and its operand.
+# - _ELEMENT: a tuple containing the element and the columns of its parameters
+# - _CONTAINER: same as _ELEMENT but evaluated one parameter set at a time
+# - _SERIES/_PARALLEL: the number of values to pop from the stack
+_ELEMENT: int = 0
+_CONTAINER: int = 1
+_SERIES: int = 2
+_PARALLEL: int = 3
+
+_ElementOperand = Tuple[Element, List[Tuple[str, int]]]
+_Instruction = Tuple[int, Union[int, _ElementOperand]]
+
+
+def _evaluate_parallel(paths: List[NDArray[complex128]]) -> NDArray[complex128]:
+    # Open paths (infinite impedance) contribute nothing to the admittance
+    # while shorted paths (zero impedance) short the whole connection.
+    with errstate(divide="ignore", invalid="ignore"):
+        Y: NDArray[complex128] = zeros(paths[0].shape, dtype=complex128)
+        shorted: NDArray = zeros(paths[0].shape, dtype=bool)
+        for Z in paths:
+            shorted |= Z == 0.0
+            Y += 1 / Z
+
+        Z = 1 / Y
+
+    Z[isinf(Y)] = 0.0
+    Z[shorted] = 0.0
+    Z[Y == 0.0] = complex(inf, 0.0)
+
+    return Z
+
+
+class CompiledCircuit:
+    """
+    A circuit that has been compiled into a flat evaluation plan, which can be used to calculate the impedances of a batch of parameter sets at multiple frequencies in a single call.
+    Instances should be created using the `compile_circuit` function.
+
+    The parameters of the circuit are arranged in the order given by `get_parameter_labels`.
+    The parameters of the subcircuits of containers (e.g., the transmission line model) are not included and retain their current values.
+
+    Parameters
+    ----------
+    circuit: Circuit
+        The circuit to compile.
+    """
+
+    def __init__(self, circuit: Circuit):
+        assert isinstance(circuit, Circuit), circuit
+        self._circuit: Circuit = deepcopy(circuit)
+        self._labels: List[Tuple[str, str]] = []
+        self._values: List[float] = []
+        self._fixed: List[bool] = []
+        self._program: List[_Instruction] = []
+
+        identifiers: Dict[Element, int] = self._circuit.generate_element_identifiers(
+            running=False
+        )
+        self._compile(self._circuit._elements, identifiers)
+
+    def __repr__(self) -> str:
+        return f"CompiledCircuit ({self._circuit.to_string()}, {hex(id(self))})"
+
+    def _compile(
+        self,
+        item: Union[Element, Connection],
+        identifiers: Dict[Element, int],
+    ):
+        if isinstance(item, Element):
+            element_label: str = self._circuit.get_element_name(
+                item,
+                identifiers=identifiers,
+            )
+            columns: List[Tuple[str, int]] = []
+
+            key: str
+            value: float
+            for key, value in item.get_values().items():
+                columns.append((key, len(self._labels)))
+                self._labels.append((element_label, key))
+                self._values.append(value)
+                self._fixed.append(item.is_fixed(key))
+
+            self._program.append(
+                (
+                    _CONTAINER if isinstance(item, Container) else _ELEMENT,
+                    (item, columns),
+                )
+            )
+            return
+
+        assert isinstance(item, (Series, Parallel)), item
+        if len(item._elements) == 0:
+            self._program.append((_SERIES, 0))
+            return
+
+        for child in item._elements:
+            self._compile(child, identifiers)
+
+        self._program.append(
+            (
+                _SERIES if isinstance(item, Series) else _PARALLEL,
+                len(item._elements),
+            )
+        )
+
+    def get_circuit(self) -> Circuit:
+        """
+        Get a copy of the circuit that was compiled.
+
+        Returns
+        -------
+        Circuit
+        """
+        return deepcopy(self._circuit)
+
+    def get_parameter_labels(self) -> List[Tuple[str, str]]:
+        """
+        Get the (element label, parameter symbol) pairs that correspond to the columns of a parameter batch.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+        """
+        return self._labels[:]
+
+    def get_values(self) -> NDArray[float64]:
+        """
+        Get the parameter values that were defined in the circuit when it was compiled.
+
+        Returns
+        -------
+        NDArray[float64]
+        """
+        return array(self._values, dtype=float64)
+
+    def get_fixed(self) -> NDArray:
+        """
+        Get a boolean array indicating which of the parameters are fixed.
+
+        Returns
+        -------
+        NDArray[bool]
+        """
+        return array(self._fixed, dtype=bool)
+
+    def has_containers(self) -> bool:
+        """
+        Check if the circuit contains any containers (e.g., the transmission line model), which are evaluated one parameter set at a time and whose subcircuits are not part of the parameter batch.
+
+        Returns
+        -------
+        bool
+        """
+        return any(opcode == _CONTAINER for opcode, _ in self._program)
+
+    def extract_values(self, circuit: Circuit) -> NDArray[float64]:
+        """
+        Get the parameter values of another circuit that has the same structure (i.e., the same basic circuit description code) as the compiled circuit.
+        The values are arranged in the same order as the labels returned by `get_parameter_labels`, which means that the values of several circuits can be stacked to form a parameter batch.
+
+        Parameters
+        ----------
+        circuit: Circuit
+            The circuit to get the parameter values from.
+
+        Returns
+        -------
+        NDArray[float64]
+        """
+        assert isinstance(circuit, Circuit), circuit
+        if circuit.to_string() != self._circuit.to_string():
+            raise ValueError(
+                f"Expected a circuit with the structure {self._circuit.to_string()} instead of {circuit.to_string()}"
+            )
+
+        values: List[float] = []
+
+        def collect(item: Union[Element, Connection]):
+            if isinstance(item, Element):
+                values.extend(item.get_values().values())
+                return
+
+            for child in item._elements:
+                collect(child)
+
+        collect(circuit._elements)
+        assert len(values) == len(self._values), (len(values), len(self._values))
+
+        return array(values, dtype=float64)
+
+    def get_impedances(
+        self,
+        frequencies: Frequencies,
+        parameters: NDArray[float64],
+    ) -> NDArray[complex128]:
+        """
+        Calculate the impedances of one or more parameter sets at the provided frequencies.
+
+        Parameters
+        ----------
+        frequencies: Frequencies
+            The excitation frequencies in hertz.
+            The frequencies must be finite and greater than zero.
+
+        parameters: NDArray[float64]
+            Either a 1-D array containing a single parameter set or a 2-D array where each row is a parameter set.
+
+        Returns
+        -------
+        NDArray[complex128]
+            A 1-D array with the impedances of a single parameter set or a 2-D array where the rows correspond to the parameter sets and the columns to the frequencies.
+        """
+        f: NDArray[float64] = array(frequencies, dtype=float64)
+        assert f.ndim == 1, f.shape
+        assert (f > 0.0).all() and not isinf(f).any(), "Expected finite, positive frequencies"
+        P: NDArray[float64] = array(parameters, dtype=float64)
+        assert P.ndim in (1, 2), P.shape
+        single: bool = P.ndim == 1
+        if single:
+            P = P.reshape((1, -1))
+
+        assert P.shape[1] == len(self._labels), (P.shape, len(self._labels))
+        num_sets: int = P.shape[0]
+
+        stack: List[NDArray[complex128]] = []
+        Z: NDArray[complex128]
+        opcode: int
+        for opcode, operand in self._program:
+            # The type of the operand depends on the opcode
+            if opcode == _ELEMENT:
+                element, columns = cast(_ElementOperand, operand)
+                func: Callable = element._impedance
+                Z = empty((num_sets, len(f)), dtype=complex128)
+                Z[:, :] = func(
+                    f.reshape((1, -1)),
+                    **{key: P[:, i].reshape((-1, 1)) for key, i in columns},
+                )
+                stack.append(Z)
+            elif opcode == _CONTAINER:
+                element, columns = cast(_ElementOperand, operand)
+                subcircuits = element.get_subcircuits()
+                Z = empty((num_sets, len(f)), dtype=complex128)
+                for row in range(num_sets):
+                    Z[row, :] = element._impedance(
+                        f,
+                        **{key: P[row, i] for key, i in columns},
+                        **subcircuits,
+                    )
+                stack.append(Z)
+            elif operand == 0:
+                stack.append(zeros((num_sets, len(f)), dtype=complex128))
+            else:
+                num_paths: int = cast(int, operand)
+                paths: List[NDArray[complex128]] = stack[-num_paths:]
+                del stack[-num_paths:]
+                if opcode == _SERIES:
+                    stack.append(sum(paths[1:], paths[0].copy()))
+                else:
+                    stack.append(_evaluate_parallel(paths))
+
+        assert len(stack) == 1, len(stack)
+        impedances: NDArray[complex128] = stack[0]
+
+        return impedances[0] if single else impedances
+
+
+def compile_circuit(circuit: Union[Circuit, str]) -> CompiledCircuit:
+    """
+    Compile a circuit into a vectorized evaluation plan that can calculate the impedances of a batch of parameter sets in a single call.
+
+    Parameters
+    ----------
+    circuit: Union[Circuit, str]
+        The circuit or circuit description code to compile.
+
+    Returns
+    -------
+    CompiledCircuit
+    """
+    if isinstance(circuit, str):
+        circuit = CIRCUIT_CACHE.parse(circuit)
+
+    assert isinstance(circuit, Circuit), circuit
+
+    return CompiledCircuit(circuit)
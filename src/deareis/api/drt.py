@@ -17,15 +17,81 @@
 # The licenses of DearEIS' dependencies and/or sources of portions of code are included in
 # the LICENSES folder.
 
+from contextlib import (
+    contextmanager as _contextmanager,
+    nullcontext as _nullcontext,
+)
+from contextvars import ContextVar as _ContextVar
+from threading import Lock as _Lock
 from uuid import uuid4 as _uuid4
 from time import time as _time
-from typing import Dict
-from numpy import array
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from numpy import (
+    argsort as _argsort,
+    array,
+    ceil as _ceil,
+    complex128 as _complex128,
+    concatenate as _concatenate,
+    diff as _diff,
+    eye as _eye,
+    finfo as _finfo,
+    hstack as _hstack,
+    linspace as _linspace,
+    float64 as _float64,
+    full as _full,
+    lexsort as _lexsort,
+    log as _ln,
+    log10 as _log,
+    logspace as _logspace,
+    mean as _mean,
+    nonzero as _nonzero,
+    ones as _ones,
+    pi as _pi,
+    quantile as _quantile,
+    vstack as _vstack,
+    zeros as _zeros,
+)
+from numpy.linalg import (
+    cholesky as _cholesky,
+    inv as _inv,
+    lstsq as _lstsq,
+)
+from numpy.random import (
+    SeedSequence as _SeedSequence,
+    default_rng as _default_rng,
+    get_state as _get_rng_state,
+    seed as _seed_rng,
+    set_state as _set_rng_state,
+)
+from numpy.typing import NDArray as _NDArray
+from scipy.optimize import nnls as _nnls
+from pandas import DataFrame as _DataFrame
 import pyimpspec as _pyimpspec
+from pyimpspec.progress import Progress as _Progress
+import pyimpspec.analysis.drt.bht as _bht
+import pyimpspec.analysis.drt.tr_nnls as _tr_nnls
+import pyimpspec.analysis.drt.tr_rbf as _tr_rbf
+from deareis.api.pool import (
+    get_shared_context as _get_context,
+    use_shared_pool as _use_shared_pool,
+)
 from deareis.data import DataSet
+from deareis.data.cache import DRT_MATRIX_CACHE as _DRT_MATRIX_CACHE
+from deareis.progress import format_eta as _format_eta
 from deareis.data.drt import (
     DRTResult,
+    DRTSeriesResult,
+    DRTSeriesSettings,
     DRTSettings,
+    _find_peak_indices,
 )
 from deareis.enums import (
     CrossValidationMethod,
@@ -43,10 +109,439 @@ from deareis.enums import (
 )
 
 
+# The functions that assemble the discretization matrices of the TR-RBF and
+# TR-NNLS methods are looked up as module attributes by pyimpspec, which means
+# that replacing them with the cached variants below while calculate_drt is
+# running makes the calculations share the matrices. The keys contain all of
+# the arguments so the cached variants are transparent regardless of who
+# calls them.
+_assemble_tr_rbf_A_matrix = _tr_rbf._assemble_A_matrix
+_assemble_tr_rbf_M_matrix = _tr_rbf._assemble_M_matrix
+_generate_tr_nnls_A_matrix = _tr_nnls._generate_A_matrix
+
+
+def _get_tr_rbf_A_matrix_key(args: tuple) -> Hashable:
+    f, tau, epsilon, real, rbf_type = args
+
+    return (
+        "tr-rbf-A",
+        array(f, dtype=_float64).tobytes(),
+        array(tau, dtype=_float64).tobytes(),
+        float(epsilon),
+        bool(real),
+        rbf_type,
+    )
+
+
+def _cached_tr_rbf_A_matrix(args: tuple) -> _NDArray[_float64]:
+    return _DRT_MATRIX_CACHE.get_matrix(
+        _get_tr_rbf_A_matrix_key(args),
+        lambda: _assemble_tr_rbf_A_matrix(args),
+    )
+
+
+def _cached_tr_rbf_M_matrix(
+    tau: _NDArray[_float64],
+    epsilon: float,
+    derivative_order: int,
+    rbf_type: str,
+) -> _NDArray[_float64]:
+    return _DRT_MATRIX_CACHE.get_matrix(
+        (
+            "tr-rbf-M",
+            array(tau, dtype=_float64).tobytes(),
+            float(epsilon),
+            int(derivative_order),
+            rbf_type,
+        ),
+        lambda: _assemble_tr_rbf_M_matrix(tau, epsilon, derivative_order, rbf_type),
+    )
+
+
+def _cached_tr_nnls_A_matrix(
+    omega: _NDArray[_float64],
+    tau: _NDArray[_float64],
+    delta_ln_tau: _NDArray[_float64],
+    is_imaginary: bool,
+) -> _NDArray[_float64]:
+    return _DRT_MATRIX_CACHE.get_matrix(
+        (
+            "tr-nnls-A",
+            array(omega, dtype=_float64).tobytes(),
+            array(tau, dtype=_float64).tobytes(),
+            array(delta_ln_tau, dtype=_float64).tobytes(),
+            bool(is_imaginary),
+        ),
+        lambda: _generate_tr_nnls_A_matrix(omega, tau, delta_ln_tau, is_imaginary),
+    )
+
+
+def _assemble_tr_rbf_A_matrix_process(args: tuple) -> _NDArray[_float64]:
+    return _assemble_tr_rbf_A_matrix(args)
+
+
+def _prepare_tr_rbf_A_matrices(
+    data: DataSet,
+    settings: DRTSettings,
+    num_procs: int,
+) -> bool:
+    # Assembles the A matrices of the TR-RBF method (in parallel if possible)
+    # and adds them to the cache. Returns True if both matrices are cached.
+    f: _NDArray[_float64] = data.get_frequencies()
+    if len(f) < 1:
+        return False
+
+    rbf_type: str = _rbf_type_to_value[settings.rbf_type]
+    epsilon: float = _tr_rbf._compute_epsilon(
+        f,
+        _rbf_shape_to_value[settings.rbf_shape],
+        settings.shape_coeff,
+        rbf_type,
+    )
+    missing: List[tuple] = [
+        args
+        for args in ((f, 1 / f, epsilon, real, rbf_type) for real in (True, False))
+        if _get_tr_rbf_A_matrix_key(args) not in _DRT_MATRIX_CACHE
+    ]
+
+    if num_procs < 1:
+        num_procs = max((_pyimpspec.get_default_num_procs() - abs(num_procs), 1))
+
+    if len(missing) > 1 and num_procs > 1:
+        with _get_context(method="spawn").Pool(len(missing)) as pool:
+            for args, A in zip(missing, pool.map(_assemble_tr_rbf_A_matrix_process, missing)):
+                _DRT_MATRIX_CACHE.get_matrix(_get_tr_rbf_A_matrix_key(args), lambda: A)
+    else:
+        for args in missing:
+            _cached_tr_rbf_A_matrix(args)
+
+    return all(
+        _get_tr_rbf_A_matrix_key((f, 1 / f, epsilon, real, rbf_type)) in _DRT_MATRIX_CACHE
+        for real in (True, False)
+    )
+
+
+# The credible intervals of the TR-RBF method and the attempts of the BHT
+# method are looked up as module attributes by pyimpspec too. The variants
+# below are only used when calculate_drt is called with parallel_sampling
+# enabled, in which case the context contains the number of processes, the
+# seed, and the convergence tolerance. Otherwise, they defer to pyimpspec.
+_SAMPLING_CONTEXT: _ContextVar[Optional[Tuple[int, Optional[int], float]]] = _ContextVar(
+    "drt_sampling_context",
+    default=None,
+)
+_calculate_tr_rbf_credible_intervals = _tr_rbf._calculate_credible_intervals
+_perform_bht_attempts = _bht._perform_attempts
+
+# The number of samples that pyimpspec discards from the start of its single
+# chain in addition to the starting point. The chains used here start from
+# the same point (i.e., the solution), so the burn-in is split between them
+# but each chain still discards at least _MIN_BURN_IN samples. For example,
+# eight chains discard 800 samples in total compared to 500 in pyimpspec.
+_BURN_IN: int = 500
+_MIN_BURN_IN: int = 100
+_MAX_CHAINS: int = 8
+_NUM_ROUNDS: int = 5
+
+
+def _generate_seed(entropy: int, *spawn_key: int) -> int:
+    return int(_SeedSequence(entropy, spawn_key=spawn_key).generate_state(1)[0])
+
+
+def _sample_truncated_gaussians_process(args: tuple) -> _NDArray[_float64]:
+    Sigma, mu, initial_X, num_samples, seed = args
+    # pyimpspec draws the velocities using the legacy global generator.
+    state: tuple = _get_rng_state()
+    _seed_rng(seed)
+    try:
+        return _tr_rbf._generate_truncated_multivariate_gaussians(
+            _eye(initial_X.shape[0], dtype=_float64),
+            _finfo(float).eps * _ones(mu.shape[0], dtype=_float64),
+            Sigma,
+            mu,
+            initial_X,
+            True,
+            num_samples,
+        )
+    finally:
+        _set_rng_state(state)
+
+
+def _calculate_credible_intervals_in_parallel(
+    num_RL: int,
+    num_samples: int,
+    mu: _NDArray[_float64],
+    Sigma_inv: _NDArray[_float64],
+    x: _NDArray[_float64],
+    tau_fine: _NDArray[_float64],
+    tau: _NDArray[_float64],
+    epsilon: float,
+    rbf_type: str,
+    timeout: int,
+    prog: _Progress,
+) -> Tuple[_NDArray[_float64], _NDArray[_float64], _NDArray[_float64]]:
+    context: Optional[Tuple[int, Optional[int], float]] = _SAMPLING_CONTEXT.get()
+    if context is None:
+        return _calculate_tr_rbf_credible_intervals(
+            num_RL,
+            num_samples,
+            mu,
+            Sigma_inv,
+            x,
+            tau_fine,
+            tau,
+            epsilon,
+            rbf_type,
+            timeout,
+            prog,
+        )
+
+    num_procs, seed, tolerance = context
+    mu = mu[num_RL:]
+    L_Sigma_inv: _NDArray[_float64] = _cholesky(Sigma_inv[num_RL:, num_RL:])
+    L_Sigma_agm: _NDArray[_float64] = _inv(L_Sigma_inv)
+    Sigma: _NDArray[_float64] = L_Sigma_agm.T @ L_Sigma_agm
+
+    # The samples are drawn using independent chains that each start from the
+    # solution and are advanced in rounds so that the progress can be reported
+    # and the intervals can be checked for convergence between the rounds.
+    num_chains: int = max(1, min(num_procs, _MAX_CHAINS))
+    burn_in: int = max(_BURN_IN // num_chains, _MIN_BURN_IN)
+    num_per_chain: int = int(_ceil(max(num_samples - _BURN_IN - 1, 1) / num_chains))
+    round_sizes: List[int] = [
+        int(_) for _ in _diff(_linspace(0, num_per_chain, _NUM_ROUNDS + 1).round()) if _ > 0
+    ]
+    num_total: int = num_chains * (burn_in + num_per_chain)
+    entropy: int = _SeedSequence(seed).entropy
+
+    states: List[_NDArray[_float64]] = [x] * num_chains
+    samples: List[_NDArray[_float64]] = []
+    previous_bounds: Optional[Tuple[_NDArray[_float64], _NDArray[_float64]]] = None
+    num_collected: int = 0
+    num_steps: int = 0
+    start: float = _time()
+
+    with (
+        _get_context(method="spawn").Pool(num_chains)
+        if num_chains > 1
+        else _nullcontext()
+    ) as pool:
+        map_function: Callable = pool.imap if pool is not None else map
+        r: int
+        size: int
+        for r, size in enumerate(round_sizes):
+            args = (
+                (
+                    Sigma,
+                    mu,
+                    states[c],
+                    size + (burn_in + 1 if r == 0 else 1),
+                    _generate_seed(entropy, c, r),
+                )
+                for c in range(0, num_chains)
+            )
+
+            c: int
+            Xs: _NDArray[_float64]
+            for c, Xs in enumerate(map_function(_sample_truncated_gaussians_process, args)):
+                states[c] = Xs[:, -1]
+                samples.append(Xs[:, burn_in + 1 if r == 0 else 1:])
+                num_collected += Xs.shape[1] - 1
+
+                duration: float = _time() - start
+                if timeout > 0 and duration >= timeout:
+                    raise _pyimpspec.DRTError(
+                        "Timed out while calculating credible intervals! Adjust the timeout limit and try again."
+                    )
+
+                status: str = f"{num_collected}/{num_total} samples ({_format_eta(duration / num_collected * (num_total - num_collected))} remaining"
+                if timeout > 0:
+                    status += f", timing out in {_format_eta(timeout - duration)}"
+
+                step: int = min(num_samples * num_collected // num_total, num_samples) - num_steps
+                num_steps += step
+                prog.set_message(status + ")", force=False)
+                prog.increment(step=step)
+
+            X: _NDArray[_float64] = _hstack(samples)
+            bounds: Tuple[_NDArray[_float64], _NDArray[_float64]] = (
+                _quantile(X, 0.005, axis=1),
+                _quantile(X, 0.995, axis=1),
+            )
+            if tolerance > 0.0 and previous_bounds is not None:
+                scale: float = max(abs(bounds[1]).max(), _finfo(float).eps)
+                change: float = max(
+                    abs(bounds[0] - previous_bounds[0]).max(),
+                    abs(bounds[1] - previous_bounds[1]).max(),
+                ) / scale
+                if change < tolerance:
+                    break
+
+            previous_bounds = bounds
+
+    return (
+        _tr_rbf._x_to_gamma(_mean(X, axis=1), tau_fine, tau, epsilon, rbf_type)[1],
+        _tr_rbf._x_to_gamma(bounds[0], tau_fine, tau, epsilon, rbf_type)[1],
+        _tr_rbf._x_to_gamma(bounds[1], tau_fine, tau, epsilon, rbf_type)[1],
+    )
+
+
+def _perform_attempts_in_parallel(
+    w: _NDArray[_float64],
+    Z: _NDArray[_complex128],
+    A_re: _NDArray[_float64],
+    A_im: _NDArray[_float64],
+    A_H_re: _NDArray[_float64],
+    A_H_im: _NDArray[_float64],
+    num_freqs: int,
+    num_taus: int,
+    maximum_symmetry: float,
+    tau_fine: _NDArray[_float64],
+    tau: _NDArray[_float64],
+    epsilon: float,
+    rbf_type: str,
+    derivative_order: int,
+    num_attempts: int,
+    num_procs: int,
+) -> tuple:
+    context: Optional[Tuple[int, Optional[int], float]] = _SAMPLING_CONTEXT.get()
+    if context is None:
+        return _perform_bht_attempts(
+            w,
+            Z,
+            A_re,
+            A_im,
+            A_H_re,
+            A_H_im,
+            num_freqs,
+            num_taus,
+            maximum_symmetry,
+            tau_fine,
+            tau,
+            epsilon,
+            rbf_type,
+            derivative_order,
+            num_attempts,
+            num_procs,
+        )
+
+    num_procs, seed, tolerance = context
+    L: _NDArray[_float64] = _bht._compute_L(tau, derivative_order)
+    entropy: int = _SeedSequence(seed).entropy
+
+    # Each attempt gets its own seed for the initial hyperparameters and the
+    # results are processed in order so that the outcome does not depend on
+    # which of the processes finishes first.
+    args = (
+        (
+            10 ** (6 * _default_rng(_generate_seed(entropy, i)).random((3, 1)) - 3),
+            w,
+            Z,
+            A_re,
+            A_im,
+            A_H_re,
+            A_H_im,
+            L,
+            num_freqs,
+            num_taus,
+            maximum_symmetry,
+            tau_fine,
+            tau,
+            epsilon,
+            rbf_type,
+        )
+        for i in range(0, num_attempts)
+    )
+
+    results: List[tuple] = []
+    errors: List[Exception] = []
+
+    prog: _Progress
+    with _Progress("Calculating Hilbert transforms", total=num_attempts + 1) as prog:
+        num_workers: int = min(num_procs, num_attempts)
+        with (
+            _get_context(method="spawn").Pool(num_workers)
+            if num_workers > 1
+            else _nullcontext()
+        ) as pool:
+            map_function: Callable = pool.imap if pool is not None else map
+            for i, res in enumerate(map_function(_bht._hilbert_transform_process, args)):
+                if isinstance(res, Exception):
+                    errors.append(res)
+                elif res is not None:
+                    results.append(res)
+
+                status: str = f"{i + 1}/{num_attempts} attempts"
+                if len(results) > 0:
+                    results.sort(key=lambda _: _[0])
+                    status += f", best pseudo chi-squared: {results[0][0]:.3e}"
+
+                prog.set_message(f"Calculating Hilbert transforms ({status})", force=False)
+                prog.increment()
+
+                # Two independent attempts reaching the same optimum is taken
+                # to mean that further attempts are unlikely to improve on it.
+                if (
+                    tolerance > 0.0
+                    and len(results) > 1
+                    and results[1][0] - results[0][0] <= tolerance * results[0][0]
+                ):
+                    break
+
+    if len(results) == 0:
+        if len(errors) > 0:
+            raise errors.pop(0)
+        else:
+            raise _pyimpspec.DRTError("Failed to perform calculations! Try tweaking the settings.")
+
+    results.sort(key=lambda _: _[0])
+
+    return results[0]
+
+
+# The module, the name, the original, and the replacement of each function
+# that is patched by _patch_pyimpspec.
+_PATCHES: List[Tuple[object, str, Callable, Callable]] = [
+    (_tr_rbf, "_assemble_A_matrix", _assemble_tr_rbf_A_matrix, _cached_tr_rbf_A_matrix),
+    (_tr_rbf, "_assemble_M_matrix", _assemble_tr_rbf_M_matrix, _cached_tr_rbf_M_matrix),
+    (_tr_nnls, "_generate_A_matrix", _generate_tr_nnls_A_matrix, _cached_tr_nnls_A_matrix),
+    (_tr_rbf, "_calculate_credible_intervals", _calculate_tr_rbf_credible_intervals, _calculate_credible_intervals_in_parallel),
+    (_bht, "_perform_attempts", _perform_bht_attempts, _perform_attempts_in_parallel),
+]
+_PATCH_LOCK: _Lock = _Lock()
+_NUM_PATCHED_CALLS: int = 0
+
+
+@_contextmanager
+def _patch_pyimpspec():
+    # Replaces the functions in pyimpspec for the duration of a call. Calls
+    # may overlap (e.g., when performed on different threads), so the
+    # originals are only restored once the last of the calls has finished.
+    global _NUM_PATCHED_CALLS
+    with _PATCH_LOCK:
+        if _NUM_PATCHED_CALLS == 0:
+            for module, name, _, replacement in _PATCHES:
+                setattr(module, name, replacement)
+        _NUM_PATCHED_CALLS += 1
+
+    try:
+        yield
+    finally:
+        with _PATCH_LOCK:
+            _NUM_PATCHED_CALLS -= 1
+            if _NUM_PATCHED_CALLS == 0:
+                for module, name, original, _ in _PATCHES:
+                    setattr(module, name, original)
+
+
+@_use_shared_pool()
 def calculate_drt(
     data: DataSet,
     settings: DRTSettings,
     num_procs: int = -1,
+    parallel_sampling: bool = False,
+    seed: Optional[int] = None,
+    convergence_tolerance: float = 0.0,
 ) -> DRTResult:
     """
     Wrapper for the `pyimpspec.calculate_drt` function.
@@ -76,6 +571,23 @@ def calculate_drt(
         The maximum number of processes to use.
         A value less than 1 will result in an attempt to automatically figure out a suitable value.
         Negative values are used as offsets relative to the number of cores detected.
+
+    parallel_sampling: bool, optional
+        If True, then the samples used to estimate the credible intervals (TR-RBF method) are drawn using multiple chains that are distributed across the processes, and the attempts (BHT method) are performed using deterministic initial values.
+        The progress is reported after each chunk of samples or attempt.
+        The burn-in of 500 samples is split between the chains, but each chain discards at least 100 samples (i.e., up to 800 samples in total when using eight chains).
+
+    seed: Optional[int], optional
+        The seed used to generate the seeds of the chains and attempts when `parallel_sampling` is enabled.
+        The results are reproducible when the same seed and number of processes are used.
+
+    convergence_tolerance: float, optional
+        If greater than zero and `parallel_sampling` is enabled, then the sampling is stopped early once the largest change of the credible intervals between two rounds of sampling, relative to the largest upper bound, is smaller than this value.
+        In the case of the BHT method, the attempts are stopped early once the two best attempts have pseudo chi-squared values that differ by less than this value (relative to the best value).
+
+    Returns
+    -------
+    DRTResult
     """
     if settings.method == DRTMethod.MRQ_FIT:
         assert settings.fit is not None, "A fitted circuit has not been provided!"
@@ -84,27 +596,49 @@ def calculate_drt(
     if settings.method is DRTMethod.TR_NNLS and settings.tr_nnls_lambda_method in (TRNNLSLambdaMethod.CUSTOM, TRNNLSLambdaMethod.LC):
         lambda_value = _tr_nnls_lambda_method_to_value[settings.tr_nnls_lambda_method]
 
-    result: _pyimpspec.DRTResult = _pyimpspec.calculate_drt(
-        data=data,
-        method=_drt_method_to_value[settings.method],
-        mode=_drt_mode_to_value[settings.mode],
-        lambda_value=lambda_value,
-        cross_validation=_cross_validation_method_to_value.get(settings.cross_validation_method, ""),
-        rbf_type=_rbf_type_to_value[settings.rbf_type],
-        derivative_order=settings.derivative_order,
-        rbf_shape=_rbf_shape_to_value[settings.rbf_shape],
-        shape_coeff=settings.shape_coeff,
-        inductance=settings.inductance,
-        credible_intervals=settings.credible_intervals,
-        num_samples=settings.num_samples,
-        num_attempts=settings.num_attempts,
-        maximum_symmetry=settings.maximum_symmetry,
-        circuit=settings.fit.circuit if settings.method == DRTMethod.MRQ_FIT else None,
-        fit=settings.fit if settings.method == DRTMethod.MRQ_FIT else None,
-        gaussian_width=settings.gaussian_width,
-        timeout=settings.timeout,
-        num_procs=num_procs,
-    )
+    if not (convergence_tolerance >= 0.0):
+        raise ValueError(f"Expected {convergence_tolerance=} >= 0.0")
+
+    if num_procs < 1:
+        num_procs = max((_pyimpspec.get_default_num_procs() - abs(num_procs), 1))
+
+    sampling_context: Optional[Tuple[int, Optional[int], float]] = None
+    if parallel_sampling:
+        sampling_context = (num_procs, seed, convergence_tolerance)
+
+    # The processes are only used by pyimpspec to assemble the A matrices of
+    # the TR-RBF method so there is no point in spawning them again once the
+    # matrices have been cached.
+    if settings.method == DRTMethod.TR_RBF and _prepare_tr_rbf_A_matrices(data, settings, num_procs):
+        num_procs = 1
+
+    token = _SAMPLING_CONTEXT.set(sampling_context)
+    try:
+        with _patch_pyimpspec():
+            result: _pyimpspec.DRTResult = _pyimpspec.calculate_drt(
+                data=data,
+                method=_drt_method_to_value[settings.method],
+                mode=_drt_mode_to_value[settings.mode],
+                lambda_value=lambda_value,
+                cross_validation=_cross_validation_method_to_value.get(settings.cross_validation_method, ""),
+                rbf_type=_rbf_type_to_value[settings.rbf_type],
+                derivative_order=settings.derivative_order,
+                rbf_shape=_rbf_shape_to_value[settings.rbf_shape],
+                shape_coeff=settings.shape_coeff,
+                inductance=settings.inductance,
+                credible_intervals=settings.credible_intervals,
+                num_samples=settings.num_samples,
+                num_attempts=settings.num_attempts,
+                maximum_symmetry=settings.maximum_symmetry,
+                circuit=settings.fit.circuit if settings.method == DRTMethod.MRQ_FIT else None,
+                fit=settings.fit if settings.method == DRTMethod.MRQ_FIT else None,
+                gaussian_width=settings.gaussian_width,
+                timeout=settings.timeout,
+                num_procs=num_procs,
+            )
+    finally:
+        _SAMPLING_CONTEXT.reset(token)
+
     real_gammas: _pyimpspec.Gammas = result.real_gammas if hasattr(result, "real_gammas") else result.gammas
     imaginary_gammas: _pyimpspec.Gammas = result.imaginary_gammas if hasattr(result, "imaginary_gammas") else array([])
 
@@ -133,3 +667,393 @@ def calculate_drt(
         mask=mask,
         settings=settings,
     )
+
+
+def _generate_series_time_constants(
+    data_sets: List[DataSet],
+    num_per_decade: int,
+) -> _NDArray[_float64]:
+    f_min: float = min(map(lambda _: _.get_frequencies().min(), data_sets))
+    f_max: float = max(map(lambda _: _.get_frequencies().max(), data_sets))
+    tau_min: float = 1 / (2 * _pi * f_max)
+    tau_max: float = 1 / (2 * _pi * f_min)
+    num_taus: int = max(int(_ceil(_log(tau_max / tau_min) * num_per_decade)) + 1, 2)
+
+    return _logspace(_log(tau_min), _log(tau_max), num_taus)
+
+
+def _solve_nonnegative(
+    M: _NDArray[_float64],
+    y: _NDArray[_float64],
+    x_guess: Optional[_NDArray[_float64]],
+) -> _NDArray[_float64]:
+    # The set of positive variables in the solution of a neighboring data set
+    # is tried first. If the solution of the unconstrained problem restricted
+    # to that set is positive and satisfies the Karush-Kuhn-Tucker conditions,
+    # then it is also the solution of the non-negative least squares problem.
+    if x_guess is not None and (x_guess > 0.0).any():
+        passive: _NDArray = x_guess > 0.0
+        x: _NDArray[_float64] = _zeros(M.shape[1], dtype=_float64)
+        x[passive] = _lstsq(M[:, passive], y, rcond=None)[0]
+        if (x[passive] > 0.0).all():
+            gradient: _NDArray[_float64] = M.T @ (y - M @ x)
+            tolerance: float = 1e-10 * max(abs(M.T @ y).max(), 1.0)
+            if (passive | (gradient <= tolerance)).all():
+                return x
+
+    return _nnls(M, y, maxiter=50 * M.shape[1])[0]
+
+
+def calculate_drt_series(
+    data_sets: List[DataSet],
+    settings: DRTSeriesSettings,
+) -> DRTSeriesResult:
+    """
+    Calculate the distributions of relaxation times of an ordered series of data sets (e.g., spectra recorded over time) using a common grid of time constants.
+
+    Each distribution is obtained using non-negative, Tikhonov-regularized least squares fitting where the time constants are spaced evenly on a logarithmic scale.
+    The data sets are analyzed in order and each solution is used as the starting point for the next one, which is significantly faster than analyzing the data sets independently when consecutive spectra are similar.
+    An optional penalty for differences between the distributions of consecutive data sets can be used to suppress noise and to keep the peaks aligned.
+
+    Parameters
+    ----------
+    data_sets: List[DataSet]
+        The data sets to analyze in order.
+        The frequencies of the data sets may differ but the time constants span the range of all of the frequencies.
+
+    settings: DRTSeriesSettings
+        The settings that determine how the analysis is performed.
+
+    Returns
+    -------
+    DRTSeriesResult
+    """
+    if not isinstance(settings, DRTSeriesSettings):
+        raise TypeError(f"Expected a DRTSeriesSettings instance instead of {settings=}")
+    elif not (settings.lambda_value > 0.0):
+        raise ValueError(f"Expected {settings.lambda_value=} > 0.0")
+    elif settings.derivative_order not in (0, 1, 2):
+        raise ValueError(f"Expected {settings.derivative_order=} to be 0, 1, or 2")
+    elif settings.smoothness < 0.0:
+        raise ValueError(f"Expected {settings.smoothness=} >= 0.0")
+    elif settings.num_per_decade < 1:
+        raise ValueError(f"Expected {settings.num_per_decade=} > 0")
+
+    if not isinstance(data_sets, list):
+        raise TypeError(f"Expected a list instead of {data_sets=}")
+    elif len(data_sets) == 0:
+        raise ValueError("Expected at least one data set")
+    elif not all(map(lambda d: isinstance(d, DataSet), data_sets)):
+        raise TypeError(f"Expected only DataSet instances instead of {data_sets=}")
+    elif any(map(lambda d: d.get_num_points() < 2, data_sets)):
+        raise ValueError("Expected at least two unmasked data points in each data set")
+
+    tau: _NDArray[_float64] = _generate_series_time_constants(
+        data_sets,
+        settings.num_per_decade,
+    )
+    num_taus: int = len(tau)
+
+    # Trapezoidal weights for the integral over ln(tau)
+    delta_ln_tau: _NDArray[_float64] = _full(
+        num_taus,
+        _ln(tau[1] / tau[0]),
+        dtype=_float64,
+    )
+    delta_ln_tau[0] /= 2
+    delta_ln_tau[-1] /= 2
+
+    use_real: bool = settings.mode != DRTMode.IMAGINARY
+    use_imaginary: bool = settings.mode != DRTMode.REAL
+    inductance: bool = settings.inductance and use_imaginary
+
+    # The variables are the series resistance (if the real parts are used),
+    # the series inductance (optional), and the gamma values.
+    num_RL: int = int(use_real) + int(inductance)
+    D: _NDArray[_float64] = _diff(
+        _eye(num_taus, dtype=_float64),
+        n=settings.derivative_order,
+        axis=0,
+    )
+
+    gammas: _NDArray[_float64] = _zeros((len(data_sets), num_taus), dtype=_float64)
+    series_resistances: _NDArray[_float64] = _zeros(len(data_sets), dtype=_float64)
+    inductances: _NDArray[_float64] = _zeros(len(data_sets), dtype=_float64)
+    pseudo_chisqrs: _NDArray[_float64] = _zeros(len(data_sets), dtype=_float64)
+
+    x: Optional[_NDArray[_float64]] = None
+    prog: _Progress
+    with _Progress("Calculating DRT series", total=len(data_sets) + 1) as prog:
+        i: int
+        data: DataSet
+        for i, data in enumerate(data_sets):
+            f: _NDArray[_float64] = data.get_frequencies()
+            Z_exp: _NDArray[_complex128] = data.get_impedances()
+            w: _NDArray[_float64] = 2 * _pi * f
+            wt: _NDArray[_float64] = w.reshape((-1, 1)) * tau
+            K: _NDArray[_complex128] = delta_ln_tau * (1 - 1j * wt) / (1 + wt**2)
+
+            A: _NDArray[_complex128] = _zeros((len(f), num_RL + num_taus), dtype=_complex128)
+            if use_real:
+                A[:, 0] = 1.0
+            if inductance:
+                A[:, num_RL - 1] = 1j * w
+            A[:, num_RL:] = K
+
+            # The residuals are relative to the magnitudes of the impedances
+            # while the penalties are relative to their mean magnitude.
+            weight: _NDArray[_float64] = 1 / abs(Z_exp)
+            scale: float = abs(Z_exp).mean()
+            rows: List[_NDArray[_float64]] = []
+            targets: List[_NDArray[_float64]] = []
+            if use_real:
+                rows.append(weight.reshape((-1, 1)) * A.real)
+                targets.append(weight * Z_exp.real)
+            if use_imaginary:
+                rows.append(weight.reshape((-1, 1)) * A.imag)
+                targets.append(weight * Z_exp.imag)
+
+            penalty: _NDArray[_float64] = _zeros((D.shape[0], num_RL + num_taus), dtype=_float64)
+            penalty[:, num_RL:] = (settings.lambda_value**0.5 / scale) * D
+            rows.append(penalty)
+            targets.append(_zeros(D.shape[0], dtype=_float64))
+
+            if settings.smoothness > 0.0 and x is not None:
+                coupling: _NDArray[_float64] = _zeros((num_taus, num_RL + num_taus), dtype=_float64)
+                coupling[:, num_RL:] = (settings.smoothness**0.5 / scale) * _eye(num_taus)
+                rows.append(coupling)
+                targets.append((settings.smoothness**0.5 / scale) * x[num_RL:])
+
+            x = _solve_nonnegative(_vstack(rows), _concatenate(targets), x)
+
+            Z_fit: _NDArray[_complex128] = A @ x
+            if not use_real:
+                # The series resistance cannot be determined from the
+                # imaginary parts so the weighted mean of the real parts of
+                # the residuals is used instead.
+                series_resistances[i] = (weight**2 * (Z_exp.real - Z_fit.real)).sum() / (weight**2).sum()
+                Z_fit = Z_fit + series_resistances[i]
+            else:
+                series_resistances[i] = x[0]
+
+            if inductance:
+                inductances[i] = x[num_RL - 1]
+
+            gammas[i, :] = x[num_RL:]
+            pseudo_chisqrs[i] = (weight**2 * abs(Z_exp - Z_fit) ** 2).sum()
+            prog.increment()
+
+    return DRTSeriesResult(
+        uuid=_uuid4().hex,
+        timestamp=_time(),
+        time_constants=tau,
+        gammas=gammas,
+        labels=list(map(lambda _: _.get_label(), data_sets)),
+        series_resistances=series_resistances,
+        inductances=inductances,
+        pseudo_chisqrs=pseudo_chisqrs,
+        settings=settings,
+    )
+
+
+def _link_peaks(
+    indices: _NDArray,
+    log_taus: _NDArray[_float64],
+    tolerance: float,
+    max_gap: int,
+    first_track: int,
+) -> _NDArray:
+    # The peaks must be sorted by index. Each peak is linked to the closest
+    # (on a logarithmic scale) unlinked track whose most recent peak is within
+    # the tolerance. Peaks that cannot be linked start new tracks.
+    tracks: _NDArray = _full(indices.size, -1, dtype=int)
+    active_ids: List[int] = []
+    active_log_taus: List[float] = []
+    active_indices: List[int] = []
+    next_track: int = first_track
+
+    starts: _NDArray = _nonzero(_concatenate(([True], _diff(indices) != 0)))[0]
+    ends: _NDArray = _concatenate((starts[1:], [indices.size]))
+    start: int
+    end: int
+    for start, end in zip(starts, ends):
+        index: int = indices[start]
+        keep: List[int] = [
+            i for i, last in enumerate(active_indices) if index - last - 1 <= max_gap
+        ]
+        active_ids = [active_ids[i] for i in keep]
+        active_log_taus = [active_log_taus[i] for i in keep]
+        active_indices = [active_indices[i] for i in keep]
+
+        if len(active_ids) > 0:
+            distances: _NDArray[_float64] = abs(
+                log_taus[start:end].reshape((-1, 1))
+                - array(active_log_taus).reshape((1, -1))
+            )
+            peaks: _NDArray
+            candidates: _NDArray
+            peaks, candidates = _nonzero(distances <= tolerance)
+            order: _NDArray = _argsort(distances[peaks, candidates], kind="stable")
+            linked_tracks: set = set()
+            for i, j in zip(peaks[order], candidates[order]):
+                if tracks[start + i] >= 0 or j in linked_tracks:
+                    continue
+
+                linked_tracks.add(j)
+                tracks[start + i] = active_ids[j]
+                active_log_taus[j] = log_taus[start + i]
+                active_indices[j] = index
+
+        for i in range(start, end):
+            if tracks[i] >= 0:
+                continue
+
+            tracks[i] = next_track
+            active_ids.append(next_track)
+            active_log_taus.append(log_taus[i])
+            active_indices.append(index)
+            next_track += 1
+
+    return tracks
+
+
+def extract_drt_peaks(
+    drts: Union[List[DRTResult], DRTSeriesResult],
+    threshold: float = 0.0,
+    tolerance: float = 0.25,
+    max_gap: int = 0,
+) -> _DataFrame:
+    """
+    Extract the peaks from an ordered series of DRT results (e.g., the results of spectra recorded over time) and track how the peaks move from one result to the next.
+
+    The peaks of all of the results are found in a single vectorized pass per group of results that share the same time constants.
+    Each peak is then linked to the closest peak (in terms of the logarithm of the time constant) of the previous result(s), which makes it possible to plot, e.g., the trend of a specific peak over thousands of results.
+
+    Parameters
+    ----------
+    drts: Union[List[DRTResult], DRTSeriesResult]
+        The DRT results in order or the result of a DRT series analysis.
+
+    threshold: float, optional
+        The minimum peak height threshold (relative to the height of the tallest peak of the same result) for a peak to be included.
+
+    tolerance: float, optional
+        The maximum distance, in decades, between the time constants of two peaks for them to be considered the same peak.
+
+    max_gap: int, optional
+        The maximum number of consecutive results where a peak may be missing (e.g., due to noise) before it is considered a new peak when it reappears.
+
+    Returns
+    -------
+    DataFrame
+        A table with one row per peak and the following columns: the index of the result in the series, the label of the result, the component of the distribution (real or imaginary), the time constant, the gamma value, the gamma value relative to the tallest peak, and the identifier of the track that the peak has been assigned to.
+        The imaginary component is only present in the case of results obtained using the Bayesian Hilbert transform method.
+    """
+    if not (0.0 <= threshold <= 1.0):
+        raise ValueError(f"Expected 0.0 <= {threshold=} <= 1.0")
+    elif not (tolerance >= 0.0):
+        raise ValueError(f"Expected {tolerance=} >= 0.0")
+    elif max_gap < 0:
+        raise ValueError(f"Expected {max_gap=} >= 0")
+
+    # Each group contains the component, the time constants, the indices and
+    # labels of the results, and the gamma values (one row per result).
+    groups: Dict[tuple, list] = {}
+    labels: List[str]
+    if isinstance(drts, DRTSeriesResult):
+        labels = drts.get_labels()
+        groups[("real", drts.time_constants.tobytes())] = [
+            "real",
+            drts.time_constants,
+            list(range(0, drts.get_num_spectra())),
+            [drts.gammas],
+        ]
+    elif isinstance(drts, list):
+        if not all(map(lambda _: isinstance(_, DRTResult), drts)):
+            raise TypeError(f"Expected only DRTResult instances instead of {drts=}")
+
+        labels = []
+        i: int
+        drt: DRTResult
+        for i, drt in enumerate(drts):
+            labels.append(drt.get_label())
+            component: str
+            gammas: _NDArray[_float64]
+            for component, gammas in (
+                ("real", drt.real_gammas),
+                ("imaginary", drt.imaginary_gammas),
+            ):
+                if gammas.size == 0:
+                    continue
+
+                key: tuple = (component, drt.time_constants.tobytes())
+                if key not in groups:
+                    groups[key] = [component, drt.time_constants, [], []]
+
+                groups[key][2].append(i)
+                groups[key][3].append(gammas.reshape((1, -1)))
+    else:
+        raise TypeError(f"Expected a list or a DRTSeriesResult instead of {drts=}")
+
+    components: List[_NDArray] = []
+    indices: List[_NDArray] = []
+    taus: List[_NDArray[_float64]] = []
+    peak_gammas: List[_NDArray[_float64]] = []
+    relative_gammas: List[_NDArray[_float64]] = []
+    for component, time_constants, group_indices, group_gammas in groups.values():
+        G: _NDArray[_float64] = _vstack(group_gammas)
+        rows: _NDArray
+        columns: _NDArray
+        rows, columns = _find_peak_indices(G)
+        values: _NDArray[_float64] = G[rows, columns]
+        relative: _NDArray[_float64] = values / G.max(axis=1)[rows]
+        mask: _NDArray = (relative > threshold) & (values > 0.0)
+
+        components.append(_full(mask.sum(), component, dtype=object))
+        indices.append(array(group_indices, dtype=int)[rows[mask]])
+        taus.append(time_constants[columns[mask]])
+        peak_gammas.append(values[mask])
+        relative_gammas.append(relative[mask])
+
+    component_column: _NDArray = _concatenate(components or [array([], dtype=object)])
+    index_column: _NDArray = _concatenate(indices or [array([], dtype=int)])
+    tau_column: _NDArray[_float64] = _concatenate(taus or [array([], dtype=_float64)])
+    gamma_column: _NDArray[_float64] = _concatenate(peak_gammas or [array([], dtype=_float64)])
+    relative_column: _NDArray[_float64] = _concatenate(
+        relative_gammas or [array([], dtype=_float64)]
+    )
+
+    order: _NDArray = _lexsort((tau_column, index_column, component_column != "real"))
+    component_column = component_column[order]
+    index_column = index_column[order]
+    tau_column = tau_column[order]
+    gamma_column = gamma_column[order]
+    relative_column = relative_column[order]
+
+    track_column: _NDArray = _full(index_column.size, -1, dtype=int)
+    num_tracks: int = 0
+    for component in ("real", "imaginary"):
+        mask = component_column == component
+        if not mask.any():
+            continue
+
+        track_column[mask] = _link_peaks(
+            index_column[mask],
+            _log(tau_column[mask]),
+            tolerance,
+            max_gap,
+            num_tracks,
+        )
+        num_tracks = track_column.max() + 1
+
+    return _DataFrame.from_dict(
+        {
+            "Index": index_column,
+            "Label": [labels[i] for i in index_column],
+            "Component": component_column,
+            "tau (s)": tau_column,
+            "gamma (ohm)": gamma_column,
+            "Relative gamma": relative_column,
+            "Track": track_column,
+        }
+    )
@@ -17,26 +17,67 @@
 # The licenses of DearEIS' dependencies and/or sources of portions of code are included in
 # the LICENSES folder.
 
-from time import time as _time
+from dataclasses import replace as _replace
+from multiprocessing.context import TimeoutError as _MPTimeoutError
+from time import (
+    perf_counter as _perf_counter,
+    time as _time,
+)
 from typing import (
+    Any,
+    Callable,
     Dict,
+    Iterable,
+    Iterator,
+    List,
     Optional,
+    Set,
+    Tuple,
 )
 from uuid import uuid4 as _uuid4
 from numpy import (
+    array as _array,
+    bool_ as _bool_,
+    complex128 as _complex128,
+    delete as _delete,
+    float64 as _float64,
     integer as _integer,
+    isfinite as _isfinite,
     issubdtype as _issubdtype,
+    log10 as _log10,
+    percentile as _percentile,
+    sqrt as _sqrt,
+)
+from numpy.typing import NDArray as _NDArray
+from scipy.stats import norm as _norm
+from numpy.random import (
+    Generator as _Generator,
+    default_rng as _default_rng,
 )
 import pyimpspec as _pyimpspec
 from pyimpspec import Circuit
+from pyimpspec.progress import Progress as _Progress
+from deareis.api.pool import (
+    get_shared_context as _get_context,
+    use_shared_pool as _use_shared_pool,
+)
+from deareis.api.shared_arrays import (
+    SharedArrays as _SharedArrays,
+    SharedArraysHandle as _SharedArraysHandle,
+    attach_shared_arrays as _attach_shared_arrays,
+)
 from deareis.data import (
     DataSet,
+    FitConfidenceIntervals,
     FitResult,
     FitSettings,
     FittedParameter,
+    MultiStartSummary,
 )
+from deareis.data.cache import CIRCUIT_CACHE as _CIRCUIT_CACHE
 from deareis.enums import (
     CNLSMethod,
+    ResamplingMethod,
     Weight,
     value_to_cnls_method as _value_to_cnls_method,
     value_to_weight as _value_to_weight,
@@ -45,6 +86,54 @@ from deareis.enums import (
 )
 
 
+def _to_fit_result(
+    result: _pyimpspec.FitResult,
+    data: DataSet,
+    settings: FitSettings,
+) -> FitResult:
+    method: Optional[CNLSMethod] = _value_to_cnls_method.get(result.method)
+    weight: Optional[Weight] = _value_to_weight.get(result.weight)
+    assert method is not None
+    assert weight is not None
+
+    parameters: Dict[str, Dict[str, FittedParameter]] = {}
+    for element_symbol in result.parameters:
+        parameters[element_symbol] = {}
+        for parameter_symbol, param in result.parameters[element_symbol].items():
+            parameters[element_symbol][parameter_symbol] = FittedParameter(
+                value=param.value,
+                stderr=param.stderr,
+                fixed=param.fixed,
+                unit=param.unit,
+            )
+
+    time: float = _time()
+    mask: Dict[int, bool] = data.get_mask().copy()
+
+    return FitResult(
+        uuid=_uuid4().hex,
+        timestamp=time,
+        circuit=result.circuit,
+        parameters=parameters,
+        frequencies=result.frequencies,
+        impedances=result.impedances,
+        residuals=result.residuals,
+        mask=mask,
+        pseudo_chisqr=result.pseudo_chisqr,
+        chisqr=result.minimizer_result.chisqr,
+        red_chisqr=result.minimizer_result.redchi,
+        aic=result.minimizer_result.aic,
+        bic=result.minimizer_result.bic,
+        ndata=result.minimizer_result.ndata,
+        nfree=result.minimizer_result.nfree,
+        nfev=result.minimizer_result.nfev,
+        method=method,
+        weight=weight,
+        settings=settings,
+    )
+
+
+@_use_shared_pool()
 def fit_circuit(
     data: DataSet,
     settings: FitSettings,
@@ -76,7 +165,7 @@ def fit_circuit(
     assert type(settings) is FitSettings, settings
     assert _issubdtype(type(num_procs), _integer), num_procs
 
-    circuit: Circuit = _pyimpspec.parse_cdc(settings.cdc)
+    circuit: Circuit = _CIRCUIT_CACHE.parse(settings.cdc)
     result: _pyimpspec.FitResult = _pyimpspec.fit_circuit(
         circuit=circuit,
         data=data,
@@ -86,43 +175,540 @@ def fit_circuit(
         num_procs=num_procs,
         timeout=settings.timeout,
     )
-    method: Optional[CNLSMethod] = _value_to_cnls_method.get(result.method)
-    weight: Optional[Weight] = _value_to_weight.get(result.weight)
-    assert method is not None
-    assert weight is not None
+    return _to_fit_result(result, data, settings)
 
-    parameters: Dict[str, Dict[str, FittedParameter]] = {}
-    for element_symbol in result.parameters:
-        parameters[element_symbol] = {}
-        for parameter_symbol, param in result.parameters[element_symbol].items():
-            parameters[element_symbol][parameter_symbol] = FittedParameter(
-                value=param.value,
-                stderr=param.stderr,
-                fixed=param.fixed,
-                unit=param.unit,
+
+def _sample_log_uniform(
+    value: float,
+    lower: float,
+    upper: float,
+    decades: float,
+    rng: _Generator,
+) -> float:
+    if value == 0.0:
+        return value
+
+    sign: float = 1.0 if value > 0.0 else -1.0
+    magnitude: float = abs(value)
+    if sign > 0.0:
+        lower, upper = max(lower, 0.0), upper
+    else:
+        lower, upper = max(-upper, 0.0), -lower
+
+    low: float = max(magnitude * 10 ** (-decades), lower)
+    high: float = min(magnitude * 10 ** decades, upper)
+    if not (_isfinite(low) and _isfinite(high)) or low <= 0.0 or high <= low:
+        return value
+
+    return sign * 10 ** rng.uniform(_log10(low), _log10(high))
+
+
+def _generate_initial_cdcs(
+    cdc: str,
+    num_starts: int,
+    decades: float,
+    rng: _Generator,
+) -> List[str]:
+    # The initial values of every start are sampled around the values that
+    # were provided rather than around those of the previous start.
+    circuit: Circuit = _CIRCUIT_CACHE.parse(cdc)
+    originals: List[Tuple[Dict[str, float], Dict[str, float], Dict[str, float]]] = []
+    element: _pyimpspec.Element
+    for element in circuit.get_elements(recursive=True):
+        fixed: Dict[str, bool] = element.are_fixed()
+        originals.append(
+            (
+                {k: v for k, v in element.get_values().items() if not fixed[k]},
+                element.get_lower_limits(),
+                element.get_upper_limits(),
             )
+        )
 
-    time: float = _time()
-    mask: Dict[int, bool] = data.get_mask().copy()
+    # The first start always uses the initial values as they were provided.
+    cdcs: List[str] = [circuit.serialize()]
+    while len(cdcs) < num_starts:
+        circuit = _CIRCUIT_CACHE.parse(cdc)
+        values: Dict[str, float]
+        lower_limits: Dict[str, float]
+        upper_limits: Dict[str, float]
+        for element, (values, lower_limits, upper_limits) in zip(
+            circuit.get_elements(recursive=True),
+            originals,
+        ):
+            if values:
+                element.set_values(
+                    **{
+                        key: _sample_log_uniform(
+                            value,
+                            lower_limits[key],
+                            upper_limits[key],
+                            decades,
+                            rng,
+                        )
+                        for key, value in values.items()
+                    }
+                )
 
-    return FitResult(
-        uuid=_uuid4().hex,
-        timestamp=time,
-        circuit=result.circuit,
-        parameters=parameters,
-        frequencies=result.frequencies,
-        impedances=result.impedances,
-        residuals=result.residuals,
-        mask=mask,
-        pseudo_chisqr=result.pseudo_chisqr,
-        chisqr=result.minimizer_result.chisqr,
-        red_chisqr=result.minimizer_result.redchi,
-        aic=result.minimizer_result.aic,
-        bic=result.minimizer_result.bic,
-        ndata=result.minimizer_result.ndata,
-        nfree=result.minimizer_result.nfree,
-        nfev=result.minimizer_result.nfev,
+        cdcs.append(circuit.serialize())
+
+    return cdcs
+
+
+def _multistart_process(
+    args: Tuple[int, str, _SharedArraysHandle, FitSettings, int],
+) -> Tuple[int, str, Optional[FitResult]]:
+    i: int
+    cdc: str
+    handle: _SharedArraysHandle
+    settings: FitSettings
+    timeout: int
+    i, cdc, handle, settings, timeout = args
+
+    arrays: Dict[str, _NDArray]
+    with _attach_shared_arrays(handle) as arrays:
+        data: DataSet = _pyimpspec.DataSet(
+            frequencies=arrays["f"].copy(),
+            impedances=arrays["Z"].copy(),
+            mask={int(j): True for j in arrays["mask"].nonzero()[0]},
+        )
+
+    try:
+        result: _pyimpspec.FitResult = _pyimpspec.fit_circuit(
+            circuit=_CIRCUIT_CACHE.parse(cdc),
+            data=data,
+            method=_cnls_method_to_value.get(settings.method, "auto"),
+            weight=_weight_to_value.get(settings.weight, "auto"),
+            max_nfev=settings.max_nfev,
+            num_procs=1,
+            timeout=timeout,
+        )
+    except Exception:
+        return (i, cdc, None)
+
+    return (i, cdc, _to_fit_result(result, data, _replace(settings, cdc=cdc)))
+
+
+def _get_remaining_time(
+    timeout: float,
+    pool_start: float,
+    completions: List[float],
+    finished: Set[int],
+    num_workers: int,
+    num_starts: int,
+) -> float:
+    # The fits are dispatched to the workers in order, so the k-th fit starts
+    # when the first worker is available after k - num_workers fits have
+    # finished. The fit that was started first among those that are still
+    # running determines the remaining time.
+    k: int
+    for k in range(min(len(completions) + num_workers, num_starts)):
+        if k in finished:
+            continue
+        start: float = pool_start if k < num_workers else completions[k - num_workers]
+        return start + timeout - _perf_counter()
+
+    return timeout
+
+
+def _map_with_timeout(
+    func: Callable[[tuple], Tuple[int, Any]],
+    args: Iterable[tuple],
+    num_tasks: int,
+    num_procs: int,
+    timeout: int,
+) -> Iterator[Tuple[int, Any]]:
+    # Yields the results, which start with the index of the task, as they
+    # become available. The worker processes cannot enforce the timeout
+    # themselves, so it is enforced here for each task when the tasks are run
+    # in parallel. The iteration stops early if a task times out.
+    if num_procs < 2 or num_tasks < 2:
+        yield from map(func, args)
+        return
+
+    num_workers: int = min(num_procs, num_tasks)
+    completions: List[float] = []
+    finished: Set[int] = set()
+    res: Tuple[int, Any]
+    with _get_context(method="spawn").Pool(num_workers) as pool:
+        pool_start: float = _perf_counter()
+        iterator = pool.imap_unordered(func, args, 1)
+        while True:
+            try:
+                if timeout > 0:
+                    res = iterator.next(
+                        timeout=max(
+                            _get_remaining_time(
+                                timeout,
+                                pool_start,
+                                completions,
+                                finished,
+                                num_workers,
+                                num_tasks,
+                            ),
+                            0.0,
+                        )
+                    )
+                else:
+                    res = iterator.next()
+            except (_MPTimeoutError, StopIteration):
+                return
+
+            completions.append(_perf_counter())
+            finished.add(res[0])
+            yield res
+
+
+def fit_circuit_multistart(
+    data: DataSet,
+    settings: FitSettings,
+    num_starts: int = 10,
+    decades: float = 1.0,
+    seed: Optional[int] = None,
+    num_procs: int = -1,
+) -> Tuple[FitResult, MultiStartSummary]:
+    """
+    Fit a circuit to a data set several times using different initial values and return the best result.
+
+    The first fit uses the initial values defined in the circuit description code of the settings.
+    The initial values of the other fits are sampled from log-uniform distributions that extend `decades` above and below the provided initial values and that are limited by the lower and upper limits of each parameter.
+    Fixed parameters and parameters with an initial value of zero are not varied.
+    The fits are performed in parallel and the settings of the returned result contain the circuit description code with the initial values that produced the best fit.
+
+    Parameters
+    ----------
+    data: DataSet
+        The data set that the circuit will be fitted to.
+
+    settings: FitSettings
+        The settings that determine the circuit and how the fit is performed.
+        The timeout, if any, is applied to each fit.
+
+    num_starts: int, optional
+        The number of sets of initial values to fit.
+
+    decades: float, optional
+        The number of decades above and below each initial value to sample from.
+
+    seed: Optional[int], optional
+        The seed to use when sampling initial values.
+
+    num_procs: int, optional
+        The maximum number of parallel processes to use.
+        A value less than 1 will result in an attempt to automatically figure out a suitable value.
+        Negative values are used as offsets relative to the number of cores detected.
+
+    Returns
+    -------
+    Tuple[FitResult, MultiStartSummary]
+    """
+    assert isinstance(data, _pyimpspec.DataSet), data
+    assert type(settings) is FitSettings, settings
+    assert _issubdtype(type(num_starts), _integer) and num_starts > 0, num_starts
+    assert isinstance(decades, (int, float)) and decades > 0.0, decades
+    assert seed is None or _issubdtype(type(seed), _integer), seed
+    assert _issubdtype(type(num_procs), _integer), num_procs
+    if num_procs < 1:
+        num_procs = max((_pyimpspec.get_default_num_procs() - abs(num_procs), 1))
+
+    _pyimpspec.analysis.fitting.validate_circuit(_CIRCUIT_CACHE.parse(settings.cdc))
+    cdcs: List[str] = _generate_initial_cdcs(
+        settings.cdc,
+        num_starts,
+        float(decades),
+        _default_rng(seed),
+    )
+    mask: Dict[int, bool] = data.get_mask()
+
+    fits: List[Tuple[str, FitResult]] = []
+    num_failed: int = 0
+    res: Tuple[int, str, Optional[FitResult]]
+    is_parallel: bool = num_procs > 1 and num_starts > 1
+    shared: _SharedArrays
+    prog: _Progress
+    with _SharedArrays(
+        {
+            "f": data.get_frequencies(masked=None),
+            "Z": data.get_impedances(masked=None),
+            "mask": _array(
+                [mask.get(i, False) for i in range(data.get_num_points(masked=None))],
+                dtype=_bool_,
+            ),
+        },
+        share=is_parallel,
+    ) as shared, _Progress(
+        "Performing multi-start fits",
+        # The final step is taken when the context is exited.
+        total=num_starts + 1,
+    ) as prog:
+        args = (
+            (i, cdc, shared.handle, settings, 0 if is_parallel else settings.timeout)
+            for i, cdc in enumerate(cdcs)
+        )
+        for res in _map_with_timeout(
+            _multistart_process,
+            args,
+            num_starts,
+            num_procs,
+            settings.timeout,
+        ):
+            if res[2] is None:
+                num_failed += 1
+            else:
+                fits.append((res[1], res[2]))
+
+            prog.increment()
+
+        if len(fits) + num_failed < num_starts:
+            # The remaining fits timed out.
+            num_failed = num_starts - len(fits)
+            prog.set(num_starts)
+
+    if not fits:
+        raise _pyimpspec.exceptions.FittingError("No valid results generated!")
+
+    fits.sort(key=lambda _: _[1].pseudo_chisqr)
+
+    return (
+        fits[0][1],
+        MultiStartSummary(
+            num_starts=num_starts,
+            pseudo_chisqrs=_array([_[1].pseudo_chisqr for _ in fits], dtype=_float64),
+            cdcs=[_[0] for _ in fits],
+            num_failed=num_failed,
+        ),
+    )
+
+
+def _resample_process(
+    args: Tuple[int, str, _SharedArraysHandle, str, str, int, int],
+) -> Tuple[int, Optional[Dict[str, Dict[str, float]]]]:
+    i: int
+    cdc: str
+    handle: _SharedArraysHandle
+    method: str
+    weight: str
+    max_nfev: int
+    timeout: int
+    i, cdc, handle, method, weight, max_nfev, timeout = args
+
+    # The impedances are either a 2D array of bootstrapped samples or the
+    # original impedances, which are refitted with one data point left out.
+    arrays: Dict[str, _NDArray]
+    f: _NDArray[_float64]
+    Z: _NDArray[_complex128]
+    with _attach_shared_arrays(handle) as arrays:
+        if arrays["Z"].ndim > 1:
+            f = arrays["f"].copy()
+            Z = arrays["Z"][i].copy()
+        else:
+            f = _delete(arrays["f"], i)
+            Z = _delete(arrays["Z"], i)
+
+    try:
+        result: _pyimpspec.FitResult = _pyimpspec.fit_circuit(
+            circuit=_CIRCUIT_CACHE.parse(cdc),
+            data=_pyimpspec.DataSet(frequencies=f, impedances=Z),
+            method=method,
+            weight=weight,
+            max_nfev=max_nfev,
+            num_procs=1,
+            timeout=timeout,
+        )
+    except Exception:
+        return (i, None)
+
+    return (
+        i,
+        {
+            element_label: {
+                parameter_label: param.value
+                for parameter_label, param in parameters.items()
+                if not param.fixed
+            }
+            for element_label, parameters in result.parameters.items()
+        },
+    )
+
+
+def calculate_confidence_intervals(
+    fit: FitResult,
+    data: DataSet,
+    method: ResamplingMethod = ResamplingMethod.BOOTSTRAP,
+    num_samples: int = 200,
+    confidence_level: float = 95.0,
+    seed: Optional[int] = None,
+    num_procs: int = -1,
+) -> FitConfidenceIntervals:
+    """
+    Estimate the confidence intervals of the fitted parameters by refitting resampled data in parallel.
+    The standard errors reported by the fitting routine are derived from the covariance matrix and may be unreliable when parameters are strongly correlated (e.g., the parameters of a constant phase element in parallel with a resistor).
+
+    The bootstrap method generates synthetic data sets by adding randomly resampled residuals (relative to the modulus of the fitted impedance) to the fitted impedances, and reports percentile intervals.
+    The jackknife method refits the data set with one data point left out at a time, and reports intervals based on the jackknife estimate of the standard error.
+    Each refit uses the fitted values as the initial values, and the method and weight that produced the fit.
+    The timeout, if any, in the settings of the fit is applied to each refit.
+
+    The estimated intervals are also stored in the `confidence_intervals` attribute of the fit result, which means that they are saved as part of a project and included in the table returned by `FitResult.to_parameters_dataframe`.
+
+    Parameters
+    ----------
+    fit: FitResult
+        The result of a circuit fit.
+
+    data: DataSet
+        The data set that the circuit was fitted to.
+
+    method: ResamplingMethod, optional
+        The method to use when resampling the data.
+
+    num_samples: int, optional
+        The number of synthetic data sets to generate when using the bootstrap method.
+        The jackknife method always generates as many data sets as there were data points in the fit.
+
+    confidence_level: float, optional
+        The confidence level (in percent) of the intervals.
+
+    seed: Optional[int], optional
+        The seed to use when resampling residuals.
+
+    num_procs: int, optional
+        The maximum number of parallel processes to use.
+        A value less than 1 will result in an attempt to automatically figure out a suitable value.
+        Negative values are used as offsets relative to the number of cores detected.
+
+    Returns
+    -------
+    FitConfidenceIntervals
+    """
+    assert type(fit) is FitResult, fit
+    assert isinstance(data, _pyimpspec.DataSet), data
+    assert type(method) is ResamplingMethod, method
+    assert _issubdtype(type(num_samples), _integer), num_samples
+    assert isinstance(confidence_level, (int, float)), confidence_level
+    assert seed is None or _issubdtype(type(seed), _integer), seed
+    assert _issubdtype(type(num_procs), _integer), num_procs
+    if num_samples < 2:
+        raise ValueError(f"Expected at least two samples instead of {num_samples=}")
+    elif not (0.0 < confidence_level < 100.0):
+        raise ValueError(
+            f"Expected 0.0 < confidence_level < 100.0 instead of {confidence_level=}"
+        )
+    if num_procs < 1:
+        num_procs = max((_pyimpspec.get_default_num_procs() - abs(num_procs), 1))
+
+    indices: List[int] = [
+        i
+        for i in range(data.get_num_points(masked=None))
+        if fit.mask.get(i, False) is not True
+    ]
+    f: _NDArray[_float64] = data.get_frequencies(masked=None)[indices]
+    Z_exp: _NDArray[_complex128] = data.get_impedances(masked=None)[indices]
+    Z_fit: _NDArray[_complex128] = fit.impedances
+    if len(f) != len(fit.frequencies) or not (f == fit.frequencies).all():
+        raise ValueError("Expected the data set that the circuit was fitted to")
+
+    Z_samples: _NDArray[_complex128]
+    if method == ResamplingMethod.BOOTSTRAP:
+        moduli: _NDArray[_float64] = abs(Z_fit)
+        residuals: _NDArray[_complex128] = (Z_exp - Z_fit) / moduli
+        resampled = _default_rng(seed).integers(0, len(f), (num_samples, len(f)))
+        Z_samples = Z_fit + residuals[resampled] * moduli
+    elif method == ResamplingMethod.JACKKNIFE:
+        Z_samples = Z_exp
+        num_samples = len(f)
+    else:
+        raise NotImplementedError(f"Unsupported resampling method: {method}")
+
+    refits: List[Dict[str, Dict[str, float]]] = []
+    num_failed: int = 0
+    res: Tuple[int, Optional[Dict[str, Dict[str, float]]]]
+    is_parallel: bool = num_procs > 1
+    shared: _SharedArrays
+    prog: _Progress
+    with _SharedArrays(
+        {"f": f, "Z": Z_samples},
+        share=is_parallel,
+    ) as shared, _Progress(
+        "Refitting resampled data",
+        total=num_samples + 1,
+    ) as prog:
+        args = (
+            (
+                i,
+                fit.circuit.serialize(),
+                shared.handle,
+                _cnls_method_to_value[fit.method],
+                _weight_to_value[fit.weight],
+                fit.settings.max_nfev,
+                0 if is_parallel else fit.settings.timeout,
+            )
+            for i in range(num_samples)
+        )
+        for res in _map_with_timeout(
+            _resample_process,
+            args,
+            num_samples,
+            num_procs,
+            fit.settings.timeout,
+        ):
+            if res[1] is None:
+                num_failed += 1
+            else:
+                refits.append(res[1])
+
+            prog.increment()
+
+        if len(refits) + num_failed < num_samples:
+            # The remaining refits timed out.
+            num_failed = num_samples - len(refits)
+            prog.set(num_samples)
+
+    if len(refits) < 2:
+        raise _pyimpspec.exceptions.FittingError(
+            "Too few of the resampled data sets could be refitted!"
+        )
+
+    lower_limits: Dict[str, Dict[str, float]] = {}
+    upper_limits: Dict[str, Dict[str, float]] = {}
+    tail: float = (100.0 - confidence_level) / 2
+
+    element_label: str
+    parameters: Dict[str, float]
+    for element_label, parameters in refits[0].items():
+        lower_limits[element_label] = {}
+        upper_limits[element_label] = {}
+
+        parameter_label: str
+        for parameter_label in parameters:
+            values: _NDArray[_float64] = _array(
+                [_[element_label][parameter_label] for _ in refits],
+                dtype=_float64,
+            )
+
+            lower: float
+            upper: float
+            if method == ResamplingMethod.BOOTSTRAP:
+                lower, upper = _percentile(values, [tail, 100.0 - tail])
+            else:
+                value: float = fit.parameters[element_label][parameter_label].value
+                stderr: float = _sqrt(
+                    (len(values) - 1) / len(values)
+                    * ((values - values.mean()) ** 2).sum()
+                )
+                z: float = _norm.ppf(1.0 - tail / 100)
+                lower, upper = value - z * stderr, value + z * stderr
+
+            lower_limits[element_label][parameter_label] = float(lower)
+            upper_limits[element_label][parameter_label] = float(upper)
+
+    intervals: FitConfidenceIntervals = FitConfidenceIntervals(
         method=method,
-        weight=weight,
-        settings=settings,
+        confidence_level=float(confidence_level),
+        num_samples=num_samples,
+        num_failed=num_failed,
+        lower_limits=lower_limits,
+        upper_limits=upper_limits,
     )
+    fit.confidence_intervals = intervals
+
+    return intervals
@@ -26,10 +26,27 @@ from typing import (
 )
 from uuid import uuid4 as _uuid4
 from numpy import (
+    array_equal as _array_equal,
+    complex128 as _complex128,
+    float64 as _float64,
     integer as _integer,
     issubdtype as _issubdtype,
+    ones as _ones,
+    pi as _pi,
+    vstack as _vstack,
+    zeros as _zeros,
 )
+from numpy.linalg import lstsq as _lstsq
+from numpy.typing import NDArray as _NDArray
 import pyimpspec as _pyimpspec
+from pyimpspec.analysis.kramers_kronig.least_squares import (
+    _update_circuit,
+)
+from pyimpspec.analysis.kramers_kronig.utility import (
+    _generate_circuit,
+    _generate_time_constants,
+)
+from deareis.api.pool import use_shared_pool as _use_shared_pool
 from deareis.data import (
     DataSet,
     KramersKronigResult,
@@ -47,6 +64,7 @@ from deareis.enums import (
 )
 
 
+@_use_shared_pool()
 def evaluate_log_F_ext(
     data: DataSet,
     settings: KramersKronigSettings,
@@ -205,6 +223,7 @@ def suggest_num_RC(
     )
 
 
+@_use_shared_pool()
 def perform_kramers_kronig_test(
     data: DataSet,
     settings: KramersKronigSettings,
@@ -281,6 +300,7 @@ def perform_kramers_kronig_test(
     )
 
 
+@_use_shared_pool()
 def perform_exploratory_kramers_kronig_tests(
     data: DataSet,
     settings: KramersKronigSettings,
@@ -379,3 +399,172 @@ def perform_exploratory_kramers_kronig_tests(
             upper_limit,
         ),
     )
+
+
+def _generate_batch_matrix(
+    w: _NDArray[_float64],
+    taus: _NDArray[_float64],
+    add_capacitance: bool,
+    add_inductance: bool,
+    admittance: bool,
+) -> _NDArray[_complex128]:
+    # The columns contain the complex immittances of the series/parallel R,
+    # the RC elements, and the optional series/parallel C and L when each of
+    # their variables is equal to one (see pyimpspec's least squares tests).
+    columns: List[_NDArray[_complex128]] = [_ones(w.shape, dtype=_complex128)]
+    columns.extend(
+        (w / (w * tau - 1j)) if admittance else (1 / (1 + 1j * w * tau))
+        for tau in taus
+    )
+
+    if add_capacitance:
+        columns.append(1j * (w if admittance else (-1 / w)))
+
+    if add_inductance:
+        columns.append(1j * ((1 / w) if admittance else w))
+
+    return _vstack(columns).T
+
+
+def perform_batch_kramers_kronig_tests(
+    data_sets: List[DataSet],
+    settings: KramersKronigSettings,
+) -> List[KramersKronigResult]:
+    """
+    Perform the same linear Kramers-Kronig test on multiple data sets that share the same (unmasked) frequencies.
+    The matrix of the circuit with the chosen number of RC elements is generated and factorized once, and all of the spectra are then solved together as a least squares problem with multiple right-hand sides.
+    The results are equivalent to calling |perform_kramers_kronig_test| for each data set but the batch is processed significantly faster.
+
+    Parameters
+    ----------
+    data_sets: List[DataSet]
+        The data sets to be tested.
+
+    settings: KramersKronigSettings
+        The settings that determine how the tests are performed.
+        Only the `KramersKronigMode.MANUAL` mode, the least squares variants of the complex, real, and imaginary tests, and either the impedance or the admittance representation are supported.
+        The value of `log_F_ext` is used directly (i.e., `num_F_ext_evaluations` must be zero).
+
+    Returns
+    -------
+    List[KramersKronigResult]
+        The results in the same order as the data sets.
+    """
+    if not isinstance(settings, KramersKronigSettings):
+        raise TypeError(f"Expected a KramersKronigSettings instance instead of {settings=}")
+    elif settings.mode != KramersKronigMode.MANUAL:
+        raise ValueError(f"Expected {settings.mode=} == KramersKronigMode.MANUAL")
+    elif settings.test not in (
+        KramersKronigTest.COMPLEX_LEASTSQ,
+        KramersKronigTest.REAL_LEASTSQ,
+        KramersKronigTest.IMAGINARY_LEASTSQ,
+    ):
+        raise ValueError(
+            f"Expected a linear least squares test instead of {settings.test=}"
+        )
+    elif settings.representation == KramersKronigRepresentation.AUTO:
+        raise ValueError(f"Expected {settings.representation=} != KramersKronigRepresentation.AUTO")
+    elif settings.num_F_ext_evaluations != 0:
+        raise ValueError(f"Expected {settings.num_F_ext_evaluations=} == 0")
+
+    if not isinstance(data_sets, list):
+        raise TypeError(f"Expected a list instead of {data_sets=}")
+    elif len(data_sets) == 0:
+        return []
+    elif not all(map(lambda d: isinstance(d, DataSet), data_sets)):
+        raise TypeError(f"Expected only DataSet instances instead of {data_sets=}")
+
+    f: _NDArray[_float64] = data_sets[0].get_frequencies()
+    data: DataSet
+    for data in data_sets[1:]:
+        if not _array_equal(data.get_frequencies(), f):
+            raise ValueError(
+                f"Expected the same frequencies in all data sets instead of those in {data.get_label()=}"
+            )
+
+    max_num_RC: int = 2 * len(f) - 5
+    if not (2 <= settings.num_RC <= max_num_RC):
+        raise ValueError(f"Expected 2 <= {settings.num_RC=} <= {max_num_RC}")
+
+    test: str = _test_to_value[settings.test]
+    admittance: bool = _test_representation_to_value[settings.representation]
+    exponent: int = -1 if admittance else 1
+    w: _NDArray[_float64] = 2 * _pi * f
+    taus: _NDArray[_float64] = _generate_time_constants(w, settings.num_RC, settings.log_F_ext)
+    A: _NDArray[_complex128] = _generate_batch_matrix(
+        w,
+        taus,
+        settings.add_capacitance,
+        settings.add_inductance,
+        admittance,
+    )
+    num_RC_columns: int = len(taus) + 1
+
+    # Each column corresponds to a data set.
+    Z_exp: _NDArray[_complex128] = _vstack([_.get_impedances() for _ in data_sets]).T
+    X_exp: _NDArray[_complex128] = Z_exp**exponent
+    X: _NDArray[_float64] = _zeros((A.shape[1], len(data_sets)), dtype=_float64)
+
+    if test == "complex":
+        X[:, :] = _lstsq(
+            _vstack((A.real, A.imag)),
+            _vstack((X_exp.real, X_exp.imag)),
+            rcond=None,
+        )[0]
+    elif test == "real":
+        # The capacitance and/or inductance are fitted afterwards to the
+        # imaginary parts of the residuals.
+        X[:num_RC_columns, :] = _lstsq(
+            A[:, :num_RC_columns].real,
+            X_exp.real,
+            rcond=None,
+        )[0]
+        if A.shape[1] > num_RC_columns:
+            X[num_RC_columns:, :] = _lstsq(
+                A[:, num_RC_columns:].imag,
+                (X_exp - A @ X).imag,
+                rcond=None,
+            )[0]
+    else:
+        # The series/parallel resistance is the weighted mean of the real
+        # parts of the residuals.
+        X[:, :] = _lstsq(A.imag, X_exp.imag, rcond=None)[0]
+        weight: _NDArray[_float64] = abs(X_exp) ** -2
+        X[0, :] = (weight * (X_exp - A @ X).real).sum(axis=0) / weight.sum(axis=0)
+
+    Z_fit: _NDArray[_complex128] = (A @ X) ** exponent
+    residuals: _NDArray[_complex128] = (Z_exp - Z_fit) / abs(Z_exp)
+    pseudo_chisqrs: _NDArray[_float64] = (abs(residuals) ** 2).sum(axis=0)
+
+    time: float = _time()
+    results: List[KramersKronigResult] = []
+    i: int
+    for i, data in enumerate(data_sets):
+        circuit: _pyimpspec.Circuit = _generate_circuit(
+            taus,
+            settings.add_capacitance,
+            settings.add_inductance,
+            admittance,
+        )
+        _update_circuit(
+            circuit,
+            X[:, i],
+            settings.add_capacitance,
+            settings.add_inductance,
+            admittance,
+        )
+        results.append(
+            KramersKronigResult(
+                uuid=_uuid4().hex,
+                timestamp=time,
+                circuit=circuit,
+                pseudo_chisqr=float(pseudo_chisqrs[i]),
+                frequencies=f.copy(),
+                impedances=Z_fit[:, i].copy(),
+                residuals=residuals[:, i].copy(),
+                mask=data.get_mask().copy(),
+                settings=settings,
+            )
+        )
+
+    return results
@@ -18,4 +18,4 @@
 # the LICENSES folder.
 
 from pyimpspec.plot.mpl import *  # pyimpspec's plotting functions can be used to visualize some of the results.
-from .mpl import plot, MPL_MARKERS
+from .mpl import plot, plot_drt_series, MPL_MARKERS
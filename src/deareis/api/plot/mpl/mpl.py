@@ -37,6 +37,7 @@ from numpy import (
 from pyimpspec.plot import mpl
 from deareis.data import (
     DRTResult,
+    DRTSeriesResult,
     DataSet,
     FitResult,
     PlotSettings,
@@ -423,3 +424,84 @@ def plot(
         figure,
         axes,
     )
+
+
+def plot_drt_series(
+    drt: DRTSeriesResult,
+    colormap: str = "viridis",
+    colorbar: bool = True,
+    title: bool = True,
+    tight_layout: bool = False,
+    figure: Optional[Figure] = None,
+    axes: List[Axes] = None,
+) -> Tuple[Figure, List[Axes]]:
+    """
+    Plot the distributions of relaxation times of a series of data sets as a heat map where the x-axis corresponds to the index of the data set and the y-axis corresponds to the time constant.
+
+    Parameters
+    ----------
+    drt: DRTSeriesResult
+        The result to plot.
+
+    colormap: str, optional
+        The name of the matplotlib colormap to use for the gamma values.
+
+    colorbar: bool, optional
+        Whether or not to include a colorbar in the figure.
+
+    title: bool, optional
+        Whether or not to include the title in the figure.
+
+    tight_layout: bool, optional
+        Whether or not to apply a tight layout that the sizes of the reduces margins.
+
+    figure: Optional[|Figure|], optional
+        The matplotlib.figure.Figure instance to use when plotting the data.
+
+    axes: List[Axes], optional
+        The matplotlib.axes.Axes instance to use when plotting the data.
+
+    Returns
+    -------
+    Tuple[|Figure|, List[|Axes|]]
+    """
+    assert type(drt) is DRTSeriesResult, drt
+    assert type(colormap) is str, colormap
+    assert type(colorbar) is bool, colorbar
+    assert type(title) is bool, title
+    assert type(tight_layout) is bool, tight_layout
+    assert type(figure) is Figure or figure is None
+    axis: Axes
+    if figure is None:
+        assert axes is None
+        figure, axis = plt.subplots()
+        axes = [axis]
+    else:
+        assert len(axes) > 0
+        axis = axes[0]
+    assert axis is not None
+
+    mesh = axis.pcolormesh(
+        range(0, drt.get_num_spectra()),
+        drt.get_time_constants(),
+        drt.get_gammas().T,
+        cmap=colormap,
+        shading="nearest",
+    )
+    axis.set_yscale("log")
+    axis.set_xlabel("Index")
+    axis.set_ylabel(r"$\tau\ (\mathrm{s})$")
+
+    if colorbar:
+        figure.colorbar(mesh, ax=axis, label=r"$\gamma\ (\Omega)$")
+
+    if title:
+        figure.suptitle(drt.get_label())
+
+    if tight_layout:
+        figure.tight_layout()
+
+    return (
+        figure,
+        axes,
+    )
@@ -0,0 +1,380 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from atexit import register as _register_exit_handler
+from collections import deque as _deque
+from contextlib import contextmanager as _contextmanager
+from multiprocessing import (
+    TimeoutError as _TimeoutError,
+    get_context as _get_context,
+    parent_process as _parent_process,
+)
+from multiprocessing.context import BaseContext as _BaseContext
+from multiprocessing.pool import (
+    AsyncResult as _AsyncResult,
+    Pool as _Pool,
+)
+from queue import (
+    Empty as _Empty,
+    SimpleQueue as _SimpleQueue,
+)
+from threading import (
+    Lock as _Lock,
+    RLock as _RLock,
+)
+from types import ModuleType as _ModuleType
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from numpy import integer as _integer
+from numpy import issubdtype as _issubdtype
+import pyimpspec as _pyimpspec
+import pyimpspec.analysis.drt.bht as _bht
+import pyimpspec.analysis.drt.tr_rbf as _tr_rbf
+import pyimpspec.analysis.fitting as _fitting
+import pyimpspec.analysis.kramers_kronig.exploratory as _exploratory
+import pyimpspec.analysis.zhit.offset as _offset
+import pyimpspec.analysis.zhit.reconstruction as _reconstruction
+
+
+_LOCK: _RLock = _RLock()
+_POOL: Optional[_Pool] = None
+_POOL_SIZE: int = 0
+_NUM_PROCS: int = -1
+_MAX_TASKS_PER_WORKER: int = 100
+# The number of active analyses that use each pool. A pool that is replaced
+# (e.g., by a larger pool) while analyses are still using it is terminated
+# once the last of those analyses has finished.
+_NUM_USERS: Dict[_Pool, int] = {}
+
+
+def configure_worker_pool(num_procs: int = -1, max_tasks_per_worker: int = 100):
+    """
+    Configure the persistent pool of worker processes that is shared by the analyses that use multiple processes.
+    The pool is created when it is first needed and the workers are kept alive between analyses in order to avoid the cost of starting processes and importing modules every time.
+    An existing pool is shut down and replaced by a new pool, which is created when it is next needed.
+
+    Parameters
+    ----------
+    num_procs: int, optional
+        The number of worker processes.
+        If the value is less than one, then the value is subtracted from the value returned by `get_default_num_procs` (minimum of one process).
+        A pool with more processes is created if an analysis requests more processes than this.
+        An analysis that requests fewer processes than this does not run more tasks at a time than it requested.
+        Multiple analyses (e.g., in different threads) can use the pool at the same time.
+
+    max_tasks_per_worker: int, optional
+        The number of tasks that a worker process completes before it is replaced by a new worker process, which limits the effects of, e.g., memory leaks.
+        A value of zero means that the worker processes are never replaced.
+    """
+    global _NUM_PROCS, _MAX_TASKS_PER_WORKER
+    if not _issubdtype(type(num_procs), _integer):
+        raise TypeError(f"Expected an integer instead of {num_procs=}")
+    elif not _issubdtype(type(max_tasks_per_worker), _integer):
+        raise TypeError(f"Expected an integer instead of {max_tasks_per_worker=}")
+    elif max_tasks_per_worker < 0:
+        raise ValueError(f"Expected a value equal to or greater than zero instead of {max_tasks_per_worker=}")
+
+    with _LOCK:
+        if (num_procs, max_tasks_per_worker) == (_NUM_PROCS, _MAX_TASKS_PER_WORKER):
+            return
+
+        _NUM_PROCS = num_procs
+        _MAX_TASKS_PER_WORKER = max_tasks_per_worker
+        shutdown_worker_pool()
+
+
+def shutdown_worker_pool():
+    """
+    Terminate the worker processes of the persistent pool, if the pool has been created.
+    If analyses are still using the pool, then the worker processes are terminated once those analyses have finished.
+    A new pool is created when it is next needed.
+    """
+    global _POOL, _POOL_SIZE
+    with _LOCK:
+        pool: Optional[_Pool] = _POOL
+        if pool is None:
+            return
+
+        _POOL = None
+        _POOL_SIZE = 0
+        if pool in _NUM_USERS:
+            return
+
+    pool.terminate()
+    pool.join()
+
+
+_register_exit_handler(shutdown_worker_pool)
+
+
+def _get_worker_pool(num_procs: int) -> _Pool:
+    global _POOL, _POOL_SIZE
+    size: int = _NUM_PROCS
+    if size < 1:
+        size = max((_pyimpspec.get_default_num_procs() - abs(size), 1))
+    size = max(size, num_procs)
+
+    if _POOL is not None and _POOL_SIZE < size:
+        shutdown_worker_pool()
+
+    if _POOL is None:
+        _POOL = _get_context(method="spawn").Pool(
+            size,
+            maxtasksperchild=_MAX_TASKS_PER_WORKER or None,
+        )
+        _POOL_SIZE = size
+
+    _NUM_USERS[_POOL] = _NUM_USERS.get(_POOL, 0) + 1
+
+    return _POOL
+
+
+def _release_worker_pool(pool: _Pool, discard: bool):
+    # Called once for each call of _get_worker_pool. A pool that has been
+    # discarded is no longer handed out to new analyses, but the workers are
+    # only terminated once the analyses that are still using it have
+    # finished.
+    global _POOL, _POOL_SIZE
+    with _LOCK:
+        _NUM_USERS[pool] -= 1
+        if _NUM_USERS[pool] == 0:
+            del _NUM_USERS[pool]
+
+        if discard and pool is _POOL:
+            _POOL = None
+            _POOL_SIZE = 0
+
+        if pool is _POOL or pool in _NUM_USERS:
+            return
+
+    pool.terminate()
+    pool.join()
+
+
+class _CappedIterator:
+    # Submits the tasks to the persistent pool one at a time so that no more
+    # than num_procs tasks are running at a time, even if the pool has more
+    # worker processes than the analysis requested. The interface is the same
+    # as that of the iterators returned by Pool.imap and Pool.imap_unordered.
+    def __init__(
+        self,
+        pool: _Pool,
+        func: Callable,
+        iterable: Iterable,
+        num_procs: int,
+        ordered: bool,
+    ):
+        self.pool: _Pool = pool
+        self.func: Callable = func
+        self.tasks: Iterator = iter(iterable)
+        self.ordered: bool = ordered
+        # The tasks that have been submitted but whose results have not been
+        # collected yet. The results are collected in the order that the
+        # tasks were submitted (pending) or in the order that the tasks were
+        # completed (completed).
+        self.num_remaining: int = 0
+        self.pending: Deque[_AsyncResult] = _deque()
+        self.completed: _SimpleQueue = _SimpleQueue()
+        for _ in range(0, num_procs):
+            if not self._submit():
+                break
+
+    def _submit(self) -> bool:
+        task: Any
+        for task in self.tasks:
+            break
+        else:
+            return False
+
+        self.num_remaining += 1
+        if self.ordered:
+            self.pending.append(self.pool.apply_async(self.func, (task,)))
+        else:
+            self.pool.apply_async(
+                self.func,
+                (task,),
+                callback=lambda _: self.completed.put((True, _)),
+                error_callback=lambda _: self.completed.put((False, _)),
+            )
+
+        return True
+
+    def __iter__(self) -> "_CappedIterator":
+        return self
+
+    def __next__(self) -> Any:
+        return self.next()
+
+    def next(self, timeout: Optional[float] = None) -> Any:
+        if self.num_remaining == 0:
+            raise StopIteration
+
+        if self.ordered:
+            pending: _AsyncResult = self.pending[0]
+            pending.wait(timeout)
+            if not pending.ready():
+                raise _TimeoutError
+
+            self.pending.popleft()
+            self.num_remaining -= 1
+            self._submit()
+
+            return pending.get()
+
+        is_successful: bool
+        result: Any
+        try:
+            is_successful, result = self.completed.get(timeout=timeout)
+        except _Empty:
+            raise _TimeoutError
+
+        self.num_remaining -= 1
+        self._submit()
+        if not is_successful:
+            raise result
+
+        return result
+
+
+class _SharedPool:
+    # Exposes the methods of Pool that are used by pyimpspec and DearEIS. The
+    # lock is only held while getting the persistent pool so that concurrent
+    # analyses can share the pool. The pool is discarded when leaving the
+    # context if any tasks are still running (e.g., due to timeouts or
+    # exceptions) since there is no way to cancel individual tasks.
+    def __init__(self, num_procs: int):
+        self.num_procs: int = num_procs
+        self.pool: Optional[_Pool] = None
+        self.iterators: List[_CappedIterator] = []
+
+    def __enter__(self) -> "_SharedPool":
+        with _LOCK:
+            self.pool = _get_worker_pool(self.num_procs)
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pool: Optional[_Pool] = self.pool
+        discard: bool = any(_.num_remaining > 0 for _ in self.iterators)
+        self.pool = None
+        self.iterators.clear()
+        if pool is not None:
+            _release_worker_pool(pool, discard)
+
+    def imap(self, func: Callable, iterable: Iterable, chunksize: int = 1) -> _CappedIterator:
+        iterator = _CappedIterator(self.pool, func, iterable, self.num_procs, ordered=True)
+        self.iterators.append(iterator)
+
+        return iterator
+
+    def imap_unordered(self, func: Callable, iterable: Iterable, chunksize: int = 1) -> _CappedIterator:
+        iterator = _CappedIterator(self.pool, func, iterable, self.num_procs, ordered=False)
+        self.iterators.append(iterator)
+
+        return iterator
+
+    def map(self, func: Callable, iterable: Iterable, chunksize: Optional[int] = None) -> list:
+        return list(self.imap(func, iterable))
+
+
+class _SharedPoolContext:
+    # Replaces the spawn context in the modules that create pools so that the
+    # persistent pool is used instead. Worker processes (e.g., the processes
+    # of the persistent pool itself) create regular pools.
+    def __init__(self, context: _BaseContext):
+        self.context: _BaseContext = context
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.context, attr)
+
+    def Pool(self, processes: Optional[int] = None, *args, **kwargs) -> Any:
+        if _parent_process() is not None or args or kwargs:
+            return self.context.Pool(processes, *args, **kwargs)
+
+        return _SharedPool(processes or 1)
+
+
+def get_shared_context(method: Optional[str] = None) -> Any:
+    """
+    Equivalent to `multiprocessing.get_context` except that the pools created using the spawn context use the persistent pool of worker processes.
+
+    Parameters
+    ----------
+    method: Optional[str], optional
+        The start method.
+
+    Returns
+    -------
+    BaseContext
+    """
+    context: _BaseContext = _get_context(method=method)
+    if method != "spawn":
+        return context
+
+    return _SharedPoolContext(context)
+
+
+# pyimpspec looks up get_context as a module attribute when creating pools
+# for, e.g., exploratory Kramers-Kronig tests, the automatic selection of the
+# fitting method and weight, and the BHT method.
+_PATCHED_MODULES: Tuple[_ModuleType, ...] = (
+    _bht,
+    _exploratory,
+    _fitting,
+    _offset,
+    _reconstruction,
+    _tr_rbf,
+)
+_PATCH_LOCK: _Lock = _Lock()
+_NUM_PATCHED_CALLS: int = 0
+_ORIGINAL_CONTEXTS: Dict[_ModuleType, Callable] = {}
+
+
+@_contextmanager
+def use_shared_pool():
+    """
+    Make pyimpspec use the persistent pool of worker processes instead of creating new pools while in this context.
+    The modules of pyimpspec are only patched while at least one such context is active, e.g., while calling a wrapper of a pyimpspec function.
+    Can also be used as a decorator.
+    """
+    global _NUM_PATCHED_CALLS
+    with _PATCH_LOCK:
+        if _NUM_PATCHED_CALLS == 0:
+            for module in _PATCHED_MODULES:
+                _ORIGINAL_CONTEXTS[module] = module.get_context
+                module.get_context = get_shared_context
+        _NUM_PATCHED_CALLS += 1
+
+    try:
+        yield
+    finally:
+        with _PATCH_LOCK:
+            _NUM_PATCHED_CALLS -= 1
+            if _NUM_PATCHED_CALLS == 0:
+                for module in _PATCHED_MODULES:
+                    module.get_context = _ORIGINAL_CONTEXTS.pop(module)
@@ -0,0 +1,195 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from contextlib import contextmanager as _contextmanager
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory as _SharedMemory
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from weakref import finalize as _finalize
+from numpy import (
+    ascontiguousarray as _ascontiguousarray,
+    dtype as _dtype,
+    ndarray as _ndarray,
+    uint8 as _uint8,
+)
+from numpy.typing import NDArray as _NDArray
+
+
+# The offsets of the arrays within a segment are aligned to this many bytes.
+_ALIGNMENT: int = 64
+
+@dataclass(frozen=True)
+class SharedArraysHandle:
+    """
+    A picklable reference to the arrays of a `SharedArrays` instance, which can be passed to worker processes instead of the arrays themselves.
+    The arrays are included in the handle if they were not placed in shared memory.
+
+    Parameters
+    ----------
+    name: str
+        The name of the shared memory segment.
+
+    layout: Tuple[Tuple[str, int, Tuple[int, ...], str], ...]
+        The key, offset, shape, and data type of each array.
+
+    arrays: Optional[Dict[str, NDArray]]
+        The arrays if they were not placed in shared memory.
+    """
+
+    name: str
+    layout: Tuple[Tuple[str, int, Tuple[int, ...], str], ...]
+    arrays: Optional[Dict[str, _NDArray]] = None
+
+
+def _release(shm: _SharedMemory):
+    try:
+        shm.unlink()
+    finally:
+        shm.close()
+
+
+class SharedArrays:
+    """
+    A set of NumPy arrays (e.g., frequencies, impedances, and masks) that are copied once into a single shared memory segment so that worker processes can access them without the arrays being pickled for every task.
+    The segment is released when leaving the context, when `close` is called, or as a last resort when the instance is garbage collected.
+
+    Parameters
+    ----------
+    arrays: Dict[str, NDArray]
+        The arrays to share.
+
+    share: bool, optional
+        Whether or not to place the arrays in shared memory.
+        If false, then the arrays are included in the handle (e.g., when the tasks are performed in the current process).
+    """
+
+    def __init__(self, arrays: Dict[str, _NDArray], share: bool = True):
+        assert isinstance(arrays, dict) and len(arrays) > 0, arrays
+        assert all(map(lambda _: isinstance(_, _ndarray), arrays.values())), arrays
+        self._finalizer: Optional[_finalize] = None
+
+        if not share:
+            self.handle: SharedArraysHandle = SharedArraysHandle(
+                name="",
+                layout=tuple(),
+                arrays=arrays.copy(),
+            )
+            return
+
+        layout: List[Tuple[str, int, Tuple[int, ...], str]] = []
+        size: int = 0
+        key: str
+        value: _NDArray
+        for key, value in arrays.items():
+            layout.append((key, size, value.shape, value.dtype.str))
+            size += -(-max(value.nbytes, 1) // _ALIGNMENT) * _ALIGNMENT
+
+        shm: _SharedMemory = _SharedMemory(create=True, size=size)
+        self._finalizer = _finalize(self, _release, shm)
+        self.handle = SharedArraysHandle(name=shm.name, layout=tuple(layout))
+        try:
+            offset: int
+            shape: Tuple[int, ...]
+            for (key, offset, shape, _), value in zip(layout, arrays.values()):
+                view: _NDArray = _ndarray(
+                    shape,
+                    dtype=value.dtype,
+                    buffer=shm.buf,
+                    offset=offset,
+                )
+                view[...] = _ascontiguousarray(value)
+                del view
+        except Exception:
+            self.close()
+            raise
+
+    def __repr__(self) -> str:
+        return f"SharedArrays ({self.handle.name or 'not shared'}, {hex(id(self))})"
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Release the shared memory segment, if any.
+        Worker processes that are still attached to the segment keep their views valid until they detach, but the segment can no longer be attached.
+        """
+        if self._finalizer is None:
+            return
+
+        self._finalizer()
+        self._finalizer = None
+
+
+@_contextmanager
+def attach_shared_arrays(handle: SharedArraysHandle) -> Iterator[Dict[str, _NDArray]]:
+    """
+    Get read-only views of the arrays referenced by a handle while in this context (e.g., during a task performed by a worker process).
+    The segment is detached once leaving the context and once the views (and any arrays derived from them) are no longer referenced so that worker processes do not keep the memory mapped after the `SharedArrays` instance has been closed.
+    The arrays, or the parts of them, that are needed after the task must be copied.
+
+    Parameters
+    ----------
+    handle: SharedArraysHandle
+        The handle of a `SharedArrays` instance.
+
+    Returns
+    -------
+    Iterator[Dict[str, NDArray]]
+    """
+    if handle.arrays is not None:
+        yield handle.arrays
+        return
+
+    shm: _SharedMemory = _SharedMemory(name=handle.name, create=False)
+    # The views are created from a single array so that the segment is closed
+    # only once none of the views are referenced. Closing the segment earlier
+    # would unmap the memory that the views point to.
+    buffer: _NDArray = _ndarray((shm.size,), dtype=_uint8, buffer=shm.buf)
+    _finalize(buffer, shm.close)
+    arrays: Dict[str, _NDArray] = {}
+
+    key: str
+    offset: int
+    shape: Tuple[int, ...]
+    dtype: str
+    for key, offset, shape, dtype in handle.layout:
+        view: _NDArray = _ndarray(
+            shape,
+            dtype=_dtype(dtype),
+            buffer=buffer,
+            offset=offset,
+        )
+        view.flags.writeable = False
+        arrays[key] = view
+
+    del buffer, view
+    try:
+        yield arrays
+    finally:
+        arrays.clear()
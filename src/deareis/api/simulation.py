@@ -18,13 +18,63 @@
 # the LICENSES folder.
 
 
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from multiprocessing import get_context as _get_context
 from time import time as _time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from uuid import uuid4 as _uuid4
+from numpy import (
+    array as _array,
+    bool_ as _bool_,
+    complex128 as _complex128,
+    concatenate as _concatenate,
+    cumsum as _cumsum,
+    float64 as _float64,
+    integer as _integer,
+    issubdtype as _issubdtype,
+    log10 as _log10,
+    nan as _nan,
+    nanmax as _nanmax,
+    nanmean as _nanmean,
+    nanmedian as _nanmedian,
+    nanmin as _nanmin,
+    nanstd as _nanstd,
+)
+from numpy.random import default_rng as _default_rng
+from numpy.typing import NDArray as _NDArray
+from pandas import DataFrame as _DataFrame
 import pyimpspec as _pyimpspec
+from pyimpspec.progress import Progress as _Progress
+from deareis.api.circuit.compiled import compile_circuit as _compile_circuit
+from deareis.api.shared_arrays import (
+    SharedArrays as _SharedArrays,
+    SharedArraysHandle as _SharedArraysHandle,
+    attach_shared_arrays as _attach_shared_arrays,
+)
 from deareis.data import (
+    DataSet,
+    DRTResult,
+    DRTSettings,
+    FitResult,
+    FitSettings,
+    KramersKronigResult,
+    KramersKronigSettings,
     SimulationResult,
     SimulationSettings,
+    SimulationSweepResult,
+    SimulationSweepSettings,
+    SweptParameter,
+    ZHITResult,
+    ZHITSettings,
 )
+from deareis.data.cache import CIRCUIT_CACHE as _CIRCUIT_CACHE
+from deareis.enums import NoiseModel
 
 
 def simulate_spectrum(
@@ -45,7 +95,7 @@ def simulate_spectrum(
     SimulationResult
     """
     assert type(settings) is SimulationSettings, settings
-    circuit: _pyimpspec.Circuit = _pyimpspec.parse_cdc(settings.cdc)
+    circuit: _pyimpspec.Circuit = _CIRCUIT_CACHE.parse(settings.cdc)
     _pyimpspec.analysis.fitting.validate_circuit(circuit)
     return SimulationResult(
         _uuid4().hex,
@@ -53,3 +103,332 @@ def simulate_spectrum(
         circuit,
         settings,
     )
+
+
+def sweep_simulation(
+    settings: SimulationSweepSettings,
+) -> SimulationSweepResult:
+    """
+    Simulate the impedance spectra generated by a circuit when one or more element parameters are varied.
+    All of the spectra are calculated in a single batch and are stored in a single result that shares the same frequencies.
+
+    Parameters
+    ----------
+    settings: SimulationSweepSettings
+        The settings to use when performing the sweep.
+
+    Returns
+    -------
+    SimulationSweepResult
+    """
+    assert type(settings) is SimulationSweepSettings, settings
+    circuit: _pyimpspec.Circuit = _CIRCUIT_CACHE.parse(settings.cdc)
+    _pyimpspec.analysis.fitting.validate_circuit(circuit)
+
+    if len(settings.parameters) == 0:
+        raise ValueError("Expected at least one parameter to sweep")
+
+    labels: List[Tuple[str, str]] = _compile_circuit(circuit).get_parameter_labels()
+    swept: List[Tuple[str, str]] = []
+
+    param: SweptParameter
+    for param in settings.parameters:
+        assert type(param) is SweptParameter, param
+        key: Tuple[str, str] = (param.element, param.parameter)
+        if key not in labels:
+            raise ValueError(
+                f"Expected one of {labels} instead of {param.element}.{param.parameter}"
+            )
+        elif key in swept:
+            raise ValueError(
+                f"Expected {param.element}.{param.parameter} to be swept only once"
+            )
+        elif param.num_steps < 1:
+            raise ValueError(f"Expected at least one step instead of {param.num_steps=}")
+        elif param.logarithmic and (param.start <= 0.0 or param.stop <= 0.0):
+            raise ValueError(
+                f"Expected positive values when sweeping {param.element}.{param.parameter} logarithmically"
+            )
+
+        swept.append(key)
+
+    if not settings.grid and len(set(map(lambda _: _.num_steps, settings.parameters))) > 1:
+        raise ValueError(
+            "Expected every swept parameter to have the same number of steps when not sweeping a grid"
+        )
+
+    values: _NDArray[_float64] = settings.get_values()
+
+    return SimulationSweepResult(
+        _uuid4().hex,
+        _time(),
+        circuit,
+        values,
+        settings,
+    )
+
+
+def generate_noisy_replicates(
+    simulation: SimulationResult,
+    num_replicates: int,
+    noise: float,
+    noise_model: NoiseModel = NoiseModel.PROPORTIONAL,
+    seed: Optional[int] = None,
+) -> List[DataSet]:
+    """
+    Generate data sets by adding random, normally distributed noise to the real and imaginary parts of a simulated impedance spectrum.
+    All of the noise is generated in a single batch.
+
+    Parameters
+    ----------
+    simulation: SimulationResult
+        The simulation to use as the noiseless spectrum.
+
+    num_replicates: int
+        The number of data sets to generate.
+
+    noise: float
+        The standard deviation of the noise.
+        If `noise_model` is `NoiseModel.CONSTANT`, then the value is in ohms.
+        Otherwise, the value is a percentage.
+
+    noise_model: NoiseModel, optional
+        How the standard deviation of the noise depends on the impedance.
+
+    seed: Optional[int], optional
+        The seed to use when generating the noise.
+        The same seed produces the same replicates.
+
+    Returns
+    -------
+    List[DataSet]
+    """
+    assert type(simulation) is SimulationResult, simulation
+    assert _issubdtype(type(num_replicates), _integer), num_replicates
+    assert isinstance(noise, (int, float)), noise
+    assert type(noise_model) is NoiseModel, noise_model
+    assert seed is None or _issubdtype(type(seed), _integer), seed
+    if num_replicates < 1:
+        raise ValueError(f"Expected at least one replicate instead of {num_replicates=}")
+    elif noise < 0.0:
+        raise ValueError(f"Expected a non-negative value instead of {noise=}")
+
+    f: _pyimpspec.Frequencies = simulation.get_frequencies()
+    Z: _pyimpspec.ComplexImpedances = simulation.get_impedances()
+
+    sd_real: _NDArray[_float64]
+    sd_imag: _NDArray[_float64]
+    if noise_model == NoiseModel.PROPORTIONAL:
+        sd_real = sd_imag = noise / 100 * abs(Z)
+    elif noise_model == NoiseModel.COMPONENTS:
+        sd_real = noise / 100 * abs(Z.real)
+        sd_imag = noise / 100 * abs(Z.imag)
+    elif noise_model == NoiseModel.CONSTANT:
+        sd_real = sd_imag = _array([noise] * len(Z), dtype=_float64)
+    else:
+        raise NotImplementedError(f"Unsupported noise model: {noise_model}")
+
+    shape: Tuple[int, int] = (num_replicates, len(Z))
+    rng = _default_rng(seed)
+    Z_noisy: _NDArray[_complex128] = Z + rng.normal(0.0, 1.0, shape) * sd_real
+    Z_noisy = Z_noisy + 1j * rng.normal(0.0, 1.0, shape) * sd_imag
+
+    label: str = simulation.get_label()
+
+    return [
+        DataSet(
+            f.copy(),
+            Z_noisy[i],
+            mask={},
+            label=f"{label} - replicate {i + 1}",
+        )
+        for i in range(num_replicates)
+    ]
+
+
+def _analyze_replicate(
+    args: Tuple[
+        _SharedArraysHandle,
+        int,
+        str,
+        Union[KramersKronigSettings, FitSettings, DRTSettings, ZHITSettings],
+    ],
+) -> Optional[Union[KramersKronigResult, FitResult, DRTResult, ZHITResult]]:
+    from deareis.api.drt import calculate_drt
+    from deareis.api.fitting import fit_circuit
+    from deareis.api.kramers_kronig import perform_kramers_kronig_test
+    from deareis.api.zhit import perform_zhit
+
+    handle, i, label, settings = args
+
+    # The data points of all of the replicates are stored end to end.
+    arrays: Dict[str, _NDArray]
+    with _attach_shared_arrays(handle) as arrays:
+        start: int = int(arrays["offsets"][i])
+        end: int = int(arrays["offsets"][i + 1])
+        data: DataSet = DataSet(
+            frequencies=arrays["f"][start:end].copy(),
+            impedances=arrays["Z"][start:end].copy(),
+            mask={int(j): True for j in arrays["mask"][start:end].nonzero()[0]},
+            label=label,
+        )
+
+    # A failed analysis (e.g., a fit that does not converge for a particularly
+    # noisy replicate) does not discard the results of the other replicates.
+    try:
+        if type(settings) is KramersKronigSettings:
+            return perform_kramers_kronig_test(data, settings, num_procs=1)
+        elif type(settings) is FitSettings:
+            return fit_circuit(data, settings, num_procs=1)
+        elif type(settings) is DRTSettings:
+            return calculate_drt(data, settings, num_procs=1)
+        elif type(settings) is ZHITSettings:
+            return perform_zhit(data, settings, num_procs=1)
+    except Exception:
+        return None
+
+    raise NotImplementedError(f"Unsupported settings: {settings}")
+
+
+def _get_replicate_statistics(
+    result: Union[KramersKronigResult, FitResult, DRTResult, ZHITResult],
+) -> Dict[str, float]:
+    statistics: Dict[str, float] = {
+        "Log pseudo chi-squared": _log10(result.pseudo_chisqr),
+    }
+
+    if type(result) is KramersKronigResult:
+        statistics["Num. RC"] = result.num_RC
+    elif type(result) is FitResult:
+        for element_label, parameters in result.parameters.items():
+            for parameter_label, param in parameters.items():
+                if not param.fixed:
+                    statistics[f"{element_label}.{parameter_label}"] = param.value
+    elif type(result) is DRTResult:
+        statistics["Lambda"] = result.lambda_value
+
+    return statistics
+
+
+def analyze_replicates(
+    replicates: List[DataSet],
+    settings: Union[KramersKronigSettings, FitSettings, DRTSettings, ZHITSettings],
+    num_procs: int = -1,
+) -> Tuple[List[Optional[Union[KramersKronigResult, FitResult, DRTResult, ZHITResult]]], _DataFrame]:
+    """
+    Perform the same analysis on each of the replicates (e.g., generated using `generate_noisy_replicates`) in parallel and aggregate the results.
+
+    Parameters
+    ----------
+    replicates: List[DataSet]
+        The data sets to analyze.
+
+    settings: Union[KramersKronigSettings, FitSettings, DRTSettings, ZHITSettings]
+        The settings that determine which analysis is performed and how.
+
+    num_procs: int, optional
+        The maximum number of parallel processes to use.
+        Each replicate is analyzed using a single process.
+        A value less than 1 will result in an attempt to automatically figure out a suitable value.
+        Negative values are used as offsets relative to the number of cores detected.
+
+    Returns
+    -------
+    Tuple[List[Optional[Union[KramersKronigResult, FitResult, DRTResult, ZHITResult]]], pandas.DataFrame]
+        The results in the same order as the replicates and a table containing the mean, standard deviation, minimum, median, and maximum of, e.g., the |pseudo chi-squared| values and the fitted parameter values.
+        The result is None for each replicate that could not be analyzed (e.g., due to a fit that raised an exception), and the table includes the number of such replicates.
+    """
+    assert isinstance(replicates, list), replicates
+    assert all(map(lambda _: isinstance(_, _pyimpspec.DataSet), replicates)), replicates
+    assert type(settings) in (
+        KramersKronigSettings,
+        FitSettings,
+        DRTSettings,
+        ZHITSettings,
+    ), settings
+    assert _issubdtype(type(num_procs), _integer), num_procs
+    if num_procs < 1:
+        num_procs = max((_pyimpspec.get_default_num_procs() - abs(num_procs), 1))
+
+    masks: List[Dict[int, bool]] = [data.get_mask() for data in replicates]
+    lengths: List[int] = [data.get_num_points(masked=None) for data in replicates]
+    results: List[Optional[Union[KramersKronigResult, FitResult, DRTResult, ZHITResult]]] = []
+
+    shared: _SharedArrays
+    prog: _Progress
+    with _SharedArrays(
+        {
+            "f": _concatenate([data.get_frequencies(masked=None) for data in replicates]),
+            "Z": _concatenate([data.get_impedances(masked=None) for data in replicates]),
+            "mask": _array(
+                [
+                    mask.get(i, False)
+                    for mask, length in zip(masks, lengths)
+                    for i in range(length)
+                ],
+                dtype=_bool_,
+            ),
+            "offsets": _cumsum([0] + lengths),
+        },
+        share=num_procs > 1 and len(replicates) > 1,
+    ) as shared, _Progress(
+        "Analyzing replicates",
+        total=len(replicates) + 1,
+    ) as prog:
+        args = (
+            (shared.handle, i, data.get_label(), settings)
+            for i, data in enumerate(replicates)
+        )
+        if num_procs > 1 and len(replicates) > 1:
+            # The analyses may spawn processes of their own, which is not
+            # possible with the daemonic processes of multiprocessing.Pool.
+            with _ProcessPoolExecutor(
+                max_workers=min((num_procs, len(replicates))),
+                mp_context=_get_context(method="spawn"),
+            ) as executor:
+                for res in executor.map(_analyze_replicate, args):
+                    results.append(res)
+                    prog.increment()
+
+        else:
+            for res in map(_analyze_replicate, args):
+                results.append(res)
+                prog.increment()
+
+    num_failed: int = sum(1 for res in results if res is None)
+    if num_failed == len(results):
+        raise ValueError("None of the replicates could be analyzed!")
+
+    rows: List[Dict[str, float]] = [
+        _get_replicate_statistics(res) for res in results if res is not None
+    ]
+    labels: List[str] = []
+    for row in rows:
+        labels.extend(_ for _ in row if _ not in labels)
+
+    columns: Dict[str, list] = {
+        "Label": labels,
+        "Mean": [],
+        "Std. dev.": [],
+        "Min.": [],
+        "Median": [],
+        "Max.": [],
+        "Num. failed": [],
+    }
+    label: str
+    for label in labels:
+        values: _NDArray[_float64] = _array(
+            [row.get(label, _nan) for row in rows],
+            dtype=_float64,
+        )
+        columns["Mean"].append(_nanmean(values))
+        columns["Std. dev."].append(_nanstd(values))
+        columns["Min."].append(_nanmin(values))
+        columns["Median"].append(_nanmedian(values))
+        columns["Max."].append(_nanmax(values))
+        columns["Num. failed"].append(num_failed)
+
+    return (
+        results,
+        _DataFrame.from_dict(columns),
+    )
@@ -68,6 +68,12 @@ ALL NECESSARY SERVICING, REPAIR OR CORRECTION.
         default=[],
         help="Create a new project and load the specified data files as data sets in that project.",
     )
+    parser.add_argument(
+        "--defer-signals",
+        dest="defer_signals",
+        action="store_true",
+        help="Process repeated requests to update plots once per frame.",
+    )
     parser.add_argument(
         "project_files",
         nargs="*",
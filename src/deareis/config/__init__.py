@@ -51,7 +51,12 @@ from pyimpspec import (
     get_elements,
 )
 from deareis.keybindings import Keybinding
+from deareis.data.cache import (
+    DRT_MATRIX_CACHE,
+    LINE_CACHE,
+)
 from deareis.data.plotting import PlotExportSettings
+from deareis.api.pool import configure_worker_pool
 from deareis.data import (
     DRTSettings,
     KramersKronigSuggestionSettings,
@@ -240,6 +245,11 @@ class Config:
         )
         self.auto_backup_interval: int = None  # type: ignore
         self.num_per_decade_in_simulated_lines: int = None  # type: ignore
+        self.line_cache_size: int = None  # type: ignore
+        self.drt_matrix_cache_size: int = None  # type: ignore
+        self.max_tasks_per_worker: int = None  # type: ignore
+        self.auto_tune_num_procs: bool = None  # type: ignore
+        self.drt_parallel_sampling: bool = None  # type: ignore
         self.default_suggestion_settings: KramersKronigSuggestionSettings = None  # type: ignore
         self.default_kramers_kronig_settings: KramersKronigSettings = None  # type: ignore
         self.default_zhit_settings: ZHITSettings = None  # type: ignore
@@ -262,6 +272,11 @@ class Config:
             "num_procs": -1,
             "auto_backup_interval": 10,
             "num_per_decade_in_simulated_lines": 100,
+            "line_cache_size": 64,
+            "drt_matrix_cache_size": 128,
+            "max_tasks_per_worker": 100,
+            "auto_tune_num_procs": False,
+            "drt_parallel_sampling": False,
             "default_kramers_kronig_settings": DEFAULT_KRAMERS_KRONIG_SETTINGS.to_dict(),
             "default_zhit_settings": DEFAULT_ZHIT_SETTINGS.to_dict(),
             "default_fit_settings": DEFAULT_FIT_SETTINGS.to_dict(),
@@ -286,6 +301,11 @@ class Config:
                     "num_procs": self.num_procs,
                     "auto_backup_interval": self.auto_backup_interval,
                     "num_per_decade_in_simulated_lines": self.num_per_decade_in_simulated_lines,
+                    "line_cache_size": self.line_cache_size,
+                    "drt_matrix_cache_size": self.drt_matrix_cache_size,
+                    "max_tasks_per_worker": self.max_tasks_per_worker,
+                    "auto_tune_num_procs": self.auto_tune_num_procs,
+                    "drt_parallel_sampling": self.drt_parallel_sampling,
                     "default_kramers_kronig_settings": kramers_kronig_settings,
                     "default_zhit_settings": self.default_zhit_settings.to_dict(),
                     "default_fit_settings": self.default_fit_settings.to_dict(),
@@ -328,6 +348,24 @@ class Config:
         self.num_per_decade_in_simulated_lines = settings[
             "num_per_decade_in_simulated_lines"
         ]
+        # The memory budget (in MiB) of the cache of interpolated lines.
+        self.line_cache_size = settings.get("line_cache_size", 64)
+        LINE_CACHE.set_max_size(self.line_cache_size * 1024**2)
+        # The memory budget (in MiB) of the cache of DRT matrices.
+        self.drt_matrix_cache_size = settings.get("drt_matrix_cache_size", 128)
+        DRT_MATRIX_CACHE.set_max_size(self.drt_matrix_cache_size * 1024**2)
+        # The number of tasks that a worker process of the persistent pool
+        # completes before being replaced.
+        self.max_tasks_per_worker = settings.get("max_tasks_per_worker", 100)
+        configure_worker_pool(self.num_procs or -1, self.max_tasks_per_worker)
+        # Whether or not the number of processes is picked for each analysis
+        # based on the measured throughput, in which case num_procs is the
+        # maximum number of processes.
+        self.auto_tune_num_procs = settings.get("auto_tune_num_procs", False)
+        # Whether or not the credible intervals (TR-RBF method) are sampled
+        # using multiple chains and the attempts (BHT method) are performed
+        # using deterministic initial values.
+        self.drt_parallel_sampling = settings.get("drt_parallel_sampling", False)
         self.default_kramers_kronig_settings = KramersKronigSettings.from_dict(
             settings.get(
                 "default_kramers_kronig_settings",
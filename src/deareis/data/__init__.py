@@ -19,6 +19,7 @@
 
 from .data_sets import DataSet
 from .project import Project
+from .fit_index import FitIndex
 from .kramers_kronig import (
     KramersKronigSuggestionSettings,
     KramersKronigResult,
@@ -26,13 +27,18 @@ from .kramers_kronig import (
     KramersKronigSuggestionSettings,
 )
 from .fitting import (
+    FitConfidenceIntervals,
     FitResult,
     FitSettings,
     FittedParameter,
+    MultiStartSummary,
 )
 from .simulation import (
     SimulationResult,
     SimulationSettings,
+    SimulationSweepResult,
+    SimulationSweepSettings,
+    SweptParameter,
 )
 from .plotting import (
     PlotSettings,
@@ -40,6 +46,8 @@ from .plotting import (
 )
 from .drt import (
     DRTResult,
+    DRTSeriesResult,
+    DRTSeriesSettings,
     DRTSettings,
 )
 from .zhit import (
@@ -0,0 +1,394 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from threading import Lock
+from typing import (
+    Callable,
+    Generic,
+    Hashable,
+    Tuple,
+    TypeVar,
+)
+from numpy import (
+    integer,
+    issubdtype,
+)
+from numpy.typing import NDArray
+from pyimpspec import (
+    Circuit,
+    ComplexImpedances,
+    Frequencies,
+)
+from pyimpspec.circuit.parser import (
+    Parser,
+    VERSION as PARSER_VERSION,
+)
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStatistics:
+    """
+    A snapshot of the statistics of a cache.
+
+    Parameters
+    ----------
+    hits: int
+        The number of lookups that were served from the cache.
+
+    misses: int
+        The number of lookups that required the value to be calculated.
+
+    evictions: int
+        The number of values that have been evicted to stay within the maximum size.
+
+    num_items: int
+        The number of values currently in the cache.
+
+    size: int
+        The total size of the values currently in the cache (e.g., the number of bytes).
+
+    max_size: int
+        The maximum size of the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    num_items: int
+    size: int
+    max_size: int
+
+    def get_hit_rate(self) -> float:
+        """
+        Get the fraction of lookups that were served from the cache.
+
+        Returns
+        -------
+        float
+        """
+        total: int = self.hits + self.misses
+        if total == 0:
+            return 0.0
+
+        return self.hits / total
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread-safe, bounded cache that evicts the least recently used values when the maximum size is exceeded.
+    The size of each value is one unless a subclass measures it differently (e.g., in bytes).
+
+    Parameters
+    ----------
+    max_size: int
+        The maximum size.
+    """
+
+    def __init__(self, max_size: int):
+        assert issubdtype(type(max_size), integer), max_size
+        self._lock: Lock = Lock()
+        self._values: "OrderedDict[K, V]" = OrderedDict()
+        self._max_size: int = max(max_size, 0)
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__} ({len(self._values)} items, {hex(id(self))})"
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._values
+
+    def _get_size(self, value: V) -> int:
+        return 1
+
+    def _evict(self):
+        while self._values and self._size > self._max_size:
+            _, value = self._values.popitem(last=False)
+            self._size -= self._get_size(value)
+            self._evictions += 1
+
+    def _get(self, key: K, calculate: Callable[[], V]) -> V:
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+                self._hits += 1
+                return value
+
+            self._misses += 1
+
+        # The lock is not held while calculating since that may take a while,
+        # and any exceptions are propagated without caching anything.
+        value = calculate()
+
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = value
+                self._size += self._get_size(value)
+                self._evict()
+
+        return value
+
+    def _remove(self, predicate: Callable[[K], bool]):
+        with self._lock:
+            key: K
+            for key in [_ for _ in self._values if predicate(_)]:
+                self._size -= self._get_size(self._values.pop(key))
+
+    def clear(self):
+        """
+        Remove all values and reset the statistics.
+        """
+        with self._lock:
+            self._values.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get_max_size(self) -> int:
+        """
+        Get the maximum size.
+
+        Returns
+        -------
+        int
+        """
+        return self._max_size
+
+    def set_max_size(self, max_size: int):
+        """
+        Set the maximum size.
+        Values are evicted immediately if the new maximum is exceeded.
+
+        Parameters
+        ----------
+        max_size: int
+            The new maximum.
+            A value of zero effectively disables the cache.
+        """
+        assert issubdtype(type(max_size), integer), max_size
+        with self._lock:
+            self._max_size = max(max_size, 0)
+            self._evict()
+
+    def get_statistics(self) -> CacheStatistics:
+        """
+        Get a snapshot of the statistics of the cache.
+
+        Returns
+        -------
+        CacheStatistics
+        """
+        with self._lock:
+            return CacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_items=len(self._values),
+                size=self._size,
+                max_size=self._max_size,
+            )
+
+
+# The key consists of the UUID of a result and the number of points per
+# decade.
+LineKey = Tuple[str, int]
+Line = Tuple[Frequencies, ComplexImpedances]
+
+
+class LineCache(LRUCache[LineKey, Line]):
+    """
+    A cache of interpolated lines (e.g., the impedance spectrum of a fitted circuit evaluated at 100 points per decade) with a memory budget in bytes.
+    A single instance, `LINE_CACHE`, is shared by the results in a process so that, e.g., the plots in the different tabs and the exporter do not keep evicting each other's lines.
+
+    Parameters
+    ----------
+    max_bytes: int, optional
+        The memory budget in bytes.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024**2):
+        super().__init__(max_size=max_bytes)
+
+    def _get_size(self, value: Line) -> int:
+        f, Z = value
+        return f.nbytes + Z.nbytes
+
+    def get_line(
+        self,
+        uuid: str,
+        num_per_decade: int,
+        calculate: Callable[[], Line],
+    ) -> Line:
+        """
+        Get a line from the cache or calculate it if it is not cached.
+
+        Parameters
+        ----------
+        uuid: str
+            The UUID of the result that the line belongs to.
+
+        num_per_decade: int
+            The number of points per decade.
+
+        calculate: Callable[[], Tuple[Frequencies, ComplexImpedances]]
+            The function that calculates the frequencies and the impedances of the line in case of a cache miss.
+
+        Returns
+        -------
+        Tuple[Frequencies, ComplexImpedances]
+            The arrays are shared and are marked as read-only.
+        """
+
+        def calculate_read_only() -> Line:
+            f, Z = calculate()
+            f.flags.writeable = False
+            Z.flags.writeable = False
+            return (f, Z)
+
+        return self._get((uuid, num_per_decade), calculate_read_only)
+
+    def invalidate(self, uuid: str):
+        """
+        Remove the lines that belong to a result (e.g., when the result is deleted).
+
+        Parameters
+        ----------
+        uuid: str
+            The UUID of the result.
+        """
+        self._remove(lambda key: key[0] == uuid)
+
+
+LINE_CACHE: LineCache = LineCache()
+
+
+class MatrixCache(LRUCache[Hashable, NDArray]):
+    """
+    A cache of matrices (e.g., the discretization matrices used when calculating the distribution of relaxation times) with a memory budget in bytes.
+    The keys must contain everything that the matrices depend on (e.g., the bytes of the frequency array and the values of the relevant settings).
+    A single instance, `DRT_MATRIX_CACHE`, is shared by the DRT analyses in a process so that, e.g., batches of data sets with the same frequencies and sweeps of the regularization parameter only assemble the matrices once.
+
+    Parameters
+    ----------
+    max_bytes: int, optional
+        The memory budget in bytes.
+    """
+
+    def __init__(self, max_bytes: int = 128 * 1024**2):
+        super().__init__(max_size=max_bytes)
+
+    def _get_size(self, value: NDArray) -> int:
+        return value.nbytes
+
+    def get_matrix(
+        self,
+        key: Hashable,
+        calculate: Callable[[], NDArray],
+    ) -> NDArray:
+        """
+        Get a matrix from the cache or calculate it if it is not cached.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key that identifies the matrix.
+
+        calculate: Callable[[], NDArray]
+            The function that calculates the matrix in case of a cache miss.
+
+        Returns
+        -------
+        NDArray
+            The matrix is shared and is marked as read-only.
+        """
+
+        def calculate_read_only() -> NDArray:
+            matrix: NDArray = calculate()
+            matrix.flags.writeable = False
+            return matrix
+
+        return self._get(key, calculate_read_only)
+
+
+DRT_MATRIX_CACHE: MatrixCache = MatrixCache()
+
+
+# The key consists of the circuit description code, the version that the code
+# is parsed as, and the version of the parser.
+CircuitKey = Tuple[str, int, int]
+
+
+class CircuitCache(LRUCache[CircuitKey, Circuit]):
+    """
+    A cache of circuits parsed from circuit description codes (CDCs) with a maximum number of circuits.
+    The cached circuits are never handed out directly.
+    Each lookup returns a deep copy, which is considerably cheaper than parsing the CDC, so that callers can modify the parameters of the circuits that they receive.
+    A single instance, `CIRCUIT_CACHE`, is shared in a process so that, e.g., the CDCs of the settings in batch analyses and the results in projects are only parsed once.
+
+    Parameters
+    ----------
+    max_circuits: int, optional
+        The maximum number of circuits.
+    """
+
+    def __init__(self, max_circuits: int = 256):
+        super().__init__(max_size=max_circuits)
+
+    def parse(self, cdc: str, version: int = -1) -> Circuit:
+        """
+        Get a circuit from the cache or parse the circuit description code if it is not cached.
+
+        Parameters
+        ----------
+        cdc: str
+            The circuit description code.
+
+        version: int, optional
+            The version of the circuit description code syntax to parse the code as.
+            See `pyimpspec.circuit.parser.Parser.process` for details.
+
+        Returns
+        -------
+        Circuit
+            A copy of the cached circuit that can be modified.
+        """
+        if not isinstance(cdc, str):
+            raise TypeError(f"Expected a string instead of {cdc=}")
+
+        return deepcopy(
+            self._get(
+                (cdc, version, PARSER_VERSION),
+                lambda: Parser().process(cdc, version=version),
+            )
+        )
+
+
+CIRCUIT_CACHE: CircuitCache = CircuitCache()
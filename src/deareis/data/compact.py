@@ -0,0 +1,132 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Union,
+)
+from numpy import (
+    array,
+    integer,
+    issubdtype,
+    ndarray,
+    zeros,
+)
+from numpy.typing import NDArray
+
+
+class ResultMask(Mapping):
+    """
+    A read-only mapping of zero-based indices to booleans (True means that the data point was omitted) that is backed by a NumPy array instead of a dictionary.
+    Results store their masks using this class in order to reduce their memory footprint.
+
+    Parameters
+    ----------
+    mask: Union[Mapping[int, bool], NDArray[bool]]
+        The mask to store.
+        The keys of a mapping are assumed to be contiguous starting from zero and any missing keys are treated as False.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, mask: Union[Mapping, NDArray]):
+        values: NDArray
+        if isinstance(mask, ResultMask):
+            values = mask._values
+        elif isinstance(mask, ndarray):
+            assert mask.ndim == 1, mask.shape
+            values = array(mask, dtype=bool)
+        else:
+            assert isinstance(mask, Mapping), mask
+            values = zeros(max(map(int, mask.keys()), default=-1) + 1, dtype=bool)
+            for i, flag in mask.items():
+                values[int(i)] = flag
+
+        values.flags.writeable = False
+        self._values: NDArray = values
+
+    def __repr__(self) -> str:
+        return f"ResultMask ({self.to_array().sum()}/{len(self)} masked, {hex(id(self))})"
+
+    def __getitem__(self, key: int) -> bool:
+        if not issubdtype(type(key), integer) or not (0 <= key < len(self._values)):
+            raise KeyError(key)
+
+        return bool(self._values[key])
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self._values)))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __reduce__(self):
+        return (ResultMask, (self.to_array(),))
+
+    def __deepcopy__(self, memo: dict) -> "ResultMask":
+        # The array is read-only so it can be shared.
+        return self
+
+    def copy(self) -> Dict[int, bool]:
+        """
+        Get the mask as a dictionary.
+
+        Returns
+        -------
+        Dict[int, bool]
+        """
+        return {i: bool(flag) for i, flag in enumerate(self._values)}
+
+    def to_array(self) -> NDArray:
+        """
+        Get the mask as an array of booleans.
+
+        Returns
+        -------
+        NDArray[bool]
+        """
+        return self._values.copy()
+
+
+class slotted_cached_property:
+    """
+    Equivalent to `functools.cached_property` but for classes that define `__slots__` instead of `__dict__`.
+    The computed value is stored in the slot with the same name as the property but prefixed with `_cached_`, which must be declared by the class or one of its base classes.
+    """
+
+    def __init__(self, func: Callable):
+        self.func: Callable = func
+        self.slot: str = f"_cached_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value: Any = self.func(instance)
+            setattr(instance, self.slot, value)
+
+            return value
@@ -28,13 +28,18 @@ from typing import (
 from numpy import (
     angle,
     array,
+    diff,
+    float64,
     floating,
     full,
+    integer,
     isnan,
     issubdtype,
+    log10 as log,
     nan,
+    nonzero,
 )
-from scipy.signal import find_peaks
+from numpy.typing import NDArray
 from pandas import DataFrame
 from pyimpspec.analysis.utility import _calculate_pseudo_chisqr
 from pyimpspec import (
@@ -76,11 +81,43 @@ from deareis.utility import (
     rename_dict_entry,
 )
 from deareis.data import DataSet
+from deareis.data.compact import ResultMask
 
 
 VERSION: int = 4
 
 
+def _find_peak_indices(gammas: NDArray[float64]) -> Tuple[Indices, Indices]:
+    """
+    Find the local maxima of one or more distributions in a single vectorized pass.
+    The results are the same as those obtained by applying `scipy.signal.find_peaks` to each row (i.e., the end points are excluded and the middle point of a flat peak is used).
+
+    Parameters
+    ----------
+    gammas: NDArray[float64]
+        A 2-D array where each row is a distribution.
+
+    Returns
+    -------
+    Tuple[Indices, Indices]
+        The row and the column indices of the peaks sorted by row and then by column.
+    """
+    assert gammas.ndim == 2, gammas.shape
+    slopes: NDArray[float64] = diff(gammas, axis=1)
+    rows: Indices
+    columns: Indices
+    rows, columns = nonzero(slopes)
+    rising: NDArray = slopes[rows, columns] > 0.0
+    # A peak is a rising slope that is followed (possibly after a plateau)
+    # by a falling slope in the same row.
+    edges: NDArray = (rows[:-1] == rows[1:]) & rising[:-1] & ~rising[1:]
+
+    return (
+        rows[:-1][edges],
+        (columns[:-1][edges] + 1 + columns[1:][edges]) // 2,
+    )
+
+
 def _parse_settings_v4(dictionary: dict) -> dict:
     lambda_value: float = dictionary.get("lambda_value", 1e-3)
 
@@ -358,7 +395,7 @@ def _parse_result_v1(dictionary: dict) -> dict:
     return dictionary
 
 
-@dataclass
+@dataclass(slots=True)
 class DRTResult:
     """
     An object representing the results of calculating the distribution of relaxation times in a  data set.
@@ -415,6 +452,7 @@ class DRTResult:
 
     mask: Dict[int, bool]
         The mask that was applied to the analyzed data set.
+        The mask is stored as a read-only `ResultMask`.
 
     settings: DRTSettings
         The settings used to perform this analysis.
@@ -437,6 +475,9 @@ class DRTResult:
     mask: Dict[int, bool]
     settings: DRTSettings
 
+    def __post_init__(self):
+        self.mask = ResultMask(self.mask)
+
     def __repr__(self) -> str:
         return f"DRTResult ({self.get_label()}, {hex(id(self))})"
 
@@ -761,16 +802,9 @@ class DRTResult:
         assert 0.0 <= threshold <= 1.0, threshold
 
         def filter_indices(gammas: Gammas) -> Indices:
-            max_g: Gamma = max(gammas)
-            indices: Indices = find_peaks(gammas)[0]
-            return array(
-                list(
-                    filter(
-                        lambda _: gammas[_] / max_g > threshold and gammas[_] > 0.0,
-                        indices,
-                    ),
-                )
-            )
+            indices: Indices = _find_peak_indices(gammas.reshape((1, -1)))[1]
+            peaks: Gammas = gammas[indices]
+            return indices[(peaks / max(gammas) > threshold) & (peaks > 0.0)]
 
         real_indices: Indices = filter_indices(self.real_gammas)
         real_taus: TimeConstants
@@ -983,3 +1017,289 @@ class DRTResult:
                 ],
             }
         )
+
+
+# The series are versioned separately from the other classes in this module.
+SERIES_VERSION: int = 1
+
+
+def _parse_series_settings_v1(dictionary: dict) -> dict:
+    assert type(dictionary) is dict
+    return {
+        "mode": DRTMode(dictionary["mode"]),
+        "lambda_value": dictionary["lambda_value"],
+        "derivative_order": dictionary["derivative_order"],
+        "smoothness": dictionary["smoothness"],
+        "inductance": dictionary["inductance"],
+        "num_per_decade": dictionary["num_per_decade"],
+    }
+
+
+@dataclass(frozen=True)
+class DRTSeriesSettings:
+    """
+    The settings to use when calculating the distribution of relaxation times of an ordered series of data sets (e.g., spectra recorded over time).
+
+    Parameters
+    ----------
+    mode: DRTMode
+        The mode or type of data (i.e., complex, real, or imaginary) to use.
+
+    lambda_value: float
+        The Tikhonov regularization parameter to use.
+        The value is relative to the mean magnitude of the impedances of each data set and must be greater than zero.
+
+    derivative_order: int
+        The derivative order (0, 1, or 2) to use when calculating the penalty in the Tikhonov regularization.
+
+    smoothness: float
+        The weight of the penalty for differences between the gamma values of consecutive data sets.
+        The value is relative to the mean magnitude of the impedances of each data set.
+        A value of zero means that the data sets are analyzed independently.
+
+    inductance: bool
+        Whether or not to include an inductive term in the calculations.
+        Ignored when the mode is `DRTMode.REAL`.
+
+    num_per_decade: int
+        The number of time constants per decade in the common grid of time constants.
+    """
+
+    mode: DRTMode
+    lambda_value: float
+    derivative_order: int
+    smoothness: float
+    inductance: bool
+    num_per_decade: int
+
+    def __repr__(self) -> str:
+        return f"DRTSeriesSettings ({hex(id(self))})"
+
+    @classmethod
+    def from_dict(Class, dictionary: dict) -> "DRTSeriesSettings":
+        """
+        Create an instance from a dictionary.
+        """
+        assert type(dictionary) is dict
+        assert "version" in dictionary
+        version: int = dictionary["version"]
+        assert version <= SERIES_VERSION, f"{version=} > {SERIES_VERSION=}"
+        parsers: Dict[int, Callable] = {
+            1: _parse_series_settings_v1,
+        }
+        assert version in parsers, f"{version=} not in {parsers.keys()=}"
+        return Class(**parsers[version](dictionary))
+
+    def to_dict(self) -> dict:
+        """
+        Return a dictionary that can be used to recreate an instance.
+        """
+        return {
+            "version": SERIES_VERSION,
+            "mode": int(self.mode),
+            "lambda_value": self.lambda_value,
+            "derivative_order": self.derivative_order,
+            "smoothness": self.smoothness,
+            "inductance": self.inductance,
+            "num_per_decade": self.num_per_decade,
+        }
+
+
+def _parse_series_result_v1(dictionary: dict) -> dict:
+    assert type(dictionary) is dict
+    return {
+        "uuid": dictionary["uuid"],
+        "timestamp": dictionary["timestamp"],
+        "time_constants": array(dictionary["time_constants"], dtype=float64),
+        "gammas": array(dictionary["gammas"], dtype=float64).reshape(
+            (len(dictionary["labels"]), len(dictionary["time_constants"]))
+        ),
+        "labels": list(dictionary["labels"]),
+        "series_resistances": array(dictionary["series_resistances"], dtype=float64),
+        "inductances": array(dictionary["inductances"], dtype=float64),
+        "pseudo_chisqrs": array(dictionary["pseudo_chisqrs"], dtype=float64),
+        "settings": DRTSeriesSettings.from_dict(dictionary["settings"]),
+    }
+
+
+@dataclass(slots=True)
+class DRTSeriesResult:
+    """
+    A class containing the distributions of relaxation times of an ordered series of data sets.
+    All of the distributions share the same time constants, which means that the gamma values can be plotted as, e.g., a heat map.
+
+    Parameters
+    ----------
+    uuid: str
+        The universally unique identifier assigned to this result.
+
+    timestamp: float
+        The Unix time (in seconds) for when the analysis was performed.
+
+    time_constants: TimeConstants
+        The time constants (in seconds) that are shared by all of the distributions.
+
+    gammas: NDArray[float64]
+        The gamma values (in ohms) as a 2-D array where each row corresponds to a data set and each column to a time constant.
+
+    labels: List[str]
+        The labels of the data sets.
+
+    series_resistances: NDArray[float64]
+        The series resistance (in ohms) of each data set.
+
+    inductances: NDArray[float64]
+        The series inductance (in henrys) of each data set.
+        The values are zero if an inductive term was not included.
+
+    pseudo_chisqrs: NDArray[float64]
+        The |pseudo chi-squared| of each data set.
+
+    settings: DRTSeriesSettings
+        The settings that were used to perform the analysis.
+    """
+
+    uuid: str
+    timestamp: float
+    time_constants: TimeConstants
+    gammas: NDArray[float64]
+    labels: List[str]
+    series_resistances: NDArray[float64]
+    inductances: NDArray[float64]
+    pseudo_chisqrs: NDArray[float64]
+    settings: DRTSeriesSettings
+
+    def __hash__(self) -> int:
+        return int(self.uuid, 16)
+
+    def __repr__(self) -> str:
+        return f"DRTSeriesResult ({self.get_label()}, {hex(id(self))})"
+
+    @classmethod
+    def from_dict(Class, dictionary: dict) -> "DRTSeriesResult":
+        """
+        Create an instance from a dictionary.
+        """
+        assert type(dictionary) is dict
+        assert "version" in dictionary
+        version: int = dictionary["version"]
+        assert version <= SERIES_VERSION, f"{version=} > {SERIES_VERSION=}"
+        parsers: Dict[int, Callable] = {
+            1: _parse_series_result_v1,
+        }
+        assert version in parsers, f"{version=} not in {parsers.keys()=}"
+        return Class(**parsers[version](dictionary))
+
+    def to_dict(self) -> dict:
+        """
+        Return a dictionary that can be used to recreate an instance.
+        """
+        return {
+            "version": SERIES_VERSION,
+            "uuid": self.uuid,
+            "timestamp": self.timestamp,
+            "time_constants": self.time_constants.tolist(),
+            "gammas": self.gammas.tolist(),
+            "labels": self.labels[:],
+            "series_resistances": self.series_resistances.tolist(),
+            "inductances": self.inductances.tolist(),
+            "pseudo_chisqrs": self.pseudo_chisqrs.tolist(),
+            "settings": self.settings.to_dict(),
+        }
+
+    def get_label(self) -> str:
+        """
+        Generate a label for the result.
+
+        Returns
+        -------
+        str
+        """
+        timestamp: str = format_timestamp(self.timestamp)
+
+        return f"DRT series, {self.get_num_spectra()} data sets ({timestamp})"
+
+    def get_num_spectra(self) -> int:
+        """
+        Get the number of analyzed data sets.
+
+        Returns
+        -------
+        int
+        """
+        return self.gammas.shape[0]
+
+    def get_labels(self) -> List[str]:
+        """
+        Get the labels of the analyzed data sets.
+
+        Returns
+        -------
+        List[str]
+        """
+        return self.labels[:]
+
+    def get_time_constants(self) -> TimeConstants:
+        """
+        Get the time constants that are shared by all of the distributions.
+
+        Returns
+        -------
+        TimeConstants
+        """
+        return self.time_constants
+
+    def get_gammas(self, index: int = -1) -> NDArray[float64]:
+        """
+        Get the gamma values of one or all of the data sets.
+
+        Parameters
+        ----------
+        index: int, optional
+            The index of the data set.
+            If the value is negative, then a 2-D array containing all of the distributions (one per row) is returned.
+
+        Returns
+        -------
+        NDArray[float64]
+        """
+        assert issubdtype(type(index), integer), index
+        if index < 0:
+            return self.gammas
+
+        return self.gammas[index]
+
+    def get_drt_data(self, index: int) -> Tuple[TimeConstants, Gammas]:
+        """
+        Get the data necessary to plot the distribution of a single data set.
+
+        Parameters
+        ----------
+        index: int
+            The index of the data set.
+
+        Returns
+        -------
+        Tuple[TimeConstants, Gammas]
+        """
+        return (
+            self.time_constants,
+            self.get_gammas(index),
+        )
+
+    def to_statistics_dataframe(self) -> DataFrame:
+        """
+        Get a `pandas.DataFrame` instance containing a table of the series resistance, the series inductance, and the |pseudo chi-squared| of each data set.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        return DataFrame.from_dict(
+            {
+                "Label": self.labels,
+                "R_inf (ohm)": self.series_resistances,
+                "L (H)": self.inductances,
+                "Log pseudo chi-squared": log(self.pseudo_chisqrs),
+            }
+        )
@@ -0,0 +1,389 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from numpy import (
+    array,
+    float64,
+    full,
+    inf,
+    int64,
+    nan,
+)
+from numpy.typing import NDArray
+from pandas import DataFrame
+from deareis.enums import (
+    cnls_method_to_label,
+    weight_to_label,
+)
+from deareis.data.fitting import (
+    FitResult,
+    FittedParameter,
+)
+
+
+# The key of a row consists of the UUID of the data set and the UUID of the fit.
+FitKey = Tuple[str, str]
+
+_TEXT_COLUMNS: Tuple[str, ...] = (
+    "data_uuid",
+    "fit_uuid",
+    "circuit",
+    "method",
+    "weight",
+)
+_FLOAT_COLUMNS: Tuple[str, ...] = (
+    "timestamp",
+    "pseudo_chisqr",
+    "chisqr",
+    "red_chisqr",
+    "aic",
+    "bic",
+)
+_INTEGER_COLUMNS: Tuple[str, ...] = (
+    "ndata",
+    "nfree",
+    "nfev",
+)
+_PARAMETER_COLUMNS: Tuple[str, ...] = (
+    "data_uuid",
+    "fit_uuid",
+    "element",
+    "parameter",
+    "value",
+    "stderr",
+)
+
+
+def _swap_remove(columns: Dict[str, List[Any]], i: int):
+    # Removes a row in constant time by moving the last row into its place.
+    column: List[Any]
+    for column in columns.values():
+        column[i] = column[-1]
+        column.pop()
+
+
+class FitIndex:
+    """
+    A columnar index of the statistics and fitted parameters of the fit results in a project.
+    Each row corresponds to a fit result of a data set and the rows are added and removed as fit results are added to or deleted from the project.
+    The columns can be queried (e.g., to find the fits with a reduced chi-squared below some threshold) or exported as a single table without going through the individual fit results.
+
+    The available columns are: data_uuid, fit_uuid, circuit, method, weight, timestamp, pseudo_chisqr, chisqr, red_chisqr, aic, bic, ndata, nfree, and nfev.
+    """
+
+    def __init__(self):
+        self._rows: Dict[FitKey, int] = {}
+        self._columns: Dict[str, List[Any]] = {
+            column: []
+            for column in _TEXT_COLUMNS + _FLOAT_COLUMNS + _INTEGER_COLUMNS
+        }
+        self._parameter_rows: Dict[FitKey, List[int]] = {}
+        self._parameter_columns: Dict[str, List[Any]] = {
+            column: [] for column in _PARAMETER_COLUMNS
+        }
+
+    def __repr__(self) -> str:
+        return f"FitIndex ({len(self._rows)} fits, {hex(id(self))})"
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: FitKey) -> bool:
+        return key in self._rows
+
+    def add(self, data_uuid: str, fit: FitResult):
+        """
+        Add a row for a fit result.
+
+        Parameters
+        ----------
+        data_uuid: str
+            The UUID of the data set that the circuit was fitted to.
+
+        fit: FitResult
+            The fit result.
+        """
+        assert isinstance(data_uuid, str), data_uuid
+        assert isinstance(fit, FitResult), fit
+        key: FitKey = (data_uuid, fit.uuid)
+        assert key not in self._rows, key
+
+        self._rows[key] = len(self._columns["fit_uuid"])
+        values: Dict[str, Any] = {
+            "data_uuid": data_uuid,
+            "fit_uuid": fit.uuid,
+            "circuit": fit.circuit.to_string(),
+            "method": cnls_method_to_label[fit.method],
+            "weight": weight_to_label[fit.weight],
+            "timestamp": fit.timestamp,
+            "pseudo_chisqr": fit.pseudo_chisqr,
+            "chisqr": fit.chisqr,
+            "red_chisqr": fit.red_chisqr,
+            "aic": fit.aic,
+            "bic": fit.bic,
+            "ndata": fit.ndata,
+            "nfree": fit.nfree,
+            "nfev": fit.nfev,
+        }
+        column: str
+        for column, value in values.items():
+            self._columns[column].append(value)
+
+        rows: List[int] = []
+        self._parameter_rows[key] = rows
+
+        element_label: str
+        parameters: Dict[str, FittedParameter]
+        for element_label, parameters in fit.parameters.items():
+            parameter_label: str
+            param: FittedParameter
+            for parameter_label, param in parameters.items():
+                rows.append(len(self._parameter_columns["fit_uuid"]))
+                self._parameter_columns["data_uuid"].append(data_uuid)
+                self._parameter_columns["fit_uuid"].append(fit.uuid)
+                self._parameter_columns["element"].append(element_label)
+                self._parameter_columns["parameter"].append(parameter_label)
+                self._parameter_columns["value"].append(param.value)
+                self._parameter_columns["stderr"].append(
+                    param.stderr if param.stderr is not None else nan
+                )
+
+    def remove(self, data_uuid: str, fit_uuid: str):
+        """
+        Remove the row of a fit result.
+
+        Parameters
+        ----------
+        data_uuid: str
+            The UUID of the data set that the circuit was fitted to.
+
+        fit_uuid: str
+            The UUID of the fit result.
+        """
+        key: FitKey = (data_uuid, fit_uuid)
+        assert key in self._rows, key
+
+        i: int = self._rows.pop(key)
+        last: int = len(self._columns["fit_uuid"]) - 1
+        if i != last:
+            self._rows[
+                (self._columns["data_uuid"][last], self._columns["fit_uuid"][last])
+            ] = i
+        _swap_remove(self._columns, i)
+
+        # The rows are removed in descending order so that the last row never
+        # belongs to the fit that is being removed unless it is the current row.
+        for i in sorted(self._parameter_rows.pop(key), reverse=True):
+            last = len(self._parameter_columns["fit_uuid"]) - 1
+            if i != last:
+                rows: List[int] = self._parameter_rows[
+                    (
+                        self._parameter_columns["data_uuid"][last],
+                        self._parameter_columns["fit_uuid"][last],
+                    )
+                ]
+                rows[rows.index(last)] = i
+            _swap_remove(self._parameter_columns, i)
+
+    def remove_data_set(self, data_uuid: str):
+        """
+        Remove the rows of the fit results of a data set.
+
+        Parameters
+        ----------
+        data_uuid: str
+            The UUID of the data set.
+        """
+        key: FitKey
+        for key in [_ for _ in self._rows if _[0] == data_uuid]:
+            self.remove(*key)
+
+    def clear(self):
+        """
+        Remove all rows.
+        """
+        self._rows.clear()
+        self._parameter_rows.clear()
+        column: List[Any]
+        for column in self._columns.values():
+            column.clear()
+        for column in self._parameter_columns.values():
+            column.clear()
+
+    def get_keys(self) -> List[FitKey]:
+        """
+        Get the (data set UUID, fit UUID) pairs in the same order as the values returned by `get_column`.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+        """
+        return list(zip(self._columns["data_uuid"], self._columns["fit_uuid"]))
+
+    def get_column(self, column: str) -> NDArray:
+        """
+        Get the values of a column.
+
+        Parameters
+        ----------
+        column: str
+            The name of the column (e.g., "red_chisqr").
+
+        Returns
+        -------
+        NDArray
+        """
+        assert column in self._columns, f"Unsupported column: {column}"
+        if column in _FLOAT_COLUMNS:
+            return array(self._columns[column], dtype=float64)
+        elif column in _INTEGER_COLUMNS:
+            return array(self._columns[column], dtype=int64)
+
+        return array(self._columns[column], dtype=object)
+
+    def get_parameter(
+        self,
+        element: str,
+        parameter: str,
+    ) -> Tuple[List[FitKey], NDArray[float64]]:
+        """
+        Get the fitted values of a parameter (e.g., for plotting a trend across data sets).
+
+        Parameters
+        ----------
+        element: str
+            The label of the element (e.g., "R_1").
+
+        parameter: str
+            The symbol of the parameter (e.g., "R").
+
+        Returns
+        -------
+        Tuple[List[Tuple[str, str]], NDArray[float64]]
+            The (data set UUID, fit UUID) pairs of the fits that include the parameter and the fitted values.
+        """
+        columns: Dict[str, List[Any]] = self._parameter_columns
+        indices: List[int] = [
+            i
+            for i, (e, p) in enumerate(zip(columns["element"], columns["parameter"]))
+            if e == element and p == parameter
+        ]
+
+        return (
+            [(columns["data_uuid"][i], columns["fit_uuid"][i]) for i in indices],
+            array([columns["value"][i] for i in indices], dtype=float64),
+        )
+
+    def find_fits(
+        self,
+        column: str,
+        minimum: float = -inf,
+        maximum: float = inf,
+    ) -> List[FitKey]:
+        """
+        Find the fits with values within an inclusive range in a numeric column (e.g., the fits with a reduced chi-squared below some threshold).
+
+        Parameters
+        ----------
+        column: str
+            The name of a numeric column (e.g., "red_chisqr").
+
+        minimum: float, optional
+            The lower limit.
+
+        maximum: float, optional
+            The upper limit.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            The (data set UUID, fit UUID) pairs of the matching fits.
+        """
+        assert column in _FLOAT_COLUMNS + _INTEGER_COLUMNS, f"Unsupported column: {column}"
+        values: NDArray = self.get_column(column)
+        keys: List[FitKey] = self.get_keys()
+
+        return [
+            keys[i]
+            for i in ((values >= minimum) & (values <= maximum)).nonzero()[0]
+        ]
+
+    def to_dataframe(
+        self,
+        data_labels: Optional[Dict[str, str]] = None,
+        parameters: bool = True,
+    ) -> DataFrame:
+        """
+        Get the index as a `pandas.DataFrame` instance where each row corresponds to a fit result.
+        The values and standard errors of the fitted parameters are included as columns (e.g., "R_1: R" and "R_1: R (stderr)"), which contain NaN for fits of circuits that do not include the parameter.
+
+        Parameters
+        ----------
+        data_labels: Optional[Dict[str, str]], optional
+            A mapping of data set UUIDs to the labels of the data sets.
+            If provided, then the labels are included as the first column.
+
+        parameters: bool, optional
+            Whether or not to include the fitted parameters.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        table: Dict[str, Any] = {}
+        if data_labels is not None:
+            table["data_label"] = [
+                data_labels.get(_, "") for _ in self._columns["data_uuid"]
+            ]
+
+        column: str
+        for column in self._columns:
+            table[column] = self.get_column(column)
+
+        if parameters:
+            num_rows: int = len(self._rows)
+            values: Dict[str, NDArray[float64]] = {}
+            errors: Dict[str, NDArray[float64]] = {}
+            columns: Dict[str, List[Any]] = self._parameter_columns
+
+            key: FitKey
+            rows: List[int]
+            for key, rows in self._parameter_rows.items():
+                row: int = self._rows[key]
+                i: int
+                for i in rows:
+                    label: str = f"{columns['element'][i]}: {columns['parameter'][i]}"
+                    if label not in values:
+                        values[label] = full(num_rows, nan, dtype=float64)
+                        errors[label] = full(num_rows, nan, dtype=float64)
+                    values[label][row] = columns["value"][i]
+                    errors[label][row] = columns["stderr"][i]
+
+            for label in sorted(values.keys()):
+                table[label] = values[label]
+                table[f"{label} (stderr)"] = errors[label]
+
+        return DataFrame.from_dict(table)
@@ -29,12 +29,15 @@ from typing import (
 from numpy import (
     angle,
     array,
+    float64,
     integer,
     isnan,
     issubdtype,
     log10 as log,
+    median,
     nan,
 )
+from numpy.typing import NDArray
 from pandas import DataFrame
 import pyimpspec
 from pyimpspec.analysis.utility import _calculate_pseudo_chisqr
@@ -51,8 +54,10 @@ from pyimpspec import (
 from pyimpspec.analysis.utility import _interpolate
 from deareis.enums import (
     CNLSMethod,
+    ResamplingMethod,
     Weight,
     cnls_method_to_label,
+    resampling_method_to_label,
     weight_to_label,
 )
 from deareis.utility import (
@@ -60,9 +65,19 @@ from deareis.utility import (
     rename_dict_entry,
 )
 from deareis.data import DataSet
+from deareis.data.cache import (
+    CIRCUIT_CACHE,
+    LINE_CACHE,
+)
+from deareis.data.lazy import lazy_slots
+from deareis.data.compact import ResultMask
+
 
+VERSION: int = 4
 
-VERSION: int = 3
+
+def _parse_fitted_parameter_v4(dictionary: dict) -> dict:
+    return dictionary
 
 
 def _parse_fitted_parameter_v3(dictionary: dict) -> dict:
@@ -106,6 +121,7 @@ class FittedParameter(pyimpspec.FittedParameter):
             1: _parse_fitted_parameter_v1,
             2: _parse_fitted_parameter_v2,
             3: _parse_fitted_parameter_v3,
+            4: _parse_fitted_parameter_v4,
         }
         assert version in parsers, f"{version=} not in {parsers.keys()=}"
 
@@ -140,6 +156,10 @@ class FittedParameter(pyimpspec.FittedParameter):
         }
 
 
+def _parse_settings_v4(dictionary: dict) -> dict:
+    return dictionary
+
+
 def _parse_settings_v3(dictionary: dict) -> dict:
     return dictionary
 
@@ -212,6 +232,7 @@ class FitSettings:
             1: _parse_settings_v1,
             2: _parse_settings_v2,
             3: _parse_settings_v3,
+            4: _parse_settings_v4,
         }
         assert version in parsers, f"{version=} not in {parsers.keys()=}"
 
@@ -251,7 +272,151 @@ class FitSettings:
         }
 
 
+def _parse_confidence_intervals_v4(dictionary: dict) -> dict:
+    return dictionary
+
+
+@dataclass(frozen=True)
+class FitConfidenceIntervals:
+    """
+    A class containing the confidence intervals of the parameters of a fitted circuit that were estimated by refitting resampled data.
+
+    Parameters
+    ----------
+    method: ResamplingMethod
+        The method that was used to resample the data.
+
+    confidence_level: float
+        The confidence level (in percent) of the intervals.
+
+    num_samples: int
+        The number of resampled data sets that were refitted.
+
+    num_failed: int
+        The number of refits that failed.
+
+    lower_limits: Dict[str, Dict[str, float]]
+        The mapping to the mappings of the lower limits of the intervals of the free element parameters.
+
+    upper_limits: Dict[str, Dict[str, float]]
+        The mapping to the mappings of the upper limits of the intervals of the free element parameters.
+    """
+
+    method: ResamplingMethod
+    confidence_level: float
+    num_samples: int
+    num_failed: int
+    lower_limits: Dict[str, Dict[str, float]]
+    upper_limits: Dict[str, Dict[str, float]]
+
+    def __repr__(self) -> str:
+        return f"FitConfidenceIntervals ({resampling_method_to_label[self.method]}, {hex(id(self))})"
+
+    @classmethod
+    def from_dict(Class, dictionary: dict) -> "FitConfidenceIntervals":
+        """
+        Create an instance from a dictionary.
+
+        Parameters
+        ----------
+        dictionary: dict
+            The dictionary to turn into a FitConfidenceIntervals object.
+
+        Returns
+        -------
+        FitConfidenceIntervals
+        """
+        assert type(dictionary) is dict
+        assert "version" in dictionary
+        version: int = dictionary["version"]
+        del dictionary["version"]
+        assert version <= VERSION, f"{version=} > {VERSION=}"
+
+        parsers: Dict[int, Callable] = {
+            4: _parse_confidence_intervals_v4,
+        }
+        assert version in parsers, f"{version=} not in {parsers.keys()=}"
+
+        v: int
+        p: Callable
+        for v, p in parsers.items():
+            if v < version:
+                continue
+            dictionary = p(dictionary)
+
+        assert "method" in dictionary
+        assert "confidence_level" in dictionary
+        assert "num_samples" in dictionary
+        assert "num_failed" in dictionary
+        assert "lower_limits" in dictionary
+        assert "upper_limits" in dictionary
+
+        dictionary["method"] = ResamplingMethod(dictionary["method"])
+
+        return Class(**dictionary)
+
+    def to_dict(self) -> dict:
+        """
+        Return a dictionary that can be used to recreate an instance.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "version": VERSION,
+            "method": self.method,
+            "confidence_level": self.confidence_level,
+            "num_samples": self.num_samples,
+            "num_failed": self.num_failed,
+            "lower_limits": {
+                element_label: parameters.copy()
+                for element_label, parameters in self.lower_limits.items()
+            },
+            "upper_limits": {
+                element_label: parameters.copy()
+                for element_label, parameters in self.upper_limits.items()
+            },
+        }
+
+    def get_interval(
+        self,
+        element_label: str,
+        parameter_label: str,
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Get the lower and upper limits of the interval of a parameter.
+
+        Parameters
+        ----------
+        element_label: str
+            The label of the element (e.g., "R_1").
+
+        parameter_label: str
+            The symbol of the parameter (e.g., "R").
+
+        Returns
+        -------
+        Optional[Tuple[float, float]]
+            None is returned if no interval was estimated for the parameter (e.g., because it is fixed).
+        """
+        if parameter_label not in self.lower_limits.get(element_label, {}):
+            return None
+
+        return (
+            self.lower_limits[element_label][parameter_label],
+            self.upper_limits[element_label][parameter_label],
+        )
+
+
+def _parse_result_v4(dictionary: dict) -> dict:
+    return dictionary
+
+
 def _parse_result_v3(dictionary: dict) -> dict:
+    if "confidence_intervals" not in dictionary:
+        dictionary["confidence_intervals"] = None
+
     return dictionary
 
 
@@ -289,7 +454,8 @@ def _parse_result_v1(dictionary: dict) -> dict:
     return dictionary
 
 
-@dataclass
+@lazy_slots(impedances="_calculate_impedances")
+@dataclass(slots=True)
 class FitResult:
     """
     A class containing the result of a circuit fit.
@@ -311,14 +477,16 @@ class FitResult:
     frequencies: Frequencies
         The frequencies used to perform the fit.
 
-    impedances: ComplexImpedances
+    impedances: Optional[ComplexImpedances]
         The complex impedances of the fitted circuit at each of the frequencies.
+        If None, then the impedances are calculated when they are first accessed.
 
     residuals: ComplexResiduals
         The residuals of the real and imaginary parts of the fit.
 
     mask: Dict[int, bool]
         The mask that was applied to the DataSet that the circuit was fitted to.
+        The mask is stored as a read-only `ResultMask`.
 
     pseudo_chisqr: float
         The calculated |pseudo chi-squared| (eq. 14 in Boukamp, 1995).
@@ -352,6 +520,9 @@ class FitResult:
 
     settings: FitSettings
         The settings that were used to perform the fit.
+
+    confidence_intervals: Optional[FitConfidenceIntervals], optional
+        The confidence intervals of the fitted parameters (see `calculate_confidence_intervals`).
     """
 
     uuid: str
@@ -359,7 +530,7 @@ class FitResult:
     circuit: Circuit
     parameters: Dict[str, Dict[str, FittedParameter]]
     frequencies: Frequencies
-    impedances: ComplexImpedances
+    impedances: Optional[ComplexImpedances]
     residuals: ComplexResiduals
     mask: Dict[int, bool]
     pseudo_chisqr: float
@@ -373,10 +544,10 @@ class FitResult:
     method: CNLSMethod
     weight: Weight
     settings: FitSettings
+    confidence_intervals: Optional[FitConfidenceIntervals] = None
 
     def __post_init__(self):
-        self._cached_frequencies: Dict[int, Frequencies] = {}
-        self._cached_impedances: Dict[int, ComplexImpedances] = {}
+        self.mask = ResultMask(self.mask)
 
     def __hash__(self) -> int:
         return int(self.uuid, 16)
@@ -416,6 +587,7 @@ class FitResult:
             1: _parse_result_v1,
             2: _parse_result_v2,
             3: _parse_result_v3,
+            4: _parse_result_v4,
         }
         assert version in parsers, f"{version=} not in {parsers.keys()=}"
 
@@ -445,8 +617,9 @@ class FitResult:
         assert "method" in dictionary
         assert "weight" in dictionary
         assert "settings" in dictionary
+        assert "confidence_intervals" in dictionary
 
-        dictionary["circuit"] = pyimpspec.parse_cdc(dictionary["circuit"])
+        dictionary["circuit"] = CIRCUIT_CACHE.parse(dictionary["circuit"])
 
         dictionary["parameters"] = {
             element_label: {
@@ -462,9 +635,8 @@ class FitResult:
             "real_impedances" not in dictionary
             or "imaginary_impedances" not in dictionary
         ):
-            dictionary["impedances"] = dictionary["circuit"].get_impedances(
-                dictionary["frequencies"]
-            )
+            # The impedances are calculated when they are first accessed.
+            dictionary["impedances"] = None
         else:
             dictionary["impedances"] = array(
                 list(
@@ -508,8 +680,16 @@ class FitResult:
         del dictionary["imaginary_residuals"]
 
         dictionary["settings"] = FitSettings.from_dict(dictionary["settings"])
+        if dictionary["confidence_intervals"] is not None:
+            dictionary["confidence_intervals"] = FitConfidenceIntervals.from_dict(
+                dictionary["confidence_intervals"]
+            )
 
         if isnan(dictionary["pseudo_chisqr"]):
+            if dictionary["impedances"] is None:
+                dictionary["impedances"] = dictionary["circuit"].get_impedances(
+                    dictionary["frequencies"]
+                )
             dictionary["pseudo_chisqr"] = _calculate_pseudo_chisqr(
                 Z_exp=data.get_impedances(),
                 Z_fit=dictionary["impedances"],
@@ -559,6 +739,9 @@ class FitResult:
             "method": self.method,
             "weight": self.weight,
             "settings": self.settings.to_dict(),
+            "confidence_intervals": self.confidence_intervals.to_dict()
+            if self.confidence_intervals is not None
+            else None,
         }
 
         if session is True:
@@ -611,6 +794,7 @@ class FitResult:
     def to_parameters_dataframe(self, running: bool = False) -> DataFrame:
         """
         Get a `pandas.DataFrame` instance containing a table of fitted element parameters.
+        If confidence intervals have been estimated, then the lower and upper limits of the intervals are included as additional columns.
 
         Parameters
         ----------
@@ -626,6 +810,8 @@ class FitResult:
         parameter_labels: List[str] = []
         fitted_values: List[float] = []
         stderr_values: List[Union[float, str]] = []
+        lower_limits: List[Union[float, str]] = []
+        upper_limits: List[Union[float, str]] = []
         fixed: List[str] = []
         units: List[str] = []
         internal_identifiers: Dict[
@@ -669,17 +855,31 @@ class FitResult:
                 )
                 fixed.append("Yes" if param.fixed else "No")
                 units.append(param.unit)
+                if self.confidence_intervals is not None:
+                    interval: Optional[
+                        Tuple[float, float]
+                    ] = self.confidence_intervals.get_interval(
+                        element_label,
+                        parameter_label,
+                    )
+                    lower_limits.append(interval[0] if interval is not None else "-")
+                    upper_limits.append(interval[1] if interval is not None else "-")
+
+        columns: Dict[str, list] = {
+            "Element": element_labels,
+            "Parameter": parameter_labels,
+            "Value": fitted_values,
+            "Std. err. (%)": stderr_values,
+        }
+        if self.confidence_intervals is not None:
+            level: str = f"{self.confidence_intervals.confidence_level:g}%"
+            columns[f"{level} CI lower"] = lower_limits
+            columns[f"{level} CI upper"] = upper_limits
 
-        return DataFrame.from_dict(
-            {
-                "Element": element_labels,
-                "Parameter": parameter_labels,
-                "Value": fitted_values,
-                "Std. err. (%)": stderr_values,
-                "Unit": units,
-                "Fixed": fixed,
-            }
-        )
+        columns["Unit"] = units
+        columns["Fixed"] = fixed
+
+        return DataFrame.from_dict(columns)
 
     def get_label(self) -> str:
         """
@@ -697,6 +897,13 @@ class FitResult:
 
         return f"{cdc} ({timestamp})"
 
+    def _calculate_impedances(self) -> ComplexImpedances:
+        return self.circuit.get_impedances(self.frequencies)
+
+    def _calculate_line(self, num_per_decade: int) -> Tuple[Frequencies, ComplexImpedances]:
+        f: Frequencies = _interpolate(self.frequencies, num_per_decade)
+        return (f, self.circuit.get_impedances(f))
+
     def get_frequencies(self, num_per_decade: int = -1) -> Frequencies:
         """
         Get an array of frequencies within the range of frequencies in the data set.
@@ -712,12 +919,11 @@ class FitResult:
         """
         assert issubdtype(type(num_per_decade), integer), num_per_decade
         if num_per_decade > 0:
-            if num_per_decade not in self._cached_frequencies:
-                self._cached_frequencies.clear()
-                self._cached_frequencies[num_per_decade] = _interpolate(
-                    self.frequencies, num_per_decade
-                )
-            return self._cached_frequencies[num_per_decade]
+            return LINE_CACHE.get_line(
+                self.uuid,
+                num_per_decade,
+                lambda: self._calculate_line(num_per_decade),
+            )[0]
 
         return self.frequencies
 
@@ -736,12 +942,11 @@ class FitResult:
         """
         assert issubdtype(type(num_per_decade), integer), num_per_decade
         if num_per_decade > 0:
-            if num_per_decade not in self._cached_impedances:
-                self._cached_impedances.clear()
-                self._cached_impedances[num_per_decade] = self.circuit.get_impedances(
-                    self.get_frequencies(num_per_decade)
-                )
-            return self._cached_impedances[num_per_decade]
+            return LINE_CACHE.get_line(
+                self.uuid,
+                num_per_decade,
+                lambda: self._calculate_line(num_per_decade),
+            )[1]
 
         return self.impedances
 
@@ -817,3 +1022,77 @@ class FitResult:
             self.residuals.real * 100,
             self.residuals.imag * 100,
         )
+
+
+@dataclass(frozen=True)
+class MultiStartSummary:
+    """
+    A class containing a summary of the outcomes of a multi-start circuit fit.
+
+    Parameters
+    ----------
+    num_starts: int
+        The number of initial parameter vectors that were generated.
+
+    pseudo_chisqrs: NDArray[float64]
+        The |pseudo chi-squared| values of the successful fits sorted in ascending order.
+
+    cdcs: List[str]
+        The circuit description codes containing the initial values of the successful fits (in the same order as `pseudo_chisqrs`).
+
+    num_failed: int
+        The number of fits that either raised an exception or timed out.
+    """
+
+    num_starts: int
+    pseudo_chisqrs: NDArray[float64]
+    cdcs: List[str]
+    num_failed: int
+
+    def __repr__(self) -> str:
+        return f"MultiStartSummary ({self.num_starts} starts, {hex(id(self))})"
+
+    def get_num_converged(self, tolerance: float = 0.01) -> int:
+        """
+        Get the number of fits that ended up within some relative tolerance of the best |pseudo chi-squared|.
+
+        Parameters
+        ----------
+        tolerance: float, optional
+            The relative tolerance.
+
+        Returns
+        -------
+        int
+        """
+        assert isinstance(tolerance, float) and tolerance >= 0.0, tolerance
+        if len(self.pseudo_chisqrs) == 0:
+            return 0
+
+        best: float = self.pseudo_chisqrs[0]
+        return int(sum(self.pseudo_chisqrs <= best * (1.0 + tolerance)))
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Get the statistics describing the distribution of the final |pseudo chi-squared| values as a `pandas.DataFrame` object.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        values: NDArray[float64] = self.pseudo_chisqrs
+        statistics: Dict[str, Union[int, float]] = {
+            "Number of starts": self.num_starts,
+            "Number of failed fits": self.num_failed,
+            "Number within 1% of best": self.get_num_converged(),
+            "Log pseudo chi-squared (min.)": log(values.min()) if len(values) > 0 else nan,
+            "Log pseudo chi-squared (median)": log(median(values)) if len(values) > 0 else nan,
+            "Log pseudo chi-squared (max.)": log(values.max()) if len(values) > 0 else nan,
+        }
+
+        return DataFrame.from_dict(
+            {
+                "Label": list(statistics.keys()),
+                "Value": list(statistics.values()),
+            }
+        )
@@ -18,7 +18,6 @@
 # the LICENSES folder.
 
 from dataclasses import dataclass
-from functools import cached_property
 from typing import (
     Callable,
     Dict,
@@ -67,6 +66,15 @@ from deareis.utility import (
     rename_dict_entry,
 )
 from deareis.data import DataSet
+from deareis.data.cache import (
+    CIRCUIT_CACHE,
+    LINE_CACHE,
+)
+from deareis.data.lazy import lazy_slots
+from deareis.data.compact import (
+    ResultMask,
+    slotted_cached_property,
+)
 from pyimpspec.typing.helpers import _is_integer
 
 
@@ -438,8 +446,36 @@ def _parse_result_v1(dictionary: dict) -> dict:
     return dictionary
 
 
-@dataclass
-class KramersKronigResult:
+class _KramersKronigResultSlots:
+    # The storage of the cached properties of KramersKronigResult, which
+    # does not have a __dict__.
+    __slots__ = (
+        "_cached_test",
+        "_cached_num_RC",
+        "_cached_admittance",
+        "_cached_label",
+        "_cached_time_constants",
+        "_cached_log_F_ext",
+        "_cached_series_resistance",
+        "_cached_series_capacitance",
+        "_cached_series_inductance",
+        "_cached_parallel_resistance",
+        "_cached_parallel_capacitance",
+        "_cached_parallel_inductance",
+        "_cached_residuals_means",
+        "_cached_residuals_sd",
+        "_cached_residuals_within_1sd",
+        "_cached_residuals_within_2sd",
+        "_cached_residuals_within_3sd",
+        "_cached_lilliefors",
+        "_cached_shapiro_wilk",
+        "_cached_kolmogorov_smirnov",
+    )
+
+
+@lazy_slots(impedances="_calculate_impedances")
+@dataclass(slots=True)
+class KramersKronigResult(_KramersKronigResultSlots):
     """
     A class containing the result of a Kramers-Kronig test.
 
@@ -460,14 +496,16 @@ class KramersKronigResult:
     frequencies: Frequencies
         The frequencies used to perform the test.
 
-    impedances: ComplexImpedances
+    impedances: Optional[ComplexImpedances]
         The complex impedances of the fitted circuit at each of the frequencies.
+        If None, then the impedances are calculated when they are first accessed.
 
     residuals: ComplexResiduals
         The residuals of the real and the imaginary parts of the fit.
 
     mask: Dict[int, bool]
         The mask that was applied to the DataSet that was tested.
+        The mask is stored as a read-only `ResultMask`.
 
     settings: KramersKronigSettings
         The settings that were used to perform the test.
@@ -478,14 +516,13 @@ class KramersKronigResult:
     circuit: Circuit
     pseudo_chisqr: float
     frequencies: Frequencies
-    impedances: ComplexImpedances
+    impedances: Optional[ComplexImpedances]
     residuals: ComplexResiduals
     mask: Dict[int, bool]
     settings: KramersKronigSettings
 
     def __post_init__(self):
-        self._cached_frequencies: Dict[int, Frequencies] = {}
-        self._cached_impedances: Dict[int, ComplexImpedances] = {}
+        self.mask = ResultMask(self.mask)
 
     def __hash__(self) -> int:
         return int(self.uuid, 16)
@@ -493,51 +530,51 @@ class KramersKronigResult:
     def __repr__(self) -> str:
         return f"KramersKronigResult ({self.label}, {hex(id(self))})"
 
-    @cached_property
+    @slotted_cached_property
     def test(self) -> str:
         return test_to_value[self.settings.test]
 
-    @cached_property
+    @slotted_cached_property
     def num_RC(self) -> int:
         return self.get_num_RC()
 
-    @cached_property
+    @slotted_cached_property
     def admittance(self) -> bool:
         return self.was_tested_on_admittance()
 
-    @cached_property
+    @slotted_cached_property
     def label(self) -> str:
         return self.get_label()
 
-    @cached_property
+    @slotted_cached_property
     def time_constants(self) -> TimeConstants:
         return self.get_time_constants()
 
-    @cached_property
+    @slotted_cached_property
     def log_F_ext(self) -> float:
         return self.get_log_F_ext()
 
-    @cached_property
+    @slotted_cached_property
     def series_resistance(self) -> float:
         return self.get_series_resistance()
 
-    @cached_property
+    @slotted_cached_property
     def series_capacitance(self) -> float:
         return self.get_series_capacitance()
 
-    @cached_property
+    @slotted_cached_property
     def series_inductance(self) -> float:
         return self.get_series_inductance()
 
-    @cached_property
+    @slotted_cached_property
     def parallel_resistance(self) -> float:
         return self.get_parallel_resistance()
 
-    @cached_property
+    @slotted_cached_property
     def parallel_capacitance(self) -> float:
         return self.get_parallel_capacitance()
 
-    @cached_property
+    @slotted_cached_property
     def parallel_inductance(self) -> float:
         return self.get_parallel_inductance()
 
@@ -569,7 +606,7 @@ class KramersKronigResult:
 
         return f"{label} ({timestamp})"
 
-    @cached_property
+    @slotted_cached_property
     def residuals_means(self) -> Tuple[float, float]:
         _, real, imag = self.get_residuals_data()
 
@@ -578,7 +615,7 @@ class KramersKronigResult:
             mean(imag),
         )
 
-    @cached_property
+    @slotted_cached_property
     def residuals_sd(self) -> Tuple[float, float]:
         _, real, imag = self.get_residuals_data()
 
@@ -587,27 +624,27 @@ class KramersKronigResult:
             std(imag, ddof=1),
         )
 
-    @cached_property
+    @slotted_cached_property
     def residuals_within_1sd(self) -> Tuple[float, float]:
         return self.get_residuals_within(n=1)
 
-    @cached_property
+    @slotted_cached_property
     def residuals_within_2sd(self) -> Tuple[float, float]:
         return self.get_residuals_within(n=2)
 
-    @cached_property
+    @slotted_cached_property
     def residuals_within_3sd(self) -> Tuple[float, float]:
         return self.get_residuals_within(n=3)
 
-    @cached_property
+    @slotted_cached_property
     def lilliefors(self) -> Tuple[float, float]:
         return self.perform_lilliefors_test()
 
-    @cached_property
+    @slotted_cached_property
     def shapiro_wilk(self) -> Tuple[float, float]:
         return self.perform_shapiro_wilk_test()
 
-    @cached_property
+    @slotted_cached_property
     def kolmogorov_smirnov(self) -> Tuple[float, float]:
         return self.perform_kolmogorov_smirnov_test()
 
@@ -663,7 +700,7 @@ class KramersKronigResult:
         assert "real_residuals" in dictionary
         assert "imaginary_residuals" in dictionary
         assert "settings" in dictionary
-        dictionary["circuit"] = pyimpspec.parse_cdc(dictionary["circuit"])
+        dictionary["circuit"] = CIRCUIT_CACHE.parse(dictionary["circuit"])
         dictionary["frequencies"] = array(dictionary["frequencies"])
         dictionary["settings"] = KramersKronigSettings.from_dict(dictionary["settings"])
 
@@ -684,9 +721,8 @@ class KramersKronigResult:
             "real_impedances" not in dictionary
             or "imaginary_impedances" not in dictionary
         ):
-            dictionary["impedances"] = dictionary["circuit"].get_impedances(
-                dictionary["frequencies"]
-            )
+            # The impedances are calculated when they are first accessed.
+            dictionary["impedances"] = None
         else:
             dictionary["impedances"] = array(
                 list(
@@ -765,6 +801,13 @@ class KramersKronigResult:
 
         return dictionary
 
+    def _calculate_impedances(self) -> ComplexImpedances:
+        return self.circuit.get_impedances(self.frequencies)
+
+    def _calculate_line(self, num_per_decade: int) -> Tuple[Frequencies, ComplexImpedances]:
+        f: Frequencies = _interpolate(self.frequencies, num_per_decade)
+        return (f, self.circuit.get_impedances(f))
+
     def get_frequencies(self, num_per_decade: int = -1) -> Frequencies:
         """
         Get an array of frequencies within the range of tested frequencies.
@@ -782,12 +825,11 @@ class KramersKronigResult:
             raise TypeError(f"Expected an integer instead of {num_per_decade=}")
 
         if num_per_decade > 0:
-            if num_per_decade not in self._cached_frequencies:
-                self._cached_frequencies.clear()
-                self._cached_frequencies[num_per_decade] = _interpolate(
-                    self.frequencies, num_per_decade
-                )
-            return self._cached_frequencies[num_per_decade]
+            return LINE_CACHE.get_line(
+                self.uuid,
+                num_per_decade,
+                lambda: self._calculate_line(num_per_decade),
+            )[0]
 
         return self.frequencies
 
@@ -808,12 +850,11 @@ class KramersKronigResult:
             raise TypeError(f"Expected an integer instead of {num_per_decade=}")
 
         if num_per_decade > 0:
-            if num_per_decade not in self._cached_impedances:
-                self._cached_impedances.clear()
-                self._cached_impedances[num_per_decade] = self.circuit.get_impedances(
-                    self.get_frequencies(num_per_decade)
-                )
-            return self._cached_impedances[num_per_decade]
+            return LINE_CACHE.get_line(
+                self.uuid,
+                num_per_decade,
+                lambda: self._calculate_line(num_per_decade),
+            )[1]
 
         return self.impedances
 
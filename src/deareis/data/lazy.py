@@ -0,0 +1,173 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+)
+from numpy import (
+    array,
+    complex128,
+    float64,
+)
+from numpy.typing import NDArray
+
+
+class _LazySlot:
+    # Wraps the member descriptor of a slot so that a value of None is
+    # replaced by the return value of a method when the slot is first read.
+    def __init__(self, member: Any, method: str):
+        self.member: Any = member
+        self.method: str = method
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        value: Any = self.member.__get__(instance, owner)
+        if value is None:
+            value = getattr(instance, self.method)()
+            self.member.__set__(instance, value)
+
+        return value
+
+    def __set__(self, instance: Any, value: Any):
+        self.member.__set__(instance, value)
+
+    def is_pending(self, instance: Any) -> bool:
+        return self.member.__get__(instance, type(instance)) is None
+
+
+def lazy_slots(**methods: str) -> Callable[[type], type]:
+    """
+    Class decorator for slotted dataclasses that makes the provided fields lazy.
+    A field that has been assigned None is calculated using the corresponding method the first time that the field is read.
+    The decorator must be applied after (i.e., above) the `dataclass` decorator.
+
+    Parameters
+    ----------
+    **methods: str
+        The names of the fields mapped to the names of the methods that calculate their values.
+    """
+
+    def decorator(Class: type) -> type:
+        field: str
+        method: str
+        for field, method in methods.items():
+            assert field in Class.__slots__, (Class, field)
+            setattr(Class, field, _LazySlot(Class.__dict__[field], method))
+
+        return Class
+
+    return decorator
+
+
+def is_pending(instance: Any, field: str) -> bool:
+    """
+    Check if a lazy field has yet to be calculated.
+
+    Parameters
+    ----------
+    instance: Any
+        The instance of a class decorated with `lazy_slots`.
+
+    field: str
+        The name of the field.
+
+    Returns
+    -------
+    bool
+    """
+    descriptor: Any = type(instance).__dict__.get(field)
+    if not isinstance(descriptor, _LazySlot):
+        return False
+
+    return descriptor.is_pending(instance)
+
+
+def calculate_pending_impedances(results: Iterable[Any]) -> int:
+    """
+    Calculate the impedances of results (e.g., Kramers-Kronig or fit results loaded from a minimized project file) that have yet to be calculated.
+    Results with circuits that have the same structure and were evaluated at the same frequencies are calculated as a single vectorized batch.
+
+    Parameters
+    ----------
+    results: Iterable[Any]
+        The results, which may also include objects without lazy impedances (e.g., data sets).
+
+    Returns
+    -------
+    int
+        The number of results whose impedances were calculated.
+    """
+    from deareis.api.circuit.compiled import (
+        CompiledCircuit,
+        compile_circuit,
+    )
+
+    groups: Dict[Tuple[str, bytes], List[Any]] = {}
+    identities: Set[int] = set()
+    num_calculated: int = 0
+    for result in results:
+        if id(result) in identities or not is_pending(result, "impedances"):
+            continue
+
+        identities.add(id(result))
+        if not hasattr(result, "frequencies"):
+            # E.g., simulation sweeps, whose spectra are already calculated
+            # as a batch.
+            result.impedances
+            num_calculated += 1
+            continue
+
+        key: Tuple[str, bytes] = (
+            result.circuit.to_string(),
+            array(result.frequencies, dtype=float64).tobytes(),
+        )
+        if key not in groups:
+            groups[key] = []
+
+        groups[key].append(result)
+
+    group: List[Any]
+    for group in groups.values():
+        num_calculated += len(group)
+        if len(group) == 1:
+            group[0].impedances
+            continue
+
+        compiled: CompiledCircuit = compile_circuit(group[0].circuit)
+        if compiled.has_containers():
+            for result in group:
+                result.impedances
+            continue
+
+        Z: NDArray[complex128] = compiled.get_impedances(
+            group[0].frequencies,
+            array([compiled.extract_values(_.circuit) for _ in group]),
+        )
+        for result, row in zip(group, Z):
+            result.impedances = row.copy()
+
+    return num_calculated
@@ -43,13 +43,19 @@ from typing import (
 )
 from uuid import uuid4
 from numpy import inf
+from pandas import DataFrame
 from pyimpspec.circuit.parser import Parser
 from deareis.data import DataSet
+from deareis.data.cache import LINE_CACHE
 from deareis.data.fitting import FitResult
+from deareis.data.fit_index import FitIndex
 from deareis.data.drt import DRTResult
 from deareis.data.kramers_kronig import KramersKronigResult
 from deareis.data.zhit import ZHITResult
-from deareis.data.simulation import SimulationResult
+from deareis.data.simulation import (
+    SimulationResult,
+    SimulationSweepResult,
+)
 from deareis.data.plotting import (
     PlotSettings,
     PlotSeries,
@@ -57,14 +63,22 @@ from deareis.data.plotting import (
 from deareis.enums import PlotType
 
 
-VERSION: int = 6
+VERSION: int = 7
 
 
-def _parse_v6(state: dict) -> dict:
+def _parse_v7(state: dict) -> dict:
     # TODO: Update implementation when VERSION is incremented
     return state
 
 
+def _parse_v6(state: dict) -> dict:
+    # Simulation sweeps were added.
+    if "simulation_sweeps" not in state:
+        state["simulation_sweeps"] = []
+
+    return state
+
+
 def _parse_v5(state: dict) -> dict:
     # Version number was bumped to force automatic backups of projects created
     # with earlier versions. Not because the project structure itself changed,
@@ -189,6 +203,7 @@ class Project:
             )
         
         self._fits: Dict[str, List[FitResult]] = {}
+        self._fit_index: FitIndex = FitIndex()
         
         for uuid, results in kwargs.get("fits", {}).items():
             data = data_lookup[uuid]
@@ -198,6 +213,8 @@ class Project:
                     results,
                 )
             )
+            for fit in self._fits[uuid]:
+                self._fit_index.add(uuid, fit)
         
         self._zhits: Dict[str, List[ZHITResult]] = {}
         
@@ -239,6 +256,10 @@ class Project:
         self._simulations: List[SimulationResult] = list(
             map(SimulationResult.from_dict, kwargs.get("simulations", []))
         )
+
+        self._simulation_sweeps: List[SimulationSweepResult] = list(
+            map(SimulationSweepResult.from_dict, kwargs.get("simulation_sweeps", []))
+        )
         
         self._tests: Dict[str, List[KramersKronigResult]] = {}
 
@@ -293,6 +314,7 @@ class Project:
                 4: _parse_v4,
                 5: _parse_v5,
                 6: _parse_v6,
+                7: _parse_v7,
             }
             assert version in parsers, (
                 version,
@@ -350,6 +372,7 @@ class Project:
         assert type(state["notes"]) is str
         assert type(state["plots"]) is list
         assert type(state["simulations"]) is list
+        assert type(state["simulation_sweeps"]) is list
         assert type(state["tests"]) is dict
 
         return state
@@ -477,6 +500,7 @@ class Project:
             state["notes"] = state["notes"] + "\n\n" + other["notes"]
             state["plots"].extend(other["plots"])
             state["simulations"].extend(other["simulations"])
+            state["simulation_sweeps"].extend(other["simulation_sweeps"])
             state["tests"].update(other["tests"])
             state["zhits"].update(other["zhits"])
             state["label"] = other["label"]
@@ -498,6 +522,7 @@ class Project:
         
         uuids.extend(list(map(lambda _: _["uuid"], state["plots"])))
         uuids.extend(list(map(lambda _: _["uuid"], state["simulations"])))
+        uuids.extend(list(map(lambda _: _["uuid"], state["simulation_sweeps"])))
         
         for tests in state["tests"].values():
             uuids.extend(list(map(lambda _: _["uuid"], tests)))
@@ -574,6 +599,9 @@ class Project:
             "notes": self._notes,
             "plots": list(map(lambda _: _.to_dict(session=session), self._plots)),
             "simulations": list(map(lambda _: _.to_dict(), self._simulations)),
+            "simulation_sweeps": list(
+                map(lambda _: _.to_dict(), self._simulation_sweeps)
+            ),
             "tests": {
                 k: list(map(lambda _: _.to_dict(session=session), v))
                 for k, v in self._tests.items()
@@ -791,7 +819,10 @@ class Project:
         assert data.uuid in list(map(lambda _: _.uuid, self._data_sets)), data
         
         self._data_sets.remove(data)
+        list(map(lambda _: LINE_CACHE.invalidate(_.uuid), self._fits[data.uuid]))
+        list(map(lambda _: LINE_CACHE.invalidate(_.uuid), self._tests[data.uuid]))
         del self._fits[data.uuid]
+        self._fit_index.remove_data_set(data.uuid)
         del self._drts[data.uuid]
         del self._tests[data.uuid]
         del self._zhits[data.uuid]
@@ -862,6 +893,7 @@ class Project:
         assert test in self._tests[data.uuid], test
         
         self._tests[data.uuid].remove(test)
+        LINE_CACHE.invalidate(test.uuid)
         list(map(lambda _: _.remove_series(test.uuid), self._plots))
 
     def get_all_zhits(self) -> Dict[str, List[ZHITResult]]:
@@ -1044,6 +1076,7 @@ class Project:
         assert fit.uuid not in list(map(lambda _: _.uuid, self._fits[data.uuid]))
         
         self._fits[data.uuid].insert(0, fit)
+        self._fit_index.add(data.uuid, fit)
 
     def delete_fit(self, data: DataSet, fit: FitResult):
         """
@@ -1063,8 +1096,40 @@ class Project:
         assert fit in self._fits[data.uuid], fit
         
         self._fits[data.uuid].remove(fit)
+        LINE_CACHE.invalidate(fit.uuid)
+        self._fit_index.remove(data.uuid, fit.uuid)
         list(map(lambda _: _.remove_series(fit.uuid), self._plots))
 
+    def get_fit_index(self) -> FitIndex:
+        """
+        Get the columnar index of the statistics and fitted parameters of all fit results in the project.
+        The index is kept up to date as fit results are added or deleted and should not be modified directly.
+
+        Returns
+        -------
+        FitIndex
+        """
+        return self._fit_index
+
+    def get_fits_dataframe(self, parameters: bool = True) -> DataFrame:
+        """
+        Get a `pandas.DataFrame` instance containing the statistics and, optionally, the fitted parameters of all fit results in the project.
+        Each row corresponds to a fit result and the first column contains the label of the data set.
+
+        Parameters
+        ----------
+        parameters: bool, optional
+            Whether or not to include the fitted parameters.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        return self._fit_index.to_dataframe(
+            data_labels={_.uuid: _.get_label() for _ in self._data_sets},
+            parameters=parameters,
+        )
+
     def get_simulations(self) -> List[SimulationResult]:
         """
         Get all of the simulation results.
@@ -1102,8 +1167,47 @@ class Project:
         assert simulation in self._simulations
         
         self._simulations.remove(simulation)
+        LINE_CACHE.invalidate(simulation.uuid)
         list(map(lambda _: _.remove_series(simulation.uuid), self._plots))
 
+    def get_simulation_sweeps(self) -> List[SimulationSweepResult]:
+        """
+        Get all of the simulation sweep results.
+
+        Returns
+        -------
+        List[SimulationSweepResult]
+        """
+        return self._simulation_sweeps
+
+    def add_simulation_sweep(self, sweep: SimulationSweepResult):
+        """
+        Add the provided simulation sweep result to the list of simulation sweep results.
+
+        Parameters
+        ----------
+        sweep: SimulationSweepResult
+            The result of the simulation sweep.
+        """
+        assert type(sweep) is SimulationSweepResult, sweep
+        assert sweep.uuid not in list(map(lambda _: _.uuid, self._simulation_sweeps))
+        
+        self._simulation_sweeps.insert(0, sweep)
+
+    def delete_simulation_sweep(self, sweep: SimulationSweepResult):
+        """
+        Remove the provided simulation sweep result from the list of simulation sweep results.
+
+        Parameters
+        ----------
+        sweep: SimulationSweepResult
+            The simulation sweep result to delete.
+        """
+        assert type(sweep) is SimulationSweepResult, sweep
+        assert sweep in self._simulation_sweeps
+        
+        self._simulation_sweeps.remove(sweep)
+
     def get_plots(self) -> List[PlotSettings]:
         """
         Get all of the plots.
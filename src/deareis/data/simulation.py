@@ -18,23 +18,33 @@
 # the LICENSES folder.
 
 from dataclasses import dataclass
+from itertools import product
 from typing import (
     Callable,
     Dict,
     List,
+    Optional,
     Tuple,
 )
 from numpy import (
     angle,
+    array,
+    complex128,
+    float64,
     integer,
     issubdtype,
+    linspace,
+    log10,
+    logspace,
+    tile,
+    zeros,
 )
+from numpy.typing import NDArray
 from pandas import DataFrame
 from pyimpspec import (
     Circuit,
     Element,
 )
-import pyimpspec
 from pyimpspec import (
     ComplexImpedances,
     Frequencies,
@@ -42,6 +52,11 @@ from pyimpspec import (
     Phases,
 )
 from pyimpspec.analysis.utility import _interpolate
+from deareis.data.cache import (
+    CIRCUIT_CACHE,
+    LINE_CACHE,
+)
+from deareis.data.lazy import lazy_slots
 from deareis.utility import format_timestamp
 
 
@@ -131,7 +146,7 @@ def _parse_result_v2(dictionary: dict) -> dict:
     return {
         "uuid": dictionary["uuid"],
         "timestamp": dictionary["timestamp"],
-        "circuit": pyimpspec.parse_cdc(dictionary["circuit"]),
+        "circuit": CIRCUIT_CACHE.parse(dictionary["circuit"]),
         "settings": SimulationSettings.from_dict(dictionary["settings"]),
     }
 
@@ -141,7 +156,7 @@ def _parse_result_v1(dictionary: dict) -> dict:
     return {
         "uuid": dictionary["uuid"],
         "timestamp": dictionary["timestamp"],
-        "circuit": pyimpspec.parse_cdc(dictionary["circuit"]),
+        "circuit": CIRCUIT_CACHE.parse(dictionary["circuit"]),
         "settings": SimulationSettings.from_dict(dictionary["settings"]),
     }
 
@@ -172,14 +187,8 @@ class SimulationResult:
     settings: SimulationSettings
 
     def __post_init__(self):
-        self._cached_frequencies: Dict[int, Frequencies] = {}
-        self._cached_impedances: Dict[int, ComplexImpedances] = {}
-        self._frequency: Frequencies = self.get_frequencies(
-            num_per_decade=self.settings.num_per_decade
-        )
-        self._impedance: ComplexImpedances = self.get_impedances(
-            num_per_decade=self.settings.num_per_decade
-        )
+        # The simulated spectrum is calculated when it is first accessed.
+        self._line: Optional[Tuple[Frequencies, ComplexImpedances]] = None
 
     def __hash__(self) -> int:
         return int(self.uuid, 16)
@@ -267,6 +276,19 @@ class SimulationResult:
 
         return f"{cdc} ({timestamp})"
 
+    def _calculate_line(self, num_per_decade: int) -> Tuple[Frequencies, ComplexImpedances]:
+        f: Frequencies = _interpolate(
+            [self.settings.min_frequency, self.settings.max_frequency],
+            num_per_decade,
+        )
+        return (f, self.circuit.get_impedances(f))
+
+    def _get_simulated_line(self) -> Tuple[Frequencies, ComplexImpedances]:
+        if self._line is None:
+            self._line = self._calculate_line(self.settings.num_per_decade)
+
+        return self._line
+
     def get_frequencies(self, num_per_decade: int = -1) -> Frequencies:
         """
         Get an array of frequencies within the range of simulated frequencies.
@@ -283,16 +305,13 @@ class SimulationResult:
         assert issubdtype(type(num_per_decade), integer), num_per_decade
 
         if num_per_decade > 0:
-            if num_per_decade not in self._cached_frequencies:
-                self._cached_frequencies.clear()
-                self._cached_frequencies[num_per_decade] = _interpolate(
-                    [self.settings.min_frequency, self.settings.max_frequency],
-                    num_per_decade,
-                )
-
-            return self._cached_frequencies[num_per_decade]
+            return LINE_CACHE.get_line(
+                self.uuid,
+                num_per_decade,
+                lambda: self._calculate_line(num_per_decade),
+            )[0]
 
-        return self._frequency
+        return self._get_simulated_line()[0]
 
     def get_impedances(
         self,
@@ -312,15 +331,13 @@ class SimulationResult:
         assert issubdtype(type(num_per_decade), integer), num_per_decade
 
         if num_per_decade > 0:
-            if num_per_decade not in self._cached_impedances:
-                self._cached_impedances.clear()
-                self._cached_impedances[num_per_decade] = self.circuit.get_impedances(
-                    self.get_frequencies(num_per_decade)
-                )
+            return LINE_CACHE.get_line(
+                self.uuid,
+                num_per_decade,
+                lambda: self._calculate_line(num_per_decade),
+            )[1]
 
-            return self._cached_impedances[num_per_decade]
-
-        return self._impedance
+        return self._get_simulated_line()[1]
 
     def get_nyquist_data(
         self,
@@ -421,3 +438,405 @@ class SimulationResult:
                 "Unit": units,
             }
         )
+
+
+def _parse_swept_parameter_v2(dictionary: dict) -> dict:
+    assert type(dictionary) is dict
+    return {
+        "element": dictionary["element"],
+        "parameter": dictionary["parameter"],
+        "start": dictionary["start"],
+        "stop": dictionary["stop"],
+        "num_steps": dictionary["num_steps"],
+        "logarithmic": dictionary["logarithmic"],
+    }
+
+
+@dataclass(frozen=True)
+class SweptParameter:
+    """
+    A class to store the range of values to use for a parameter in a simulation sweep.
+
+    Parameters
+    ----------
+    element: str
+        The label of the element (e.g., "R_1" or "R_ct").
+
+    parameter: str
+        The symbol of the parameter (e.g., "R").
+
+    start: float
+        The first value in the range.
+
+    stop: float
+        The last value in the range.
+
+    num_steps: int
+        The number of values in the range.
+
+    logarithmic: bool
+        Whether or not the values are distributed logarithmically instead of linearly.
+    """
+
+    element: str
+    parameter: str
+    start: float
+    stop: float
+    num_steps: int
+    logarithmic: bool
+
+    def __repr__(self) -> str:
+        return f"SweptParameter ({self.element}.{self.parameter}, {hex(id(self))})"
+
+    @classmethod
+    def from_dict(Class, dictionary: dict) -> "SweptParameter":
+        """
+        Create an instance from a dictionary.
+        """
+        assert type(dictionary) is dict
+        assert "version" in dictionary
+        version: int = dictionary["version"]
+        assert version <= VERSION, f"{version=} > {VERSION=}"
+        parsers: Dict[int, Callable] = {
+            2: _parse_swept_parameter_v2,
+        }
+        assert version in parsers, f"{version=} not in {parsers.keys()=}"
+        return Class(**parsers[version](dictionary))
+
+    def to_dict(self) -> dict:
+        """
+        Return a dictionary that can be used to recreate an instance.
+        """
+        return {
+            "version": VERSION,
+            "element": self.element,
+            "parameter": self.parameter,
+            "start": self.start,
+            "stop": self.stop,
+            "num_steps": self.num_steps,
+            "logarithmic": self.logarithmic,
+        }
+
+    def get_values(self) -> NDArray[float64]:
+        """
+        Get the values in the range.
+
+        Returns
+        -------
+        NDArray[float64]
+        """
+        if self.logarithmic:
+            assert self.start > 0.0 and self.stop > 0.0, (self.start, self.stop)
+            return logspace(log10(self.start), log10(self.stop), self.num_steps)
+
+        return linspace(self.start, self.stop, self.num_steps)
+
+
+def _parse_sweep_settings_v2(dictionary: dict) -> dict:
+    assert type(dictionary) is dict
+    return {
+        "cdc": dictionary["cdc"],
+        "min_frequency": dictionary["min_frequency"],
+        "max_frequency": dictionary["max_frequency"],
+        "num_per_decade": dictionary["num_per_decade"],
+        "parameters": tuple(map(SweptParameter.from_dict, dictionary["parameters"])),
+        "grid": dictionary["grid"],
+    }
+
+
+@dataclass(frozen=True)
+class SimulationSweepSettings:
+    """
+    A class to store the settings used to perform a simulation sweep where one or more element parameters are varied.
+
+    Parameters
+    ----------
+    cdc: str
+        The circuit description code (CDC) for the circuit to simulate.
+        The parameters that are not swept keep the values defined here.
+
+    min_frequency: float
+        The minimum frequency (in hertz) to simulate.
+
+    max_frequency: float
+        The maximum frequency (in hertz) to simulate.
+
+    num_per_decade: int
+        The number of frequencies per decade to simulate.
+
+    parameters: Tuple[SweptParameter, ...]
+        The parameters to sweep.
+
+    grid: bool
+        If true, then every combination of the swept values is simulated.
+        Otherwise, the swept values are paired up in order, which requires that every swept parameter has the same number of steps.
+    """
+
+    cdc: str
+    min_frequency: float
+    max_frequency: float
+    num_per_decade: int
+    parameters: Tuple[SweptParameter, ...]
+    grid: bool = True
+
+    def __repr__(self) -> str:
+        return f"SimulationSweepSettings ({hex(id(self))})"
+
+    @classmethod
+    def from_dict(Class, dictionary: dict) -> "SimulationSweepSettings":
+        """
+        Create an instance from a dictionary.
+        """
+        assert type(dictionary) is dict
+        assert "version" in dictionary
+        version: int = dictionary["version"]
+        assert version <= VERSION, f"{version=} > {VERSION=}"
+        parsers: Dict[int, Callable] = {
+            2: _parse_sweep_settings_v2,
+        }
+        assert version in parsers, f"{version=} not in {parsers.keys()=}"
+        return Class(**parsers[version](dictionary))
+
+    def to_dict(self) -> dict:
+        """
+        Return a dictionary that can be used to recreate an instance.
+        """
+        return {
+            "version": VERSION,
+            "cdc": self.cdc,
+            "min_frequency": self.min_frequency,
+            "max_frequency": self.max_frequency,
+            "num_per_decade": self.num_per_decade,
+            "parameters": list(map(lambda _: _.to_dict(), self.parameters)),
+            "grid": self.grid,
+        }
+
+    def get_values(self) -> NDArray[float64]:
+        """
+        Get the combinations of swept values.
+
+        Returns
+        -------
+        NDArray[float64]
+            A 2-D array where each row is a combination and the columns are in the same order as `parameters`.
+        """
+        ranges: List[NDArray[float64]] = list(
+            map(lambda _: _.get_values(), self.parameters)
+        )
+        if len(ranges) == 0:
+            return zeros((0, 0), dtype=float64)
+        elif self.grid:
+            return array(list(product(*ranges)), dtype=float64)
+
+        assert len(set(map(len, ranges))) == 1, "Expected the same number of steps"
+        return array(ranges, dtype=float64).T
+
+
+def _parse_sweep_result_v2(dictionary: dict) -> dict:
+    assert type(dictionary) is dict
+    return {
+        "uuid": dictionary["uuid"],
+        "timestamp": dictionary["timestamp"],
+        "circuit": CIRCUIT_CACHE.parse(dictionary["circuit"]),
+        "values": array(dictionary["values"], dtype=float64).reshape(
+            (-1, len(dictionary["settings"]["parameters"]))
+        ),
+        "settings": SimulationSweepSettings.from_dict(dictionary["settings"]),
+    }
+
+
+@lazy_slots(impedances="_calculate_impedances")
+@dataclass(slots=True)
+class SimulationSweepResult:
+    """
+    A class containing the grouped results of a simulation sweep.
+    All of the simulated spectra share the same frequencies.
+
+    Parameters
+    ----------
+    uuid: str
+        The universally unique identifier assigned to this result.
+
+    timestamp: float
+        The Unix time (in seconds) for when the sweep was performed.
+
+    circuit: Circuit
+        The simulated circuit with the parameter values that were not swept.
+
+    values: NDArray[float64]
+        The swept values where each row corresponds to a spectrum and the columns are in the same order as the swept parameters in the settings.
+
+    settings: SimulationSweepSettings
+        The settings that were used to perform the sweep.
+
+    impedances: Optional[NDArray[complex128]], optional
+        The simulated spectra (one per row).
+        If None, then the spectra are calculated when they are first accessed.
+    """
+
+    uuid: str
+    timestamp: float
+    circuit: Circuit
+    values: NDArray[float64]
+    settings: SimulationSweepSettings
+    impedances: Optional[NDArray[complex128]] = None
+
+    def _calculate_impedances(self) -> NDArray[complex128]:
+        from deareis.api.circuit.compiled import (
+            CompiledCircuit,
+            compile_circuit,
+        )
+
+        compiled: CompiledCircuit = compile_circuit(self.circuit)
+        labels: List[Tuple[str, str]] = compiled.get_parameter_labels()
+
+        parameters: NDArray[float64] = tile(
+            compiled.get_values(),
+            (self.values.shape[0], 1),
+        )
+        param: SweptParameter
+        for i, param in enumerate(self.settings.parameters):
+            parameters[:, labels.index((param.element, param.parameter))] = self.values[:, i]
+
+        return compiled.get_impedances(self.get_frequencies(), parameters)
+
+    def __hash__(self) -> int:
+        return int(self.uuid, 16)
+
+    def __repr__(self) -> str:
+        return f"SimulationSweepResult ({self.get_label()}, {hex(id(self))})"
+
+    @classmethod
+    def from_dict(Class, dictionary: dict) -> "SimulationSweepResult":
+        """
+        Create an instance from a dictionary.
+        """
+        assert type(dictionary) is dict
+        assert "version" in dictionary
+        version: int = dictionary["version"]
+        assert version <= VERSION, f"{version=} > {VERSION=}"
+        parsers: Dict[int, Callable] = {
+            2: _parse_sweep_result_v2,
+        }
+        assert version in parsers, f"{version=} not in {parsers.keys()=}"
+        return Class(**parsers[version](dictionary))
+
+    def to_dict(self) -> dict:
+        """
+        Return a dictionary that can be used to recreate an instance.
+        The impedances are not included since they are recalculated when they are first accessed after the instance has been recreated.
+        """
+        return {
+            "version": VERSION,
+            "uuid": self.uuid,
+            "timestamp": self.timestamp,
+            "circuit": self.circuit.serialize(),
+            "values": self.values.tolist(),
+            "settings": self.settings.to_dict(),
+        }
+
+    def get_label(self) -> str:
+        """
+        Generate a label for the result.
+        """
+        cdc: str = self.circuit.to_string()
+        if cdc.startswith("[") and cdc.endswith("]"):
+            cdc = cdc[1:-1]
+
+        swept: str = ", ".join(
+            map(lambda _: f"{_.element}.{_.parameter}", self.settings.parameters)
+        )
+        timestamp: str = format_timestamp(self.timestamp)
+
+        return f"{cdc}; {swept} ({timestamp})"
+
+    def get_num_spectra(self) -> int:
+        """
+        Get the number of simulated spectra.
+
+        Returns
+        -------
+        int
+        """
+        return self.values.shape[0]
+
+    def get_frequencies(self) -> Frequencies:
+        """
+        Get the frequencies that are shared by all of the simulated spectra.
+
+        Returns
+        -------
+        Frequencies
+        """
+        return _interpolate(
+            [self.settings.min_frequency, self.settings.max_frequency],
+            self.settings.num_per_decade,
+        )
+
+    def get_impedances(self, index: Optional[int] = None) -> NDArray[complex128]:
+        """
+        Get the complex impedances of one or all of the simulated spectra.
+
+        Parameters
+        ----------
+        index: Optional[int], optional
+            The index of the spectrum.
+            If the value is None, then a 2-D array containing all of the spectra (one per row) is returned.
+
+        Returns
+        -------
+        NDArray[complex128]
+        """
+        impedances: NDArray[complex128] = self.impedances
+        if index is None:
+            return impedances
+
+        assert issubdtype(type(index), integer), index
+
+        return impedances[index]
+
+    def get_circuit(self, index: int) -> Circuit:
+        """
+        Get the circuit with the swept values of a specific spectrum applied.
+
+        Parameters
+        ----------
+        index: int
+            The index of the spectrum.
+
+        Returns
+        -------
+        Circuit
+        """
+        assert issubdtype(type(index), integer), index
+        circuit: Circuit = CIRCUIT_CACHE.parse(self.circuit.serialize())
+        identifiers: Dict[Element, int] = circuit.generate_element_identifiers(
+            running=False
+        )
+        elements: Dict[str, Element] = {
+            circuit.get_element_name(element, identifiers=identifiers): element
+            for element in circuit.get_elements()
+        }
+
+        param: SweptParameter
+        for i, param in enumerate(self.settings.parameters):
+            elements[param.element].set_values(
+                **{param.parameter: float(self.values[index, i])}
+            )
+
+        return circuit
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Get a `pandas.DataFrame` instance containing a table of the swept values of each spectrum.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        columns: Dict[str, NDArray[float64]] = {}
+        param: SweptParameter
+        for i, param in enumerate(self.settings.parameters):
+            columns[f"{param.element}.{param.parameter}"] = self.values[:, i]
+
+        return DataFrame.from_dict(columns)
@@ -55,6 +55,7 @@ from deareis.enums import (
 )
 from deareis.utility import format_timestamp
 from deareis.data import DataSet
+from deareis.data.compact import ResultMask
 
 VERSION: int = 2
 
@@ -197,7 +198,7 @@ def _parse_result_v1(dictionary: dict) -> dict:
     return dictionary
 
 
-@dataclass
+@dataclass(slots=True)
 class ZHITResult:
     """
     A class containing the result of a Z-HIT analysis.
@@ -221,6 +222,7 @@ class ZHITResult:
 
     mask: Dict[int, bool]
         The mask that was applied to the original data set.
+        The mask is stored as a read-only `ResultMask`.
 
     pseudo_chisqr: float
         The calculated |pseudo chi-squared| (eq. 14 in Boukamp, 1995).
@@ -249,6 +251,9 @@ class ZHITResult:
     window: str
     settings: ZHITSettings
 
+    def __post_init__(self):
+        self.mask = ResultMask(self.mask)
+
     def __repr__(self) -> str:
         return f"ZHITResult ({hex(id(self))})"
 
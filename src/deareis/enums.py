@@ -1700,3 +1700,54 @@ assert set(zhit_representation_to_label.keys()) == set(
 assert set(zhit_representation_to_value.keys()) == set(
     zhit_representation_to_value.keys()
 ), "Missing ZHIT representation value detected!"
+
+
+class NoiseModel(IntEnum):
+    """
+    Types of noise that can be added to simulated impedance spectra:
+
+    - PROPORTIONAL: the standard deviation is proportional to :math:`|Z|`
+    - COMPONENTS: the standard deviations are proportional to :math:`|{\\rm Re}(Z)|` and :math:`|{\\rm Im}(Z)|`
+    - CONSTANT: the standard deviation is constant (in ohms)
+    """
+
+    PROPORTIONAL = 1
+    COMPONENTS = 2
+    CONSTANT = 3
+
+
+noise_model_to_label: Dict[NoiseModel, str] = {
+    NoiseModel.PROPORTIONAL: "Proportional",
+    NoiseModel.COMPONENTS: "Components",
+    NoiseModel.CONSTANT: "Constant",
+}
+label_to_noise_model: Dict[str, NoiseModel] = {
+    v: k for k, v in noise_model_to_label.items()
+}
+assert set(noise_model_to_label.keys()) == set(
+    label_to_noise_model.values()
+), "Duplicate noise model string labels detected!"
+
+
+class ResamplingMethod(IntEnum):
+    """
+    Methods for estimating the confidence intervals of fitted parameters:
+
+    - BOOTSTRAP: refit synthetic data sets generated by resampling the residuals of the fit
+    - JACKKNIFE: refit the data set with one data point left out at a time
+    """
+
+    BOOTSTRAP = 1
+    JACKKNIFE = 2
+
+
+resampling_method_to_label: Dict[ResamplingMethod, str] = {
+    ResamplingMethod.BOOTSTRAP: "Bootstrap",
+    ResamplingMethod.JACKKNIFE: "Jackknife",
+}
+label_to_resampling_method: Dict[str, ResamplingMethod] = {
+    v: k for k, v in resampling_method_to_label.items()
+}
+assert set(resampling_method_to_label.keys()) == set(
+    label_to_resampling_method.values()
+), "Duplicate resampling method string labels detected!"
@@ -0,0 +1,354 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from ast import (
+    AST,
+    Call,
+    Constant,
+    Name,
+    UnaryOp,
+    UAdd,
+    USub,
+    dump as dump_ast,
+    parse as parse_ast,
+)
+from json import (
+    dumps as dump_json,
+    loads as load_json,
+)
+from multiprocessing import (
+    Process,
+    Queue,
+)
+from os.path import exists
+from queue import Empty
+from traceback import format_exc
+from typing import (
+    Any,
+    Dict,
+    IO,
+    Optional,
+    Set,
+    Tuple,
+)
+from pyimpspec import Circuit
+import sympy
+from sympy import (
+    Basic,
+    Expr,
+    simplify,
+    srepr,
+)
+
+
+VERSION: int = 1
+
+
+def _evaluate_node(node: AST) -> Any:
+    if isinstance(node, Constant) and type(node.value) in (bool, int, float, str):
+        return node.value
+    elif (
+        isinstance(node, UnaryOp)
+        and isinstance(node.op, (UAdd, USub))
+        and isinstance(node.operand, Constant)
+        and type(node.operand.value) in (int, float)
+    ):
+        value = node.operand.value
+        return -value if isinstance(node.op, USub) else value
+    elif isinstance(node, Name):
+        obj: Any = getattr(sympy, node.id, None)
+        if isinstance(obj, Basic) or (isinstance(obj, type) and issubclass(obj, Basic)):
+            return obj
+    elif (
+        isinstance(node, Call)
+        and isinstance(node.func, Name)
+        and all(_.arg is not None for _ in node.keywords)
+    ):
+        Class: Any = _evaluate_node(node.func)
+        if isinstance(Class, type):
+            return Class(
+                *map(_evaluate_node, node.args),
+                **{_.arg: _evaluate_node(_.value) for _ in node.keywords},
+            )
+
+    raise ValueError(f"Unsupported syntax in expression: {dump_ast(node)}")
+
+
+def parse_expression(string: str) -> Expr:
+    """
+    Parse an expression that has been serialized using `sympy.srepr`.
+    Unlike `sympy.sympify`, which uses `eval`, only (nested) calls of SymPy classes with literal arguments are accepted, which means that, e.g., an edited file cannot be used to run arbitrary code.
+
+    Parameters
+    ----------
+    string: str
+        The serialized expression.
+
+    Returns
+    -------
+    Expr
+    """
+    assert isinstance(string, str), string
+    expr: Any = _evaluate_node(parse_ast(string, mode="eval").body)
+    if not isinstance(expr, Expr):
+        raise ValueError(f"Expected an expression instead of {string=}")
+
+    return expr
+
+
+def _simplify_process(requests: Queue, results: Queue):
+    # Runs in the helper process until a request of None is received. The
+    # result of each request is the key, the simplified expression, and the
+    # traceback of the error that occurred (an empty string if successful).
+    results.put(None)
+    while True:
+        request: Optional[Tuple[str, str]] = requests.get()
+        if request is None:
+            break
+
+        key, expr = request
+        try:
+            results.put((key, srepr(simplify(parse_expression(expr))), ""))
+        except Exception:
+            results.put((key, expr, format_exc()))
+
+
+class ExpressionCache:
+    """
+    A cache of simplified SymPy expressions of circuits.
+    The expressions are keyed by the unsimplified expressions, which depend on the structure of the circuits and the labels of the elements but not the values of the parameters.
+    The expressions are simplified by a long-lived helper process, which is started once and reused, and can be persisted to a file (e.g., in the state directory) so that the same circuits are not simplified again in later sessions.
+
+    Parameters
+    ----------
+    path: str, optional
+        The path to the file where the expressions are persisted.
+        If the path is an empty string, then the expressions are only kept in memory.
+
+    timeout: float, optional
+        The maximum number of seconds to wait for an expression to be simplified.
+        The helper process is restarted if the timeout is exceeded.
+
+    max_expressions: int, optional
+        The maximum number of expressions to keep.
+        The oldest expressions are discarded first.
+    """
+
+    def __init__(
+        self,
+        path: str = "",
+        timeout: float = 2.0,
+        max_expressions: int = 256,
+    ):
+        assert isinstance(path, str), path
+        assert timeout > 0.0, timeout
+        assert max_expressions > 0, max_expressions
+        self._path: str = path
+        self._timeout: float = timeout
+        self._max_expressions: int = max_expressions
+        self._expressions: Dict[str, str] = {}
+        self._failed: Set[str] = set()
+        self._is_dirty: bool = False
+        self._process: Optional[Process] = None
+        self._requests: Optional[Queue] = None
+        self._results: Optional[Queue] = None
+        self._is_ready: bool = False
+        self.load()
+
+    def __repr__(self) -> str:
+        return f"ExpressionCache ({len(self._expressions)} expressions, {hex(id(self))})"
+
+    def __len__(self) -> int:
+        return len(self._expressions)
+
+    def load(self):
+        """
+        Load the persisted expressions, if any.
+        Files that cannot be parsed are ignored.
+        """
+        if self._path == "" or not exists(self._path):
+            return
+
+        try:
+            fp: IO
+            with open(self._path, "r") as fp:
+                dictionary: dict = load_json(fp.read())
+            if dictionary.get("version") != VERSION:
+                return
+            expressions: Dict[str, str] = dictionary["expressions"]
+            assert isinstance(expressions, dict), expressions
+        except Exception:
+            print(format_exc())
+            return
+
+        for key, expr in expressions.items():
+            if key not in self._expressions:
+                self._expressions[key] = expr
+        self._trim()
+
+    def save(self):
+        """
+        Persist the expressions if any new expressions have been simplified.
+        """
+        if self._path == "" or not self._is_dirty:
+            return
+
+        fp: IO
+        with open(self._path, "w") as fp:
+            fp.write(
+                dump_json(
+                    {
+                        "version": VERSION,
+                        "expressions": self._expressions,
+                    }
+                )
+            )
+
+        self._is_dirty = False
+
+    def _trim(self):
+        while len(self._expressions) > self._max_expressions:
+            del self._expressions[next(iter(self._expressions))]
+
+    def _store(self, key: str, expr: str):
+        self._expressions.pop(key, None)
+        self._expressions[key] = expr
+        self._is_dirty = True
+        self._trim()
+
+    def start(self):
+        """
+        Start the helper process if it is not running.
+        The helper process is started automatically when needed, but it can be started ahead of time since importing the required modules takes a while.
+        """
+        if self._process is not None and self._process.is_alive():
+            return
+
+        self._requests = Queue()
+        self._results = Queue()
+        self._is_ready = False
+        self._process = Process(
+            target=_simplify_process,
+            args=(
+                self._requests,
+                self._results,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+
+    def stop(self):
+        """
+        Stop the helper process if it is running.
+        """
+        if self._process is None:
+            return
+
+        if self._process.is_alive():
+            if self._is_ready:
+                self._requests.put(None)
+                self._process.join(1.0)
+            if self._process.is_alive():
+                self._process.kill()
+
+        self._process = None
+        self._requests = None
+        self._results = None
+        self._is_ready = False
+
+    def simplify(self, expr: Expr) -> Expr:
+        """
+        Simplify an expression.
+        The simplified expression is returned from the cache if possible.
+        Otherwise, the expression is simplified by the helper process and the original expression is returned if the timeout is exceeded.
+
+        Parameters
+        ----------
+        expr: Expr
+            The expression to simplify.
+
+        Returns
+        -------
+        Expr
+
+        Raises
+        ------
+        ValueError
+            If the helper process failed to simplify the expression.
+            The original expression is returned by subsequent calls.
+        """
+        key: str = str(expr)
+        if key in self._expressions:
+            try:
+                return parse_expression(self._expressions[key])
+            except Exception:
+                # E.g., the persisted expressions have been edited.
+                del self._expressions[key]
+                self._is_dirty = True
+
+        if key in self._failed:
+            return expr
+
+        self.start()
+        if not self._is_ready:
+            # Importing the modules is not included in the timeout.
+            try:
+                self._results.get(True, max(self._timeout, 60.0))
+            except Empty:
+                self.stop()
+                return expr
+            self._is_ready = True
+
+        self._requests.put((key, srepr(expr)))
+        while True:
+            try:
+                result: Tuple[str, str, str] = self._results.get(True, self._timeout)
+            except Empty:
+                self.stop()
+                self._failed.add(key)
+                return expr
+
+            other_key, simplified, error = result
+            if error != "":
+                self._failed.add(other_key)
+                if other_key == key:
+                    raise ValueError(f"Failed to simplify the expression!\n\n{error}")
+            else:
+                self._store(other_key, simplified)
+
+            if other_key == key:
+                break
+
+        return parse_expression(self._expressions[key])
+
+    def get_expression(self, circuit: Circuit) -> Expr:
+        """
+        Get the simplified SymPy expression of a circuit.
+
+        Parameters
+        ----------
+        circuit: Circuit
+            The circuit.
+
+        Returns
+        -------
+        Expr
+        """
+        assert isinstance(circuit, Circuit), circuit
+        return self.simplify(circuit.to_sympy())
@@ -18,6 +18,7 @@
 # the LICENSES folder.
 
 import dearpygui.dearpygui as dpg
+from deareis.progress import format_eta
 from deareis.typing.helpers import Tag
 
 
@@ -64,12 +65,19 @@ class BusyMessage:
                 tag=self.progress_bar,
             )
 
+            with dpg.group(horizontal=True):
+                self.eta_spacer: Tag = dpg.generate_uuid()
+                dpg.add_spacer(tag=self.eta_spacer)
+                self.eta_text: Tag = dpg.generate_uuid()
+                dpg.add_text(tag=self.eta_text, show=False)
+
     def is_visible(self) -> bool:
         return dpg.is_item_shown(self.window)
 
-    def show(self, message: str = "", progress: float = -1.0):
+    def show(self, message: str = "", progress: float = -1.0, eta: float = -1.0):
         assert type(message) is str, message
         assert type(progress) is float and progress <= 1.0, progress
+        assert isinstance(eta, float), eta
 
         dpg.split_frame(delay=33)
         if not self.is_visible():
@@ -103,6 +111,17 @@ class BusyMessage:
                 default_value=progress,
             )
 
+        if progress < 0.0 or eta < 0.0:
+            dpg.hide_item(self.eta_text)
+        else:
+            eta_message: str = f"{format_eta(eta)} remaining"
+            dpg.show_item(self.eta_text)
+            dpg.set_item_width(
+                self.eta_spacer,
+                max(0, (self.width - dpg.get_text_size(eta_message)[0]) / 2 - 16),
+            )
+            dpg.set_value(self.eta_text, eta_message)
+
     def hide(self):
         dpg.hide_item(self.window)
         dpg.split_frame()
@@ -37,9 +37,9 @@ from pyimpspec import (
     Element,
     Series,
     get_elements,
-    parse_cdc,
 )
 import dearpygui.dearpygui as dpg
+from deareis.data.cache import CIRCUIT_CACHE
 from deareis.signals import Signal
 import deareis.signals as signals
 from deareis.utility import (
@@ -579,7 +579,7 @@ class CircuitEditor:
         assert isinstance(admittance, bool), admittance
 
         if circuit is not None:
-            circuit = parse_cdc(circuit.serialize())
+            circuit = CIRCUIT_CACHE.parse(circuit.serialize())
 
         self.clear_node_window(add_info=True)
         self.parser.circuit_to_nodes(circuit)
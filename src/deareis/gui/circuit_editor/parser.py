@@ -36,6 +36,7 @@ from pyimpspec import (
     Series,
 )
 import pyimpspec
+from deareis.data.cache import CIRCUIT_CACHE
 import deareis.themes as themes
 from deareis.typing.helpers import Tag
 
@@ -729,7 +730,7 @@ class Parser:
             msg = str(e)
         else:
             try:
-                circuit = pyimpspec.parse_cdc("".join(string_stack))
+                circuit = CIRCUIT_CACHE.parse("".join(string_stack))
             except ParsingError as e:
                 msg = str(e)
             else:
@@ -52,6 +52,7 @@ from deareis.tooltips import (
 import deareis.tooltips as tooltips
 import deareis.themes as themes
 from deareis.data import DataSet
+from deareis.scheduler import SCHEDULER
 from deareis.typing.helpers import Tag
 
 
@@ -114,7 +115,7 @@ class DataTable:
             return
 
         i: int
-        for i in range(0, num_rows - len(rows)):
+        for i in SCHEDULER.iterate(range(0, num_rows - len(rows))):
             with dpg.table_row(parent=self._table):
                 dpg.add_checkbox(
                     default_value=False,
@@ -704,14 +705,14 @@ class DataSetsTab:
         is_showing_frequency: bool = dpg.get_value(self.nyquist_show_frequency_checkbox)
         if is_showing_frequency is True:
             self.toggle_nyquist_show_frequency(False)
-            dpg.split_frame(delay=33)
+            SCHEDULER.wait_for_frame()
 
         self.nyquist_plot.set_admittance(admittance)
         self.bode_plot.set_admittance(admittance)
         self.impedance_plot.set_admittance(admittance)
 
         if is_showing_frequency is True:
-            dpg.split_frame(delay=33)
+            SCHEDULER.wait_for_frame()
             self.toggle_nyquist_show_frequency(True)
 
     def resize(self, width: int, height: int):
@@ -45,7 +45,6 @@ from pyimpspec import (
     FittedParameter,
     Frequencies,
 )
-import pyimpspec
 from pyimpspec.analysis.utility import _calculate_residuals, _interpolate
 import dearpygui.dearpygui as dpg
 from deareis.signals import Signal
@@ -96,6 +95,7 @@ from deareis.gui.shared import (
     DataSetsCombo,
     ResultsCombo,
 )
+from deareis.data.cache import CIRCUIT_CACHE
 from deareis.gui.widgets.combo import Combo
 from deareis.typing.helpers import Tag
 
@@ -897,7 +897,7 @@ class SettingsTable:
             cells,
         )
 
-        circuit: Circuit = pyimpspec.parse_cdc(fit.settings.cdc)
+        circuit: Circuit = CIRCUIT_CACHE.parse(fit.settings.cdc)
 
         tag: int
         value: str
@@ -1619,7 +1619,7 @@ class FittingTab:
         self.parameters_table.populate(fit)
         self.statistics_table.populate(fit)
         self.settings_table.populate(fit, data)
-        self.circuit_preview.update(pyimpspec.parse_cdc(fit.settings.cdc))
+        self.circuit_preview.update(CIRCUIT_CACHE.parse(fit.settings.cdc))
 
         freq_markers: ndarray = fit.get_frequencies()
         freq_line: ndarray = fit.get_frequencies(
@@ -35,6 +35,7 @@ from numpy import (
 )
 import deareis.themes as themes
 from deareis.gui.plots.base import Plot
+from deareis.scheduler import SCHEDULER
 from deareis.typing.helpers import Tag
 
 
@@ -336,7 +337,7 @@ class Bode(Plot):
             self.update(index=i, **kwargs)
 
         if adjust_limits:
-            dpg.split_frame(delay=33)
+            SCHEDULER.wait_for_frame()
             self.queue_limits_adjustment()
             self.adjust_limits()
 
@@ -559,7 +560,7 @@ class BodeMagnitude(Plot):
             self.update(index=i, **kwargs)
 
         if adjust_limits:
-            dpg.split_frame(delay=33)
+            SCHEDULER.wait_for_frame()
             self.queue_limits_adjustment()
             self.adjust_limits()
 
@@ -777,7 +778,7 @@ class BodePhase(Plot):
             self.update(index=i, **kwargs)
 
         if adjust_limits:
-            dpg.split_frame(delay=33)
+            SCHEDULER.wait_for_frame()
             self.queue_limits_adjustment()
             self.adjust_limits()
 
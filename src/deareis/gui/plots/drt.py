@@ -32,6 +32,7 @@ from numpy import (
 import dearpygui.dearpygui as dpg
 import deareis.themes as themes
 from deareis.gui.plots.base import Plot
+from deareis.scheduler import SCHEDULER
 from deareis.typing.helpers import Tag
 
 
@@ -330,7 +331,7 @@ class DRT(Plot):
             self.update(index=i, **kwargs)
 
         if adjust_limits:
-            dpg.split_frame(delay=33)
+            SCHEDULER.wait_for_frame()
             self.queue_limits_adjustment()
             self.adjust_limits()
 
@@ -34,6 +34,7 @@ from numpy import (
 )
 import deareis.themes as themes
 from deareis.gui.plots.base import Plot
+from deareis.scheduler import SCHEDULER
 from deareis.typing.helpers import Tag
 
 
@@ -323,7 +324,7 @@ class Impedance(Plot):
             self.update(index=i, **kwargs)
 
         if adjust_limits:
-            dpg.split_frame(delay=33)
+            SCHEDULER.wait_for_frame()
             self.queue_limits_adjustment()
             self.adjust_limits()
 
@@ -569,7 +570,7 @@ class ImpedanceSingleAxis(Plot):
             self.update(index=i, **kwargs)
 
         if adjust_limits:
-            dpg.split_frame(delay=33)
+            SCHEDULER.wait_for_frame()
             self.queue_limits_adjustment()
             self.adjust_limits()
 
@@ -26,6 +26,7 @@ from numpy import (
 )
 import deareis.themes as themes
 from deareis.gui.plots.base import Plot
+from deareis.scheduler import SCHEDULER
 from deareis.typing.helpers import Tag
 
 
@@ -238,7 +239,7 @@ class Nyquist(Plot):
             self.update(index=i, **kwargs)
 
         if adjust_limits:
-            dpg.split_frame(delay=33)
+            SCHEDULER.wait_for_frame()
             self.queue_limits_adjustment()
             self.adjust_limits()
 
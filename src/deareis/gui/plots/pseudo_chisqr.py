@@ -30,6 +30,7 @@ from numpy import (
 )
 import deareis.themes as themes
 from deareis.gui.plots.base import Plot
+from deareis.scheduler import SCHEDULER
 from deareis.typing.helpers import Tag
 
 
@@ -253,7 +254,7 @@ class PseudoChisqrAndScore(Plot):
             ymax=max_pseudo_chisqr + 0.1,
         )
 
-        dpg.split_frame(delay=33)
+        SCHEDULER.wait_for_frame()
         dpg.set_axis_limits_auto(self._x_axis)
         dpg.set_axis_limits_auto(self._y_axis_2)
 
@@ -49,6 +49,7 @@ from deareis.data import (
     KramersKronigResult,
     ZHITResult,
 )
+from deareis.data.lazy import calculate_pending_impedances
 from deareis.gui.plots import (
     BodeMagnitude,
     BodePhase,
@@ -58,6 +59,7 @@ from deareis.gui.plots import (
     Nyquist,
 )
 from deareis.gui.plots.base import Plot
+from deareis.scheduler import SCHEDULER
 from deareis.signals import Signal
 import deareis.signals as signals
 from deareis.utility import (
@@ -2515,7 +2517,21 @@ class PlottingTab:
 
         dpg.split_frame()
         plot.set_title(settings.get_label())
-        for uuid in settings.series_order:
+        # Results loaded from minimized project files may have yet to
+        # calculate their impedances, which is done in batches when possible.
+        calculate_pending_impedances(
+            settings.find_series(
+                uuid=uuid,
+                data_sets=data_sets,
+                tests=tests,
+                zhits=zhits,
+                drts=drts,
+                fits=fits,
+                simulations=simulations,
+            )
+            for uuid in settings.series_order
+        )
+        for uuid in SCHEDULER.iterate(settings.series_order, priority=1):
             series: Optional[
                 Union[DataSet, KramersKronigResult, DRTResult, FitResult, SimulationResult]
             ]
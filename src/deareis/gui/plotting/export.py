@@ -37,6 +37,7 @@ from deareis.data import (
 )
 from deareis.data.plotting import PlotExportSettings
 from deareis.gui.plots import Image
+from deareis.scheduler import SCHEDULER
 from deareis.signals import Signal
 from deareis.tooltips import (
     attach_tooltip,
@@ -794,7 +795,7 @@ class PlotExporter:
 
         extension: str = self.settings_menu.get_settings().extension
         self.close()
-        dpg.split_frame(delay=33)
+        SCHEDULER.wait_for_frame()
         signals.emit(
             Signal.SAVE_PLOT,
             figure=figure,
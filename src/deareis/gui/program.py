@@ -208,7 +208,8 @@ class ProjectTabBar:
 class MenuBar:
     def __init__(self):
         button: int
-        with dpg.menu_bar():
+        self.menu_bar: Tag = dpg.generate_uuid()
+        with dpg.menu_bar(tag=self.menu_bar):
             with dpg.menu(label="File"):
                 dpg.add_menu_item(
                     label="New project",
@@ -332,6 +333,37 @@ class MenuBar:
                     callback=lambda: signals.emit(Signal.SHOW_HELP_LICENSES),
                 )
 
+    def add_debug_menu(self):
+        with dpg.menu(label="Debug", parent=self.menu_bar):
+            dpg.add_menu_item(
+                label="Signal statistics",
+                callback=lambda: signals.emit(Signal.SHOW_SIGNAL_STATISTICS),
+            )
+            dpg.add_separator()
+            profile_item: Tag = dpg.generate_uuid()
+            memory_item: Tag = dpg.generate_uuid()
+
+            # Changing either setting while profiling starts a new session.
+            def toggle_profiling():
+                signals.emit(
+                    Signal.TOGGLE_PROFILING,
+                    flag=dpg.get_value(profile_item),
+                    memory=dpg.get_value(memory_item),
+                )
+
+            dpg.add_menu_item(
+                label="Profile actions",
+                check=True,
+                callback=toggle_profiling,
+                tag=profile_item,
+            )
+            dpg.add_menu_item(
+                label="Trace memory allocations",
+                check=True,
+                callback=toggle_profiling,
+                tag=memory_item,
+            )
+
 
 class ProgramWindow:
     def __init__(self):
@@ -34,7 +34,12 @@ from deareis.utility import calculate_window_position_dimensions
 from deareis.tooltips import attach_tooltip
 import deareis.tooltips as tooltips
 from deareis.gui.project import ProjectTab
+from deareis.data.cache import (
+    DRT_MATRIX_CACHE,
+    LINE_CACHE,
+)
 from deareis.data.plotting import PlotExportSettings
+from deareis.api.pool import configure_worker_pool
 from deareis.data import (
     DRTSettings,
     FitSettings,
@@ -99,6 +104,7 @@ def general_settings(label_pad: int, state):
 
         def update_num_procs(value: int):
             state.config.num_procs = value
+            configure_worker_pool(value or -1, state.config.max_tasks_per_worker)
 
         with dpg.group(horizontal=True):
             dpg.add_text("Number of processes".rjust(label_pad))
@@ -113,6 +119,82 @@ def general_settings(label_pad: int, state):
                 width=-54,
                 tag=num_procs_input,
             )
+
+        def update_auto_tune_num_procs(value: bool):
+            state.config.auto_tune_num_procs = value
+
+        with dpg.group(horizontal=True):
+            dpg.add_text("Auto-tune processes".rjust(label_pad))
+            attach_tooltip(tooltips.general.auto_tune_num_procs)
+            dpg.add_checkbox(
+                default_value=state.config.auto_tune_num_procs,
+                callback=lambda s, a, u: update_auto_tune_num_procs(a),
+            )
+
+        def update_drt_parallel_sampling(value: bool):
+            state.config.drt_parallel_sampling = value
+
+        with dpg.group(horizontal=True):
+            dpg.add_text("Parallel DRT sampling".rjust(label_pad))
+            attach_tooltip(tooltips.general.drt_parallel_sampling)
+            dpg.add_checkbox(
+                default_value=state.config.drt_parallel_sampling,
+                callback=lambda s, a, u: update_drt_parallel_sampling(a),
+            )
+
+        def update_line_cache_size(value: int):
+            state.config.line_cache_size = value
+            LINE_CACHE.set_max_size(value * 1024**2)
+
+        with dpg.group(horizontal=True):
+            dpg.add_text("Line cache size".rjust(label_pad))
+            attach_tooltip(tooltips.general.line_cache_size)
+            dpg.add_input_int(
+                default_value=state.config.line_cache_size,
+                label="MiB",
+                min_value=0,
+                min_clamped=True,
+                step=0,
+                on_enter=True,
+                callback=lambda s, a, u: update_line_cache_size(a),
+                width=-54,
+            )
+
+        def update_drt_matrix_cache_size(value: int):
+            state.config.drt_matrix_cache_size = value
+            DRT_MATRIX_CACHE.set_max_size(value * 1024**2)
+
+        with dpg.group(horizontal=True):
+            dpg.add_text("DRT matrix cache size".rjust(label_pad))
+            attach_tooltip(tooltips.general.drt_matrix_cache_size)
+            dpg.add_input_int(
+                default_value=state.config.drt_matrix_cache_size,
+                label="MiB",
+                min_value=0,
+                min_clamped=True,
+                step=0,
+                on_enter=True,
+                callback=lambda s, a, u: update_drt_matrix_cache_size(a),
+                width=-54,
+            )
+
+        def update_max_tasks_per_worker(value: int):
+            state.config.max_tasks_per_worker = value
+            configure_worker_pool(state.config.num_procs or -1, value)
+
+        with dpg.group(horizontal=True):
+            dpg.add_text("Tasks per worker".rjust(label_pad))
+            attach_tooltip(tooltips.general.max_tasks_per_worker)
+            dpg.add_input_int(
+                default_value=state.config.max_tasks_per_worker,
+                label="tasks",
+                min_value=0,
+                min_clamped=True,
+                step=0,
+                on_enter=True,
+                callback=lambda s, a, u: update_max_tasks_per_worker(a),
+                width=-54,
+            )
         section_spacer()
 
 
@@ -37,6 +37,7 @@ from pyimpspec import (
     Element,
     get_elements,
 )
+from deareis.data.cache import CIRCUIT_CACHE
 from deareis.utility import calculate_window_position_dimensions
 from deareis.signals import Signal
 import deareis.signals as signals
@@ -82,18 +83,33 @@ def update_table(table: int, elements: Dict[str, Type[Element]]):
             attach_tooltip(Class.get_extended_description())
 
 
-def refresh(
-    path: str = "",
-    path_input: int = -1,
-    close_window: Optional[Callable] = None,
-):
-    global USER_DEFINED_ELEMENTS
+def unload_elements():
     key: str
     for key in USER_DEFINED_ELEMENTS:
         del registry._ELEMENTS[key]
 
     USER_DEFINED_ELEMENTS.clear()
+    # The cached circuits may contain instances of the unloaded elements.
+    CIRCUIT_CACHE.clear()
 
+
+def load_elements(path: str):
+    global USER_DEFINED_ELEMENTS
+    loader = SourceFileLoader("user_defined_elements", path)
+    mod = ModuleType(loader.name)
+    loader.exec_module(mod)
+    USER_DEFINED_ELEMENTS = {
+        k: v for k, v in get_elements().items() if k not in DEFAULT_ELEMENTS
+    }
+    CIRCUIT_CACHE.clear()
+
+
+def refresh(
+    path: str = "",
+    path_input: int = -1,
+    close_window: Optional[Callable] = None,
+):
+    unload_elements()
     update_path(path, path_input)
 
     if close_window is not None:
@@ -106,12 +122,7 @@ def refresh(
             message="Loading user-defined elements...",
         )
         dpg.split_frame(delay=1000)
-        loader = SourceFileLoader("user_defined_elements", path)
-        mod = ModuleType(loader.name)
-        loader.exec_module(mod)
-        USER_DEFINED_ELEMENTS = {
-            k: v for k, v in get_elements().items() if k not in DEFAULT_ELEMENTS
-        }
+        load_elements(path)
         signals.emit(Signal.HIDE_BUSY_MESSAGE)
 
     if close_window is not None:
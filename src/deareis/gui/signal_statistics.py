@@ -0,0 +1,271 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from os.path import join
+from time import (
+    localtime,
+    strftime,
+)
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import dearpygui.dearpygui as dpg
+from deareis.signals import Signal
+from deareis.signal_statistics import (
+    HISTOGRAM_LABELS,
+    SignalStatistics,
+    TimingHistogram,
+)
+from deareis.utility import calculate_window_position_dimensions
+import deareis.signals as signals
+from deareis.state import STATE
+from deareis.enums import Action
+from deareis.keybindings import (
+    Keybinding,
+    TemporaryKeybindingHandler,
+)
+from deareis.typing.helpers import Tag
+
+
+def _format_histogram(histogram: TimingHistogram) -> str:
+    # Bins are shown from the fastest to the slowest (e.g., "3 5 1 0 ...").
+    return " ".join(map(str, histogram.bins))
+
+
+class SignalStatisticsWindow:
+    def __init__(self):
+        self.create_window()
+        self.register_keybindings()
+        self.refresh()
+
+    def register_keybindings(self):
+        callbacks: Dict[Keybinding, Callable] = {}
+        # Cancel
+        kb: Keybinding = Keybinding(
+            key=dpg.mvKey_Escape,
+            mod_alt=False,
+            mod_ctrl=False,
+            mod_shift=False,
+            action=Action.CANCEL,
+        )
+        callbacks[kb] = self.close
+        # Create the handler
+        self.keybinding_handler: TemporaryKeybindingHandler = (
+            TemporaryKeybindingHandler(callbacks=callbacks)
+        )
+
+    def create_table(self, columns: List[str]) -> Tag:
+        table: Tag = dpg.generate_uuid()
+        with dpg.table(
+            borders_outerV=True,
+            borders_outerH=True,
+            borders_innerV=True,
+            borders_innerH=True,
+            scrollY=True,
+            freeze_rows=1,
+            sortable=False,
+            height=-1,
+            tag=table,
+        ):
+            label: str
+            for label in columns:
+                dpg.add_table_column(
+                    label=label,
+                    width_fixed=label not in ("Signal", "Callback"),
+                )
+
+        return table
+
+    def create_window(self):
+        x: int
+        y: int
+        w: int
+        h: int
+        x, y, w, h = calculate_window_position_dimensions(1000, 600)
+
+        self.window: Tag = dpg.generate_uuid()
+        with dpg.window(
+            label="Signal statistics",
+            modal=True,
+            pos=(x, y),
+            width=w,
+            height=h,
+            on_close=self.close,
+            tag=self.window,
+        ):
+            with dpg.group(horizontal=True):
+                dpg.add_button(label="Refresh", callback=self.refresh)
+                dpg.add_button(label="Reset", callback=self.reset)
+                dpg.add_button(label="Export as JSON", callback=self.export)
+                self.status_text: Tag = dpg.generate_uuid()
+                dpg.add_text(tag=self.status_text)
+
+            dpg.add_text(f"Histogram bins: {', '.join(HISTOGRAM_LABELS)}")
+            with dpg.tab_bar():
+                with dpg.tab(label="Signals"):
+                    self.signals_table: Tag = self.create_table(
+                        ["Signal", "Count", "Total (ms)", "Mean (ms)", "Max. (ms)", "Histogram"]
+                    )
+                with dpg.tab(label="Callbacks"):
+                    self.callbacks_table: Tag = self.create_table(
+                        ["Signal", "Callback", "Count", "Total (ms)", "Mean (ms)", "Max. (ms)", "Histogram"]
+                    )
+                with dpg.tab(label="Slow calls"):
+                    self.slow_calls_table: Tag = self.create_table(
+                        ["Time", "Signal", "Callback", "Duration (ms)", "Depth"]
+                    )
+                with dpg.tab(label="Call trees"):
+                    self.call_trees_window: Tag = dpg.generate_uuid()
+                    dpg.add_child_window(border=False, tag=self.call_trees_window)
+
+        signals.emit(Signal.BLOCK_KEYBINDINGS, window=self.window, window_object=self)
+
+    def close(self):
+        if dpg.does_item_exist(self.window):
+            dpg.delete_item(self.window)
+        self.keybinding_handler.delete()
+        signals.emit(Signal.UNBLOCK_KEYBINDINGS)
+
+    def add_row(self, table: Tag, values: List[str]):
+        with dpg.table_row(parent=table):
+            value: str
+            for value in values:
+                dpg.add_text(value)
+
+    def add_call_tree(self, node: dict, parent: Tag):
+        # Signal nodes contain the callbacks and callback nodes contain the
+        # signals that were emitted by the callback.
+        label: str
+        children: List[dict]
+        if "signal" in node:
+            label = node["signal"]
+            children = node["callbacks"] + node.get("emits", [])
+        else:
+            label = node["callback"]
+            children = node["emits"]
+
+        label = f"{label} ({node['duration'] * 1e3:.2f} ms)"
+        if not children:
+            dpg.add_text(label, bullet=True, parent=parent)
+            return
+
+        with dpg.tree_node(label=label, parent=parent) as tree_node:
+            child: dict
+            for child in children:
+                self.add_call_tree(child, tree_node)
+
+    def refresh(self):
+        table: Tag
+        for table in (
+            self.signals_table,
+            self.callbacks_table,
+            self.slow_calls_table,
+        ):
+            dpg.delete_item(table, children_only=True, slot=1)
+        dpg.delete_item(self.call_trees_window, children_only=True)
+
+        statistics: Optional[SignalStatistics] = signals.get_statistics()
+        if statistics is None:
+            dpg.set_value(self.status_text, "Statistics are not being recorded.")
+            return
+
+        dpg.set_value(
+            self.status_text,
+            f"Callbacks slower than {statistics.slow_threshold * 1e3:g} ms are logged.",
+        )
+
+        histogram: TimingHistogram
+        signal: str
+        for signal, histogram in sorted(
+            statistics.get_signals().items(),
+            key=lambda _: _[1].total,
+            reverse=True,
+        ):
+            self.add_row(
+                self.signals_table,
+                [
+                    signal,
+                    str(histogram.count),
+                    f"{histogram.total * 1e3:.2f}",
+                    f"{histogram.get_mean() * 1e3:.2f}",
+                    f"{histogram.maximum * 1e3:.2f}",
+                    _format_histogram(histogram),
+                ],
+            )
+
+        key: Tuple[str, str]
+        for key, histogram in sorted(
+            statistics.get_callbacks().items(),
+            key=lambda _: _[1].total,
+            reverse=True,
+        ):
+            self.add_row(
+                self.callbacks_table,
+                [
+                    *key,
+                    str(histogram.count),
+                    f"{histogram.total * 1e3:.2f}",
+                    f"{histogram.get_mean() * 1e3:.2f}",
+                    f"{histogram.maximum * 1e3:.2f}",
+                    _format_histogram(histogram),
+                ],
+            )
+
+        call: dict
+        for call in reversed(statistics.get_slow_calls()):
+            self.add_row(
+                self.slow_calls_table,
+                [
+                    strftime("%H:%M:%S", localtime(call["timestamp"])),
+                    call["signal"],
+                    call["callback"],
+                    f"{call['duration'] * 1e3:.2f}",
+                    str(call["depth"]),
+                ],
+            )
+
+        node: dict
+        for node in reversed(statistics.get_call_trees()):
+            self.add_call_tree(node, self.call_trees_window)
+
+    def reset(self):
+        statistics: Optional[SignalStatistics] = signals.get_statistics()
+        if statistics is not None:
+            statistics.reset()
+        self.refresh()
+
+    def export(self):
+        statistics: Optional[SignalStatistics] = signals.get_statistics()
+        if statistics is None:
+            return
+
+        path: str = join(
+            STATE.state_directory_path,
+            f"signal-statistics-{strftime('%Y%m%d-%H%M%S')}.json",
+        )
+        statistics.save(path)
+        dpg.set_value(self.status_text, f"Exported to {path}")
+
+
+def show_signal_statistics(*args, **kwargs):
+    SignalStatisticsWindow()
@@ -31,7 +31,6 @@ from numpy import (
     inf,
     ndarray,
 )
-import pyimpspec
 from pyimpspec import (
     Circuit,
     ComplexImpedance,
@@ -77,7 +76,15 @@ from deareis.data import (
     DataSet,
     SimulationResult,
     SimulationSettings,
+    SimulationSweepResult,
+    SimulationSweepSettings,
+    SweptParameter,
 )
+from deareis.api.circuit.compiled import (
+    CompiledCircuit,
+    compile_circuit,
+)
+from deareis.data.cache import CIRCUIT_CACHE
 from deareis.gui.widgets.combo import Combo
 from deareis.typing.helpers import Tag
 from deareis.enums import Action
@@ -89,6 +96,7 @@ from deareis.keybindings import (
 
 STATE = None
 _DEFAULT_NOISE: float = 0.0
+_MAX_PLOTTED_SPECTRA: int = 100
 
 
 class NoiseAdditionWindow:
@@ -209,6 +217,255 @@ class NoiseAdditionWindow:
             **kwargs,
         )
 
+class SweepWindow:
+    def __init__(
+        self,
+        settings: SimulationSettings,
+        sweeps: List[SimulationSweepResult],
+    ):
+        assert type(settings) is SimulationSettings, settings
+        self.settings: SimulationSettings = settings
+        self.values: Dict[str, float] = {}
+        self.user_data: Dict[str, Tuple[str, str]] = {}
+
+        compiled: CompiledCircuit = compile_circuit(CIRCUIT_CACHE.parse(settings.cdc))
+        element: str
+        parameter: str
+        value: float
+        for (element, parameter), value in zip(
+            compiled.get_parameter_labels(),
+            compiled.get_values(),
+        ):
+            label: str = f"{element}.{parameter}"
+            self.values[label] = float(value)
+            self.user_data[label] = (element, parameter)
+
+        x: int
+        y: int
+        w: int
+        h: int
+        x, y, w, h = calculate_window_position_dimensions(
+            width=600,
+            height=540,
+        )
+
+        label_pad: int = 12
+        self.window: Tag = dpg.generate_uuid()
+        with dpg.window(
+            label="Parameter sweep",
+            modal=True,
+            pos=(
+                x,
+                y,
+            ),
+            width=w,
+            height=h,
+            no_resize=True,
+            no_move=True,
+            on_close=self.close,
+            tag=self.window,
+        ):
+            with dpg.group(horizontal=True):
+                dpg.add_text("Parameter".rjust(label_pad))
+                attach_tooltip(tooltips.simulation.sweep_parameter)
+                self.parameter_combo: Combo = Combo(
+                    items=list(self.values.keys()),
+                    user_data=self.user_data,
+                    callback=lambda s, a, u: self.select_parameter(a),
+                    width=-1,
+                )
+
+            with dpg.group(horizontal=True):
+                dpg.add_text("Range".rjust(label_pad))
+                attach_tooltip(tooltips.simulation.sweep_range)
+                self.start_input: Tag = dpg.generate_uuid()
+                dpg.add_input_float(
+                    step=0.0,
+                    format="%.3g",
+                    width=100,
+                    tag=self.start_input,
+                )
+                dpg.add_text("to")
+                self.stop_input: Tag = dpg.generate_uuid()
+                dpg.add_input_float(
+                    step=0.0,
+                    format="%.3g",
+                    width=100,
+                    tag=self.stop_input,
+                )
+                dpg.add_text("in")
+                self.steps_input: Tag = dpg.generate_uuid()
+                dpg.add_input_int(
+                    label="steps",
+                    default_value=10,
+                    min_value=1,
+                    min_clamped=True,
+                    step=0,
+                    width=60,
+                    tag=self.steps_input,
+                )
+                self.log_checkbox: Tag = dpg.generate_uuid()
+                dpg.add_checkbox(
+                    label="Log",
+                    default_value=True,
+                    tag=self.log_checkbox,
+                )
+                attach_tooltip(tooltips.simulation.sweep_logarithmic)
+
+            with dpg.group(horizontal=True):
+                dpg.add_text("".rjust(label_pad))
+                self.accept_button: Tag = dpg.generate_uuid()
+                dpg.add_button(
+                    label="Perform",
+                    callback=lambda s, a, u: self.accept(),
+                    width=-1,
+                    tag=self.accept_button,
+                )
+
+            dpg.add_spacer(height=8)
+
+            with dpg.group(horizontal=True):
+                dpg.add_text("Result".rjust(label_pad))
+                self.results_combo: Tag = dpg.generate_uuid()
+                dpg.add_combo(
+                    callback=lambda s, a, u: self.select_sweep(u.get(a)),
+                    user_data={},
+                    width=-60,
+                    tag=self.results_combo,
+                )
+                self.delete_button: Tag = dpg.generate_uuid()
+                dpg.add_button(
+                    label="Delete",
+                    callback=lambda s, a, u: signals.emit(
+                        Signal.DELETE_SIMULATION_SWEEP,
+                        sweep=u,
+                        window=self,
+                    ),
+                    width=-1,
+                    tag=self.delete_button,
+                )
+                attach_tooltip(tooltips.simulation.remove_sweep)
+
+            self.nyquist_plot: Nyquist = Nyquist(width=-1, height=-1)
+
+        self.select_parameter(self.parameter_combo.get_label())
+        self.populate(sweeps)
+        self.register_keybindings()
+
+    def register_keybindings(self):
+        callbacks: Dict[Keybinding, Callable] = {}
+
+        # Cancel
+        kb: Keybinding = Keybinding(
+            key=dpg.mvKey_Escape,
+            mod_alt=False,
+            mod_ctrl=False,
+            mod_shift=False,
+            action=Action.CANCEL,
+        )
+        callbacks[kb] = self.close
+
+        # Accept
+        for kb in STATE.config.keybindings:
+            if kb.action is Action.PERFORM_ACTION:
+                break
+        else:
+            kb = Keybinding(
+                key=dpg.mvKey_Return,
+                mod_alt=True,
+                mod_ctrl=False,
+                mod_shift=False,
+                action=Action.PERFORM_ACTION,
+            )
+        callbacks[kb] = self.accept
+
+        # Create the handler
+        self.keybinding_handler: TemporaryKeybindingHandler = (
+            TemporaryKeybindingHandler(callbacks=callbacks)
+        )
+
+    def close(self):
+        dpg.hide_item(self.window)
+        dpg.delete_item(self.window)
+        self.keybinding_handler.delete()
+        signals.emit(Signal.UNBLOCK_KEYBINDINGS)
+
+    def select_parameter(self, label: str):
+        value: float = self.values.get(label, 1.0)
+        logarithmic: bool = value > 0.0
+        dpg.set_value(self.log_checkbox, logarithmic)
+        dpg.set_value(self.start_input, value / 10 if logarithmic else value - 1.0)
+        dpg.set_value(self.stop_input, value * 10 if logarithmic else value + 1.0)
+
+    def accept(self):
+        if len(self.values) == 0:
+            return
+
+        element: str
+        parameter: str
+        element, parameter = self.parameter_combo.get_value()
+        settings: SimulationSweepSettings = SimulationSweepSettings(
+            cdc=self.settings.cdc,
+            min_frequency=self.settings.min_frequency,
+            max_frequency=self.settings.max_frequency,
+            num_per_decade=self.settings.num_per_decade,
+            parameters=(
+                SweptParameter(
+                    element=element,
+                    parameter=parameter,
+                    start=dpg.get_value(self.start_input),
+                    stop=dpg.get_value(self.stop_input),
+                    num_steps=dpg.get_value(self.steps_input),
+                    logarithmic=dpg.get_value(self.log_checkbox),
+                ),
+            ),
+        )
+        signals.emit(
+            Signal.PERFORM_SIMULATION_SWEEP,
+            settings=settings,
+            window=self,
+        )
+
+    def populate(
+        self,
+        sweeps: List[SimulationSweepResult],
+        sweep: Optional[SimulationSweepResult] = None,
+    ):
+        lookup: Dict[str, SimulationSweepResult] = {
+            _.get_label(): _ for _ in sweeps
+        }
+        dpg.configure_item(
+            self.results_combo,
+            items=list(lookup.keys()),
+            user_data=lookup,
+        )
+        if sweep is None and len(sweeps) > 0:
+            sweep = sweeps[0]
+
+        self.select_sweep(sweep)
+
+    def select_sweep(self, sweep: Optional[SimulationSweepResult]):
+        dpg.set_item_user_data(self.delete_button, sweep)
+        dpg.set_value(self.results_combo, sweep.get_label() if sweep else "")
+        self.nyquist_plot.clear()
+        if sweep is None:
+            return
+
+        Z: ndarray = sweep.get_impedances()
+        i: int
+        for i in range(min(sweep.get_num_spectra(), _MAX_PLOTTED_SPECTRA)):
+            self.nyquist_plot.plot(
+                impedances=Z[i],
+                label=f"{i + 1}",
+                line=True,
+                simulation=True,
+                theme=themes.nyquist.simulation,
+                show_label=False,
+            )
+
+        self.nyquist_plot.queue_limits_adjustment()
+
+
 class SettingsMenu:
     def __init__(
         self,
@@ -624,7 +881,7 @@ class SettingsTable:
             cells,
         )
 
-        circuit: Circuit = pyimpspec.parse_cdc(settings.cdc)
+        circuit: Circuit = CIRCUIT_CACHE.parse(settings.cdc)
 
         tag: int
         value: str
@@ -881,10 +1138,17 @@ class SimulationTab:
                         settings=self.get_settings(),
                     ),
                     user_data=None,
-                    width=-1,
+                    width=-60,
                     tag=self.perform_sim_button,
                 )
 
+                dpg.add_button(
+                    label="Sweep",
+                    callback=lambda s, a, u: self.show_sweep_window(),
+                    width=-1,
+                )
+                attach_tooltip(tooltips.simulation.sweep)
+
     def create_results_menu(self):
         with dpg.child_window(width=-1, height=82):
             label_pad = 8
@@ -1361,7 +1625,7 @@ class SimulationTab:
         self.results_combo.set(simulation.get_label())
         self.parameters_table.populate(simulation)
         self.settings_table.populate(simulation)
-        self.circuit_preview.update(pyimpspec.parse_cdc(simulation.settings.cdc))
+        self.circuit_preview.update(CIRCUIT_CACHE.parse(simulation.settings.cdc))
 
         freq_markers: ndarray = simulation.get_frequencies()
         freq_line: ndarray = simulation.get_frequencies(
@@ -1463,6 +1727,21 @@ class SimulationTab:
 
         self.settings_menu.parse_cdc(circuit.serialize())
 
+    def show_sweep_window(self):
+        settings: SimulationSettings = self.get_settings()
+        if settings.cdc == "":
+            return
+
+        window: SweepWindow = SweepWindow(
+            settings,
+            self.state.get_active_project().get_simulation_sweeps(),
+        )
+        signals.emit(
+            Signal.BLOCK_KEYBINDINGS,
+            window=window.window,
+            window_object=window,
+        )
+
     def show_enlarged_nyquist(self):
         signals.emit(
             Signal.SHOW_ENLARGED_PLOT,
@@ -0,0 +1,280 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from cProfile import Profile
+from os import makedirs
+from os.path import join
+from threading import (
+    Lock,
+    get_ident,
+)
+from time import (
+    perf_counter,
+    time,
+)
+from typing import (
+    IO,
+    List,
+    Optional,
+)
+import tracemalloc
+
+
+class ActionProfiler:
+    """
+    Profiles user actions, i.e., signals that are emitted outside of the callbacks of other signals (see `deareis.signals.enable_profiling`).
+    Each action is profiled using cProfile and, optionally, the memory allocations are traced using tracemalloc.
+    The profiles of actions that take longer than a threshold are saved as .prof files (e.g., for use with `python -m pstats` or snakeviz) together with reports of the lines of code that allocated the most memory.
+    Only one action is profiled at a time, so actions that are started on other threads while an action is being profiled are not profiled.
+
+    Parameters
+    ----------
+    directory: str
+        The directory where the profiles, reports, and summary are saved.
+        The directory is created when the first profile is saved.
+
+    memory: bool, optional
+        Whether or not to trace memory allocations.
+        Tracing slows down the program considerably.
+
+    min_duration: float, optional
+        The duration (in seconds) that an action needs to exceed for its profile to be saved.
+        All actions are included in the summary.
+
+    num_lines: int, optional
+        The number of lines of code to include in the memory reports.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        memory: bool = False,
+        min_duration: float = 0.1,
+        num_lines: int = 20,
+    ):
+        assert isinstance(directory, str) and directory != "", directory
+        assert min_duration >= 0.0, min_duration
+        assert num_lines > 0, num_lines
+        self.directory: str = directory
+        self.memory: bool = memory
+        self.min_duration: float = min_duration
+        self.num_lines: int = num_lines
+        self._lock: Lock = Lock()
+        self._is_closed: bool = False
+        self._thread_id: Optional[int] = None
+        self._counter: int = 0
+        self._label: str = ""
+        self._start: float = 0.0
+        self._profile: Optional[Profile] = None
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._actions: List[dict] = []
+        self._started_tracing: bool = False
+        self._num_summarized_actions: Optional[int] = None
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def __repr__(self) -> str:
+        return f"ActionProfiler ({len(self._actions)} actions, {hex(id(self))})"
+
+    def begin_action(self, label: str) -> bool:
+        """
+        Start profiling an action unless another action is already being profiled.
+
+        Parameters
+        ----------
+        label: str
+            The label of the action (e.g., the name of the signal).
+
+        Returns
+        -------
+        bool
+            True if profiling was started, in which case `end_action` must be called.
+        """
+        if self._is_closed or not self._lock.acquire(blocking=False):
+            return False
+
+        self._label = label
+        self._snapshot = tracemalloc.take_snapshot() if self.memory else None
+        self._profile = Profile()
+        try:
+            self._profile.enable()
+        except ValueError:
+            # Another profiler (e.g., a debugger) is active.
+            self._profile = None
+            self._snapshot = None
+            self._lock.release()
+            return False
+
+        self._thread_id = get_ident()
+        self._start = perf_counter()
+        return True
+
+    def end_action(self):
+        """
+        Stop profiling the current action and save the results if the action was slow enough.
+        """
+        duration: float = perf_counter() - self._start
+        profile: Optional[Profile] = self._profile
+        assert profile is not None
+        profile.disable()
+        try:
+            action: dict = {
+                "action": self._label,
+                "timestamp": time(),
+                "duration": duration,
+                "profile": "",
+                "memory": "",
+            }
+            if duration >= self.min_duration:
+                self._save(action, profile)
+            self._actions.append(action)
+        finally:
+            self._profile = None
+            self._snapshot = None
+            self._thread_id = None
+            self._lock.release()
+            if self._num_summarized_actions is not None:
+                # The profiler was closed by this action.
+                self._finish(self._num_summarized_actions)
+
+    def _save(self, action: dict, profile: Profile):
+        makedirs(self.directory, exist_ok=True)
+        self._counter += 1
+        stem: str = join(self.directory, f"{self._counter:04d}-{self._label.lower()}")
+        action["profile"] = f"{stem}.prof"
+        profile.dump_stats(action["profile"])
+        if self._snapshot is None:
+            return
+
+        # Exclude the allocations made by tracemalloc while taking the
+        # snapshots.
+        ignored = (tracemalloc.Filter(False, tracemalloc.__file__),)
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        differences: List[tracemalloc.StatisticDiff] = snapshot.filter_traces(
+            ignored
+        ).compare_to(self._snapshot.filter_traces(ignored), "lineno")
+        action["memory"] = f"{stem}-memory.txt"
+        fp: IO
+        with open(action["memory"], "w") as fp:
+            fp.write(f"Action: {self._label}\n")
+            fp.write(f"Duration: {action['duration'] * 1e3:.2f} ms\n")
+            fp.write(f"Net change: {sum(_.size_diff for _ in differences) / 1024:+.1f} KiB\n")
+            fp.write(f"\nTop {self.num_lines} lines by net change in allocated memory:\n")
+            i: int
+            difference: tracemalloc.StatisticDiff
+            for i, difference in enumerate(differences[: self.num_lines], start=1):
+                fp.write(f"{i}. {difference}\n")
+
+    def get_actions(self) -> List[dict]:
+        """
+        Get the actions that have been profiled.
+        Each action contains the label, the time stamp, the duration (in seconds), and the paths to the profile and to the memory report (empty strings if not saved).
+
+        Returns
+        -------
+        List[dict]
+        """
+        return list(self._actions)
+
+    def get_slowest_actions(self, num_actions: int = 10) -> List[dict]:
+        """
+        Get the slowest actions that have been profiled.
+
+        Parameters
+        ----------
+        num_actions: int, optional
+            The maximum number of actions to return.
+
+        Returns
+        -------
+        List[dict]
+        """
+        return sorted(
+            self._actions,
+            key=lambda _: _["duration"],
+            reverse=True,
+        )[:num_actions]
+
+    def summarize(self, num_actions: int = 10) -> str:
+        """
+        Summarize the slowest actions that have been profiled.
+
+        Parameters
+        ----------
+        num_actions: int, optional
+            The maximum number of actions to include.
+
+        Returns
+        -------
+        str
+        """
+        lines: List[str] = [
+            f"Profiled {len(self._actions)} action(s) ({self.directory})",
+        ]
+        action: dict
+        for action in self.get_slowest_actions(num_actions):
+            lines.append(
+                f"- {action['action']}: {action['duration'] * 1e3:.2f} ms"
+                + (f" ({action['profile']})" if action["profile"] else "")
+            )
+
+        return "\n".join(lines)
+
+    def close(self, num_actions: int = 10) -> str:
+        """
+        Stop profiling and save a summary of the slowest actions if any profiles were saved.
+
+        Parameters
+        ----------
+        num_actions: int, optional
+            The maximum number of actions to include in the summary.
+
+        Returns
+        -------
+        str
+            The summary.
+        """
+        if self._thread_id == get_ident():
+            # Closed by the action that is being profiled, which still needs
+            # the memory traces when it ends. The tracing is stopped and the
+            # summary is saved by `end_action`.
+            self._is_closed = True
+            self._num_summarized_actions = num_actions
+            return self.summarize(num_actions)
+
+        # Wait for an action that is being profiled on another thread.
+        with self._lock:
+            self._is_closed = True
+
+        return self._finish(num_actions)
+
+    def _finish(self, num_actions: int) -> str:
+        self._num_summarized_actions = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        summary: str = self.summarize(num_actions)
+        if self._counter > 0:
+            fp: IO
+            with open(join(self.directory, "summary.txt"), "w") as fp:
+                fp.write(summary + "\n")
+
+        return summary
@@ -29,13 +29,10 @@ from json import (
     dumps as dump_json,
     load as load_json,
 )
-from multiprocessing import (
-    Process,
-    Queue,
-    set_start_method,
-)
-from queue import Empty
+from multiprocessing import set_start_method
 from os import remove
+from os.path import join
+from time import strftime
 from traceback import format_exc
 from typing import (
     Dict,
@@ -60,7 +57,6 @@ from pandas import DataFrame
 from sympy import (
     Expr,
     latex,
-    simplify,
 )
 from .project import (
     close_project,
@@ -124,7 +120,9 @@ from .fitting import (
 from .simulation import (
     apply_simulation_settings,
     delete_simulation_result,
+    delete_simulation_sweep,
     perform_simulation,
+    perform_simulation_sweep,
     select_simulation_result,
 )
 from .plotting import (
@@ -146,6 +144,7 @@ from .plotting import (
 from .check_updates import perform_update_check
 from deareis.typing.helpers import Tag
 from deareis.gui.about import show_help_about
+from deareis.gui.signal_statistics import show_signal_statistics
 from deareis.gui.plots import show_modal_plot_window
 from deareis.gui.changelog import show_changelog
 from deareis.enums import (
@@ -173,6 +172,8 @@ from deareis.gui import (
 from deareis.signals import Signal
 import deareis.signals as signals
 from deareis.state import STATE
+from deareis.scheduler import SCHEDULER
+from deareis.profiling import ActionProfiler
 from deareis.utility import (
     calculate_window_position_dimensions,
     format_latex_element,
@@ -201,40 +202,32 @@ from deareis.gui.settings import (
     show_user_defined_elements_window,
     refresh_user_defined_elements,
 )
+from deareis.progress import ProgressAggregator
 import deareis.themes as themes
 from deareis.version import PACKAGE_VERSION
 
 
-# Hook into the progress callbacks implemented in pyimpspec
-pyimpspec.progress.register(
+# Hook into the progress callbacks implemented in pyimpspec. The updates are
+# coalesced since each update of the busy message waits for a frame to be
+# rendered.
+PROGRESS_AGGREGATOR: ProgressAggregator = ProgressAggregator(
     lambda *a, **k: signals.emit(Signal.SHOW_BUSY_MESSAGE, *a, **k)
 )
-
-
-def sympy_wrapper(expr: Expr, queue: Queue):
-    queue.put(simplify(expr))
+pyimpspec.progress.register(PROGRESS_AGGREGATOR)
 
 
 def get_sympy_expr(circuit: Circuit) -> Expr:
     assert type(circuit) is Circuit
-    expr: Expr = circuit.to_sympy()
     # Try to simplify the expression, but don't wait for an indefinite period of time
-    queue: Queue = Queue()
-    proc: Process = Process(
-        target=sympy_wrapper,
-        args=(
-            expr,
-            queue,
-        ),
-    )
-    proc.start()
     try:
-        expr = queue.get(True, 2)
-    except Empty:
-        pass
-    if proc.is_alive:
-        proc.kill()
-    return expr
+        return STATE.expression_cache.get_expression(circuit)
+    except ValueError:
+        signals.emit(
+            Signal.SHOW_ERROR_MESSAGE,
+            traceback=format_exc(),
+            message="Failed to simplify the expression of the circuit, so the unsimplified expression is used instead.",
+        )
+        return circuit.to_sympy()
 
 
 # TODO: Refactor into smaller functions
@@ -315,6 +308,11 @@ def copy_output(*args, **kwargs):
                             "Value": format_latex_value,
                             "Std. err. (%)": format_latex_value,
                             "Unit": format_latex_unit,
+                            **{
+                                column: format_latex_value
+                                for column in dataframe.columns
+                                if " CI " in column
+                            },
                         }
                     )
                     .format_index(axis="columns", escape="latex")
@@ -825,6 +823,27 @@ def copy_plot_data(*args, **kwargs):
         )
 
 
+def toggle_profiling(*args, **kwargs):
+    flag: bool = kwargs.get("flag", False)
+    memory: bool = kwargs.get("memory", False)
+    profiler: Optional[ActionProfiler] = signals.disable_profiling()
+    if profiler is not None:
+        print(profiler.summarize())
+
+    if not flag:
+        return
+
+    profiler = signals.enable_profiling(
+        directory=join(
+            STATE.state_directory_path,
+            "profiles",
+            strftime("%Y%m%d-%H%M%S"),
+        ),
+        memory=memory,
+    )
+    print(f"Profiling actions ({profiler.directory})...")
+
+
 def restore_unsaved_project_snapshots():
     parsing_errors: Dict[str, str] = {}
     unsaved_project_snapshots: List[str] = STATE.get_unsaved_project_snapshots()
@@ -961,6 +980,7 @@ def initialize_program(args: Namespace):
     # program is busy e.g. performing a fit.
     signals.register(Signal.SHOW_BUSY_MESSAGE, STATE.program_window.busy_message.show)
     signals.register(Signal.HIDE_BUSY_MESSAGE, STATE.program_window.busy_message.hide)
+    signals.register(Signal.HIDE_BUSY_MESSAGE, PROGRESS_AGGREGATOR.reset)
     signals.register(
         Signal.SHOW_ERROR_MESSAGE,
         lambda *a, **k: STATE.program_window.busy_message.hide(),
@@ -1061,6 +1081,8 @@ def initialize_program(args: Namespace):
     signals.register(Signal.SELECT_SIMULATION_RESULT, select_simulation_result)
     signals.register(Signal.DELETE_SIMULATION_RESULT, delete_simulation_result)
     signals.register(Signal.APPLY_SIMULATION_SETTINGS, apply_simulation_settings)
+    signals.register(Signal.PERFORM_SIMULATION_SWEEP, perform_simulation_sweep)
+    signals.register(Signal.DELETE_SIMULATION_SWEEP, delete_simulation_sweep)
 
     # Signals for the plotting tab
     signals.register(Signal.NEW_PLOT_SETTINGS, new_plot_settings)
@@ -1086,9 +1108,21 @@ def initialize_program(args: Namespace):
     signals.register(Signal.BATCH_PERFORM_ANALYSIS, select_batch_data_sets)
     signals.register(Signal.CHECK_UPDATES, perform_update_check)
     signals.register(Signal.SHOW_CHANGELOG, show_changelog)
+    if signals.get_statistics() is not None:
+        signals.register(Signal.SHOW_SIGNAL_STATISTICS, show_signal_statistics)
+        signals.register(Signal.TOGGLE_PROFILING, toggle_profiling)
+        STATE.program_window.menu_bar.add_debug_menu()
+
+    if args.defer_signals:
+        signals.set_deferred_dispatch(SCHEDULER.submit)
+
+    # The helper process that simplifies SymPy expressions imports modules
+    # that take a while to import, so it is started in the background now
+    # rather than when an expression is first copied.
+    STATE.expression_cache.start()
 
     # Program is actually starting to function at this point
-    dpg.split_frame(delay=100)
+    SCHEDULER.wait_for_frame()
     STATE.program_window.busy_message.resize(
         dpg.get_viewport_client_width(),
         dpg.get_viewport_client_height(),
@@ -1149,7 +1183,13 @@ def program_closing():
     STATE.clear_project_backups(clean_projects)
 
     STATE.save_recent_projects()
+    STATE.expression_cache.save()
+    STATE.expression_cache.stop()
+    STATE.worker_count_tuner.save()
     STATE.config.save()
+    profiler: Optional[ActionProfiler] = signals.disable_profiling()
+    if profiler is not None:
+        print(profiler.summarize())
 
 
 def main():
@@ -1172,10 +1212,17 @@ def main():
     try:
         dpg.set_frame_callback(1, lambda: initialize_program(args))
         dpg.set_exit_callback(program_closing)
-        dpg.start_dearpygui()
+        # Equivalent to dpg.start_dearpygui() except that chunks of long tasks
+        # are run before each frame.
+        SCHEDULER.start()
+        while dpg.is_dearpygui_running():
+            SCHEDULER.run_frame()
+            dpg.render_dearpygui_frame()
+            SCHEDULER.frame_rendered()
     except Exception:
         print(format_exc())
     finally:
+        SCHEDULER.stop()
         dpg.destroy_context()
 
 
@@ -1183,6 +1230,7 @@ def debug():
     # This function is called by one of the entry points defined in setup.py.
     print("Enabling debugging features...")
     signals.DEBUG = True
+    signals.enable_statistics()
     main()
 
 
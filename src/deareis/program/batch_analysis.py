@@ -19,12 +19,12 @@
 
 from traceback import format_exc
 from typing import (
+    Dict,
     List,
     Optional,
     Tuple,
     Union,
 )
-import dearpygui.dearpygui as dpg
 from pyimpspec.exceptions import (
     KramersKronigError,
     FittingError,
@@ -40,10 +40,14 @@ from deareis.data import (
     ZHITSettings,
 )
 from .kramers_kronig import perform_test
-from .zhit import perform_zhit
+from .zhit import (
+    perform_batch_zhit,
+    perform_zhit,
+)
 from .drt import perform_drt
 from .fitting import perform_fit
 from deareis.gui.batch_analysis import BatchAnalysis
+from deareis.scheduler import SCHEDULER
 from deareis.signals import Signal
 import deareis.signals as signals
 from deareis.state import STATE
@@ -59,7 +63,28 @@ def batch_perform_analyses(data_sets: List[DataSet], settings: Settings):
         "batch": True,
     }
     data: DataSet
-    for data in data_sets:
+    if isinstance(settings, ZHITSettings):
+        # Data sets with the same frequencies are analyzed together and any
+        # group that fails is analyzed one data set at a time below in order
+        # to find out which of the data sets caused the error.
+        groups: Dict[bytes, List[DataSet]] = {}
+        for data in data_sets:
+            if data.get_num_points() > 0:
+                groups.setdefault(data.get_frequencies().tobytes(), []).append(data)
+
+        group: List[DataSet]
+        for group in SCHEDULER.iterate(list(groups.values()), priority=-1):
+            if len(group) < 2:
+                continue
+            try:
+                perform_batch_zhit(data_sets=group, **kwargs)
+            except (ZHITError, ValueError):
+                continue
+            data_sets = [_ for _ in data_sets if all(_ is not g for g in group)]
+
+    # The busy message is rendered between data sets whenever the per-frame
+    # time budget has been used up.
+    for data in SCHEDULER.iterate(data_sets, priority=-1):
         if isinstance(settings, KramersKronigSettings):
             try:
                 perform_test(data=data, **kwargs)
@@ -84,8 +109,6 @@ def batch_perform_analyses(data_sets: List[DataSet], settings: Settings):
             except FittingError:
                 errors.append((data, format_exc()))
 
-        dpg.split_frame(delay=60)
-
     signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
     if len(errors) == 0:
         return
@@ -409,7 +409,8 @@ def apply_data_set_mask(*args, **kwargs):
     if mask is None or data is None:
         return
 
-    data.set_mask(mask)
+    # Results store their masks as read-only mappings.
+    data.set_mask(dict(mask))
     signals.emit(Signal.SELECT_PLOT_SETTINGS, settings=project_tab.get_active_plot())
     signals.emit(Signal.SELECT_DATA_SET, data=data)
 
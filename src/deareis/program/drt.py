@@ -104,11 +104,17 @@ def perform_drt(*args, **kwargs):
     ), "There are no data points to use to calculate the distribution of relaxation times!"
     batch: bool = kwargs.get("batch", False)
     signals.emit(Signal.SHOW_BUSY_MESSAGE, message="Performing analysis")
-    drt: DRTResult = api.calculate_drt(
-        data=data,
-        settings=settings,
-        num_procs=STATE.config.num_procs or -1,
-    )
+    num_procs: int
+    with STATE.measure_num_procs(
+        f"drt-{settings.method.name}",
+        data.get_num_points(),
+    ) as num_procs:
+        drt: DRTResult = api.calculate_drt(
+            data=data,
+            settings=settings,
+            num_procs=num_procs,
+            parallel_sampling=STATE.config.drt_parallel_sampling,
+        )
     project.add_drt(data=data, drt=drt)
     project_tab.populate_drts(project, data)
     project_tab.plotting_tab.populate_drts(
@@ -120,11 +120,16 @@ def perform_fit(*args, **kwargs):
 
     batch: bool = kwargs.get("batch", False)
     signals.emit(Signal.SHOW_BUSY_MESSAGE, message="Performing fit")
-    fit: FitResult = api.fit_circuit(
-        data=data,
-        settings=settings,
-        num_procs=STATE.config.num_procs or -1,
-    )
+    num_procs: int
+    with STATE.measure_num_procs(
+        f"fitting-{settings.method.name}-{settings.weight.name}",
+        data.get_num_points(),
+    ) as num_procs:
+        fit: FitResult = api.fit_circuit(
+            data=data,
+            settings=settings,
+            num_procs=num_procs,
+        )
     project.add_fit(data, fit)
 
     project_tab.populate_fits(project, data)
@@ -182,11 +182,18 @@ def perform_test(*args, **kwargs):
     batch: bool = kwargs.get("batch", False)
     if settings.mode == KramersKronigMode.AUTO or settings.mode == KramersKronigMode.MANUAL:
         signals.emit(Signal.SHOW_BUSY_MESSAGE, message="Performing test(s)")
-        test: KramersKronigResult = api.perform_kramers_kronig_test(
-            data=data,
-            settings=settings,
-            num_procs=STATE.config.num_procs or -1,
-        )
+        num_procs: int
+        # Exploratory tests (AUTO) and single tests (MANUAL) scale very
+        # differently with the number of processes.
+        with STATE.measure_num_procs(
+            f"kramers_kronig-{settings.mode.name}",
+            data.get_num_points(),
+        ) as num_procs:
+            test: KramersKronigResult = api.perform_kramers_kronig_test(
+                data=data,
+                settings=settings,
+                num_procs=num_procs,
+            )
 
         signals.emit(Signal.HIDE_BUSY_MESSAGE)
         project.add_test(
@@ -217,11 +224,15 @@ def perform_test(*args, **kwargs):
             tmp = settings.to_dict()
             tmp["representation"] = KramersKronigRepresentation.IMPEDANCE
 
-            Z_evaluations = api.evaluate_log_F_ext(
-                data=data,
-                settings=KramersKronigSettings.from_dict(tmp),
-                num_procs=STATE.config.num_procs or -1,
-            )
+            with STATE.measure_num_procs(
+                "kramers_kronig-exploratory",
+                data.get_num_points(),
+            ) as num_procs:
+                Z_evaluations = api.evaluate_log_F_ext(
+                    data=data,
+                    settings=KramersKronigSettings.from_dict(tmp),
+                    num_procs=num_procs,
+                )
 
             signals.emit(
                 Signal.SHOW_BUSY_MESSAGE,
@@ -247,11 +258,15 @@ def perform_test(*args, **kwargs):
             tmp = settings.to_dict()
             tmp["representation"] = KramersKronigRepresentation.ADMITTANCE
 
-            Y_evaluations = api.evaluate_log_F_ext(
-                data=data,
-                settings=KramersKronigSettings.from_dict(tmp),
-                num_procs=STATE.config.num_procs or -1,
-            )
+            with STATE.measure_num_procs(
+                "kramers_kronig-exploratory",
+                data.get_num_points(),
+            ) as num_procs:
+                Y_evaluations = api.evaluate_log_F_ext(
+                    data=data,
+                    settings=KramersKronigSettings.from_dict(tmp),
+                    num_procs=num_procs,
+                )
 
             for evaluation in Y_evaluations:
                 for result in evaluation[1]:
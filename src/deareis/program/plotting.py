@@ -530,14 +530,17 @@ def delete_plot_settings(*args, **kwargs):
     signals.emit(Signal.SHOW_BUSY_MESSAGE, message="Deleting plot")
     project.delete_plot(settings)
 
-    plots: List[PlotSettings] = project.get_plots()
-    if not plots:
-        signals.emit(Signal.NEW_PLOT_SETTINGS)
-    else:
-        project_tab.populate_plots(project)
-        signals.emit(Signal.SELECT_PLOT_SETTINGS, settings=plots[0])
+    # Creating a new plot also selects the plot and creates a snapshot.
+    with signals.deferred():
+        plots: List[PlotSettings] = project.get_plots()
+        if not plots:
+            signals.emit(Signal.NEW_PLOT_SETTINGS)
+        else:
+            project_tab.populate_plots(project)
+            signals.emit(Signal.SELECT_PLOT_SETTINGS, settings=plots[0])
+
+        signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
 
-    signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
     signals.emit(Signal.HIDE_BUSY_MESSAGE)
 
 
@@ -17,6 +17,7 @@
 # The licenses of DearEIS' dependencies and/or sources of portions of code are included in
 # the LICENSES folder.
 
+from traceback import format_exc
 from typing import (
     Optional,
 )
@@ -27,6 +28,8 @@ from deareis.data import (
     Project,
     SimulationResult,
     SimulationSettings,
+    SimulationSweepResult,
+    SimulationSweepSettings,
 )
 import deareis.api.simulation as api
 from deareis.enums import Context
@@ -130,3 +133,61 @@ def perform_simulation(*args, **kwargs):
     )
     signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
     signals.emit(Signal.HIDE_BUSY_MESSAGE)
+
+
+def perform_simulation_sweep(*args, **kwargs):
+    project: Optional[Project] = STATE.get_active_project()
+    project_tab: Optional[ProjectTab] = STATE.get_active_project_tab()
+    if project is None or project_tab is None:
+        return
+
+    settings: Optional[SimulationSweepSettings] = kwargs.get("settings")
+    if settings is None:
+        return
+
+    assert (
+        settings.min_frequency != settings.max_frequency
+    ), "The minimum and maximum frequencies cannot be the same!"
+
+    signals.emit(Signal.SHOW_BUSY_MESSAGE, message="Performing simulation sweep")
+    sweep: SimulationSweepResult
+    try:
+        sweep = api.sweep_simulation(settings)
+    except Exception:
+        signals.emit(
+            Signal.SHOW_ERROR_MESSAGE,
+            traceback=format_exc(),
+            message="Encountered an error while performing the simulation sweep.",
+        )
+        signals.emit(Signal.HIDE_BUSY_MESSAGE)
+        return
+
+    project.add_simulation_sweep(sweep)
+
+    window = kwargs.get("window")
+    if window is not None:
+        window.populate(project.get_simulation_sweeps(), sweep)
+
+    signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
+    signals.emit(Signal.HIDE_BUSY_MESSAGE)
+
+
+def delete_simulation_sweep(*args, **kwargs):
+    project: Optional[Project] = STATE.get_active_project()
+    project_tab: Optional[ProjectTab] = STATE.get_active_project_tab()
+    if project is None or project_tab is None:
+        return
+
+    sweep: Optional[SimulationSweepResult] = kwargs.get("sweep")
+    if sweep is None:
+        return
+
+    signals.emit(Signal.SHOW_BUSY_MESSAGE, message="Deleting simulation sweep")
+    project.delete_simulation_sweep(sweep)
+
+    window = kwargs.get("window")
+    if window is not None:
+        window.populate(project.get_simulation_sweeps())
+
+    signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
+    signals.emit(Signal.HIDE_BUSY_MESSAGE)
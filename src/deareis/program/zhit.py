@@ -114,11 +114,13 @@ def perform_zhit(*args, **kwargs):
     batch: bool = kwargs.get("batch", False)
     signals.emit(Signal.SHOW_BUSY_MESSAGE, message="Performing Z-HIT analysis")
     try:
-        zhit: ZHITResult = api.perform_zhit(
-            data=data,
-            settings=settings,
-            num_procs=STATE.config.num_procs or -1,
-        )
+        num_procs: int
+        with STATE.measure_num_procs("zhit", data.get_num_points()) as num_procs:
+            zhit: ZHITResult = api.perform_zhit(
+                data=data,
+                settings=settings,
+                num_procs=num_procs,
+            )
     except ZHITError:
         signals.emit(Signal.SHOW_ERROR_MESSAGE, traceback=format_exc())
         return
@@ -137,6 +139,40 @@ def perform_zhit(*args, **kwargs):
         signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
 
 
+def perform_batch_zhit(*args, **kwargs):
+    # Unlike perform_zhit, errors are raised so that the caller can fall back
+    # to analyzing the data sets one at a time.
+    project: Optional[Project] = STATE.get_active_project()
+    project_tab: Optional[ProjectTab] = STATE.get_active_project_tab()
+    if project is None or project_tab is None:
+        return
+    data_sets: List[DataSet] = kwargs.get("data_sets", [])
+    settings: Optional[ZHITSettings] = kwargs.get("settings")
+    if len(data_sets) == 0 or settings is None:
+        return
+    signals.emit(Signal.SHOW_BUSY_MESSAGE, message="Performing Z-HIT analyses")
+    try:
+        zhits: List[ZHITResult] = api.perform_batch_zhit(
+            data_sets=data_sets,
+            settings=settings,
+        )
+        data: DataSet
+        zhit: ZHITResult
+        for data, zhit in zip(data_sets, zhits):
+            project.add_zhit(
+                data=data,
+                zhit=zhit,
+            )
+        project_tab.populate_zhits(project, data_sets[-1])
+        project_tab.plotting_tab.populate_zhits(
+            project.get_all_zhits(),
+            project.get_data_sets(),
+            project_tab.get_active_plot(),
+        )
+    finally:
+        signals.emit(Signal.HIDE_BUSY_MESSAGE)
+
+
 def preview_zhit_weights(*args, **kwargs):
     project: Optional[Project] = STATE.get_active_project()
     project_tab: Optional[ProjectTab] = STATE.get_active_project_tab()
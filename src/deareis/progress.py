@@ -0,0 +1,185 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from collections import deque
+from math import ceil
+from re import compile as compile_regex
+from threading import (
+    RLock,
+    Timer,
+)
+from time import perf_counter
+from typing import (
+    Callable,
+    Deque,
+    Optional,
+    Pattern,
+    Tuple,
+)
+
+
+def format_eta(seconds: float) -> str:
+    """
+    Format an estimate of the remaining time (e.g., "~3 min").
+
+    Parameters
+    ----------
+    seconds: float
+        The number of seconds.
+
+    Returns
+    -------
+    str
+    """
+    seconds = int(ceil(seconds))
+    minutes: int = seconds // 60
+
+    return f"~{minutes if minutes > 0 else seconds} {'min' if minutes > 0 else 's'}"
+
+
+# Matches the numbers (e.g., counters and estimates of the remaining time)
+# that are embedded in the messages of some tasks.
+_NUMBER_PATTERN: Pattern = compile_regex(r"[-+]?\d[\d.,]*(?:[eE][-+]?\d+)?")
+
+
+def _get_message_key(message: str) -> str:
+    return _NUMBER_PATTERN.sub("#", message)
+
+
+class ProgressAggregator:
+    """
+    Coalesces progress updates (e.g., those emitted by pyimpspec from within loops) so that the callback, which typically updates the GUI, is invoked at most once per interval.
+    Updates that change the message (ignoring any numbers such as counters) or complete the progress are always passed on.
+    If an update is dropped, then the latest update is passed on once the interval has passed unless a newer update has been passed on before then.
+    An estimate of the remaining time is calculated based on the rate of progress during a rolling window and passed on as the `eta` keyword argument (negative if no estimate is available).
+
+    Parameters
+    ----------
+    callback: Callable
+        The function to invoke with the `message`, `progress`, and `eta` keyword arguments.
+
+    interval: float, optional
+        The minimum number of seconds between invocations of the callback (e.g., the duration of a frame).
+        The interval starts when the previous invocation returns.
+
+    window: float, optional
+        The number of seconds of progress to base the estimate of the remaining time on.
+
+    min_elapsed: float, optional
+        The number of seconds that need to have passed since the start of a task before the remaining time is estimated.
+    """
+
+    def __init__(
+        self,
+        callback: Callable,
+        interval: float = 1.0 / 30.0,
+        window: float = 10.0,
+        min_elapsed: float = 1.0,
+    ):
+        assert callable(callback), callback
+        assert interval >= 0.0, interval
+        assert window > 0.0, window
+        assert min_elapsed >= 0.0, min_elapsed
+        self._callback: Callable = callback
+        self._interval: float = interval
+        self._window: float = window
+        self._min_elapsed: float = min_elapsed
+        self._lock: RLock = RLock()
+        self._timer: Optional[Timer] = None
+        self._is_pending: bool = False
+        self._message: str = ""
+        self._progress: float = -1.0
+        self._start: float = 0.0
+        self._next: float = 0.0
+        self._samples: Deque[Tuple[float, float]] = deque()
+        self.num_received: int = 0
+        self.num_forwarded: int = 0
+
+    def __call__(self, *args, message: str = "", progress: float = -1.0, **kwargs):
+        with self._lock:
+            self.num_received += 1
+            now: float = perf_counter()
+            if progress < self._progress or self._progress < 0.0:
+                # A new task has started.
+                self._start = now
+                self._samples.clear()
+                self._next = 0.0
+
+            is_forced: bool = (
+                _get_message_key(message) != _get_message_key(self._message)
+                or progress >= 1.0
+            )
+            self._message = message
+            self._progress = progress
+            if now < self._next and not is_forced:
+                self._is_pending = True
+                if self._timer is None:
+                    self._timer = Timer(self._next - now, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+
+            self._forward(now)
+
+    def flush(self):
+        """
+        Pass on the latest update if it was dropped.
+        """
+        with self._lock:
+            self._timer = None
+            if self._is_pending:
+                self._forward(perf_counter())
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _forward(self, now: float):
+        self._is_pending = False
+        self._cancel_timer()
+        eta: float = -1.0
+        progress: float = self._progress
+        if progress >= 0.0:
+            samples: Deque[Tuple[float, float]] = self._samples
+            samples.append((now, progress))
+            while len(samples) > 2 and now - samples[0][0] > self._window:
+                samples.popleft()
+
+            duration: float = now - samples[0][0]
+            rate: float = (progress - samples[0][1]) / duration if duration > 0.0 else 0.0
+            if rate > 0.0 and now - self._start >= self._min_elapsed:
+                eta = (1.0 - progress) / rate
+
+        self.num_forwarded += 1
+        self._callback(message=self._message, progress=progress, eta=eta)
+        self._next = perf_counter() + self._interval
+
+    def reset(self):
+        """
+        Forget the current task so that the next update is passed on and starts a new estimate of the remaining time.
+        Any dropped update is discarded.
+        """
+        with self._lock:
+            self._cancel_timer()
+            self._is_pending = False
+            self._message = ""
+            self._progress = -1.0
+            self._samples.clear()
+            self._next = 0.0
@@ -0,0 +1,394 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from heapq import (
+    heappop,
+    heappush,
+)
+from itertools import count
+from threading import (
+    Condition,
+    Event,
+    Lock,
+    get_ident,
+)
+from time import perf_counter
+from traceback import format_exc
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+
+T = TypeVar("T")
+
+
+class ScheduledTask:
+    """
+    A handle for a task that has been submitted to a `FrameScheduler`.
+
+    Parameters
+    ----------
+    chunks: Optional[Union[Callable[[], None], Iterator]]
+        A function, which is run as a single chunk, or an iterator, where each step is a chunk.
+
+    priority: int
+        Tasks with higher priorities are run first.
+
+    label: str
+        The label of the task.
+    """
+
+    def __init__(
+        self,
+        chunks: Optional[Union[Callable[[], None], Iterator]],
+        priority: int,
+        label: str,
+    ):
+        self.priority: int = priority
+        self.label: str = label
+        self._chunks: Optional[Union[Callable[[], None], Iterator]] = chunks
+        self._is_cancelled: bool = False
+        self._is_done: bool = False
+
+    def __repr__(self) -> str:
+        return f"ScheduledTask ({self.label or '?'}, {hex(id(self))})"
+
+    def cancel(self):
+        """
+        Cancel the task.
+        Any remaining chunks are skipped.
+        """
+        self._is_cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """
+        Check if the task has been cancelled.
+
+        Returns
+        -------
+        bool
+        """
+        return self._is_cancelled
+
+    def is_done(self) -> bool:
+        """
+        Check if the task has run to completion or has been cancelled.
+
+        Returns
+        -------
+        bool
+        """
+        return self._is_done or self._is_cancelled
+
+    def _step(self) -> bool:
+        # Returns True if the task has chunks left.
+        if not isinstance(self._chunks, Iterator):
+            self._is_done = True
+            if self._chunks is not None:
+                self._chunks()
+            return False
+
+        try:
+            next(self._chunks)
+        except StopIteration:
+            self._is_done = True
+            return False
+        except Exception:
+            self._is_done = True
+            raise
+
+        return True
+
+
+class FrameScheduler:
+    """
+    A cooperative scheduler that is driven by the main loop, which calls `run_frame` once before rendering each frame and `frame_rendered` once after rendering each frame.
+    Submitted tasks are split into chunks that are run within a per-frame time budget in the order of their priorities.
+    Tasks run on the thread of the main loop and delay the rendering of the frame, so they should be kept short (e.g., processing the plot updates deferred by `deareis.signals.flush_deferred`).
+
+    Long loops in callbacks (e.g., plotting hundreds of series or performing batch analyses) can instead use `iterate`, which yields control to the renderer only once the time budget has been used up rather than pausing for a fixed time after each step.
+
+    Parameters
+    ----------
+    budget: float, optional
+        The number of seconds per frame that can be spent on running tasks and, separately, that each loop in a callback can run before waiting for the next frame.
+    """
+
+    def __init__(self, budget: float = 0.008):
+        assert budget > 0.0, budget
+        self.budget: float = budget
+        self._lock: Lock = Lock()
+        self._frame: Condition = Condition(self._lock)
+        self._frame_count: int = 0
+        self._thread_id: Optional[int] = None
+        self._counter: Iterator[int] = count()
+        self._heap: List[Tuple[int, int, ScheduledTask]] = []
+        self._labeled_tasks: Dict[str, ScheduledTask] = {}
+
+    def __repr__(self) -> str:
+        return f"FrameScheduler ({len(self._heap)} tasks, {hex(id(self))})"
+
+    def start(self):
+        """
+        Mark the current thread as the one that runs the main loop.
+        """
+        with self._lock:
+            self._thread_id = get_ident()
+
+    def stop(self):
+        """
+        Cancel all pending tasks and stop waiting for frames (e.g., when the main loop exits).
+        """
+        with self._lock:
+            self._thread_id = None
+            for _, _, task in self._heap:
+                task.cancel()
+            self._heap.clear()
+            self._labeled_tasks.clear()
+            self._frame.notify_all()
+
+    def is_running(self) -> bool:
+        """
+        Check if the main loop is running.
+
+        Returns
+        -------
+        bool
+        """
+        return self._thread_id is not None
+
+    def _is_main_thread(self) -> bool:
+        return self._thread_id == get_ident()
+
+    def _register(self, task: ScheduledTask):
+        # A task replaces a pending task with the same label.
+        if task.label == "":
+            return
+
+        previous: Optional[ScheduledTask] = self._labeled_tasks.get(task.label)
+        if previous is not None:
+            previous.cancel()
+        self._labeled_tasks[task.label] = task
+
+    def submit(
+        self,
+        task: Union[Callable[[], None], Iterable],
+        priority: int = 0,
+        label: str = "",
+    ) -> ScheduledTask:
+        """
+        Submit a task to run on the thread of the main loop.
+
+        Parameters
+        ----------
+        task: Union[Callable[[], None], Iterable]
+            A function, which is run as a single chunk, or an iterable (e.g., a generator), where each step is a chunk.
+
+        priority: int, optional
+            Tasks with higher priorities are run first.
+            Tasks with the same priority take turns.
+
+        label: str, optional
+            If not an empty string, then any pending task with the same label is cancelled.
+
+        Returns
+        -------
+        ScheduledTask
+        """
+        handle: ScheduledTask = ScheduledTask(
+            task if callable(task) else iter(task),
+            priority,
+            label,
+        )
+        with self._lock:
+            self._register(handle)
+            heappush(self._heap, (-priority, next(self._counter), handle))
+
+        return handle
+
+    def cancel(self, label: str) -> bool:
+        """
+        Cancel the pending task with the given label, if any.
+
+        Parameters
+        ----------
+        label: str
+            The label of the task.
+
+        Returns
+        -------
+        bool
+            True if a pending task was cancelled.
+        """
+        with self._lock:
+            task: Optional[ScheduledTask] = self._labeled_tasks.pop(label, None)
+
+        if task is None or task.is_done():
+            return False
+
+        task.cancel()
+        return True
+
+    def get_num_pending(self) -> int:
+        """
+        Get the number of tasks that have chunks left.
+
+        Returns
+        -------
+        int
+        """
+        with self._lock:
+            return sum(1 for _, _, task in self._heap if not task.is_done())
+
+    def run_frame(self) -> int:
+        """
+        Run chunks of the pending tasks until the time budget has been used up.
+        This should be called once per frame by the main loop.
+
+        Returns
+        -------
+        int
+            The number of chunks that were run.
+        """
+        start: float = perf_counter()
+        num_chunks: int = 0
+        while perf_counter() - start < self.budget:
+            task: ScheduledTask
+            with self._lock:
+                while self._heap and self._heap[0][2].is_cancelled():
+                    heappop(self._heap)
+                if not self._heap:
+                    break
+                task = heappop(self._heap)[2]
+
+            has_chunks: bool = False
+            try:
+                has_chunks = task._step()
+            except Exception:
+                print(format_exc())
+
+            num_chunks += 1
+            with self._lock:
+                if has_chunks and not task.is_cancelled():
+                    heappush(self._heap, (-task.priority, next(self._counter), task))
+                elif self._labeled_tasks.get(task.label) is task:
+                    del self._labeled_tasks[task.label]
+
+        return num_chunks
+
+    def frame_rendered(self):
+        """
+        Wake up the threads that are waiting for a frame to be rendered.
+        This should be called once per frame by the main loop after the frame has been rendered.
+        """
+        with self._lock:
+            self._frame_count += 1
+            self._frame.notify_all()
+
+    def wait_for_frame(self, timeout: float = 1.0) -> bool:
+        """
+        Wait until the main loop has rendered a frame.
+        Returns immediately if called from the thread of the main loop or if the main loop is not running.
+
+        Parameters
+        ----------
+        timeout: float, optional
+            The maximum number of seconds to wait.
+
+        Returns
+        -------
+        bool
+            True if a frame was rendered.
+        """
+        if not self.is_running() or self._is_main_thread():
+            return False
+
+        with self._lock:
+            target: int = self._frame_count + 1
+            return self._frame.wait_for(
+                lambda: self._frame_count >= target or self._thread_id is None,
+                timeout,
+            ) and self._thread_id is not None
+
+    def iterate(
+        self,
+        iterable: Iterable[T],
+        priority: int = 0,
+        label: str = "",
+    ) -> Iterator[T]:
+        """
+        Iterate over the items of an iterable in the calling thread (e.g., in a callback) and wait for the next frame whenever the time budget has been used up.
+        If several loops are waiting, then the loop with the highest priority is resumed first.
+
+        Parameters
+        ----------
+        iterable: Iterable[T]
+            The items to iterate over.
+
+        priority: int, optional
+            The priority of the loop.
+
+        label: str, optional
+            If not an empty string, then any loop or pending task with the same label is cancelled.
+            A cancelled loop stops yielding items.
+
+        Returns
+        -------
+        Iterator[T]
+        """
+        token: ScheduledTask = ScheduledTask(None, priority, label)
+        with self._lock:
+            self._register(token)
+
+        resumed: Event = Event()
+        deadline: float = perf_counter() + self.budget
+        try:
+            item: T
+            for item in iterable:
+                if token.is_cancelled():
+                    return
+                elif perf_counter() >= deadline and self.is_running() and not self._is_main_thread():
+                    resumed.clear()
+                    turn: ScheduledTask = self.submit(resumed.set, priority=priority)
+                    while not resumed.wait(0.1):
+                        if not self.is_running():
+                            break
+                        elif token.is_cancelled():
+                            turn.cancel()
+                            return
+
+                    deadline = perf_counter() + self.budget
+
+                yield item
+        finally:
+            token._is_done = True
+            with self._lock:
+                if self._labeled_tasks.get(label) is token:
+                    del self._labeled_tasks[label]
+
+
+SCHEDULER: FrameScheduler = FrameScheduler()
@@ -0,0 +1,358 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from bisect import bisect_left
+from collections import deque
+from json import dumps as dump_json
+from threading import (
+    Lock,
+    local,
+)
+from time import (
+    perf_counter,
+    time,
+)
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    IO,
+    List,
+    Tuple,
+)
+
+
+# The upper limits (in milliseconds) of the bins of the histograms. The last
+# bin contains the durations that exceed the last limit.
+HISTOGRAM_LIMITS: Tuple[float, ...] = (
+    0.1,
+    0.3,
+    1.0,
+    3.0,
+    10.0,
+    30.0,
+    100.0,
+    300.0,
+    1000.0,
+    3000.0,
+)
+
+HISTOGRAM_LABELS: Tuple[str, ...] = tuple(
+    [f"<={limit:g} ms" for limit in HISTOGRAM_LIMITS]
+    + [f">{HISTOGRAM_LIMITS[-1]:g} ms"]
+)
+
+
+def get_callback_label(callback: Callable) -> str:
+    """
+    Get a human-readable label (e.g., "deareis.program.fitting.perform_fit") for a callback.
+    The line number is included for lambda functions.
+
+    Parameters
+    ----------
+    callback: Callable
+        The callback.
+
+    Returns
+    -------
+    str
+    """
+    label: str = f"{getattr(callback, '__module__', None) or ''}.{getattr(callback, '__qualname__', None) or repr(callback)}"
+    if "<lambda>" in label and hasattr(callback, "__code__"):
+        label += f" (line {callback.__code__.co_firstlineno})"
+
+    return label.lstrip(".")
+
+
+class TimingHistogram:
+    """
+    The number of calls, the total and maximum durations, and a histogram of the durations.
+    """
+
+    __slots__ = (
+        "count",
+        "total",
+        "maximum",
+        "bins",
+    )
+
+    def __init__(self):
+        self.count: int = 0
+        self.total: float = 0.0
+        self.maximum: float = 0.0
+        self.bins: List[int] = [0] * (len(HISTOGRAM_LIMITS) + 1)
+
+    def add(self, seconds: float):
+        """
+        Add a duration.
+
+        Parameters
+        ----------
+        seconds: float
+            The duration.
+        """
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+        self.bins[bisect_left(HISTOGRAM_LIMITS, seconds * 1e3)] += 1
+
+    def get_mean(self) -> float:
+        """
+        Get the mean duration in seconds.
+
+        Returns
+        -------
+        float
+        """
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.get_mean(),
+            "maximum": self.maximum,
+            "histogram": dict(zip(HISTOGRAM_LABELS, self.bins)),
+        }
+
+
+class SignalStatistics:
+    """
+    Records the wall time spent on dispatching signals (see `deareis.signals.enable_statistics`).
+    The durations are recorded per signal and per registered callback.
+    Callbacks that take longer than a threshold are logged, and the most recent trees of nested signals (i.e., signals emitted by the callbacks of other signals) are kept.
+
+    Parameters
+    ----------
+    slow_threshold: float, optional
+        The duration (in seconds) above which calls to callbacks are logged.
+
+    max_slow_calls: int, optional
+        The number of logged slow calls to keep.
+
+    max_call_trees: int, optional
+        The number of call trees to keep.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float = 0.05,
+        max_slow_calls: int = 200,
+        max_call_trees: int = 50,
+    ):
+        assert slow_threshold >= 0.0, slow_threshold
+        assert max_slow_calls > 0, max_slow_calls
+        assert max_call_trees > 0, max_call_trees
+        self.slow_threshold: float = slow_threshold
+        self._lock: Lock = Lock()
+        self._local: local = local()
+        self._signals: Dict[str, TimingHistogram] = {}
+        self._callbacks: Dict[Tuple[str, str], TimingHistogram] = {}
+        self._slow_calls: Deque[dict] = deque(maxlen=max_slow_calls)
+        self._call_trees: Deque[dict] = deque(maxlen=max_call_trees)
+
+    def __repr__(self) -> str:
+        return f"SignalStatistics ({len(self._signals)} signals, {hex(id(self))})"
+
+    def _get_stack(self) -> List[dict]:
+        # Each thread (e.g., timers) has its own stack of emits and callbacks.
+        stack: List[dict] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+
+        return stack
+
+    def begin_emit(self, signal: str):
+        """
+        Start timing an emitted signal.
+
+        Parameters
+        ----------
+        signal: str
+            The name of the signal.
+        """
+        stack: List[dict] = self._get_stack()
+        node: dict = {
+            "signal": signal,
+            "start": perf_counter(),
+            "callbacks": [],
+        }
+        if stack:
+            # Signals may also be emitted outside of callbacks (e.g., when
+            # a callback raises an exception).
+            stack[-1].setdefault("emits", []).append(node)
+        stack.append(node)
+
+    def end_emit(self):
+        """
+        Stop timing the most recently emitted signal.
+        """
+        stack: List[dict] = self._get_stack()
+        node: dict = stack.pop()
+        node["duration"] = perf_counter() - node.pop("start")
+        with self._lock:
+            histogram: TimingHistogram = self._signals.get(node["signal"]) or TimingHistogram()
+            self._signals[node["signal"]] = histogram
+            histogram.add(node["duration"])
+            if not stack:
+                self._call_trees.append(node)
+
+    def call(self, signal: str, callback: Callable, *args, **kwargs) -> Any:
+        """
+        Call and time a callback of a signal that is being emitted.
+
+        Parameters
+        ----------
+        signal: str
+            The name of the signal.
+
+        callback: Callable
+            The callback.
+
+        *args
+            The positional arguments to pass to the callback.
+
+        **kwargs
+            The keyword arguments to pass to the callback.
+
+        Returns
+        -------
+        Any
+        """
+        stack: List[dict] = self._get_stack()
+        label: str = get_callback_label(callback)
+        node: dict = {
+            "callback": label,
+            "emits": [],
+        }
+        if stack:
+            stack[-1]["callbacks"].append(node)
+        stack.append(node)
+
+        start: float = perf_counter()
+        try:
+            return callback(*args, **kwargs)
+        finally:
+            duration: float = perf_counter() - start
+            node["duration"] = duration
+            stack.pop()
+            with self._lock:
+                histogram: TimingHistogram = self._callbacks.get((signal, label)) or TimingHistogram()
+                self._callbacks[(signal, label)] = histogram
+                histogram.add(duration)
+                if duration >= self.slow_threshold:
+                    self._slow_calls.append(
+                        {
+                            "timestamp": time(),
+                            "signal": signal,
+                            "callback": label,
+                            "duration": duration,
+                            "depth": sum(1 for _ in stack if "signal" in _),
+                        }
+                    )
+
+    def reset(self):
+        """
+        Discard all recorded data.
+        """
+        with self._lock:
+            self._signals.clear()
+            self._callbacks.clear()
+            self._slow_calls.clear()
+            self._call_trees.clear()
+
+    def get_signals(self) -> Dict[str, TimingHistogram]:
+        """
+        Get the durations per signal.
+
+        Returns
+        -------
+        Dict[str, TimingHistogram]
+        """
+        with self._lock:
+            return dict(self._signals)
+
+    def get_callbacks(self) -> Dict[Tuple[str, str], TimingHistogram]:
+        """
+        Get the durations per (signal, callback) pair.
+
+        Returns
+        -------
+        Dict[Tuple[str, str], TimingHistogram]
+        """
+        with self._lock:
+            return dict(self._callbacks)
+
+    def get_slow_calls(self) -> List[dict]:
+        """
+        Get the logged calls that exceeded the threshold.
+
+        Returns
+        -------
+        List[dict]
+        """
+        with self._lock:
+            return list(self._slow_calls)
+
+    def get_call_trees(self) -> List[dict]:
+        """
+        Get the most recent trees of nested signals.
+        Each node of a signal contains the name of the signal, the duration, and the callbacks, and each node of a callback contains the label of the callback, the duration, and the signals that it emitted.
+
+        Returns
+        -------
+        List[dict]
+        """
+        with self._lock:
+            return list(self._call_trees)
+
+    def to_dict(self) -> dict:
+        return {
+            "slow_threshold": self.slow_threshold,
+            "signals": {
+                signal: histogram.to_dict()
+                for signal, histogram in self.get_signals().items()
+            },
+            "callbacks": [
+                {
+                    "signal": signal,
+                    "callback": label,
+                    **histogram.to_dict(),
+                }
+                for (signal, label), histogram in self.get_callbacks().items()
+            ],
+            "slow_calls": self.get_slow_calls(),
+            "call_trees": self.get_call_trees(),
+        }
+
+    def save(self, path: str):
+        """
+        Export the recorded data as JSON.
+
+        Parameters
+        ----------
+        path: str
+            The path of the file to write to.
+        """
+        fp: IO
+        with open(path, "w") as fp:
+            fp.write(dump_json(self.to_dict(), indent=2))
@@ -17,6 +17,11 @@
 # The licenses of DearEIS' dependencies and/or sources of portions of code are included in
 # the LICENSES folder.
 
+from contextlib import contextmanager
+from threading import (
+    Lock,
+    local,
+)
 from traceback import format_exc
 from enum import (
     IntEnum,
@@ -26,10 +31,14 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
+    Set,
     Tuple,
 )
+from deareis.profiling import ActionProfiler
+from deareis.signal_statistics import SignalStatistics
 
 
 DEBUG: bool = False
@@ -57,6 +66,7 @@ class Signal(IntEnum):
     DELETE_FIT_RESULT = auto()
     DELETE_PLOT_SETTINGS = auto()
     DELETE_SIMULATION_RESULT = auto()
+    DELETE_SIMULATION_SWEEP = auto()
     DELETE_TEST_RESULT = auto()
     DELETE_ZHIT_RESULT = auto()
     DUPLICATE_PLOT_SETTINGS = auto()
@@ -75,6 +85,7 @@ class Signal(IntEnum):
     PERFORM_DRT = auto()
     PERFORM_FIT = auto()
     PERFORM_SIMULATION = auto()
+    PERFORM_SIMULATION_SWEEP = auto()
     PERFORM_TEST = auto()
     PERFORM_ZHIT = auto()
     PREVIEW_ZHIT_WEIGHTS = auto()
@@ -123,8 +134,10 @@ class Signal(IntEnum):
     SHOW_SETTINGS_DEFAULTS = auto()
     SHOW_SETTINGS_KEYBINDINGS = auto()
     SHOW_SETTINGS_USER_DEFINED_ELEMENTS = auto()
+    SHOW_SIGNAL_STATISTICS = auto()
     TOGGLE_DATA_POINT = auto()
     TOGGLE_PLOT_SERIES = auto()
+    TOGGLE_PROFILING = auto()
     UNBLOCK_KEYBINDINGS = auto()
     UNDO_PROJECT_ACTION = auto()
     VIEWPORT_RESIZED = auto()
@@ -133,11 +146,236 @@ class Signal(IntEnum):
 _UUID_COUNTER: int = 0
 _REGISTERED_CALLBACKS: Dict[Signal, List[Tuple[Callable, int]]] = {}
 _QUEUE: Optional[Dict[Signal, List[Tuple[tuple, dict]]]] = {}
+_STATISTICS: Optional[SignalStatistics] = None
+_PROFILER: Optional[ActionProfiler] = None
+
+
+def _merge_snapshot_kwargs(old: dict, new: dict) -> dict:
+    return {**new, "dirty": old.get("dirty", True) or new.get("dirty", True)}
+
+
+def _merge_plot_kwargs(old: dict, new: dict) -> dict:
+    # The plot is fully repopulated and the limits are adjusted if any of the
+    # merged emissions asked for it.
+    return {
+        **new,
+        "adjust_limits": old.get("adjust_limits", True) or new.get("adjust_limits", True),
+        "plot_only": old.get("plot_only", False) and new.get("plot_only", False),
+    }
+
+
+# The signals that only need to be processed once when emitted several times
+# in quick succession. Each signal maps to a function that merges the keyword
+# arguments of an earlier emission with those of a later emission (the later
+# arguments are used as is if there is no function).
+COALESCIBLE_SIGNALS: Dict[Signal, Optional[Callable[[dict, dict], dict]]] = {
+    Signal.CREATE_PROJECT_SNAPSHOT: _merge_snapshot_kwargs,
+    Signal.SELECT_PLOT_SETTINGS: _merge_plot_kwargs,
+}
+# The coalescible signals that are also deferred until the next frame in the
+# deferred dispatch mode. Project snapshots are excluded since merging them or
+# processing them out of order would change the undo history, so they are only
+# coalesced within explicit `deferred` blocks.
+FRAME_COALESCIBLE_SIGNALS: Set[Signal] = {
+    Signal.SELECT_PLOT_SETTINGS,
+}
+# The signals deferred until the next frame in the deferred dispatch mode are
+# shared by all threads, whereas each thread has its own `deferred` blocks.
+_DEFERRED_LOCK: Lock = Lock()
+_DEFERRED: Dict[Signal, Tuple[tuple, dict]] = {}
+_DEFERRED_SCHEDULER: Optional[Callable[[Callable], Any]] = None
+_IS_FLUSH_SCHEDULED: bool = False
+
+
+class _DeferredBlocks(local):
+    def __init__(self):
+        self.depth: int = 0
+        self.signals: Dict[Signal, Tuple[tuple, dict]] = {}
+
+
+_BLOCKS: _DeferredBlocks = _DeferredBlocks()
+
+
+def _defer(
+    queue: Dict[Signal, Tuple[tuple, dict]],
+    signal: Signal,
+    args: tuple,
+    kwargs: dict,
+):
+    # The signal is moved to the end so that the deferred signals are
+    # processed in the order of their most recent emissions.
+    merge: Optional[Callable[[dict, dict], dict]] = COALESCIBLE_SIGNALS[signal]
+    if signal in queue:
+        if merge is not None:
+            kwargs = merge(queue[signal][1], kwargs)
+        del queue[signal]
+
+    queue[signal] = (args, kwargs)
+
+
+def flush_deferred():
+    """
+    Process the signals that have been deferred until the next frame.
+    """
+    global _IS_FLUSH_SCHEDULED
+    while True:
+        with _DEFERRED_LOCK:
+            if not _DEFERRED:
+                _IS_FLUSH_SCHEDULED = False
+                return
+
+            signal: Signal = next(iter(_DEFERRED))
+            args, kwargs = _DEFERRED.pop(signal)
+
+        _emit(signal, args, kwargs)
+
+
+@contextmanager
+def deferred() -> Iterator[None]:
+    """
+    Defer the processing of coalescible signals (see `COALESCIBLE_SIGNALS`) that are emitted within the context by the current thread.
+    Each deferred signal is processed once with the most recent arguments when the outermost context is exited.
+    """
+    _BLOCKS.depth += 1
+    try:
+        yield
+    finally:
+        _BLOCKS.depth -= 1
+        while _BLOCKS.depth == 0 and _BLOCKS.signals:
+            signal: Signal = next(iter(_BLOCKS.signals))
+            args, kwargs = _BLOCKS.signals.pop(signal)
+            _emit(signal, args, kwargs)
+
+
+def set_deferred_dispatch(scheduler: Optional[Callable[[Callable], Any]]):
+    """
+    Enable or disable the deferred dispatch mode.
+    In this mode, the signals in `FRAME_COALESCIBLE_SIGNALS` are always deferred and the scheduler is asked to call `flush_deferred` at a later time (e.g., when the next frame is rendered).
+    Other coalescible signals (e.g., project snapshots) are only deferred within `deferred` blocks.
+
+    Parameters
+    ----------
+    scheduler: Optional[Callable[[Callable], Any]]
+        The function that schedules calls of the function that it is given (e.g., `deareis.scheduler.SCHEDULER.submit`).
+        The function is called again only once the previous call of `flush_deferred` has processed all deferred signals.
+        The mode is disabled if the value is None, in which case any deferred signals are processed immediately.
+    """
+    global _DEFERRED_SCHEDULER
+    _DEFERRED_SCHEDULER = scheduler
+    if scheduler is None:
+        flush_deferred()
+
+
+def enable_statistics(slow_threshold: float = 0.05) -> SignalStatistics:
+    """
+    Start recording the wall time spent on dispatching signals.
+    The existing statistics, if any, are kept.
+
+    Parameters
+    ----------
+    slow_threshold: float, optional
+        The duration (in seconds) above which calls to callbacks are logged.
+
+    Returns
+    -------
+    SignalStatistics
+    """
+    global _STATISTICS
+    if _STATISTICS is None:
+        _STATISTICS = SignalStatistics(slow_threshold=slow_threshold)
+    else:
+        _STATISTICS.slow_threshold = slow_threshold
+
+    return _STATISTICS
+
+
+def disable_statistics():
+    """
+    Stop recording the wall time spent on dispatching signals.
+    """
+    global _STATISTICS
+    _STATISTICS = None
+
+
+def get_statistics() -> Optional[SignalStatistics]:
+    """
+    Get the statistics that are being recorded, if any.
+
+    Returns
+    -------
+    Optional[SignalStatistics]
+    """
+    return _STATISTICS
+
+
+def enable_profiling(
+    directory: str,
+    memory: bool = False,
+    min_duration: float = 0.1,
+) -> ActionProfiler:
+    """
+    Start profiling user actions, i.e., signals that are emitted outside of the callbacks of other signals.
+    Any existing profiler is closed.
+
+    Parameters
+    ----------
+    directory: str
+        The directory where the profiles and memory reports are saved.
+
+    memory: bool, optional
+        Whether or not to also trace memory allocations.
+
+    min_duration: float, optional
+        The duration (in seconds) that an action needs to exceed for its profile to be saved.
+
+    Returns
+    -------
+    ActionProfiler
+    """
+    global _PROFILER
+    disable_profiling()
+    _PROFILER = ActionProfiler(
+        directory=directory,
+        memory=memory,
+        min_duration=min_duration,
+    )
+
+    return _PROFILER
+
+
+def disable_profiling() -> Optional[ActionProfiler]:
+    """
+    Stop profiling user actions and save a summary of the slowest actions.
+
+    Returns
+    -------
+    Optional[ActionProfiler]
+        The profiler that was closed, if any.
+    """
+    global _PROFILER
+    profiler: Optional[ActionProfiler] = _PROFILER
+    _PROFILER = None
+    if profiler is not None:
+        profiler.close()
+
+    return profiler
+
+
+def get_profiler() -> Optional[ActionProfiler]:
+    """
+    Get the profiler of user actions, if any.
+
+    Returns
+    -------
+    Optional[ActionProfiler]
+    """
+    return _PROFILER
 
 
 def emit(signal: Signal, *args, **kwargs):
     global _REGISTERED_CALLBACKS
     global _QUEUE
+    global _IS_FLUSH_SCHEDULED
     
     assert type(signal) is Signal, signal
     
@@ -153,7 +391,46 @@ def emit(signal: Signal, *args, **kwargs):
         return
     
     assert signal in _REGISTERED_CALLBACKS, signal
-    
+
+    if signal in COALESCIBLE_SIGNALS:
+        scheduler: Optional[Callable[[Callable], Any]] = _DEFERRED_SCHEDULER
+        if _BLOCKS.depth > 0:
+            _defer(_BLOCKS.signals, signal, args, kwargs)
+            return
+        elif scheduler is not None and signal in FRAME_COALESCIBLE_SIGNALS:
+            with _DEFERRED_LOCK:
+                _defer(_DEFERRED, signal, args, kwargs)
+                is_flush_scheduled: bool = _IS_FLUSH_SCHEDULED
+                _IS_FLUSH_SCHEDULED = True
+            if not is_flush_scheduled:
+                scheduler(flush_deferred)
+            return
+
+    _emit(signal, args, kwargs)
+
+
+def _emit(signal: Signal, args: tuple, kwargs: dict):
+    profiler: Optional[ActionProfiler] = _PROFILER
+    if (
+        profiler is None
+        # Toggling the profiling closes the profiler.
+        or signal is Signal.TOGGLE_PROFILING
+        or not profiler.begin_action(signal.name)
+    ):
+        _dispatch(signal, args, kwargs)
+        return
+
+    try:
+        _dispatch(signal, args, kwargs)
+    finally:
+        profiler.end_action()
+
+
+def _dispatch(signal: Signal, args: tuple, kwargs: dict):
+    statistics: Optional[SignalStatistics] = _STATISTICS
+    if statistics is not None:
+        statistics.begin_emit(signal.name)
+
     try:
         if DEBUG:
             print(f"\nsignals.emit: {str(signal)}")
@@ -183,12 +460,18 @@ def emit(signal: Signal, *args, **kwargs):
             if DEBUG:
                 print(f" - {uuid}: {repr(func)}")
             
-            func(*args, **kwargs)
+            if statistics is None:
+                func(*args, **kwargs)
+            else:
+                statistics.call(signal.name, func, *args, **kwargs)
     except Exception:
         if signal == Signal.SHOW_ERROR_MESSAGE:
             print(format_exc())
         else:
             emit(Signal.SHOW_ERROR_MESSAGE, format_exc())
+    finally:
+        if statistics is not None:
+            statistics.end_emit()
 
 
 def register(signal: Signal, callback: Callable) -> int:
@@ -17,6 +17,7 @@
 # The licenses of DearEIS' dependencies and/or sources of portions of code are included in
 # the LICENSES folder.
 
+from contextlib import nullcontext
 from json import dumps as dump_json
 from os import (
     getcwd,
@@ -30,6 +31,7 @@ from os.path import (
 )
 from typing import (
     Any,
+    ContextManager,
     Dict,
     IO,
     List,
@@ -42,6 +44,8 @@ from xdg import (
 import dearpygui.dearpygui as dpg
 from deareis.version import PACKAGE_VERSION
 from deareis.config import Config
+from deareis.expressions import ExpressionCache
+from deareis.tuning import WorkerCountTuner
 from deareis.data import (
     PlotSettings,
     Project,
@@ -78,6 +82,12 @@ class State:
             self.state_directory_path, "recent_projects"
         )
         self.recent_projects: List[str] = []
+        self.expression_cache: ExpressionCache = ExpressionCache(
+            join(self.state_directory_path, "sympy_expressions.json")
+        )
+        self.worker_count_tuner: WorkerCountTuner = WorkerCountTuner(
+            join(self.state_directory_path, "worker_counts.json")
+        )
         self.config: Config = Config()
         self.config.load()
         self.program_window: ProgramWindow = ProgramWindow()
@@ -407,6 +417,18 @@ class State:
     def is_busy_message_visible(self) -> bool:
         return self.program_window.busy_message.is_visible()
 
+    def measure_num_procs(self, analysis: str, num_points: int) -> ContextManager[int]:
+        # Provides the number of processes to use for an analysis. The number
+        # is picked based on the measured throughput if auto-tuning is enabled.
+        if not self.config.auto_tune_num_procs:
+            return nullcontext(self.config.num_procs or -1)
+
+        return self.worker_count_tuner.measure(
+            analysis,
+            num_points,
+            self.config.num_procs or -1,
+        )
+
     def check_version(self):
         recent_version_path: str = join(self.state_directory_path, "recent_version")
 
@@ -77,6 +77,29 @@ Setting this interval to zero disables automatic backups.
     """.strip(),
         "num_procs": """
 The number of parallel processes to use when performing, e.g., circuit fitting. A value greater than 0 results in that specific number of processes being used. A value of 0 results in N-1 processes (minimum of 1) being used where N = {} at the moment. The value of N is based on the detected linear algebra libraries that are used by NumPy and by the values of some environment variables used by those libraries.
+    """.strip(),
+        "auto_tune_num_procs": """
+Pick the number of parallel processes to use for each analysis based on the type of analysis, the number of data points, and the throughput that has been measured previously on this computer. The number of processes specified above is used as the upper limit. Different numbers of processes are tried the first few times that a type of analysis is performed on data sets of a similar size, after which the fastest option is used.
+
+The measurements are stored in the state directory.
+    """.strip(),
+        "drt_parallel_sampling": """
+Calculate the credible intervals of the TR-RBF method using multiple chains of samples that are distributed across the parallel processes, and perform the attempts of the BHT method using deterministic initial values. Each chain discards at least 100 samples as burn-in, which means that more samples are discarded in total when many chains are used.
+    """.strip(),
+        "line_cache_size": """
+The amount of memory to use for caching the interpolated lines (e.g., the impedance spectra of fitted circuits) that are shown in plots and exported. The least recently used lines are discarded when this limit is exceeded.
+
+Setting this size to zero disables the cache.
+    """.strip(),
+        "drt_matrix_cache_size": """
+The amount of memory to use for caching the matrices that are assembled when calculating the distribution of relaxation times using the TR-RBF or TR-NNLS method. The matrices can be reused when, e.g., the same settings are applied to several data sets with the same frequencies. The least recently used matrices are discarded when this limit is exceeded.
+
+Setting this size to zero disables the cache.
+    """.strip(),
+        "max_tasks_per_worker": """
+The number of tasks that a process in the pool of worker processes completes before it is replaced by a new process. The worker processes are kept alive between analyses in order to avoid the overhead of starting new processes every time, and replacing them periodically limits the amount of memory that they can accumulate.
+
+Setting this value to zero means that the worker processes are never replaced.
     """.strip(),
         "plot_admittance": """
 Plot the admittance representation of the immittance data.
@@ -51,6 +51,21 @@ Remove the current simulation result.
     """.strip(),
         "load_as_data_set": """
 Load the current simulation as a data set.
+    """.strip(),
+        "sweep": """
+Simulate multiple spectra by varying the value of one of the parameters in the circuit. The spectra are stored together as a single result.
+    """.strip(),
+        "sweep_parameter": """
+The parameter to vary.
+    """.strip(),
+        "sweep_range": """
+The first and the last value of the parameter, and the number of values to simulate.
+    """.strip(),
+        "sweep_logarithmic": """
+Distribute the values logarithmically instead of linearly.
+    """.strip(),
+        "remove_sweep": """
+Remove the current sweep result.
     """.strip(),
     },
 )
@@ -0,0 +1,302 @@
+# DearEIS is licensed under the GPLv3 or later (https://www.gnu.org/licenses/gpl-3.0.html).
+# Copyright 2025 DearEIS developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# The licenses of DearEIS' dependencies and/or sources of portions of code are included in
+# the LICENSES folder.
+
+from contextlib import contextmanager
+from json import (
+    dumps as dump_json,
+    loads as load_json,
+)
+from os.path import exists
+from time import perf_counter
+from traceback import format_exc
+from typing import (
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Optional,
+)
+from pyimpspec import get_default_num_procs
+
+
+VERSION: int = 1
+
+# The number of selections between attempts to use a worker count that is
+# adjacent to the best one in order to adapt to, e.g., changes in load.
+EXPLORATION_INTERVAL: int = 16
+
+
+def _get_bucket(num_points: int) -> str:
+    # Data sets are grouped by powers of two of the number of points.
+    return str(max(num_points, 1).bit_length() - 1)
+
+
+def _get_candidates(max_num_procs: int) -> List[int]:
+    candidates: List[int] = []
+    num_procs: int = 1
+    while num_procs < max_num_procs:
+        candidates.append(num_procs)
+        num_procs *= 2
+    candidates.append(max_num_procs)
+
+    return candidates
+
+
+class WorkerCountTuner:
+    """
+    Picks the number of parallel processes to use for an analysis based on the throughput (data points per second) that has been measured on the local machine for the same type of analysis and a similar number of data points.
+    The candidate worker counts (powers of two up to the maximum) are tried in descending order the first few times that a type of analysis is performed on data sets of a given size, after which the worker count with the highest throughput is used.
+    The first measurement of each worker count is discarded since it may include, e.g., the start-up of worker processes.
+    The subsequent measurements are kept as exponential moving averages and can be persisted to a file (e.g., in the state directory) as a small performance profile.
+
+    Parameters
+    ----------
+    path: str, optional
+        The path to the file where the profile is persisted.
+        If the path is an empty string, then the profile is only kept in memory.
+
+    smoothing: float, optional
+        The weight (0.0 to 1.0) of a new measurement in the moving averages.
+    """
+
+    def __init__(self, path: str = "", smoothing: float = 0.3):
+        assert isinstance(path, str), path
+        assert 0.0 < smoothing <= 1.0, smoothing
+        self._path: str = path
+        self._smoothing: float = smoothing
+        # Analysis -> bucket -> worker count -> (throughput, count). The count
+        # is zero if only the discarded first measurement has been recorded.
+        self._profiles: Dict[str, Dict[str, Dict[str, List[float]]]] = {}
+        self._is_dirty: bool = False
+        self.load()
+
+    def __repr__(self) -> str:
+        return f"WorkerCountTuner ({len(self._profiles)} analyses, {hex(id(self))})"
+
+    def load(self):
+        """
+        Load the persisted profile, if any.
+        Files that cannot be parsed are ignored.
+        """
+        if self._path == "" or not exists(self._path):
+            return
+
+        try:
+            fp: IO
+            with open(self._path, "r") as fp:
+                dictionary: dict = load_json(fp.read())
+            if dictionary.get("version") != VERSION:
+                return
+            profiles: Dict[str, Dict[str, Dict[str, List[float]]]]
+            profiles = dictionary["profiles"]
+            assert isinstance(profiles, dict), profiles
+        except Exception:
+            print(format_exc())
+            return
+
+        self._profiles = profiles
+
+    def save(self):
+        """
+        Persist the profile if any new measurements have been recorded.
+        """
+        if self._path == "" or not self._is_dirty:
+            return
+
+        fp: IO
+        with open(self._path, "w") as fp:
+            fp.write(
+                dump_json(
+                    {
+                        "version": VERSION,
+                        "profiles": self._profiles,
+                    }
+                )
+            )
+
+        self._is_dirty = False
+
+    def clear(self):
+        """
+        Discard all measurements.
+        """
+        self._profiles.clear()
+        self._is_dirty = True
+
+    def get_throughput(
+        self,
+        analysis: str,
+        num_points: int,
+        num_procs: int,
+    ) -> Optional[float]:
+        """
+        Get the measured throughput, if any.
+
+        Parameters
+        ----------
+        analysis: str
+            The type of analysis (e.g., "fitting").
+
+        num_points: int
+            The number of data points.
+
+        num_procs: int
+            The number of parallel processes.
+
+        Returns
+        -------
+        Optional[float]
+            The moving average of the number of data points processed per second.
+        """
+        measurement: Optional[List[float]] = (
+            self._profiles.get(analysis, {})
+            .get(_get_bucket(num_points), {})
+            .get(str(num_procs))
+        )
+        if measurement is None or measurement[1] < 1:
+            return None
+
+        return measurement[0]
+
+    def select(
+        self,
+        analysis: str,
+        num_points: int,
+        max_num_procs: int = -1,
+    ) -> int:
+        """
+        Pick the number of parallel processes to use.
+
+        Parameters
+        ----------
+        analysis: str
+            The type of analysis (e.g., "fitting").
+
+        num_points: int
+            The number of data points.
+
+        max_num_procs: int, optional
+            The maximum number of parallel processes.
+            If the value is less than one, then the value is subtracted from the value returned by `get_default_num_procs` (minimum of one process).
+
+        Returns
+        -------
+        int
+        """
+        assert isinstance(analysis, str), analysis
+        if max_num_procs < 1:
+            max_num_procs = max((get_default_num_procs() - abs(max_num_procs), 1))
+
+        candidates: List[int] = _get_candidates(max_num_procs)
+        measurements: Dict[str, List[float]] = self._profiles.get(
+            analysis, {}
+        ).get(_get_bucket(num_points), {})
+
+        num_procs: int
+        for num_procs in reversed(candidates):
+            if measurements.get(str(num_procs), [0.0, 0])[1] < 1:
+                return num_procs
+
+        i: int = max(
+            range(len(candidates)),
+            key=lambda _: measurements[str(candidates[_])][0],
+        )
+        total: int = int(sum(_[1] for _ in measurements.values()))
+        if len(candidates) > 1 and total % EXPLORATION_INTERVAL == 0:
+            neighbors: List[int] = [
+                candidates[j] for j in (i - 1, i + 1) if 0 <= j < len(candidates)
+            ]
+            return min(neighbors, key=lambda _: measurements[str(_)][1])
+
+        return candidates[i]
+
+    def record(
+        self,
+        analysis: str,
+        num_points: int,
+        num_procs: int,
+        seconds: float,
+    ):
+        """
+        Record the time that it took to perform an analysis.
+
+        Parameters
+        ----------
+        analysis: str
+            The type of analysis (e.g., "fitting").
+
+        num_points: int
+            The number of data points.
+
+        num_procs: int
+            The number of parallel processes that were used.
+
+        seconds: float
+            The duration of the analysis.
+        """
+        assert isinstance(analysis, str), analysis
+        assert num_procs > 0, num_procs
+        if seconds <= 0.0:
+            return
+
+        throughput: float = max(num_points, 1) / seconds
+        measurements: Dict[str, List[float]] = self._profiles.setdefault(
+            analysis, {}
+        ).setdefault(_get_bucket(num_points), {})
+
+        measurement: Optional[List[float]] = measurements.get(str(num_procs))
+        if measurement is None:
+            measurements[str(num_procs)] = [throughput, 0]
+        elif measurement[1] < 1:
+            measurements[str(num_procs)] = [throughput, 1]
+        else:
+            measurement[0] += self._smoothing * (throughput - measurement[0])
+            measurement[1] += 1
+
+        self._is_dirty = True
+
+    @contextmanager
+    def measure(
+        self,
+        analysis: str,
+        num_points: int,
+        max_num_procs: int = -1,
+    ) -> Iterator[int]:
+        """
+        Pick the number of parallel processes to use and record the throughput if the block completes without raising an exception.
+
+        Parameters
+        ----------
+        analysis: str
+            The type of analysis (e.g., "fitting").
+
+        num_points: int
+            The number of data points.
+
+        max_num_procs: int, optional
+            The maximum number of parallel processes.
+
+        Returns
+        -------
+        Iterator[int]
+        """
+        num_procs: int = self.select(analysis, num_points, max_num_procs)
+        start: float = perf_counter()
+        yield num_procs
+        self.record(analysis, num_points, num_procs, perf_counter() - start)
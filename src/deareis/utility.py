@@ -60,7 +60,6 @@ from pyimpspec import (
     InvalidParameterKey,
     ParsingError,
     TokenizingError,
-    parse_cdc as _parse_cdc,
 )
 from deareis.typing.helpers import Tag
 
@@ -413,8 +412,11 @@ def find_parent_containers(circuit: Circuit) -> Dict[Element, Container]:
 
 
 def process_cdc(cdc: str) -> Tuple[Optional[Circuit], str]:
+    # Imported here to avoid a circular import via deareis.data.
+    from deareis.data.cache import CIRCUIT_CACHE
+
     try:
-        circuit: Circuit = _parse_cdc(cdc)
+        circuit: Circuit = CIRCUIT_CACHE.parse(cdc)
     except (TokenizingError, ParsingError, InvalidParameterKey) as err:
         return (None, str(err))
 
@@ -17,31 +17,74 @@
 # The licenses of DearEIS' dependencies and/or sources of portions of code are included in
 # the LICENSES folder.
 
+from copy import deepcopy
+from dataclasses import replace
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from os import getpid
 from pathlib import Path
+from threading import Thread
 from os.path import (
     dirname,
+    exists,
     join,
 )
 from typing import (
+    Callable,
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
 )
-from unittest import TestCase
+from time import (
+    sleep,
+    time,
+)
+from unittest import (
+    TestCase,
+    skipUnless,
+)
 from pandas import DataFrame
 from numpy import (
     allclose,
     angle,
+    array,
+    array_equal,
     isclose,
     isnan,
+    nan,
     ndarray,
 )
+from numpy.random import default_rng
 import matplotlib
 import pyimpspec
 import deareis
+from deareis.api.shared_arrays import (
+    SharedArrays,
+    attach_shared_arrays,
+)
 from deareis.config import Config
+from deareis.data.cache import (
+    CIRCUIT_CACHE,
+    CacheStatistics,
+    CircuitCache,
+    DRT_MATRIX_CACHE,
+    LINE_CACHE,
+    LineCache,
+    MatrixCache,
+)
+from deareis.data.lazy import (
+    calculate_pending_impedances,
+    is_pending,
+)
+from deareis.gui.settings.user_defined_elements import (
+    load_elements,
+    unload_elements,
+)
+import deareis.api.drt as drt_module
+import deareis.api.pool as pool_module
 
 matplotlib.use("Agg")
 
@@ -178,6 +221,69 @@ class TestCDC(TestCase):
                 parallel += deareis.Capacitor(C=1.68e-11).set_label("dl")
         self.assertEqual(builder.to_string(), self.circuit.to_string())
 
+    def test_compile_circuit(self):
+        compiled: deareis.CompiledCircuit = deareis.compile_circuit(self.circuit)
+        self.assertEqual(
+            compiled.get_parameter_labels(),
+            [("R_sol", "R"), ("R_ct", "R"), ("W_1", "Y"), ("W_1", "n"), ("C_dl", "C")],
+        )
+        self.assertEqual(list(compiled.get_fixed()), [False, False, False, True, False])
+        f: ndarray = pyimpspec.generate_mock_data("CIRCUIT_1")[0].get_frequencies()
+        values: ndarray = compiled.get_values()
+        self.assertTrue(
+            allclose(
+                compiled.get_impedances(f, values),
+                self.circuit.get_impedances(f),
+            )
+        )
+        batch: ndarray = array([values, values * 2])
+        Z: ndarray = compiled.get_impedances(f, batch)
+        self.assertEqual(Z.shape, (2, len(f)))
+        circuit: deareis.Circuit = deareis.parse_cdc(
+            "R{R=106.4}([R{R=650.324}W{Y=2E-3,n=1.0}]C{C=3.36E-11})"
+        )
+        self.assertTrue(allclose(Z[1], circuit.get_impedances(f)))
+
+    def test_circuit_cache(self):
+        cache: CircuitCache = CircuitCache(max_circuits=2)
+        cdc: str = self.circuit.serialize()
+        first: deareis.Circuit = cache.parse(cdc)
+        second: deareis.Circuit = cache.parse(cdc)
+        self.assertEqual(first.serialize(), self.circuit.serialize())
+        self.assertEqual(second.serialize(), self.circuit.serialize())
+        statistics: CacheStatistics = cache.get_statistics()
+        self.assertEqual((statistics.hits, statistics.misses), (1, 1))
+        # The circuits that are handed out must not share state with the cache
+        self.assertIsNot(first, second)
+        element: deareis.Element = first.get_elements()[0]
+        element.set_values(R=1.0)
+        self.assertEqual(cache.parse(cdc).serialize(), self.circuit.serialize())
+        # Invalid codes are not cached
+        with self.assertRaises(deareis.ParsingError):
+            cache.parse("R(")
+        cache.parse("R")
+        cache.parse("C")
+        statistics = cache.get_statistics()
+        self.assertEqual(statistics.num_items, 2)
+        self.assertEqual(statistics.evictions, 1)
+        self.assertIsInstance(CIRCUIT_CACHE.parse("RC"), deareis.Circuit)
+
+    def test_circuit_cache_user_defined_elements(self):
+        cdc: str = "RUserdefined"
+        load_elements(join(dirname(__file__), "user_defined_elements.py"))
+        try:
+            Class: Type[deareis.Element] = type(CIRCUIT_CACHE.parse(cdc).get_elements()[-1])
+            unload_elements()
+            load_elements(join(dirname(__file__), "user_defined_elements.py"))
+            # Circuits parsed before reloading the elements are not reused
+            element: deareis.Element = CIRCUIT_CACHE.parse(cdc).get_elements()[-1]
+            self.assertIsNot(type(element), Class)
+            self.assertIs(type(element), deareis.get_elements()["Userdefined"])
+        finally:
+            unload_elements()
+        with self.assertRaises(deareis.ParsingError):
+            CIRCUIT_CACHE.parse(cdc)
+
 
 class TestConfig(TestCase):
     @classmethod
@@ -196,6 +302,175 @@ class TestConfig(TestCase):
             self.assertTrue(config.load(str(path)), msg=path.name)
 
 
+def _get_worker_interval(seconds: float) -> Tuple[int, float, float]:
+    start: float = time()
+    sleep(seconds)
+
+    return (getpid(), start, time())
+
+
+def _get_max_num_concurrent(intervals: List[Tuple[int, float, float]]) -> int:
+    # The largest number of distinct workers that were busy at the same time.
+    return max(
+        len({pid for pid, start, end in intervals if start <= t < end})
+        for _, t, _ in intervals
+    )
+
+
+def _sleep_task(args: Tuple[int, float]) -> Tuple[int, float]:
+    sleep(args[1])
+
+    return args
+
+
+class TestWorkerPool(TestCase):
+    def test_reuse(self):
+        pool_module.configure_worker_pool(num_procs=2, max_tasks_per_worker=0)
+        try:
+            context = pool_module.get_shared_context(method="spawn")
+            with context.Pool(2) as pool:
+                self.assertEqual(list(pool.imap(abs, [-1, -2, -3])), [1, 2, 3])
+                self.assertEqual(pool.map(abs, [-4, -5]), [4, 5])
+            workers = pool_module._POOL
+            self.assertIsNotNone(workers)
+            with context.Pool(2) as pool:
+                self.assertEqual(sorted(pool.imap_unordered(abs, [-1, -2])), [1, 2])
+            self.assertIs(pool_module._POOL, workers)
+            # Leaving tasks unfinished discards the workers
+            with context.Pool(2) as pool:
+                for _ in pool.imap(abs, range(8)):
+                    break
+            self.assertIsNone(pool_module._POOL)
+            # Exceptions do not discard the workers if no tasks are running
+            with self.assertRaises(KeyError):
+                with context.Pool(2) as pool:
+                    self.assertEqual(pool.map(abs, [-1, -2]), [1, 2])
+                    raise KeyError
+            workers = pool_module._POOL
+            self.assertIsNotNone(workers)
+            with context.Pool(2) as pool:
+                self.assertEqual(pool.map(abs, [-3]), [3])
+            self.assertIs(pool_module._POOL, workers)
+            with self.assertRaises(ValueError):
+                pool_module.configure_worker_pool(max_tasks_per_worker=-1)
+        finally:
+            pool_module.configure_worker_pool()
+
+    def test_concurrency(self):
+        pool_module.configure_worker_pool(num_procs=2, max_tasks_per_worker=0)
+        try:
+            context = pool_module.get_shared_context(method="spawn")
+            results: List[List[int]] = []
+
+            def analyze():
+                with context.Pool(2) as pool:
+                    results.append(pool.map(abs, [-1, -2]))
+
+            with context.Pool(2) as first:
+                workers = pool_module._POOL
+                # Other analyses can use the pool at the same time
+                thread: Thread = Thread(target=analyze)
+                thread.start()
+                thread.join(timeout=30.0)
+                self.assertFalse(thread.is_alive())
+                self.assertEqual(results, [[1, 2]])
+                self.assertIs(pool_module._POOL, workers)
+                # A larger pool replaces the pool that is in use, but the
+                # workers of the latter are only terminated once unused
+                with context.Pool(3) as third:
+                    self.assertIsNot(third.pool, workers)
+                    self.assertEqual(third.map(abs, [-3, -4, -5]), [3, 4, 5])
+                self.assertEqual(first.map(abs, [-6]), [6])
+            self.assertNotIn(workers, pool_module._NUM_USERS)
+            self.assertIsNot(pool_module._POOL, workers)
+            self.assertIsNotNone(pool_module._POOL)
+        finally:
+            pool_module.configure_worker_pool()
+
+    def test_num_workers(self):
+        pool_module.configure_worker_pool(num_procs=4, max_tasks_per_worker=0)
+        try:
+            context = pool_module.get_shared_context(method="spawn")
+            with context.Pool(4) as pool:
+                self.assertEqual(len(pool.map(_get_worker_interval, [0.0] * 4)), 4)
+            pids: Set[int] = set(_.pid for _ in pool_module._POOL._pool)
+            self.assertEqual(len(pids), 4)
+            # Smaller requests share the pool but do not use more workers at
+            # a time than requested
+            num_procs: int
+            for num_procs in (1, 2):
+                with context.Pool(num_procs) as pool:
+                    intervals: List[Tuple[int, float, float]] = list(
+                        pool.imap_unordered(_get_worker_interval, [0.1] * 8)
+                    )
+                    self.assertEqual(len(intervals), 8)
+                    self.assertLessEqual(_get_max_num_concurrent(intervals), num_procs)
+                    intervals = pool.map(_get_worker_interval, [0.1] * 8)
+                    self.assertLessEqual(_get_max_num_concurrent(intervals), num_procs)
+                self.assertTrue(set(_[0] for _ in intervals).issubset(pids))
+            # The modules of pyimpspec are only patched while in use
+            self.assertIs(pyimpspec.analysis.fitting.get_context, get_context)
+            with pool_module.use_shared_pool():
+                self.assertIs(
+                    pyimpspec.analysis.fitting.get_context,
+                    pool_module.get_shared_context,
+                )
+            self.assertIs(pyimpspec.analysis.fitting.get_context, get_context)
+        finally:
+            pool_module.configure_worker_pool()
+
+
+def _get_num_mappings(name: str) -> int:
+    with open("/proc/self/maps") as fp:
+        return fp.read().count(name.lstrip("/"))
+
+
+class TestSharedArrays(TestCase):
+    def test_lifecycle(self):
+        f: ndarray = array([1e3, 1e2, 1e1])
+        Z: ndarray = array([[1 - 1j, 2 - 2j, 3 - 3j], [4 - 4j, 5 - 5j, 6 - 6j]])
+        mask: ndarray = array([False, True, False])
+        arrays: Dict[str, ndarray]
+        with SharedArrays({"f": f, "Z": Z, "mask": mask}) as shared:
+            name: str = shared.handle.name
+            with attach_shared_arrays(shared.handle) as arrays:
+                self.assertTrue(array_equal(arrays["f"], f))
+                self.assertTrue(array_equal(arrays["Z"], Z))
+                self.assertTrue(array_equal(arrays["mask"], mask))
+                with self.assertRaises(ValueError):
+                    arrays["f"][0] = 0.0
+                copy: ndarray = arrays["Z"][1].copy()
+            self.assertEqual(arrays, {})
+            self.assertTrue(array_equal(copy, Z[1]))
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name=name)
+        # Closing more than once is fine
+        shared.close()
+        unshared = SharedArrays({"f": f}, share=False)
+        with attach_shared_arrays(unshared.handle) as arrays:
+            self.assertIs(arrays["f"], f)
+
+    @skipUnless(exists("/proc/self/maps"), "Requires /proc/self/maps")
+    def test_detach(self):
+        f: ndarray = array([1e3, 1e2, 1e1])
+        arrays: Dict[str, ndarray]
+        with SharedArrays({"f": f}) as shared:
+            # The process that created the segment also has it mapped
+            name: str = shared.handle.name
+            self.assertEqual(_get_num_mappings(name), 1)
+            with attach_shared_arrays(shared.handle) as arrays:
+                self.assertEqual(_get_num_mappings(name), 2)
+            self.assertEqual(_get_num_mappings(name), 1)
+            # The segment stays attached while views are referenced
+            with attach_shared_arrays(shared.handle) as arrays:
+                view: ndarray = arrays["f"][1:]
+            self.assertEqual(_get_num_mappings(name), 2)
+            self.assertTrue(array_equal(view, f[1:]))
+            del view
+            self.assertEqual(_get_num_mappings(name), 1)
+        self.assertEqual(_get_num_mappings(name), 0)
+
+
 # TODO: Update tests
 class TestKramersKronig(TestCase):
     @classmethod
@@ -317,6 +592,80 @@ class TestKramersKronig(TestCase):
     def test_pseudo_chisqr(self):
         self.assertEqual(self.control_result.pseudo_chisqr, self.result.pseudo_chisqr)
 
+    def test_compact(self):
+        self.assertFalse(hasattr(self.result, "__dict__"))
+        self.assertEqual(self.result.mask, self.data.get_mask())
+        self.assertIsInstance(self.result.mask.copy(), dict)
+        self.assertEqual(self.result.label, self.result.get_label())
+        self.assertIs(self.result.label, self.result.label)
+        self.assertIs(self.result.get_impedances(10), self.result.get_impedances(10))
+        result: deareis.KramersKronigResult = deareis.KramersKronigResult.from_dict(
+            self.result.to_dict(session=False),
+            data=self.data,
+        )
+        self.assertEqual(result.mask, self.result.mask)
+
+    def test_batch(self):
+        data_sets: List[deareis.DataSet] = [
+            deareis.DataSet(
+                frequencies=self.data.get_frequencies(),
+                impedances=self.data.get_impedances() * (1.0 + 0.01 * i),
+                label=f"Batch {i}",
+            )
+            for i in range(0, 3)
+        ]
+        settings: deareis.KramersKronigSettings = deareis.KramersKronigSettings(
+            test=deareis.KramersKronigTest.REAL_LEASTSQ,
+            mode=deareis.KramersKronigMode.MANUAL,
+            representation=deareis.KramersKronigRepresentation.ADMITTANCE,
+            add_capacitance=True,
+            add_inductance=True,
+            num_RC=15,
+            min_log_F_ext=-1.0,
+            max_log_F_ext=1.0,
+            log_F_ext=0.2,
+            num_F_ext_evaluations=0,
+            rapid_F_ext_evaluations=True,
+            cnls_method=deareis.CNLSMethod.LEASTSQ,
+            max_nfev=0,
+            timeout=60,
+            suggestion_settings=self.result.settings.suggestion_settings,
+        )
+        results: List[deareis.KramersKronigResult] = deareis.perform_batch_kramers_kronig_tests(
+            data_sets,
+            settings=settings,
+        )
+        self.assertEqual(len(results), len(data_sets))
+
+        data: deareis.DataSet
+        result: deareis.KramersKronigResult
+        for data, result in zip(data_sets, results):
+            self.assertIsInstance(result, deareis.KramersKronigResult)
+            control: pyimpspec.KramersKronigResult = pyimpspec.perform_kramers_kronig_test(
+                data,
+                test="real",
+                num_RC=settings.num_RC,
+                add_capacitance=True,
+                add_inductance=True,
+                admittance=True,
+                log_F_ext=settings.log_F_ext,
+                num_F_ext_evaluations=0,
+            )
+            self.assertEqual(result.circuit.to_string(), control.circuit.to_string())
+            self.assertTrue(isclose(result.pseudo_chisqr, control.pseudo_chisqr))
+            self.assertTrue(allclose(result.get_impedances(), control.impedances))
+
+        with self.assertRaises(ValueError):
+            deareis.perform_batch_kramers_kronig_tests(
+                data_sets + [
+                    deareis.DataSet(
+                        frequencies=self.data.get_frequencies()[:-1],
+                        impedances=self.data.get_impedances()[:-1],
+                    )
+                ],
+                settings=settings,
+            )
+
     def test_impedance(self):
         data_impedance: ndarray = self.data.get_impedances()
         test_impedance: ndarray = self.result.get_impedances()
@@ -585,6 +934,110 @@ class TestFitting(TestCase):
         self.assertTrue("Method" in markdown)
         self.assertTrue("Weight" in markdown)
 
+    def test_multistart(self):
+        result: deareis.FitResult
+        summary: deareis.MultiStartSummary
+        result, summary = deareis.fit_circuit_multistart(
+            self.data,
+            self.settings,
+            num_starts=4,
+            seed=42,
+            num_procs=2,
+        )
+        self.assertIsInstance(result, deareis.FitResult)
+        self.assertIsInstance(summary, deareis.MultiStartSummary)
+        self.assertEqual(summary.num_starts, 4)
+        self.assertEqual(len(summary.pseudo_chisqrs) + summary.num_failed, 4)
+        self.assertEqual(len(summary.cdcs), len(summary.pseudo_chisqrs))
+        self.assertEqual(result.pseudo_chisqr, summary.pseudo_chisqrs[0])
+        self.assertEqual(result.settings.cdc, summary.cdcs[0])
+        self.assertLessEqual(result.pseudo_chisqr, self.result.pseudo_chisqr * 1.01)
+        self.assertGreaterEqual(summary.get_num_converged(), 1)
+        self.assertTrue("Number of starts" in summary.to_dataframe().to_markdown())
+
+    def test_multistart_initial_values(self):
+        # Every start is sampled around the provided initial values.
+        cdcs: List[str] = deareis.api.fitting._generate_initial_cdcs(
+            "R{R=100}",
+            200,
+            1.0,
+            default_rng(42),
+        )
+        self.assertEqual(len(cdcs), 200)
+        values: List[float] = [
+            pyimpspec.parse_cdc(_).get_elements()[0].get_value("R") for _ in cdcs
+        ]
+        self.assertEqual(values[0], 100.0)
+        self.assertTrue(all(10.0 <= _ <= 1000.0 for _ in values))
+        self.assertGreater(len(set(values)), 190)
+
+    def test_timeout(self):
+        # The timeout applies to each task rather than to each wait for the
+        # next result, so one slow task ends the iteration even though the
+        # other tasks keep finishing.
+        map_with_timeout: Callable = deareis.api.fitting._map_with_timeout
+        tasks: List[Tuple[int, float]] = [(i, 0.1) for i in range(80)]
+        self.assertEqual(len(list(map_with_timeout(_sleep_task, tasks[:4], 4, 2, 0))), 4)
+        tasks[0] = (0, 10.0)
+        start: float = time()
+        indices: List[int] = [_[0] for _ in map_with_timeout(_sleep_task, tasks, 80, 2, 3)]
+        self.assertLess(time() - start, 6.0)
+        self.assertNotIn(0, indices)
+        self.assertTrue(5 < len(indices) < 60, len(indices))
+        # Serial tasks are not interrupted
+        self.assertEqual(len(list(map_with_timeout(_sleep_task, tasks[1:4], 3, 1, 1))), 3)
+
+    def test_confidence_intervals(self):
+        fit: deareis.FitResult = deepcopy(self.result)
+        self.assertEqual(fit.confidence_intervals, None)
+        intervals: deareis.FitConfidenceIntervals
+        intervals = deareis.calculate_confidence_intervals(
+            fit,
+            self.data,
+            num_samples=8,
+            seed=42,
+            num_procs=2,
+        )
+        self.assertIs(fit.confidence_intervals, intervals)
+        self.assertEqual(intervals.method, deareis.ResamplingMethod.BOOTSTRAP)
+        self.assertEqual(intervals.num_samples, 8)
+        lower: float
+        upper: float
+        element_label: str
+        parameters: Dict[str, deareis.FittedParameter]
+        for element_label, parameters in fit.parameters.items():
+            parameter_label: str
+            param: deareis.FittedParameter
+            for parameter_label, param in parameters.items():
+                if param.fixed:
+                    self.assertEqual(
+                        intervals.get_interval(element_label, parameter_label),
+                        None,
+                    )
+                    continue
+                lower, upper = intervals.get_interval(element_label, parameter_label)
+                self.assertLessEqual(lower, upper)
+        df: DataFrame = fit.to_parameters_dataframe()
+        self.assertTrue("95% CI lower" in df.columns)
+        self.assertTrue("95% CI upper" in df.columns)
+        self.assertFalse("95% CI lower" in self.result.to_parameters_dataframe().columns)
+        dictionary: dict = fit.to_dict()
+        self.assertEqual(
+            deareis.FitResult.from_dict(dictionary).confidence_intervals,
+            intervals,
+        )
+        intervals = deareis.calculate_confidence_intervals(
+            fit,
+            self.data,
+            method=deareis.ResamplingMethod.JACKKNIFE,
+            confidence_level=90.0,
+            num_procs=2,
+        )
+        self.assertEqual(intervals.num_samples, len(fit.frequencies))
+        self.assertTrue("90% CI upper" in fit.to_parameters_dataframe().columns)
+        lower, upper = intervals.get_interval("R_1", "R")
+        self.assertTrue(lower < fit.parameters["R_1"]["R"].value < upper)
+
 
 class TestSimulation(TestCase):
     @classmethod
@@ -654,6 +1107,161 @@ class TestSimulation(TestCase):
         self.assertTrue(allclose(abs(impedance), bode_data[1]))
         self.assertTrue(allclose(-angle(impedance, deg=True), bode_data[2]))
 
+    def test_sweep(self):
+        settings: deareis.SimulationSweepSettings = deareis.SimulationSweepSettings(
+            cdc=self.settings.cdc,
+            min_frequency=self.settings.min_frequency,
+            max_frequency=self.settings.max_frequency,
+            num_per_decade=self.settings.num_per_decade,
+            parameters=(
+                deareis.SweptParameter("R_2", "R", 10.0, 1000.0, 3, True),
+                deareis.SweptParameter("C_1", "C", 1e-6, 2e-6, 2, False),
+            ),
+        )
+        sweep: deareis.SimulationSweepResult = deareis.sweep_simulation(settings)
+        self.assertEqual(sweep.get_num_spectra(), 6)
+        self.assertTrue(allclose(sweep.get_frequencies(), self.simulation.get_frequencies()))
+        self.assertEqual(sweep.get_impedances().shape, (6, len(sweep.get_frequencies())))
+        self.assertTrue(
+            allclose(
+                sweep.get_impedances(5),
+                sweep.get_circuit(5).get_impedances(sweep.get_frequencies()),
+            )
+        )
+        self.assertTrue(allclose(sweep.get_impedances(-1), sweep.get_impedances(5)))
+        self.assertEqual(list(sweep.to_dataframe().columns), ["R_2.R", "C_1.C"])
+        self.assertTrue(allclose(sweep.values[:, 0], [10.0, 10.0, 100.0, 100.0, 1000.0, 1000.0]))
+        copy: deareis.SimulationSweepResult = deareis.SimulationSweepResult.from_dict(
+            sweep.to_dict()
+        )
+        self.assertEqual(copy.settings, sweep.settings)
+        # The spectra are only calculated when first accessed
+        self.assertTrue(is_pending(copy, "impedances"))
+        self.assertTrue(allclose(copy.get_impedances(), sweep.get_impedances()))
+        self.assertFalse(is_pending(copy, "impedances"))
+        copy = deareis.SimulationSweepResult.from_dict(sweep.to_dict())
+        self.assertEqual(calculate_pending_impedances([copy]), 1)
+        self.assertFalse(is_pending(copy, "impedances"))
+        with self.assertRaises(ValueError):
+            deareis.sweep_simulation(
+                deareis.SimulationSweepSettings(
+                    cdc=self.settings.cdc,
+                    min_frequency=self.settings.min_frequency,
+                    max_frequency=self.settings.max_frequency,
+                    num_per_decade=self.settings.num_per_decade,
+                    parameters=(deareis.SweptParameter("L_1", "L", 1.0, 2.0, 2, False),),
+                )
+            )
+
+    def test_noisy_replicates(self):
+        replicates: List[deareis.DataSet] = deareis.generate_noisy_replicates(
+            self.simulation,
+            num_replicates=4,
+            noise=1.0,
+            seed=42,
+        )
+        self.assertEqual(len(replicates), 4)
+        Z: ndarray = self.simulation.get_impedances()
+        for data in replicates:
+            self.assertEqual(type(data), deareis.DataSet)
+            self.assertTrue(allclose(data.get_frequencies(), self.simulation.get_frequencies()))
+            self.assertFalse(allclose(data.get_impedances(), Z))
+            self.assertTrue(allclose(data.get_impedances(), Z, rtol=0.1))
+        self.assertTrue(
+            allclose(
+                replicates[-1].get_impedances(),
+                deareis.generate_noisy_replicates(
+                    self.simulation,
+                    num_replicates=4,
+                    noise=1.0,
+                    seed=42,
+                )[-1].get_impedances(),
+            )
+        )
+        constant: deareis.DataSet = deareis.generate_noisy_replicates(
+            self.simulation,
+            num_replicates=1,
+            noise=0.0,
+            noise_model=deareis.NoiseModel.CONSTANT,
+        )[0]
+        self.assertTrue(allclose(constant.get_impedances(), Z))
+        with self.assertRaises(ValueError):
+            deareis.generate_noisy_replicates(self.simulation, num_replicates=0, noise=1.0)
+        results, df = deareis.analyze_replicates(
+            replicates,
+            deareis.FitSettings(
+                cdc=self.settings.cdc,
+                method=deareis.CNLSMethod.LEASTSQ,
+                weight=deareis.Weight.MODULUS,
+                max_nfev=1000,
+                timeout=60,
+            ),
+            num_procs=2,
+        )
+        self.assertEqual(len(results), len(replicates))
+        self.assertTrue(all(map(lambda _: type(_) is deareis.FitResult, results)))
+        self.assertEqual(
+            list(df["Label"]),
+            ["Log pseudo chi-squared", "R_1.R", "R_2.R", "C_1.C"],
+        )
+        self.assertTrue(abs(df["Mean"][1] - self.parameter_values[0]) < 1.0)
+        self.assertEqual(list(df["Num. failed"]), [0] * 4)
+        # Replicates that cannot be analyzed do not discard the other results
+        failing: deareis.DataSet = deareis.DataSet(
+            frequencies=replicates[0].get_frequencies(),
+            impedances=replicates[0].get_impedances() * nan,
+        )
+        fit_settings: deareis.FitSettings = deareis.FitSettings(
+            cdc=self.settings.cdc,
+            method=deareis.CNLSMethod.LEASTSQ,
+            weight=deareis.Weight.MODULUS,
+            max_nfev=1000,
+            timeout=60,
+        )
+        results, df = deareis.analyze_replicates(
+            [failing, replicates[0], failing],
+            fit_settings,
+            num_procs=1,
+        )
+        self.assertEqual([type(_) for _ in results], [type(None), deareis.FitResult, type(None)])
+        self.assertEqual(list(df["Num. failed"]), [2] * 4)
+        with self.assertRaises(ValueError):
+            deareis.analyze_replicates([failing], fit_settings, num_procs=1)
+
+    def test_line_cache(self):
+        Z: ndarray = self.simulation.get_impedances(num_per_decade=17)
+        self.assertIs(Z, self.simulation.get_impedances(num_per_decade=17))
+        self.assertFalse(Z.flags.writeable)
+        self.assertEqual(len(self.simulation.get_frequencies(num_per_decade=17)), len(Z))
+        self.assertGreater(LINE_CACHE.get_statistics().hits, 0)
+
+        cache: LineCache = LineCache(max_bytes=1024)
+        calculate = lambda: (array([1.0] * 32), array([1.0 + 1.0j] * 32))
+        cache.get_line("a", 10, calculate)
+        cache.get_line("a", 10, calculate)
+        cache.get_line("a", 20, calculate)
+        cache.get_line("b", 10, calculate)
+        statistics: CacheStatistics = cache.get_statistics()
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 3)
+        self.assertEqual(statistics.num_items, 1)
+        self.assertEqual(statistics.evictions, 2)
+        self.assertLessEqual(statistics.size, statistics.max_size)
+        self.assertEqual(statistics.get_hit_rate(), 0.25)
+        cache.invalidate("b")
+        self.assertEqual(cache.get_statistics().num_items, 0)
+        cache.set_max_size(0)
+        cache.get_line("a", 10, calculate)
+        self.assertEqual(cache.get_statistics().size, 0)
+
+        # Deleting a result from a project removes its lines
+        project: deareis.Project = deareis.Project()
+        project.add_simulation(self.simulation)
+        project.delete_simulation(self.simulation)
+        misses: int = LINE_CACHE.get_statistics().misses
+        self.assertIsNot(Z, self.simulation.get_impedances(num_per_decade=17))
+        self.assertEqual(LINE_CACHE.get_statistics().misses, misses + 1)
+
     def test_markdown(self):
         markdown: str = self.simulation.to_dataframe().to_markdown()
         lines: List[str] = markdown.split("\n")
@@ -790,6 +1398,156 @@ class TestDRT(TestCase):
             )
         )
 
+    def test_matrix_cache(self):
+        DRT_MATRIX_CACHE.clear()
+        settings: deareis.DRTSettings = deareis.DRTSettings(
+            method=deareis.DRTMethod.TR_RBF,
+            mode=deareis.DRTMode.COMPLEX,
+            lambda_value=1e-3,
+            rbf_type=deareis.RBFType.GAUSSIAN,
+            derivative_order=1,
+            rbf_shape=deareis.RBFShape.FWHM,
+            shape_coeff=0.5,
+            inductance=False,
+            credible_intervals=False,
+            timeout=60,
+            num_samples=2000,
+            num_attempts=10,
+            maximum_symmetry=0.5,
+            fit=None,
+            gaussian_width=0.15,
+            num_per_decade=100,
+            cross_validation_method=deareis.CrossValidationMethod.NONE,
+            tr_nnls_lambda_method=deareis.TRNNLSLambdaMethod.CUSTOM,
+        )
+        first: deareis.DRTResult = deareis.calculate_drt(self.data, settings)
+        statistics: CacheStatistics = DRT_MATRIX_CACHE.get_statistics()
+        self.assertEqual(statistics.misses, 3)
+        self.assertEqual(statistics.num_items, 3)
+
+        second: deareis.DRTResult = deareis.calculate_drt(self.data, settings)
+        self.assertEqual(DRT_MATRIX_CACHE.get_statistics().misses, 3)
+        # pyimpspec is only patched while calculating
+        module: object
+        name: str
+        original: Callable
+        for module, name, original, _ in drt_module._PATCHES:
+            self.assertIs(getattr(module, name), original)
+        self.assertTrue(allclose(first.get_gammas()[0], second.get_gammas()[0]))
+        self.assertEqual(first.pseudo_chisqr, second.pseudo_chisqr)
+
+        deareis.calculate_drt(self.data, self.drt.settings)
+        self.assertEqual(DRT_MATRIX_CACHE.get_statistics().misses, 4)
+        self.assertEqual(
+            self.drt.pseudo_chisqr,
+            deareis.calculate_drt(self.data, self.drt.settings).pseudo_chisqr,
+        )
+        self.assertEqual(DRT_MATRIX_CACHE.get_statistics().misses, 4)
+
+        cache: MatrixCache = MatrixCache(max_bytes=1024)
+        matrix: ndarray = cache.get_matrix("a", lambda: array([[1.0] * 10] * 10))
+        self.assertFalse(matrix.flags.writeable)
+        self.assertIs(cache.get_matrix("a", lambda: array([])), matrix)
+        cache.get_matrix("b", lambda: array([[2.0] * 10] * 10))
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+        self.assertEqual(cache.get_statistics().evictions, 1)
+
+    def test_series(self):
+        data_sets: List[deareis.DataSet] = [
+            deareis.DataSet(
+                frequencies=self.data.get_frequencies(),
+                impedances=self.data.get_impedances() * (1.0 + 0.05 * i),
+                label=f"Series {i}",
+            )
+            for i in range(0, 4)
+        ]
+        settings: deareis.DRTSeriesSettings = deareis.DRTSeriesSettings(
+            mode=deareis.DRTMode.COMPLEX,
+            lambda_value=1e-3,
+            derivative_order=1,
+            smoothness=0.1,
+            inductance=False,
+            num_per_decade=10,
+        )
+        series: deareis.DRTSeriesResult = deareis.calculate_drt_series(
+            data_sets,
+            settings,
+        )
+        self.assertEqual(series.get_num_spectra(), len(data_sets))
+        self.assertEqual(series.get_labels(), [_.get_label() for _ in data_sets])
+        self.assertEqual(
+            series.get_gammas().shape,
+            (len(data_sets), len(series.get_time_constants())),
+        )
+        self.assertTrue((series.get_gammas() >= 0.0).all())
+        self.assertTrue(series.series_resistances[-1] > series.series_resistances[0])
+        self.assertEqual(series.get_gammas(1).shape, series.get_time_constants().shape)
+
+        copy: deareis.DRTSeriesResult = deareis.DRTSeriesResult.from_dict(
+            series.to_dict()
+        )
+        self.assertEqual(copy.uuid, series.uuid)
+        self.assertEqual(copy.settings, series.settings)
+        self.assertTrue(allclose(copy.get_gammas(), series.get_gammas()))
+
+        df: DataFrame = series.to_statistics_dataframe()
+        self.assertIsInstance(df, DataFrame)
+        self.assertEqual(len(df), len(data_sets))
+
+        with self.assertRaises(ValueError):
+            deareis.calculate_drt_series([], settings)
+
+        figure, axes = deareis.mpl.plot_drt_series(series)
+        matplotlib.pyplot.close(figure)
+
+        peaks: DataFrame = deareis.extract_drt_peaks(series, threshold=0.1)
+        self.assertEqual(set(peaks["Index"]), set(range(0, len(data_sets))))
+        self.assertTrue((peaks["Relative gamma"] > 0.1).all())
+
+    def test_extract_peaks(self):
+        taus: ndarray
+        gammas: ndarray
+        taus, gammas, _, _ = self.drt.get_peaks(threshold=0.05)
+        df: DataFrame = deareis.extract_drt_peaks(
+            [self.drt, self.drt],
+            threshold=0.05,
+        )
+        self.assertEqual(
+            list(df.columns),
+            [
+                "Index",
+                "Label",
+                "Component",
+                "tau (s)",
+                "gamma (ohm)",
+                "Relative gamma",
+                "Track",
+            ],
+        )
+        self.assertEqual(len(df), 2 * len(taus))
+        self.assertTrue(allclose(df["tau (s)"][df["Index"] == 1], taus))
+        self.assertTrue(allclose(df["gamma (ohm)"][df["Index"] == 0], gammas))
+        self.assertEqual(set(df["Component"]), {"real"})
+        self.assertEqual(
+            list(df["Track"][df["Index"] == 0]),
+            list(df["Track"][df["Index"] == 1]),
+        )
+        self.assertEqual(df["Track"].nunique(), len(taus))
+
+        tracks: DataFrame = deareis.extract_drt_peaks(
+            [self.drt, self.drt, self.drt],
+            threshold=0.05,
+            tolerance=0.0,
+        )
+        self.assertEqual(tracks["Track"].nunique(), len(taus))
+
+        with self.assertRaises(ValueError):
+            deareis.extract_drt_peaks([self.drt], threshold=2.0)
+
+        with self.assertRaises(TypeError):
+            deareis.extract_drt_peaks([self.data])
+
     def test_bht(self):
         deareis.calculate_drt(
             self.data,
@@ -815,6 +1573,104 @@ class TestDRT(TestCase):
             )
         )
 
+    def test_parallel_sampling(self):
+        settings: deareis.DRTSettings = deareis.DRTSettings(
+            method=deareis.DRTMethod.TR_RBF,
+            mode=deareis.DRTMode.COMPLEX,
+            lambda_value=1e-3,
+            rbf_type=deareis.RBFType.GAUSSIAN,
+            derivative_order=1,
+            rbf_shape=deareis.RBFShape.FWHM,
+            shape_coeff=0.5,
+            inductance=False,
+            credible_intervals=True,
+            timeout=60,
+            num_samples=1000,
+            num_attempts=3,
+            maximum_symmetry=0.5,
+            fit=None,
+            gaussian_width=0.15,
+            num_per_decade=100,
+            cross_validation_method=deareis.CrossValidationMethod.NONE,
+            tr_nnls_lambda_method=deareis.TRNNLSLambdaMethod.CUSTOM,
+        )
+        first: deareis.DRTResult = deareis.calculate_drt(
+            self.data,
+            settings,
+            num_procs=1,
+            parallel_sampling=True,
+            seed=42,
+        )
+        second: deareis.DRTResult = deareis.calculate_drt(
+            self.data,
+            settings,
+            num_procs=1,
+            parallel_sampling=True,
+            seed=42,
+        )
+        self.assertEqual(first.lower_bounds.shape, first.get_time_constants().shape)
+        self.assertTrue(allclose(first.lower_bounds, second.lower_bounds))
+        self.assertTrue(allclose(first.upper_bounds, second.upper_bounds))
+        self.assertTrue((first.lower_bounds <= first.upper_bounds).all())
+
+        early: deareis.DRTResult = deareis.calculate_drt(
+            self.data,
+            settings,
+            num_procs=1,
+            parallel_sampling=True,
+            seed=42,
+            convergence_tolerance=1.0,
+        )
+        self.assertEqual(early.upper_bounds.shape, first.upper_bounds.shape)
+
+        # Multiple chains that are distributed across processes
+        chains: List[deareis.DRTResult] = [
+            deareis.calculate_drt(
+                self.data,
+                settings,
+                num_procs=2,
+                parallel_sampling=True,
+                seed=42,
+            )
+            for _ in range(0, 2)
+        ]
+        self.assertTrue(allclose(chains[0].lower_bounds, chains[1].lower_bounds))
+        self.assertTrue(allclose(chains[0].upper_bounds, chains[1].upper_bounds))
+        self.assertTrue((chains[0].lower_bounds <= chains[0].upper_bounds).all())
+        self.assertFalse(allclose(chains[0].upper_bounds, first.upper_bounds))
+
+        with self.assertRaises(ValueError):
+            deareis.calculate_drt(
+                self.data,
+                settings,
+                parallel_sampling=True,
+                convergence_tolerance=-1.0,
+            )
+
+        bht: deareis.DRTSettings = replace(
+            settings,
+            method=deareis.DRTMethod.BHT,
+            credible_intervals=False,
+        )
+        self.assertEqual(
+            deareis.calculate_drt(
+                self.data,
+                bht,
+                num_procs=1,
+                parallel_sampling=True,
+                seed=7,
+                convergence_tolerance=1.0,
+            ).pseudo_chisqr,
+            deareis.calculate_drt(
+                self.data,
+                bht,
+                num_procs=1,
+                parallel_sampling=True,
+                seed=7,
+                convergence_tolerance=1.0,
+            ).pseudo_chisqr,
+        )
+
     def test_mrq_fit(self):
         fit: deareis.FitResult = deareis.fit_circuit(
             data=self.data,
@@ -911,3 +1767,52 @@ class TestZHIT(TestCase):
         self.assertTrue("Smoothing" in markdown)
         self.assertTrue("Interpolation" in markdown)
         self.assertTrue("Window" in markdown)
+
+    def test_batch(self):
+        data: deareis.DataSet = deareis.parse_data(TEST_DATA_PATH)[0]
+        data_sets: List[deareis.DataSet] = [
+            deareis.DataSet(
+                frequencies=data.get_frequencies(),
+                impedances=data.get_impedances() * (1.0 + 0.05 * i),
+                label=f"Batch {i}",
+            )
+            for i in range(0, 3)
+        ]
+        for representation in (
+            deareis.ZHITRepresentation.IMPEDANCE,
+            deareis.ZHITRepresentation.ADMITTANCE,
+        ):
+            settings: deareis.ZHITSettings = replace(
+                self.zhit.settings,
+                representation=representation,
+            )
+            results: List[deareis.ZHITResult] = deareis.perform_batch_zhit(
+                data_sets,
+                settings,
+            )
+            self.assertEqual(len(results), len(data_sets))
+            for data, result in zip(data_sets, results):
+                control: deareis.ZHITResult = deareis.perform_zhit(
+                    data,
+                    settings,
+                    num_procs=1,
+                )
+                self.assertEqual(result.settings, settings)
+                self.assertEqual(result.window, control.window)
+                # The offsets are fitted with Newton's method rather than
+                # pyimpspec's iterative optimizer, which converges to the same
+                # offset within ~1e-5 relative for these data sets.
+                self.assertTrue(
+                    isclose(result.pseudo_chisqr, control.pseudo_chisqr, rtol=1e-4)
+                )
+                self.assertTrue(
+                    allclose(result.get_impedances(), control.get_impedances(), rtol=1e-5)
+                )
+
+        self.assertEqual(deareis.perform_batch_zhit([], self.zhit.settings), [])
+        truncated: deareis.DataSet = deareis.DataSet(
+            frequencies=data.get_frequencies()[1:],
+            impedances=data.get_impedances()[1:],
+        )
+        with self.assertRaises(ValueError):
+            deareis.perform_batch_zhit([data_sets[0], truncated], self.zhit.settings)
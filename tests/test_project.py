@@ -28,10 +28,13 @@ from typing import (
     List,
 )
 from unittest import TestCase
+from numpy import allclose
+from pandas import DataFrame
 import deareis
 from deareis import (
     DRTResult,
     DataSet,
+    FitIndex,
     FitResult,
     PlotSeries,
     PlotSettings,
@@ -40,6 +43,10 @@ from deareis import (
     KramersKronigResult,
     ZHITResult,
 )
+from deareis.data.lazy import (
+    calculate_pending_impedances,
+    is_pending,
+)
 
 
 class TestProject(TestCase):
@@ -84,6 +91,27 @@ class TestProject(TestCase):
             self.assertTrue(exists(path))
             Project.from_file(path)
 
+    def test_lazy_impedances(self):
+        project: Project = Project.from_file(self.example_project_paths[-1])
+        minimized: Project = Project.from_dict(project.to_dict(session=False))
+        results: list = []
+        controls: list = []
+        for data in project.get_data_sets():
+            results.extend(minimized.get_tests(data) + minimized.get_fits(data))
+            controls.extend(project.get_tests(data) + project.get_fits(data))
+        self.assertGreater(len(results), 1)
+        self.assertTrue(all(map(lambda _: is_pending(_, "impedances"), results)))
+        self.assertEqual(calculate_pending_impedances(results + results), len(results))
+        self.assertFalse(any(map(lambda _: is_pending(_, "impedances"), results)))
+        for result, control in zip(results, controls):
+            self.assertEqual(result.uuid, control.uuid)
+            self.assertTrue(allclose(result.impedances, control.impedances))
+        control: FitResult = controls[-1]
+        result: FitResult = FitResult.from_dict(control.to_dict(session=False))
+        self.assertTrue(is_pending(result, "impedances"))
+        self.assertTrue(allclose(result.get_impedances(), control.impedances))
+        self.assertFalse(is_pending(result, "impedances"))
+
     def test_merge(self):
         methods: Dict[str, Callable] = {
             "data_sets": lambda _: _.get_data_sets(),
@@ -390,6 +418,56 @@ class TestProject(TestCase):
             # Attempt to remove fit from a data set that the fit does not belong to
             self.project.delete_fit(data, fits[0])
 
+    def test_fit_index(self):
+        project: Project = Project.from_file(self.example_project_paths[-1])
+        index: FitIndex = project.get_fit_index()
+        fits: Dict[str, List[FitResult]] = project.get_all_fits()
+        self.assertEqual(len(index), sum(map(len, fits.values())))
+        df: DataFrame = project.get_fits_dataframe()
+        self.assertEqual(len(df), len(index))
+        self.assertEqual(df.columns[0], "data_label")
+        data: DataSet = [_ for _ in project.get_data_sets() if len(fits[_.uuid]) > 1][0]
+        fit: FitResult = fits[data.uuid][0]
+        row = df[df["fit_uuid"] == fit.uuid].iloc[0]
+        self.assertEqual(row["data_label"], data.get_label())
+        self.assertEqual(row["circuit"], fit.circuit.to_string())
+        self.assertAlmostEqual(row["red_chisqr"], fit.red_chisqr)
+        self.assertEqual(row["nfev"], fit.nfev)
+        element: str = list(fit.parameters.keys())[0]
+        parameter: str = list(fit.parameters[element].keys())[0]
+        self.assertAlmostEqual(
+            row[f"{element}: {parameter}"],
+            fit.parameters[element][parameter].value,
+        )
+        keys, values = index.get_parameter(element, parameter)
+        self.assertTrue((data.uuid, fit.uuid) in keys)
+        self.assertEqual(len(keys), len(values))
+        self.assertEqual(
+            sorted(index.find_fits("red_chisqr", maximum=fit.red_chisqr)),
+            sorted(
+                (uuid, _.uuid)
+                for uuid, results in fits.items()
+                for _ in results
+                if _.red_chisqr <= fit.red_chisqr
+            ),
+        )
+        # Removing rows moves other rows, which should still be found
+        project.delete_fit(data, fit)
+        self.assertEqual(len(index), len(df) - 1)
+        self.assertFalse((data.uuid, fit.uuid) in index)
+        other: DataSet = [_ for _ in project.get_data_sets() if _ != data][0]
+        project.add_fit(other, fit)
+        self.assertTrue((other.uuid, fit.uuid) in index)
+        project.delete_data_set(data)
+        self.assertEqual(len(index), sum(map(len, project.get_all_fits().values())))
+        df = project.get_fits_dataframe(parameters=False)
+        self.assertEqual(sorted(df["fit_uuid"]), sorted(_[1] for _ in index.get_keys()))
+        for (data_uuid, fit_uuid), nfev in zip(index.get_keys(), index.get_column("nfev")):
+            self.assertEqual(
+                nfev,
+                [_ for _ in project.get_all_fits()[data_uuid] if _.uuid == fit_uuid][0].nfev,
+            )
+
     def test_get_simulations(self):
         simulations: List[SimulationResult] = self.project.get_simulations()
         self.assertIsInstance(simulations, list)
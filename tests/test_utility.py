@@ -28,14 +28,42 @@ from deareis.utility import (
     format_timestamp,
     process_cdc,
 )
+from deareis.expressions import (
+    ExpressionCache,
+    parse_expression,
+)
+from deareis.profiling import ActionProfiler
+from deareis.progress import (
+    ProgressAggregator,
+    format_eta,
+)
+from deareis.scheduler import FrameScheduler
+from deareis.signals import Signal
+from deareis.tuning import WorkerCountTuner
+import deareis.signals as signals
 from pyimpspec import Circuit
 from numpy import (
     array,
     nan,
     inf,
 )
+from sympy import (
+    simplify,
+    srepr,
+)
 from datetime import datetime
+from json import loads
+from os import listdir
+from os.path import (
+    exists,
+    join,
+)
+from pstats import Stats
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import sleep
 from typing import Optional
+import tracemalloc
 
 
 class TestUtility(TestCase):
@@ -155,3 +183,365 @@ class TestUtility(TestCase):
         self.assertEqual(format_latex_element("C_dl"), r"$\rm C_{dl}$")
         with self.assertRaises(AssertionError):
             format_latex_element("C_dl_2")
+
+    def test_expression_cache(self):
+        circuit: Circuit = process_cdc("R{:sol}(C[RW])")[0]
+        with TemporaryDirectory() as directory:
+            path: str = join(directory, "expressions.json")
+            cache: ExpressionCache = ExpressionCache(path, timeout=30.0)
+            try:
+                expr = cache.get_expression(circuit)
+                self.assertEqual(expr, simplify(circuit.to_sympy()))
+                self.assertEqual(len(cache), 1)
+                # The helper process is reused
+                process = cache._process
+                cache.get_expression(process_cdc("RC")[0])
+                self.assertIs(cache._process, process)
+                self.assertEqual(len(cache), 2)
+            finally:
+                cache.save()
+                cache.stop()
+            self.assertTrue(exists(path))
+            cache = ExpressionCache(path)
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(cache.get_expression(circuit), expr)
+            # The persisted expressions do not require the helper process
+            self.assertIsNone(cache._process)
+
+        # Only SymPy classes with literal arguments are evaluated
+        self.assertEqual(parse_expression(srepr(expr)), expr)
+        for string in (
+            "__import__('os').getcwd()",
+            "Symbol('R').__class__",
+            "Symbol(*['R'])",
+            "eval('1')",
+        ):
+            with self.assertRaises(ValueError, msg=string):
+                parse_expression(string)
+
+    def test_worker_count_tuner(self):
+        with TemporaryDirectory() as directory:
+            path: str = join(directory, "worker_counts.json")
+            tuner: WorkerCountTuner = WorkerCountTuner(path)
+            # The candidates are tried in descending order and the first
+            # measurement of each candidate is discarded
+            tried = []
+            for seconds in (60.0, 1.0, 60.0, 2.0, 60.0, 4.0, 60.0, 8.0):
+                num_procs: int = tuner.select("fitting", 100, max_num_procs=8)
+                tried.append(num_procs)
+                tuner.record("fitting", 100, num_procs, seconds)
+            self.assertEqual(tried, [8, 8, 4, 4, 2, 2, 1, 1])
+            self.assertEqual(tuner.get_throughput("fitting", 100, 8), 100.0)
+            # The worker count with the highest throughput is picked
+            tuner.record("fitting", 100, 2, 1e-3)
+            self.assertEqual(tuner.select("fitting", 100, max_num_procs=8), 2)
+            self.assertEqual(tuner.select("fitting", 110, max_num_procs=8), 2)
+            # Other sizes and analyses are measured separately
+            self.assertEqual(tuner.select("fitting", 1000, max_num_procs=8), 8)
+            self.assertEqual(tuner.select("zhit", 100, max_num_procs=8), 8)
+            self.assertEqual(tuner.select("zhit", 100, max_num_procs=1), 1)
+            self.assertIsNone(tuner.get_throughput("zhit", 100, 8))
+            for _ in range(2):
+                self.assertIsNone(tuner.get_throughput("zhit", 100, 8))
+                with tuner.measure("zhit", 100, max_num_procs=8) as num_procs:
+                    self.assertEqual(num_procs, 8)
+            self.assertIsNotNone(tuner.get_throughput("zhit", 100, 8))
+            tuner.save()
+            self.assertTrue(exists(path))
+            tuner = WorkerCountTuner(path)
+            self.assertGreater(tuner.get_throughput("fitting", 100, 2), 0.0)
+            self.assertEqual(tuner.select("fitting", 100, max_num_procs=8), 2)
+            tuner.clear()
+            self.assertIsNone(tuner.get_throughput("fitting", 100, 2))
+
+    def test_progress_aggregator(self):
+        updates = []
+        aggregator = ProgressAggregator(
+            lambda **k: updates.append(k),
+            interval=60.0,
+            min_elapsed=0.0,
+        )
+        aggregator(message="Task", progress=0.0)
+        for i in range(1, 1000):
+            aggregator(message="Task", progress=i / 2500)
+        # Only the first update is passed on within the interval
+        self.assertEqual(aggregator.num_received, 1000)
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(updates[0]["eta"], -1.0)
+        # Changing the message or completing the task is always passed on
+        sleep(0.01)
+        aggregator(message="Task (stage 2)", progress=0.5)
+        self.assertEqual(len(updates), 2)
+        self.assertGreater(updates[-1]["eta"], 0.0)
+        aggregator(message="Task (stage 2)", progress=1.0)
+        self.assertEqual(len(updates), 3)
+        self.assertEqual(updates[-1]["progress"], 1.0)
+        # A decrease in progress starts a new task
+        aggregator(message="Task (stage 2)", progress=0.0)
+        self.assertEqual(len(updates), 4)
+        self.assertEqual(updates[-1]["eta"], -1.0)
+        # Changing only the numbers in the message is not forced
+        aggregator(message="Sampling (10/100 samples, ~5 s remaining)", progress=0.1)
+        aggregator(message="Sampling (20/100 samples, ~4 s remaining)", progress=0.2)
+        self.assertEqual(len(updates), 5)
+        aggregator.reset()
+        # The latest dropped update is passed on once the interval has passed
+        aggregator = ProgressAggregator(lambda **k: updates.append(k), interval=0.05)
+        aggregator(message="Task (1/3)", progress=0.1)
+        aggregator(message="Task (2/3)", progress=0.2)
+        self.assertEqual(len(updates), 6)
+        sleep(0.25)
+        self.assertEqual(len(updates), 7)
+        self.assertEqual(updates[-1]["message"], "Task (2/3)")
+        self.assertEqual(aggregator.num_forwarded, 2)
+        self.assertEqual(format_eta(5.2), "~6 s")
+        self.assertEqual(format_eta(150.0), "~2 min")
+
+    def test_signal_statistics(self):
+        def outer(*args, **kwargs):
+            signals.emit(Signal.SHOW_SIGNAL_STATISTICS, nested=True)
+
+        def inner(*args, **kwargs):
+            if kwargs.get("nested"):
+                sleep(0.02)
+
+        statistics = signals.enable_statistics(slow_threshold=0.01)
+        signals.register(Signal.SHOW_SETTINGS_USER_DEFINED_ELEMENTS, outer)
+        signals.register(Signal.SHOW_SIGNAL_STATISTICS, inner)
+        try:
+            signals.emit(Signal.SHOW_SIGNAL_STATISTICS)
+            signals.emit(Signal.SHOW_SETTINGS_USER_DEFINED_ELEMENTS)
+        finally:
+            signals.clear(Signal.SHOW_SETTINGS_USER_DEFINED_ELEMENTS)
+            signals.clear(Signal.SHOW_SIGNAL_STATISTICS)
+            signals.disable_statistics()
+        self.assertIsNone(signals.get_statistics())
+
+        histograms = statistics.get_signals()
+        self.assertEqual(histograms["SHOW_SIGNAL_STATISTICS"].count, 2)
+        self.assertEqual(histograms["SHOW_SETTINGS_USER_DEFINED_ELEMENTS"].count, 1)
+        self.assertEqual(sum(histograms["SHOW_SIGNAL_STATISTICS"].bins), 2)
+        callbacks = statistics.get_callbacks()
+        self.assertEqual(len(callbacks), 2)
+        # Only the nested call exceeded the threshold
+        slow_calls = statistics.get_slow_calls()
+        self.assertEqual(
+            [(_["signal"], _["depth"]) for _ in slow_calls],
+            [("SHOW_SIGNAL_STATISTICS", 2), ("SHOW_SETTINGS_USER_DEFINED_ELEMENTS", 1)],
+        )
+        self.assertTrue(slow_calls[0]["callback"].endswith("inner"))
+        trees = statistics.get_call_trees()
+        self.assertEqual(len(trees), 2)
+        tree = trees[-1]
+        self.assertEqual(tree["signal"], "SHOW_SETTINGS_USER_DEFINED_ELEMENTS")
+        self.assertEqual(
+            tree["callbacks"][0]["emits"][0]["signal"],
+            "SHOW_SIGNAL_STATISTICS",
+        )
+        self.assertGreaterEqual(tree["duration"], 0.02)
+        with TemporaryDirectory() as directory:
+            path: str = join(directory, "statistics.json")
+            statistics.save(path)
+            with open(path, "r") as fp:
+                dictionary: dict = loads(fp.read())
+        self.assertEqual(dictionary["signals"]["SHOW_SIGNAL_STATISTICS"]["count"], 2)
+        statistics.reset()
+        self.assertEqual(statistics.get_signals(), {})
+
+    def test_deferred_signals(self):
+        calls = []
+
+        def plot(*args, **kwargs):
+            calls.append(("plot", kwargs))
+
+        def snapshot(*args, **kwargs):
+            calls.append(("snapshot", kwargs))
+            signals.emit(Signal.SELECT_PLOT_SETTINGS, settings="c")
+
+        scheduled = []
+        signals.register(Signal.SELECT_PLOT_SETTINGS, plot)
+        signals.register(Signal.CREATE_PROJECT_SNAPSHOT, snapshot)
+        try:
+            with signals.deferred():
+                signals.emit(Signal.SELECT_PLOT_SETTINGS, settings="a", plot_only=True)
+                signals.emit(Signal.CREATE_PROJECT_SNAPSHOT, dirty=False)
+                with signals.deferred():
+                    signals.emit(Signal.SELECT_PLOT_SETTINGS, settings="b", adjust_limits=False)
+                self.assertEqual(calls, [])
+                signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
+            # Each signal is processed once in the order of the most recent
+            # emissions and signals emitted while flushing are processed too.
+            self.assertEqual(
+                calls,
+                [
+                    ("plot", {"settings": "b", "adjust_limits": True, "plot_only": False}),
+                    ("snapshot", {"dirty": True}),
+                    ("plot", {"settings": "c"}),
+                ],
+            )
+            calls.clear()
+            signals.set_deferred_dispatch(scheduled.append)
+            signals.emit(Signal.SELECT_PLOT_SETTINGS, settings="a")
+            signals.emit(Signal.SELECT_PLOT_SETTINGS, settings="b")
+            self.assertEqual(calls, [])
+            self.assertEqual(len(scheduled), 1)
+            scheduled.pop()()
+            self.assertEqual(calls, [("plot", {"settings": "b", "adjust_limits": True, "plot_only": False})])
+            # Project snapshots are neither merged nor reordered outside of
+            # explicit deferred blocks.
+            calls.clear()
+            signals.emit(Signal.CREATE_PROJECT_SNAPSHOT, dirty=False)
+            signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
+            self.assertEqual(calls, [("snapshot", {"dirty": False}), ("snapshot", {})])
+            self.assertEqual(len(scheduled), 1)
+            scheduled.pop()()
+            self.assertEqual(calls[2:], [("plot", {"settings": "c", "adjust_limits": True, "plot_only": False})])
+            # The deferred blocks of one thread do not capture the signals
+            # emitted by other threads.
+            calls.clear()
+            signals.set_deferred_dispatch(None)
+            with signals.deferred():
+                thread = Thread(
+                    target=lambda: signals.emit(Signal.CREATE_PROJECT_SNAPSHOT, dirty=False)
+                )
+                thread.start()
+                thread.join()
+                self.assertEqual(calls, [("snapshot", {"dirty": False}), ("plot", {"settings": "c"})])
+                signals.emit(Signal.CREATE_PROJECT_SNAPSHOT)
+                self.assertEqual(len(calls), 2)
+            self.assertEqual(calls[2:], [("snapshot", {}), ("plot", {"settings": "c"})])
+        finally:
+            signals.set_deferred_dispatch(None)
+            signals.clear(Signal.SELECT_PLOT_SETTINGS)
+            signals.clear(Signal.CREATE_PROJECT_SNAPSHOT)
+
+    def test_frame_scheduler(self):
+        scheduler = FrameScheduler(budget=1.0)
+        order = []
+
+        def chunks(name, num_chunks):
+            for i in range(num_chunks):
+                order.append((name, i))
+                yield
+
+        low = scheduler.submit(chunks("low", 2), priority=-1)
+        scheduler.submit(chunks("high", 2), priority=1)
+        scheduler.submit(lambda: order.append(("function", 0)))
+        superseded = scheduler.submit(chunks("table", 3), label="table")
+        scheduler.submit(chunks("table (new)", 1), label="table")
+        self.assertTrue(superseded.is_cancelled())
+        self.assertEqual(scheduler.get_num_pending(), 4)
+        self.assertEqual(scheduler.run_frame(), 9)
+        self.assertEqual(
+            order,
+            [
+                ("high", 0),
+                ("high", 1),
+                ("function", 0),
+                ("table (new)", 0),
+                ("low", 0),
+                ("low", 1),
+            ],
+        )
+        self.assertTrue(low.is_done())
+        self.assertEqual(scheduler.get_num_pending(), 0)
+        # Loops in other threads yield to the main loop once the budget has
+        # been used up.
+        scheduler.budget = 0.005
+        self.assertFalse(scheduler.wait_for_frame())
+        self.assertEqual(list(scheduler.iterate(range(3))), [0, 1, 2])
+        num_frames = 0
+
+        def main_loop():
+            nonlocal num_frames
+            scheduler.start()
+            while scheduler.is_running():
+                scheduler.run_frame()
+                sleep(0.01)
+                num_frames += 1
+                scheduler.frame_rendered()
+
+        thread = Thread(target=main_loop)
+        thread.start()
+        try:
+            while not scheduler.is_running():
+                sleep(0.001)
+            self.assertTrue(scheduler.wait_for_frame())
+            items = []
+            for i in scheduler.iterate(range(20), label="loop"):
+                items.append(i)
+                sleep(0.002)
+            self.assertEqual(items, list(range(20)))
+            self.assertGreaterEqual(num_frames, 5)
+            items.clear()
+            for i in scheduler.iterate(range(20), label="loop"):
+                items.append(i)
+                if i == 4:
+                    scheduler.cancel("loop")
+            self.assertEqual(items, list(range(5)))
+        finally:
+            scheduler.stop()
+            thread.join()
+
+    def test_action_profiler(self):
+        def outer(*args, **kwargs):
+            signals.emit(Signal.SHOW_SIGNAL_STATISTICS)
+
+        def inner(*args, **kwargs):
+            return [0] * 100000
+
+        signals.register(Signal.SHOW_SETTINGS_USER_DEFINED_ELEMENTS, outer)
+        signals.register(Signal.SHOW_SIGNAL_STATISTICS, inner)
+        with TemporaryDirectory() as directory:
+            try:
+                profiler = signals.enable_profiling(
+                    directory=directory,
+                    memory=True,
+                    min_duration=0.0,
+                )
+                signals.emit(Signal.SHOW_SETTINGS_USER_DEFINED_ELEMENTS)
+                signals.emit(Signal.SHOW_SIGNAL_STATISTICS)
+            finally:
+                self.assertIs(signals.disable_profiling(), profiler)
+                signals.clear(Signal.SHOW_SETTINGS_USER_DEFINED_ELEMENTS)
+                signals.clear(Signal.SHOW_SIGNAL_STATISTICS)
+            self.assertIsNone(signals.get_profiler())
+            # Signals emitted by callbacks are part of the same action.
+            actions = profiler.get_actions()
+            self.assertEqual(
+                [_["action"] for _ in actions],
+                ["SHOW_SETTINGS_USER_DEFINED_ELEMENTS", "SHOW_SIGNAL_STATISTICS"],
+            )
+            self.assertEqual(len(listdir(directory)), 5)
+            stats = Stats(actions[0]["profile"])
+            self.assertTrue(any(_[2] == "inner" for _ in stats.stats))
+            with open(actions[0]["memory"], "r") as fp:
+                self.assertIn("SHOW_SETTINGS_USER_DEFINED_ELEMENTS", fp.read())
+            summary = profiler.summarize(num_actions=1)
+            self.assertEqual(len(summary.split("\n")), 2)
+            self.assertTrue(exists(join(directory, "summary.txt")))
+            self.assertFalse(profiler.begin_action("TEST"))
+        # The profiler can be closed by the action that is being profiled
+        # (e.g., when toggled via the GUI).
+        with TemporaryDirectory() as directory:
+            profiler = ActionProfiler(directory, memory=True, min_duration=0.0)
+            self.assertTrue(profiler.begin_action("TEST"))
+            summary = profiler.close()
+            self.assertTrue(tracemalloc.is_tracing())
+            profiler.end_action()
+            self.assertFalse(tracemalloc.is_tracing())
+            self.assertNotIn("TEST", summary)
+            with open(join(directory, "summary.txt"), "r") as fp:
+                self.assertIn("TEST", fp.read())
+            self.assertFalse(profiler.begin_action("TEST"))
+            # Toggling the profiling is not profiled.
+            signals.register(Signal.TOGGLE_PROFILING, lambda *args, **kwargs: signals.disable_profiling())
+            try:
+                profiler = signals.enable_profiling(directory=directory, memory=True, min_duration=0.0)
+                signals.emit(Signal.TOGGLE_PROFILING)
+            finally:
+                signals.disable_profiling()
+                signals.clear(Signal.TOGGLE_PROFILING)
+            self.assertIsNone(signals.get_profiler())
+            self.assertEqual(profiler.get_actions(), [])
+            self.assertFalse(tracemalloc.is_tracing())